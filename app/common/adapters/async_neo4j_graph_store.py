@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from common.adapters.neo4j_graph_store import (
+    POSTINGS_BY_SKILLS_QUERY,
+    REQUIRED_SKILLS_QUERY,
+)
+from common.async_graph_db import AsyncGraphDBClient
+from common.graph_db import GraphDBClient
+
+
+class AsyncNeo4jGraphStore:
+    """
+    Neo4j(Graph DB) async 어댑터. (AsyncGraphStorePort 구현)
+
+    - `Neo4jGraphStore`와 같은 쿼리를 `AsyncGraphDBClient`로 실행합니다.
+    """
+
+    async def upsert_job_posting(
+        self,
+        *,
+        posting_id: int,
+        position: str,
+        company_name: str,
+        skills_required: list[str],
+    ) -> None:
+        if not skills_required:
+            return
+        await AsyncGraphDBClient.get_instance().add_job_posting(
+            posting_id=posting_id,
+            position=position,
+            company_name=company_name,
+            skills=skills_required,
+        )
+
+    async def upsert_job_postings(self, *, postings: list[dict]) -> None:
+        rows = [p for p in postings if p.get("skills_required")]
+        if not rows:
+            return
+        await AsyncGraphDBClient.get_instance().add_job_postings(rows)
+
+    async def get_required_skills(self, *, posting_id: int) -> set[str]:
+        return set(
+            await AsyncGraphDBClient.get_instance().execute_read(
+                REQUIRED_SKILLS_QUERY,
+                {"posting_id": posting_id},
+                mapper=lambda record: record["skill_name"],
+            )
+        )
+
+    async def get_postings_by_skills(
+        self, *, user_skills: set[str], limit: int = 50
+    ) -> list[int]:
+        if not user_skills:
+            return []
+        return await AsyncGraphDBClient.get_instance().execute_read(
+            POSTINGS_BY_SKILLS_QUERY,
+            {"user_skills": list(user_skills), "limit": limit},
+            mapper=lambda record: record["posting_id"],
+        )
+
+    async def get_skill_statistics(self, *, skill_name: str | None = None) -> dict:
+        client = AsyncGraphDBClient.get_instance()
+        if skill_name:
+            records = await client.execute_read(
+                GraphDBClient.SKILL_STATISTICS_QUERY, {"skill_name": skill_name}
+            )
+        else:
+            records = await client.execute_read(GraphDBClient.TOP_SKILLS_QUERY)
+        return GraphDBClient.build_skill_statistics(skill_name, records)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from common.ports.recommendation_evaluator import RecommendationEvaluatorPort
+from common.ports.search_plan_builder import SearchPlanBuilderPort
+from job.models import JobPosting
+from recommendation.models import RecommendationPrompt
+from resume.models import Resume
+
+
+class BoundedSearchPlanBuilder:
+    """
+    동시 LLM 호출 수를 semaphore로 제한하는 SearchPlanBuilderPort 래퍼.
+
+    배치에서 여러 이력서를 병렬 처리해도 LLM API에는 semaphore 크기만큼만 동시에 요청합니다.
+    """
+
+    def __init__(self, *, inner: SearchPlanBuilderPort, semaphore: threading.Semaphore):
+        self._inner = inner
+        self._semaphore = semaphore
+
+    def build_plan(self, *, resume: Resume) -> dict:
+        with self._semaphore:
+            return self._inner.build_plan(resume=resume)
+
+    def build_fallback_plan(self, *, resume: Resume) -> dict:
+        # LLM 호출이 아니므로 semaphore를 잡지 않습니다.
+        return self._inner.build_fallback_plan(resume=resume)
+
+
+class BoundedRecommendationEvaluator:
+    """동시 LLM 호출 수를 semaphore로 제한하는 RecommendationEvaluatorPort 래퍼."""
+
+    def __init__(
+        self, *, inner: RecommendationEvaluatorPort, semaphore: threading.Semaphore
+    ):
+        self._inner = inner
+        self._semaphore = semaphore
+
+    def evaluate_batch(
+        self,
+        *,
+        postings: list[JobPosting],
+        resume: Resume,
+        prompt: RecommendationPrompt,
+        search_contexts: Optional[list[dict]] = None,
+    ) -> list[dict]:
+        with self._semaphore:
+            return self._inner.evaluate_batch(
+                postings=postings,
+                resume=resume,
+                prompt=prompt,
+                search_contexts=search_contexts,
+            )
@@ -13,6 +13,8 @@ class ChromaVectorStore:
     - 유스케이스 레이어는 ChromaDB를 직접 알지 않고 이 어댑터(=VectorStorePort 구현)만 의존합니다.
     """
 
+    UPSERT_BATCH_SIZE = 1000
+
     def upsert_text(
         self,
         *,
@@ -29,6 +31,78 @@ class ChromaVectorStore:
             ids=[doc_id],
         )
 
+    def upsert_texts(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: list[str],
+        texts: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """
+        여러 문서를 한 번에 업서트합니다. (임베딩도 배치로 계산)
+
+        Chroma 서버의 최대 배치 크기를 넘지 않도록 UPSERT_BATCH_SIZE 단위로 나눕니다.
+        """
+        if not doc_ids:
+            return
+        collection = VectorDB.get_instance().get_or_create_collection(collection_name)
+        for start in range(0, len(doc_ids), self.UPSERT_BATCH_SIZE):
+            end = start + self.UPSERT_BATCH_SIZE
+            VectorDB.get_instance().upsert_documents(
+                collection=collection,
+                documents=texts[start:end],
+                metadatas=metadatas[start:end],
+                ids=doc_ids[start:end],
+            )
+
+    def delete_documents(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: Optional[list[str]] = None,
+        where: Optional[dict] = None,
+    ) -> None:
+        """ID 목록 또는 메타데이터 조건(where)에 맞는 문서를 삭제합니다."""
+        if not doc_ids and not where:
+            return
+        collection = VectorDB.get_instance().get_or_create_collection(collection_name)
+        collection.delete(ids=doc_ids or None, where=where)
+
+    def get_metadatas(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: Optional[list[str]] = None,
+        where: Optional[dict] = None,
+    ) -> dict[str, dict]:
+        """ID 목록 또는 메타데이터 조건(where)에 맞는 문서의 {id: metadata}를 반환합니다."""
+        if not doc_ids and not where:
+            return {}
+        collection = VectorDB.get_instance().get_or_create_collection(collection_name)
+        result = collection.get(ids=doc_ids or None, where=where, include=["metadatas"])
+        return {
+            doc_id: dict(metadata or {})
+            for doc_id, metadata in zip(result["ids"], result["metadatas"])
+        }
+
+    def update_metadatas(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: list[str],
+        metadatas: list[dict],
+    ) -> None:
+        """
+        문서의 메타데이터만 교체합니다. (문서/임베딩은 그대로, 재임베딩 없음)
+        """
+        if not doc_ids:
+            return
+        collection = VectorDB.get_instance().get_or_create_collection(collection_name)
+        for start in range(0, len(doc_ids), self.UPSERT_BATCH_SIZE):
+            end = start + self.UPSERT_BATCH_SIZE
+            collection.update(ids=doc_ids[start:end], metadatas=metadatas[start:end])
+
     def get_embedding(self, *, collection_name: str, doc_id: str) -> Optional[Any]:
         collection = VectorDB.get_instance().get_or_create_collection(collection_name)
         result = collection.get(ids=[doc_id], include=["embeddings"])
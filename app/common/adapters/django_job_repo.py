@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from job.models import JobPosting
+from job.models import JobPosting, JobPostingChange
 
 
 class DjangoJobPostingRepository:
@@ -12,9 +12,30 @@ class DjangoJobPostingRepository:
         except JobPosting.DoesNotExist:
             return None
 
+    def get_many(self, posting_ids: list[int]) -> list[JobPosting]:
+        return list(
+            JobPosting.objects.filter(posting_id__in=posting_ids).order_by("posting_id")
+        )
+
     def save(
         self, job_posting: JobPosting, *, update_fields: Optional[list[str]] = None
     ) -> JobPosting:
         job_posting.save(update_fields=update_fields)
         job_posting.refresh_from_db()
         return job_posting
+
+    def bulk_update_skills(self, job_postings: list[JobPosting]) -> None:
+        if not job_postings:
+            return
+        JobPosting.objects.bulk_update(
+            job_postings, ["skills_required", "skills_preferred"], batch_size=500
+        )
+        # bulk_update는 save()를 거치지 않으므로 변경 로그를 직접 남깁니다.
+        JobPostingChange.record([jp.posting_id for jp in job_postings])
+
+    def bulk_update_duplicates(self, job_postings: list[JobPosting]) -> None:
+        if not job_postings:
+            return
+        JobPosting.objects.bulk_update(job_postings, ["duplicate_of"], batch_size=500)
+        # bulk_update는 save()를 거치지 않으므로 변경 로그를 직접 남깁니다.
+        JobPostingChange.record([jp.posting_id for jp in job_postings])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Q
+from job.domain.minhash import DUPLICATE_THRESHOLD, band_buckets, estimate_similarity
+from job.models import JobPosting, JobPostingLSHBucket, JobPostingSignature
+
+
+class DjangoPostingSignatureStore:
+    """
+    MinHash 서명/LSH 버킷 저장소 어댑터 (Postgres).
+
+    - 후보 조회는 (band, bucket) 인덱스에 대한 밴드 수(16)만큼의 동등 조건 1회 쿼리입니다.
+    - 대표 공고는 클러스터에서 가장 먼저 등록된(created_at이 가장 이른, 같으면 posting_id가
+      작은) 공고입니다. 자신보다 먼저 등록된 공고만 후보로 보므로 duplicate_of 사이에 순환이
+      생기지 않습니다.
+    """
+
+    def __init__(self, *, threshold: float = DUPLICATE_THRESHOLD):
+        self._threshold = threshold
+
+    def save(self, *, posting_id: int, signature: list[int]) -> None:
+        with transaction.atomic():
+            JobPostingSignature.objects.update_or_create(
+                posting_id=posting_id, defaults={"signature": signature}
+            )
+            JobPostingLSHBucket.objects.filter(posting_id=posting_id).delete()
+            JobPostingLSHBucket.objects.bulk_create(
+                [
+                    JobPostingLSHBucket(posting_id=posting_id, band=band, bucket=bucket)
+                    for band, bucket in band_buckets(signature)
+                ]
+            )
+
+    def delete(self, *, posting_id: int) -> None:
+        JobPostingLSHBucket.objects.filter(posting_id=posting_id).delete()
+        JobPostingSignature.objects.filter(posting_id=posting_id).delete()
+
+    def find_canonical(self, *, posting_id: int, signature: list[int]) -> Optional[int]:
+        lookup = reduce(
+            or_,
+            (Q(band=band, bucket=bucket) for band, bucket in band_buckets(signature)),
+        )
+        candidate_ids = set(
+            JobPostingLSHBucket.objects.filter(lookup)
+            .exclude(posting_id=posting_id)
+            .values_list("posting_id", flat=True)
+            .distinct()
+        )
+        if not candidate_ids:
+            return None
+        created_at = (
+            JobPosting.objects.filter(posting_id=posting_id)
+            .values_list("created_at", flat=True)
+            .first()
+        )
+        # 삭제된 공고의 서명이 남아 있을 수 있으므로 존재하는 공고만 후보로 둡니다.
+        candidates = JobPosting.objects.filter(posting_id__in=candidate_ids)
+        if created_at is None:
+            candidates = candidates.filter(posting_id__lt=posting_id)
+        else:
+            candidates = candidates.filter(
+                Q(created_at__lt=created_at)
+                | Q(created_at=created_at, posting_id__lt=posting_id)
+            )
+        canonical_by_id = {
+            candidate_id: (duplicate_of_id, (candidate_created_at, candidate_id))
+            for candidate_id, duplicate_of_id, candidate_created_at in (
+                candidates.values_list("posting_id", "duplicate_of_id", "created_at")
+            )
+        }
+        if not canonical_by_id:
+            return None
+
+        # 버킷 충돌(false positive)은 서명 일치율로 걸러냅니다. (같은 점수면 먼저 등록된 공고)
+        best_id, best_score = None, 0.0
+        for candidate_id, candidate_signature in JobPostingSignature.objects.filter(
+            posting_id__in=canonical_by_id.keys()
+        ).values_list("posting_id", "signature"):
+            score = estimate_similarity(signature, candidate_signature)
+            if score >= self._threshold and (
+                score > best_score
+                or (
+                    score == best_score
+                    and canonical_by_id[candidate_id][1] < canonical_by_id[best_id][1]
+                )
+            ):
+                best_id, best_score = candidate_id, score
+        if best_id is None:
+            return None
+        return canonical_by_id[best_id][0] or best_id
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from django.db import connection
+from recommendation.application.usecases.generate_recommendations import (
+    GenerateRecommendationsUseCase,
+)
+from recommendation.models import JobRecommendation
+from resume.models import Resume
+
+
+class DjangoRecommendationBatchRepository:
+    """
+    야간 추천 배치 어댑터 (Django ORM).
+
+    추천 생성/저장은 실시간 추천과 같은 `RecommendationService.generate_recommendations`
+    (입력 fingerprint 재사용, append-only 세트 저장, 스냅샷 갱신)를 쓰고, 추천 유스케이스
+    하나(공고 특징 캐시, LLM semaphore 포함)를 모든 worker가 공유합니다.
+    """
+
+    def __init__(self, *, usecase: GenerateRecommendationsUseCase, limit: int):
+        self._usecase = usecase
+        self._limit = limit
+
+    def list_targets(self) -> list[tuple[int, int]]:
+        return list(
+            Resume.objects.filter(is_primary=True)
+            .order_by("id")
+            .values_list("id", "user_id")
+        )
+
+    def generate_recommendations(self, resume_id: int) -> list[JobRecommendation]:
+        # services -> container -> 이 모듈 순서로 import되므로 호출 시점에 가져옵니다.
+        from recommendation.services import RecommendationService
+
+        return RecommendationService.generate_recommendations(
+            resume_id, limit=self._limit, usecase=self._usecase
+        )
+
+    def release_thread_resources(self) -> None:
+        # worker 스레드마다 열린 DB 연결은 스레드가 끝나도 자동으로 닫히지 않습니다.
+        connection.close()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+from job.models import JobPosting
+from skill.models import SkillStat
+
+WINDOW_7D = timedelta(days=7)
+WINDOW_30D = timedelta(days=30)
+TOP_N = 10
+
+
+class DjangoSkillStatRepository:
+    """
+    `SkillStat` 테이블(materialized 스킬 통계) 어댑터.
+
+    - 공고의 필수 스킬이 바뀔 때마다 diff(added/removed)만 F() 표현식으로 반영합니다.
+    - Top-N 조회는 (-required_count) 인덱스 스캔으로 처리됩니다.
+    """
+
+    def apply_posting_change(
+        self,
+        *,
+        added: Iterable[str],
+        removed: Iterable[str],
+        posted_at: Optional[datetime] = None,
+    ) -> None:
+        added = sorted({s for s in added if s})
+        removed = sorted({s for s in removed if s})
+        if not added and not removed:
+            return
+
+        now = timezone.now()
+        in_7d = posted_at is not None and posted_at >= now - WINDOW_7D
+        in_30d = posted_at is not None and posted_at >= now - WINDOW_30D
+
+        with transaction.atomic():
+            if added:
+                SkillStat.objects.bulk_create(
+                    [SkillStat(skill_name=s) for s in added], ignore_conflicts=True
+                )
+                updates = {"required_count": F("required_count") + 1}
+                if in_7d:
+                    updates["count_7d"] = F("count_7d") + 1
+                if in_30d:
+                    updates["count_30d"] = F("count_30d") + 1
+                if posted_at is not None:
+                    updates["last_seen"] = Greatest(
+                        Coalesce(F("last_seen"), Value(posted_at)), Value(posted_at)
+                    )
+                SkillStat.objects.filter(skill_name__in=added).update(**updates)
+
+            if removed:
+                updates = {"required_count": Greatest(F("required_count") - 1, 0)}
+                if in_7d:
+                    updates["count_7d"] = Greatest(F("count_7d") - 1, 0)
+                if in_30d:
+                    updates["count_30d"] = Greatest(F("count_30d") - 1, 0)
+                SkillStat.objects.filter(skill_name__in=removed).update(**updates)
+
+    def rebuild(self) -> int:
+        """
+        JobPosting.skills_required 전체를 다시 집계합니다. (7/30일 윈도우 재계산 포함)
+
+        Returns:
+            집계된 스킬 수
+        """
+        now = timezone.now()
+        required: Counter[str] = Counter()
+        recent_7d: Counter[str] = Counter()
+        recent_30d: Counter[str] = Counter()
+        last_seen: dict[str, datetime] = {}
+
+        rows = (
+            JobPosting.objects.exclude(skills_required__isnull=True)
+            .values_list("skills_required", "created_at")
+            .iterator(chunk_size=2000)
+        )
+        for skills, created_at in rows:
+            if not isinstance(skills, list):
+                continue
+            for skill in set(skills):
+                if not skill:
+                    continue
+                required[skill] += 1
+                if created_at is None:
+                    continue
+                if created_at >= now - WINDOW_7D:
+                    recent_7d[skill] += 1
+                if created_at >= now - WINDOW_30D:
+                    recent_30d[skill] += 1
+                if skill not in last_seen or created_at > last_seen[skill]:
+                    last_seen[skill] = created_at
+
+        with transaction.atomic():
+            SkillStat.objects.all().delete()
+            SkillStat.objects.bulk_create(
+                [
+                    SkillStat(
+                        skill_name=skill,
+                        required_count=count,
+                        count_7d=recent_7d.get(skill, 0),
+                        count_30d=recent_30d.get(skill, 0),
+                        last_seen=last_seen.get(skill),
+                    )
+                    for skill, count in required.items()
+                ],
+                batch_size=500,
+            )
+        return len(required)
+
+    def has_data(self) -> bool:
+        return SkillStat.objects.exists()
+
+    def get_statistics(self, *, skill_name: str | None = None) -> dict:
+        if skill_name:
+            stat = SkillStat.objects.filter(skill_name=skill_name).first()
+            if not stat:
+                return {
+                    "skill_name": skill_name,
+                    "required_count": 0,
+                    "preferred_count": 0,
+                    "total_count": 0,
+                    "count_7d": 0,
+                    "count_30d": 0,
+                    "last_seen": None,
+                }
+            return {
+                "skill_name": stat.skill_name,
+                "required_count": stat.required_count,
+                "preferred_count": 0,
+                "total_count": stat.required_count,
+                "count_7d": stat.count_7d,
+                "count_30d": stat.count_30d,
+                "last_seen": stat.last_seen,
+            }
+
+        top = SkillStat.objects.filter(required_count__gt=0).order_by(
+            "-required_count", "skill_name"
+        )
+        return {
+            "total_skills": top.count(),
+            "most_required_skills": [
+                {
+                    "skill": row["skill_name"],
+                    "count": row["required_count"],
+                    "count_7d": row["count_7d"],
+                    "count_30d": row["count_30d"],
+                }
+                for row in top.values(
+                    "skill_name", "required_count", "count_7d", "count_30d"
+                )[:TOP_N]
+            ],
+        }
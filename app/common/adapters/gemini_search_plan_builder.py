@@ -163,6 +163,9 @@ JSON 스키마(예시):
             "scoring_rubric": rubric,
         }
 
+    def build_fallback_plan(self, *, resume: Resume) -> dict:
+        return self._fallback_plan(resume=resume)
+
     def _fallback_plan(self, *, resume: Resume) -> dict:
         analysis_result = (
             resume.analysis_result if isinstance(resume.analysis_result, dict) else {}
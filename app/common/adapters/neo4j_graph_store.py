@@ -2,12 +2,25 @@ from __future__ import annotations
 
 from common.graph_db import GraphDBClient
 
+REQUIRED_SKILLS_QUERY = """
+MATCH (jp:JobPosting {posting_id: $posting_id})-[:REQUIRES_SKILL]->(skill:Skill)
+RETURN skill.name AS skill_name
+"""
+
+POSTINGS_BY_SKILLS_QUERY = """
+MATCH (jp:JobPosting)-[:REQUIRES_SKILL]->(skill:Skill)
+WHERE skill.name IN $user_skills
+RETURN jp.posting_id AS posting_id, count(skill) as match_count
+ORDER BY match_count DESC, jp.posting_id DESC
+LIMIT $limit
+"""
+
 
 class Neo4jGraphStore:
     """
     Neo4j(Graph DB) 어댑터.
 
-    - 내부적으로는 기존 `common.graph_db.graph_db_client`를 그대로 사용합니다.
+    - 내부적으로는 `common.graph_db.GraphDBClient`(연결 풀 싱글톤)를 사용합니다.
     """
 
     def upsert_job_posting(
@@ -27,34 +40,37 @@ class Neo4jGraphStore:
             skills=skills_required,
         )
 
-    def get_required_skills(self, *, posting_id: int) -> set[str]:
-        query = """
-        MATCH (jp:JobPosting {posting_id: $posting_id})-[:REQUIRES_SKILL]->(skill:Skill)
-        RETURN skill.name AS skill_name
+    def upsert_job_postings(self, *, postings: list[dict]) -> None:
+        """
+        여러 공고를 UNWIND 한 번으로 업서트합니다.
+
+        Args:
+            postings: [{"posting_id", "position", "company_name", "skills_required"}]
         """
-        result = GraphDBClient.get_instance().execute_query(
-            query, {"posting_id": posting_id}
+        rows = [p for p in postings if p.get("skills_required")]
+        if not rows:
+            return
+        GraphDBClient.get_instance().add_job_postings(rows)
+
+    def get_required_skills(self, *, posting_id: int) -> set[str]:
+        return set(
+            GraphDBClient.get_instance().execute_read(
+                REQUIRED_SKILLS_QUERY,
+                {"posting_id": posting_id},
+                mapper=lambda record: record["skill_name"],
+            )
         )
-        return {record["skill_name"] for record in result} if result else set()
 
     def get_postings_by_skills(
         self, *, user_skills: set[str], limit: int = 50
     ) -> list[int]:
         if not user_skills:
             return []
-        query = """
-        MATCH (jp:JobPosting)-[:REQUIRES_SKILL]->(skill:Skill)
-        WHERE skill.name IN $user_skills
-        RETURN jp.posting_id AS posting_id, count(skill) as match_count
-        ORDER BY match_count DESC, jp.posting_id DESC
-        LIMIT $limit
-        """
-        result = GraphDBClient.get_instance().execute_query(
-            query, {"user_skills": list(user_skills), "limit": limit}
+        return GraphDBClient.get_instance().execute_read(
+            POSTINGS_BY_SKILLS_QUERY,
+            {"user_skills": list(user_skills), "limit": limit},
+            mapper=lambda record: record["posting_id"],
         )
-        if not result:
-            return []
-        return [record["posting_id"] for record in result if "posting_id" in record]
 
     def get_skill_statistics(self, *, skill_name: str | None = None) -> dict:
         return GraphDBClient.get_instance().get_skill_statistics(skill_name)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from common.ports.graph_store import GraphStorePort
+from common.skill_index import SkillBitmapIndex
+
+
+class SkillIndexGraphStore:
+    """
+    In-process 스킬 비트맵 인덱스 기반 GraphStorePort 구현.
+
+    - 읽기(get_postings_by_skills / get_required_skills)는 `SkillBitmapIndex`에서 처리합니다.
+    - 쓰기/통계는 기존 그래프 저장소(fallback, 보통 Neo4jGraphStore)에 위임합니다.
+      인덱스는 `JobPostingChange` 변경 로그를 통해 스스로 갱신됩니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        fallback: GraphStorePort,
+        index: SkillBitmapIndex | None = None,
+    ):
+        self._fallback = fallback
+        self._index = index
+
+    def _get_index(self) -> SkillBitmapIndex:
+        index = self._index or SkillBitmapIndex.get_instance()
+        index.ensure_fresh()
+        return index
+
+    def upsert_job_posting(
+        self,
+        *,
+        posting_id: int,
+        position: str,
+        company_name: str,
+        skills_required: list[str],
+    ) -> None:
+        self._fallback.upsert_job_posting(
+            posting_id=posting_id,
+            position=position,
+            company_name=company_name,
+            skills_required=skills_required,
+        )
+
+    def upsert_job_postings(self, *, postings: list[dict]) -> None:
+        self._fallback.upsert_job_postings(postings=postings)
+
+    def get_required_skills(self, *, posting_id: int) -> set[str]:
+        return self._get_index().get_required_skills(posting_id=posting_id)
+
+    def get_postings_by_skills(
+        self, *, user_skills: set[str], limit: int = 50
+    ) -> list[int]:
+        if not user_skills:
+            return []
+        return self._get_index().get_postings_by_skills(
+            user_skills=user_skills, limit=limit
+        )
+
+    def get_skill_statistics(self, *, skill_name: str | None = None) -> dict:
+        return self._fallback.get_skill_statistics(skill_name=skill_name)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class SlackWebhookNotifier:
+    """
+    Slack Incoming Webhook 기반 NotifierPort 구현.
+
+    - queue()로 모은 메시지를 flush() 시 max_chars 이하 묶음으로 합쳐 보냅니다.
+      (사용자마다 한 번씩 보내던 요청 수를 묶음 수로 줄입니다.)
+    - 요청 사이에는 min_interval_seconds 간격을 두고, 429 응답이면 Retry-After 만큼 기다린 뒤
+      한 번 재시도합니다. (webhook 권장 속도: 초당 1건)
+    """
+
+    def __init__(
+        self,
+        *,
+        webhook_url: Optional[str],
+        min_interval_seconds: float = 1.0,
+        max_chars: int = 3500,
+        timeout: float = 10,
+    ):
+        self._webhook_url = webhook_url
+        self._min_interval_seconds = min_interval_seconds
+        self._max_chars = max_chars
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._last_sent_at = 0.0
+
+    def queue(self, text: str) -> None:
+        if text:
+            with self._lock:
+                self._pending.append(text)
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        sent = 0
+        for chunk in self._pack(pending):
+            if self._post(chunk):
+                sent += 1
+        return sent
+
+    def _pack(self, messages: list[str]) -> list[str]:
+        chunks: list[str] = []
+        current: list[str] = []
+        size = 0
+        for message in messages:
+            extra = len(message) + (2 if current else 0)
+            if current and size + extra > self._max_chars:
+                chunks.append("\n\n".join(current))
+                current, size = [], 0
+                extra = len(message)
+            current.append(message)
+            size += extra
+        if current:
+            chunks.append("\n\n".join(current))
+        return chunks
+
+    def _wait_for_slot(self) -> None:
+        wait = self._min_interval_seconds - (time.monotonic() - self._last_sent_at)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _post(self, text: str) -> bool:
+        if not self._webhook_url:
+            logger.warning(
+                f"SLACK_WEBHOOK_URL이 설정되지 않아 메시지를 전송하지 않습니다: {text[:200]}"
+            )
+            return False
+
+        for attempt in range(2):
+            self._wait_for_slot()
+            try:
+                response = requests.post(
+                    self._webhook_url, json={"text": text}, timeout=self._timeout
+                )
+            except requests.RequestException as e:
+                logger.error(f"Slack 메시지 전송 실패: {e}")
+                return False
+            finally:
+                self._last_sent_at = time.monotonic()
+
+            if response.status_code == 429 and attempt == 0:
+                retry_after = float(response.headers.get("Retry-After", "1") or 1)
+                time.sleep(retry_after)
+                continue
+            if response.status_code >= 400:
+                logger.error(
+                    f"Slack 메시지 전송 실패: HTTP {response.status_code} {response.text[:200]}"
+                )
+                return False
+            return True
+        return False
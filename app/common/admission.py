@@ -0,0 +1,198 @@
+"""
+요청 수락 제어(admission control).
+
+gunicorn worker 스레드 수는 한정되어 있습니다(workers × threads). LLM을 쓰는 느린 요청이 스레드를 모두
+차지하면 공고 목록/health check 같은 가벼운 요청까지 밀리므로, 비싼 엔드포인트에만 다음을 적용합니다.
+
+- `AdmissionController`: 동시 실행 수를 max_concurrent로 제한합니다. 자리가 없으면 최대 max_queue개까지
+  도착 순서대로 queue_timeout 동안 기다리고, 대기열이 가득 찼거나 시간 안에 자리가 나지 않으면
+  기다리지 않고 거절(`AdmissionRejected`)합니다.
+- `TokenBucket`: 키(사용자)별 요청 속도를 제한합니다.
+
+대기 중인 요청도 스레드를 점유하므로 max_concurrent + max_queue는 worker 스레드 수보다 작게 둡니다.
+상태는 프로세스(worker)별입니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Hashable, Iterator
+
+
+class AdmissionRejected(Exception):
+    """동시 실행 자리를 얻지 못했습니다. (reason: queue_full | queue_timeout)"""
+
+    def __init__(self, reason: str, *, retry_after_seconds: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        retry_after_seconds: float,
+        wait_samples: int = 512,
+    ):
+        self.name = name
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._max_queue = max(0, int(max_queue))
+        self._queue_timeout_seconds = max(0.0, float(queue_timeout_seconds))
+        self._retry_after_seconds = retry_after_seconds
+        self._cond = threading.Condition()
+        self._active = 0
+        self._queue: deque[object] = deque()
+        # 최근 수락된 요청의 대기 시간(초) 표본
+        self._waits: deque[float] = deque(maxlen=wait_samples)
+        self._counters = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_timeout": 0,
+        }
+
+    @contextmanager
+    def admit(self) -> Iterator[float]:
+        """
+        실행 자리를 얻을 때까지(최대 queue_timeout) 기다린 뒤 블록을 실행합니다.
+
+        Yields:
+            대기한 시간(초)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 시간 안에 자리가 나지 않은 경우
+        """
+        waited = self._acquire()
+        try:
+            yield waited
+        finally:
+            self._release()
+
+    def _acquire(self) -> float:
+        started = time.monotonic()
+        with self._cond:
+            if self._active < self._max_concurrent and not self._queue:
+                return self._admitted(0.0)
+            if len(self._queue) >= self._max_queue:
+                self._counters["rejected_queue_full"] += 1
+                raise AdmissionRejected(
+                    "queue_full", retry_after_seconds=self._retry_after_seconds
+                )
+
+            ticket = object()
+            self._queue.append(ticket)
+            self._counters["queued"] += 1
+            give_up_at = started + self._queue_timeout_seconds
+            acquired = False
+            try:
+                while True:
+                    if self._queue[0] is ticket and self._active < self._max_concurrent:
+                        acquired = True
+                        break
+                    remaining = give_up_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            finally:
+                self._queue.remove(ticket)
+                # 대기열 맨 앞이 바뀌었으므로 다음 대기자가 다시 확인하도록 깨웁니다.
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            if not acquired:
+                self._counters["rejected_timeout"] += 1
+                raise AdmissionRejected(
+                    "queue_timeout", retry_after_seconds=self._retry_after_seconds
+                )
+            return self._admitted(waited)
+
+    def _admitted(self, waited: float) -> float:
+        self._active += 1
+        self._counters["admitted"] += 1
+        self._waits.append(waited)
+        return waited
+
+    def _release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def get_stats(self) -> dict:
+        """현재 실행/대기 수, 누적 수락·거절 수, 최근 대기 시간 분포(초)"""
+        with self._cond:
+            waits = sorted(self._waits)
+            stats = {
+                "name": self.name,
+                "max_concurrent": self._max_concurrent,
+                "max_queue": self._max_queue,
+                "queue_timeout_seconds": self._queue_timeout_seconds,
+                "active": self._active,
+                "waiting": len(self._queue),
+                **{f"{key}_total": value for key, value in self._counters.items()},
+            }
+        stats["queue_wait_seconds"] = {
+            "samples": len(waits),
+            "p50": round(_percentile(waits, 0.50), 4),
+            "p95": round(_percentile(waits, 0.95), 4),
+            "max": round(waits[-1], 4) if waits else 0.0,
+        }
+        return stats
+
+
+class TokenBucket:
+    """
+    키별 token bucket (rate_per_second 속도로 채워지고 최대 burst개까지 쌓임)
+
+    오래 쓰지 않은 키는 max_keys를 넘으면 버립니다. (가득 찬 버킷과 같음)
+    """
+
+    def __init__(self, *, max_keys: int = 10000):
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        # key -> (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._limited = 0
+
+    def consume(self, key: Hashable, *, rate_per_second: float, burst: int) -> float:
+        """
+        토큰 1개를 사용합니다. (rate_per_second <= 0 이면 제한 없음)
+
+        Returns:
+            허용되면 0.0, 아니면 다음 토큰까지 남은 시간(초)
+        """
+        if rate_per_second <= 0:
+            return 0.0
+        capacity = float(max(1, burst))
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate_per_second)
+            if tokens >= 1.0:
+                tokens -= 1.0
+                retry_after = 0.0
+            else:
+                retry_after = (1.0 - tokens) / rate_per_second
+                self._limited += 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self._max_keys:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"tracked_keys": len(self._buckets), "limited_total": self._limited}
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, AsyncIterator, Optional
+
+from common.graph_db import GraphDBClient, RecordMapper, driver_options
+from django.conf import settings
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase
+
+
+class AsyncGraphDBClient:
+    """
+    Neo4j async 클라이언트 (`neo4j.AsyncGraphDatabase`).
+
+    async 드라이버는 생성된 이벤트 루프에 묶이므로 루프마다 인스턴스를 하나씩 둡니다.
+    (루프가 사라지면 인스턴스도 함께 정리됩니다.)
+    """
+
+    _instances: (
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGraphDBClient]"
+    ) = weakref.WeakKeyDictionary()
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self, uri, user, password, *, database: Optional[str] = None, **options
+    ):
+        self._database = database
+        self._driver = AsyncGraphDatabase.driver(uri, auth=(user, password), **options)
+
+    @classmethod
+    def get_instance(cls) -> "AsyncGraphDBClient":
+        loop = asyncio.get_running_loop()
+        with cls._instances_lock:
+            instance = cls._instances.get(loop)
+            if instance is None:
+                instance = AsyncGraphDBClient(
+                    uri=settings.NEO4J_URI,
+                    user=settings.NEO4J_USER,
+                    password=settings.NEO4J_PASSWORD,
+                    database=settings.NEO4J_DATABASE,
+                    **driver_options(),
+                )
+                cls._instances[loop] = instance
+        return instance
+
+    async def close(self) -> None:
+        await self._driver.close()
+
+    async def verify_connectivity(self) -> None:
+        await self._driver.verify_connectivity()
+
+    def _session(self, access_mode: str, **kwargs):
+        return self._driver.session(
+            database=self._database, default_access_mode=access_mode, **kwargs
+        )
+
+    async def execute_read(
+        self, query, parameters=None, *, mapper: Optional[RecordMapper] = None
+    ) -> list:
+        async def _work(tx):
+            result = await tx.run(query, parameters or {})
+            if mapper is None:
+                return [record async for record in result]
+            return [mapper(record) async for record in result]
+
+        async with self._session(READ_ACCESS) as session:
+            return await session.execute_read(_work)
+
+    async def execute_write(
+        self, query, parameters=None, *, mapper: Optional[RecordMapper] = None
+    ) -> list:
+        async def _work(tx):
+            result = await tx.run(query, parameters or {})
+            if mapper is None:
+                return [record async for record in result]
+            return [mapper(record) async for record in result]
+
+        async with self._session(WRITE_ACCESS) as session:
+            return await session.execute_write(_work)
+
+    async def stream(
+        self,
+        query,
+        parameters=None,
+        *,
+        mapper: Optional[RecordMapper] = None,
+        fetch_size: int = 1000,
+    ) -> AsyncIterator[Any]:
+        async with self._session(READ_ACCESS, fetch_size=fetch_size) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield mapper(record) if mapper else record
+
+    async def add_job_posting(self, posting_id, position, company_name, skills):
+        await self.execute_write(
+            GraphDBClient.UPSERT_JOB_POSTING_QUERY,
+            {
+                "posting_id": posting_id,
+                "position": position,
+                "company_name": company_name,
+                "skills": list(skills),
+            },
+        )
+
+    async def add_job_postings(self, postings: list[dict], *, batch_size: int = 500):
+        for start in range(0, len(postings), batch_size):
+            await self.execute_write(
+                GraphDBClient.UPSERT_JOB_POSTINGS_QUERY,
+                {
+                    "rows": GraphDBClient.to_upsert_rows(
+                        postings[start : start + batch_size]
+                    )
+                },
+            )
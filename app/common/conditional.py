@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts: object) -> str:
+    """
+    응답 내용을 결정하는 값들로부터 (strong) ETag를 만듭니다.
+    """
+    digest = hashlib.sha1(
+        "|".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return quote_etag(digest)
+
+
+def queryset_validators(
+    queryset: QuerySet, *, field: str = "updated_at"
+) -> tuple[Optional[datetime], int]:
+    """
+    (Max(field), Count) 를 한 번의 집계 쿼리로 계산합니다.
+
+    행이 추가/삭제되면 count가, 수정되면 max가 바뀌므로 ETag 재료로 사용합니다.
+    """
+    row = queryset.order_by().aggregate(last_modified=Max(field), count=Count("pk"))
+    return row["last_modified"], row["count"]
+
+
+def check_not_modified(
+    request: HttpRequest,
+    *,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    max_age: Optional[int] = None,
+    public: bool = True,
+) -> Optional[HttpResponse]:
+    """
+    If-None-Match / If-Modified-Since 가 일치하면 304 응답을 반환합니다. (아니면 None)
+
+    본문을 만들기 전에 호출해야 재요청 비용(직렬화/쿼리)을 아낄 수 있습니다.
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        apply_validators(
+            response,
+            etag=etag,
+            last_modified=last_modified,
+            max_age=max_age,
+            public=public,
+        )
+    return response
+
+
+def apply_validators(
+    response: HttpResponse,
+    *,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    max_age: Optional[int] = None,
+    public: bool = True,
+) -> HttpResponse:
+    """
+    ETag / Last-Modified / Cache-Control 헤더를 설정합니다.
+
+    - public: 공유 캐시(nginx/CDN)가 max_age 동안 저장할 수 있습니다.
+    - private(인증 필요 응답): 공유 캐시 저장 금지, 클라이언트는 매번 ETag로 재검증합니다.
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    if not public:
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+    if max_age is None:
+        max_age = int(getattr(settings, "PUBLIC_API_CACHE_MAX_AGE_SECONDS", 60))
+    patch_cache_control(response, public=True, max_age=max_age)
+    return response
@@ -0,0 +1,96 @@
+"""
+요청 단위 시간 예산(deadline).
+
+느린 외부 호출(LLM/Chroma/Neo4j) 하나가 요청 전체를 gunicorn timeout까지 끌지 않도록,
+요청 시작 시 예산을 정하고 단계마다 남은 시간 안에서만 기다립니다.
+
+- 시간 안에 끝나지 않은 호출은 끊을 수 없으므로(스레드) 결과만 버리고 다음 단계로 넘어갑니다.
+- 건너뛰거나 결과를 버린 단계는 `mark_degraded()`로 기록해 응답에 알립니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(Exception):
+    """남은 시간 안에 호출이 끝나지 않았습니다."""
+
+
+class Deadline:
+    def __init__(
+        self,
+        budget_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget_seconds = max(0.0, float(budget_seconds))
+        self._clock = clock
+        self._expires_at = clock() + self.budget_seconds
+        self._lock = threading.Lock()
+        self._degraded: list[str] = []
+
+    @classmethod
+    def from_budget_ms(cls, budget_ms: int) -> "Deadline":
+        return cls(budget_ms / 1000.0)
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def slice(self, fraction: float, *, reserve: float = 0.0) -> float:
+        """
+        단계에 줄 시간(초): 전체 예산의 fraction 만큼, 단 남은 시간 - reserve 를 넘지 않음
+        """
+        return max(0.0, min(self.budget_seconds * fraction, self.remaining() - reserve))
+
+    def mark_degraded(self, stage: str) -> None:
+        with self._lock:
+            if stage not in self._degraded:
+                self._degraded.append(stage)
+
+    @property
+    def degraded(self) -> list[str]:
+        with self._lock:
+            return list(self._degraded)
+
+
+def _close_thread_connections() -> None:
+    # worker 스레드가 연 DB 연결은 스레드가 끝나도 자동으로 닫히지 않습니다.
+    from django.db import connections
+
+    connections.close_all()
+
+
+def run_with_timeout(
+    fn: Callable[[], T], *, timeout: float, name: Optional[str] = None
+) -> T:
+    """
+    fn을 별도 스레드에서 실행하고 최대 timeout 초 기다립니다.
+
+    Raises:
+        DeadlineExceeded: timeout 안에 끝나지 않은 경우 (실행 중인 호출의 결과는 버려집니다)
+    """
+
+    def _run() -> T:
+        try:
+            return fn()
+        finally:
+            _close_thread_connections()
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name or "deadline")
+    future = executor.submit(_run)
+    try:
+        return future.result(timeout=max(0.0, timeout))
+    except FutureTimeoutError as e:
+        raise DeadlineExceeded(f"{name or 'call'} exceeded {timeout:.3f}s") from e
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,33 +1,128 @@
+import threading
 from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional
 
 from django.conf import settings
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, GraphDatabase, Record
+
+# 레코드 → 값 변환 함수. 결과를 Record 리스트로 쌓지 않고 읽으면서 바로 변환합니다.
+RecordMapper = Callable[[Record], Any]
+
+
+def driver_options() -> dict:
+    """
+    Neo4j 드라이버 연결 풀 옵션 (sync/async 드라이버 공통)
+    """
+    return {
+        "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        "liveness_check_timeout": settings.NEO4J_LIVENESS_CHECK_TIMEOUT,
+    }
 
 
 class GraphDBClient:
-    def __init__(self, uri, user, password):
-        self._driver = GraphDatabase.driver(uri, auth=(user, password))
+    """
+    Neo4j 클라이언트 (프로세스 단위 싱글톤).
+
+    - 드라이버 하나가 연결 풀을 소유하며, 세션은 호출마다 풀에서 연결을 빌려옵니다.
+    - 읽기/쓰기는 `execute_read`/`execute_write`(managed transaction, 재시도 포함)로 라우팅합니다.
+    - 대량 결과는 `stream()`으로 레코드를 하나씩 소비합니다.
+    """
+
+    _instance: Optional["GraphDBClient"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self, uri, user, password, *, database: Optional[str] = None, **options
+    ):
+        self._database = database
+        self._driver = GraphDatabase.driver(uri, auth=(user, password), **options)
 
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
-            cls._instance = GraphDBClient(
-                uri=settings.NEO4J_URI,
-                user=settings.NEO4J_USER,
-                password=settings.NEO4J_PASSWORD,
-            )
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = GraphDBClient(
+                        uri=settings.NEO4J_URI,
+                        user=settings.NEO4J_USER,
+                        password=settings.NEO4J_PASSWORD,
+                        database=settings.NEO4J_DATABASE,
+                        **driver_options(),
+                    )
         return cls._instance
 
     def close(self):
         self._driver.close()
 
+    def verify_connectivity(self) -> None:
+        self._driver.verify_connectivity()
+
+    def _session(self, access_mode: str, **kwargs):
+        return self._driver.session(
+            database=self._database, default_access_mode=access_mode, **kwargs
+        )
+
+    def execute_read(
+        self, query, parameters=None, *, mapper: Optional[RecordMapper] = None
+    ) -> list:
+        """
+        읽기 트랜잭션으로 쿼리를 실행합니다. (클러스터에서는 reader로 라우팅)
+
+        Args:
+            mapper: 레코드별 변환 함수 (None이면 Record 그대로 반환)
+        """
+
+        def _work(tx):
+            result = tx.run(query, parameters or {})
+            if mapper is None:
+                return list(result)
+            return [mapper(record) for record in result]
+
+        with self._session(READ_ACCESS) as session:
+            return session.execute_read(_work)
+
+    def execute_write(
+        self, query, parameters=None, *, mapper: Optional[RecordMapper] = None
+    ) -> list:
+        """
+        쓰기 트랜잭션으로 쿼리를 실행합니다. (클러스터에서는 leader로 라우팅)
+        """
+
+        def _work(tx):
+            result = tx.run(query, parameters or {})
+            if mapper is None:
+                return list(result)
+            return [mapper(record) for record in result]
+
+        with self._session(WRITE_ACCESS) as session:
+            return session.execute_write(_work)
+
+    def stream(
+        self,
+        query,
+        parameters=None,
+        *,
+        mapper: Optional[RecordMapper] = None,
+        fetch_size: int = 1000,
+    ) -> Iterator[Any]:
+        """
+        읽기 쿼리 결과를 fetch_size 단위로 받아오며 하나씩 yield 합니다.
+
+        제너레이터를 끝까지 소비(또는 close)해야 세션이 풀로 반환됩니다.
+        """
+        with self._session(READ_ACCESS, fetch_size=fetch_size) as session:
+            for record in session.run(query, parameters or {}):
+                yield mapper(record) if mapper else record
+
     def execute_query(self, query, parameters=None):
-        with self._driver.session() as session:
-            result = session.run(query, parameters)
-            return [record for record in result]
+        """
+        [Backward Compatibility] 읽기 쿼리 실행. `execute_read`를 사용합니다.
+        """
+        return self.execute_read(query, parameters)
 
     def add_job_posting(self, posting_id, position, company_name, skills):
-        with self._driver.session() as session:
+        with self._session(WRITE_ACCESS) as session:
             session.execute_write(
                 self._create_job_posting_and_relations,
                 posting_id,
@@ -36,39 +131,66 @@ class GraphDBClient:
                 skills,
             )
 
+    def add_job_postings(self, postings: list[dict], *, batch_size: int = 500):
+        """
+        여러 공고를 UNWIND 쿼리로 batch_size 단위 업서트합니다.
+
+        Args:
+            postings: [{"posting_id", "position", "company_name", "skills_required"}]
+        """
+        for start in range(0, len(postings), batch_size):
+            self.execute_write(
+                self.UPSERT_JOB_POSTINGS_QUERY,
+                {"rows": self.to_upsert_rows(postings[start : start + batch_size])},
+            )
+
+    @staticmethod
+    def to_upsert_rows(postings: list[dict]) -> list[dict]:
+        return [
+            {
+                "posting_id": p["posting_id"],
+                "position": p["position"],
+                "company_name": p["company_name"],
+                "skills": list(p["skills_required"]),
+            }
+            for p in postings
+        ]
+
+    UPSERT_JOB_POSTINGS_QUERY = """
+    UNWIND $rows AS row
+    MERGE (c:Company {name: row.company_name})
+    MERGE (j:JobPosting {posting_id: row.posting_id})
+    ON CREATE SET j.position = row.position
+    MERGE (j)-[:POSTED_BY]->(c)
+    WITH j, row
+    UNWIND row.skills AS skill
+    MERGE (s:Skill {name: skill})
+    MERGE (j)-[:REQUIRES_SKILL]->(s)
+    """
+
+    # 공고/회사/스킬 관계를 한 번의 왕복으로 MERGE 합니다. (sync/async 공통)
+    UPSERT_JOB_POSTING_QUERY = """
+    MERGE (c:Company {name: $company_name})
+    MERGE (j:JobPosting {posting_id: $posting_id})
+    ON CREATE SET j.position = $position
+    MERGE (j)-[:POSTED_BY]->(c)
+    WITH j
+    UNWIND $skills AS skill
+    MERGE (s:Skill {name: skill})
+    MERGE (j)-[:REQUIRES_SKILL]->(s)
+    """
+
     @staticmethod
     def _create_job_posting_and_relations(
         tx, posting_id, position, company_name, skills
     ):
-        # Create or merge company
-        tx.run("MERGE (c:Company {name: $company_name})", company_name=company_name)
-
-        # Create or merge job posting and link to company
         tx.run(
-            """
-            MERGE (j:JobPosting {posting_id: $posting_id})
-            ON CREATE SET j.position = $position
-            WITH j
-            MATCH (c:Company {name: $company_name})
-            MERGE (j)-[:POSTED_BY]->(c)
-            """,
+            GraphDBClient.UPSERT_JOB_POSTING_QUERY,
             posting_id=posting_id,
             position=position,
             company_name=company_name,
-        )
-
-        # Create or merge skills and link to job posting
-        for skill in skills:
-            tx.run(
-                """
-                MERGE (s:Skill {name: $skill})
-                WITH s
-                MATCH (j:JobPosting {posting_id: $posting_id})
-                MERGE (j)-[:REQUIRES_SKILL]->(s)
-                """,
-                skill=skill,
-                posting_id=posting_id,
-            )
+            skills=list(skills),
+        ).consume()
 
     def get_jobs_related_to_skill(self, skill_name: str, limit: int = 10) -> list[int]:
         """
@@ -84,9 +206,11 @@ class GraphDBClient:
         RETURN DISTINCT related_job.posting_id AS posting_id
         LIMIT $limit
         """
-        with self._driver.session() as session:
-            result = session.run(query, skill_name=skill_name, limit=limit)
-            return [record["posting_id"] for record in result]
+        return self.execute_read(
+            query,
+            {"skill_name": skill_name, "limit": limit},
+            mapper=lambda record: record["posting_id"],
+        )
 
     def filter_postings_by_skills(
         self, posting_ids: list[int], user_skills: list[str], limit: int = 20
@@ -123,20 +247,17 @@ class GraphDBClient:
         LIMIT $limit
         """
 
-        with self._driver.session() as session:
-            result = session.run(
-                query, posting_ids=posting_ids, user_skills=user_skills, limit=limit
-            )
-            return [
-                {
-                    "posting_id": record["posting_id"],
-                    "matched_skills": record["matched_skills"],
-                    "matched_skill_names": record["matched_skill_names"],
-                    "total_skills": record["total_skills"],
-                    "match_ratio": record["match_ratio"],
-                }
-                for record in result
-            ]
+        return self.execute_read(
+            query,
+            {"posting_ids": posting_ids, "user_skills": user_skills, "limit": limit},
+            mapper=lambda record: {
+                "posting_id": record["posting_id"],
+                "matched_skills": record["matched_skills"],
+                "matched_skill_names": record["matched_skill_names"],
+                "total_skills": record["total_skills"],
+                "match_ratio": record["match_ratio"],
+            },
+        )
 
     @lru_cache(maxsize=1)
     def get_all_skills(self) -> list[str]:
@@ -153,9 +274,7 @@ class GraphDBClient:
         ORDER BY s.name
         """
 
-        with self._driver.session() as session:
-            result = session.run(query)
-            return [record["skill_name"] for record in result]
+        return list(self.stream(query, mapper=lambda record: record["skill_name"]))
 
     def get_skill_statistics(self, skill_name: str = None) -> dict:
         """
@@ -181,67 +300,64 @@ class GraphDBClient:
             }
         """
         if skill_name:
-            # 특정 스킬의 통계
-            query = """
-            MATCH (s:Skill {name: $skill_name})
-            OPTIONAL MATCH (s)<-[:REQUIRES_SKILL]-(jp:JobPosting)
-            RETURN s.name AS skill_name,
-                   COUNT(DISTINCT jp) AS required_count,
-                   0 AS preferred_count,
-                   COUNT(DISTINCT jp) AS total_count
-            """
-
-            with self._driver.session() as session:
-                result = session.run(query, skill_name=skill_name)
-                record = result.single()
-
-                if not record or not record["skill_name"]:
-                    return {
-                        "skill_name": skill_name,
-                        "required_count": 0,
-                        "preferred_count": 0,
-                        "total_count": 0,
-                    }
-
-                return {
-                    "skill_name": record["skill_name"],
-                    "required_count": record["required_count"],
-                    "preferred_count": record["preferred_count"],
-                    "total_count": record["total_count"],
-                }
+            records = self.execute_read(
+                self.SKILL_STATISTICS_QUERY, {"skill_name": skill_name}
+            )
         else:
-            # 전체 통계
-            query = """
-            MATCH (s:Skill)<-[:REQUIRES_SKILL]-(j:JobPosting)
-            WITH s, COUNT(j) AS posting_count
-            RETURN COUNT(DISTINCT s) AS total_skills,
-                   COLLECT({
-                       skill: s.name,
-                       count: posting_count
-                   }) AS skill_usage
-            """
-
-            with self._driver.session() as session:
-                result = session.run(query)
-                record = result.single()
-
-                if not record:
-                    return {
-                        "total_skills": 0,
-                        "total_postings": 0,
-                        "most_required_skills": [],
-                    }
-
-                skill_usage = record["skill_usage"]
-                # 사용 빈도순 정렬
-                sorted_skills = sorted(
-                    skill_usage, key=lambda x: x["count"], reverse=True
-                )
+            records = self.execute_read(self.TOP_SKILLS_QUERY)
+        return self.build_skill_statistics(skill_name, records)
+
+    # 특정 스킬의 통계
+    SKILL_STATISTICS_QUERY = """
+    MATCH (s:Skill {name: $skill_name})
+    OPTIONAL MATCH (s)<-[:REQUIRES_SKILL]-(jp:JobPosting)
+    RETURN s.name AS skill_name,
+           COUNT(DISTINCT jp) AS required_count,
+           0 AS preferred_count,
+           COUNT(DISTINCT jp) AS total_count
+    """
+
+    # 전체 통계 (정렬/Top-N은 DB에서 처리)
+    TOP_SKILLS_QUERY = """
+    MATCH (s:Skill)<-[:REQUIRES_SKILL]-(j:JobPosting)
+    WITH s, COUNT(j) AS posting_count
+    ORDER BY posting_count DESC
+    WITH COUNT(s) AS total_skills,
+         COLLECT({skill: s.name, count: posting_count}) AS skill_usage
+    RETURN total_skills, skill_usage[0..10] AS most_required_skills
+    """
 
+    @staticmethod
+    def build_skill_statistics(skill_name: Optional[str], records: list) -> dict:
+        """
+        통계 쿼리 결과를 응답 dict로 변환합니다. (sync/async 공통)
+        """
+        record = records[0] if records else None
+        if skill_name:
+            if not record or not record["skill_name"]:
                 return {
-                    "total_skills": record["total_skills"],
-                    "most_required_skills": sorted_skills[:10],
+                    "skill_name": skill_name,
+                    "required_count": 0,
+                    "preferred_count": 0,
+                    "total_count": 0,
                 }
+            return {
+                "skill_name": record["skill_name"],
+                "required_count": record["required_count"],
+                "preferred_count": record["preferred_count"],
+                "total_count": record["total_count"],
+            }
+
+        if not record:
+            return {
+                "total_skills": 0,
+                "total_postings": 0,
+                "most_required_skills": [],
+            }
+        return {
+            "total_skills": record["total_skills"],
+            "most_required_skills": list(record["most_required_skills"]),
+        }
 
     def create_skill_index(self):
         """
@@ -254,5 +370,4 @@ class GraphDBClient:
         ON (s.name)
         """
 
-        with self._driver.session() as session:
-            session.run(index_query)
+        self.execute_write(index_query)
@@ -4,7 +4,9 @@ import uuid
 from typing import Callable
 
 from common.request_id import set_request_id
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
+from django.middleware.gzip import GZipMiddleware
 
 
 class RequestIdMiddleware:
@@ -30,3 +32,29 @@ class RequestIdMiddleware:
         response = self.get_response(request)
         response[self.response_header] = request_id
         return response
+
+
+class ApiGZipMiddleware(GZipMiddleware):
+    """
+    API 응답(/api/) gzip 압축.
+
+    - API_GZIP_MIN_LENGTH 바이트 미만 응답은 압축 이득보다 CPU 비용이 커서 그대로 둡니다.
+    - 스트리밍 응답(SSE 등)은 압축기가 chunk를 모아 두면 실시간 전달이 지연되므로 제외합니다.
+    - 클라이언트가 gzip을 허용하지 않거나 이미 인코딩된 응답은 GZipMiddleware가 걸러냅니다.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.path_prefix = getattr(settings, "API_GZIP_PATH_PREFIX", "/api/")
+        self.min_length = int(getattr(settings, "API_GZIP_MIN_LENGTH", 1024))
+
+    def process_response(self, request, response):
+        if not request.path.startswith(self.path_prefix):
+            return response
+        if response.streaming:
+            return response
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        if len(response.content) < self.min_length:
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,171 @@
+"""
+Keyset(cursor) 페이지네이션.
+
+OFFSET 대신 "마지막으로 본 row의 정렬 키 이후"를 WHERE 조건으로 조회하므로
+몇 페이지를 넘기든 인덱스 range scan + LIMIT 한 번으로 끝납니다.
+
+- 정렬 키는 queryset의 order_by를 그대로 사용합니다. (예: -created_at, -posting_id)
+- 마지막 정렬 필드는 유일해야 하고(tie-breaker), 정렬 필드는 NULL이 없어야 합니다.
+- 응답 형식: {"next": url|null, "previous": url|null, "results": [...]}
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Optional
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _invert(ordering: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(f[1:] if f.startswith("-") else f"-{f}" for f in ordering)
+
+
+def _after(ordering: tuple[str, ...], values: list) -> Q:
+    """
+    정렬 순서상 values 위치 "다음" row 조건.
+
+    (a, b, c) 이후 = a>A | (a=A & b>B) | (a=A & b=B & c>C)  (내림차순 필드는 <)
+    """
+    condition = Q()
+    equal_prefix = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        op = "lt" if field.startswith("-") else "gt"
+        condition |= equal_prefix & Q(**{f"{name}__{op}": value})
+        equal_prefix &= Q(**{name: value})
+    return condition
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = "cursor"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = tuple(queryset.query.order_by)
+        if not self.ordering:
+            raise ImproperlyConfigured(
+                "KeysetPagination requires an ordered queryset (order_by)."
+            )
+
+        position, reverse = self.decode_cursor(request)
+        ordering = _invert(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(_after(ordering, position))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request) -> int:
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.page_size
+        try:
+            value = int(raw)
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(value, self.max_page_size))
+
+    # ------------------------------------------------------------------
+    # cursor 인코딩
+    # ------------------------------------------------------------------
+    def decode_cursor(self, request) -> tuple[Optional[list], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            position = payload["p"]
+            reverse = bool(payload.get("r", False))
+        except (ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, obj, *, reverse: bool) -> str:
+        position = []
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip("-"))
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            position.append(value)
+        payload = json.dumps({"p": position, "r": reverse}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def _link(self, cursor: str) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.encode_cursor(self.page[-1], reverse=False))
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param
+            )
+        return self._link(self.encode_cursor(self.page[0], reverse=True))
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "페이지 cursor (응답의 next/previous 링크 사용)",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"페이지 크기 (최대 {self.max_page_size})",
+                "schema": {"type": "integer"},
+            },
+        ]
@@ -13,6 +13,8 @@ class GraphStorePort(Protocol):
         skills_required: list[str],
     ) -> None: ...
 
+    def upsert_job_postings(self, *, postings: list[dict]) -> None: ...
+
     def get_required_skills(self, *, posting_id: int) -> set[str]: ...
 
     def get_postings_by_skills(
@@ -20,3 +22,30 @@ class GraphStorePort(Protocol):
     ) -> list[int]: ...
 
     def get_skill_statistics(self, *, skill_name: str | None = None) -> dict: ...
+
+
+class AsyncGraphStorePort(Protocol):
+    """
+    GraphStorePort의 async 버전.
+
+    async 뷰/동시 파이프라인에서 그래프 조회를 벡터/LLM 호출과 겹쳐 실행할 때 사용합니다.
+    """
+
+    async def upsert_job_posting(
+        self,
+        *,
+        posting_id: int,
+        position: str,
+        company_name: str,
+        skills_required: list[str],
+    ) -> None: ...
+
+    async def upsert_job_postings(self, *, postings: list[dict]) -> None: ...
+
+    async def get_required_skills(self, *, posting_id: int) -> set[str]: ...
+
+    async def get_postings_by_skills(
+        self, *, user_skills: set[str], limit: int = 50
+    ) -> list[int]: ...
+
+    async def get_skill_statistics(self, *, skill_name: str | None = None) -> dict: ...
@@ -8,6 +8,12 @@ from job.models import JobPosting
 class JobPostingRepositoryPort(Protocol):
     def get_by_id(self, posting_id: int) -> Optional[JobPosting]: ...
 
+    def get_many(self, posting_ids: list[int]) -> list[JobPosting]: ...
+
     def save(
         self, job_posting: JobPosting, *, update_fields: Optional[list[str]] = None
     ) -> JobPosting: ...
+
+    def bulk_update_skills(self, job_postings: list[JobPosting]) -> None: ...
+
+    def bulk_update_duplicates(self, job_postings: list[JobPosting]) -> None: ...
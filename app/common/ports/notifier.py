@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class NotifierPort(Protocol):
+    """
+    운영 알림(Slack 등) 전송 포트.
+
+    - queue: 메시지를 모아 둡니다. (여러 스레드에서 호출 가능)
+    - flush: 모아 둔 메시지를 묶어서 전송하고 전송한 요청 수를 반환합니다.
+    """
+
+    def queue(self, text: str) -> None: ...
+
+    def flush(self) -> int: ...
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import Optional, Protocol
+
+
+class PostingSignatureStorePort(Protocol):
+    def save(self, *, posting_id: int, signature: list[int]) -> None: ...
+
+    def find_canonical(
+        self, *, posting_id: int, signature: list[int]
+    ) -> Optional[int]: ...
+
+    def delete(self, *, posting_id: int) -> None: ...
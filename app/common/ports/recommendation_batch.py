@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Protocol, Sequence
+
+
+class RecommendationBatchRepositoryPort(Protocol):
+    """
+    야간 추천 배치 저장소 포트.
+
+    - list_targets: 배치 대상 (resume_id, user_id) 목록 (대표 이력서, id 순)
+    - generate_recommendations: 이력서 하나의 추천을 생성/저장하고 저장한 추천을 반환합니다.
+      (실패는 예외로 전달)
+    - release_thread_resources: worker 스레드가 쓴 자원(DB 연결 등)을 돌려줍니다.
+    """
+
+    def list_targets(self) -> list[tuple[int, int]]: ...
+
+    def generate_recommendations(self, resume_id: int) -> Sequence: ...
+
+    def release_thread_resources(self) -> None: ...
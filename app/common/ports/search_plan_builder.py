@@ -9,6 +9,9 @@ class SearchPlanBuilderPort(Protocol):
     """
     추천 검색전략(쿼리/필터/루브릭)을 생성하는 포트.
     - LLM 기반 구현체를 기본으로 하되, API 키가 없거나 실패하면 fallback을 사용합니다.
+    - build_fallback_plan: LLM 없이 만드는 휴리스틱 전략 (요청 시간 예산이 부족할 때 사용)
     """
 
     def build_plan(self, *, resume: Resume) -> dict: ...
+
+    def build_fallback_plan(self, *, resume: Resume) -> dict: ...
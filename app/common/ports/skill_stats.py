@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional, Protocol
+
+
+class SkillStatsPort(Protocol):
+    def apply_posting_change(
+        self,
+        *,
+        added: Iterable[str],
+        removed: Iterable[str],
+        posted_at: Optional[datetime] = None,
+    ) -> None: ...
+
+    def get_statistics(self, *, skill_name: str | None = None) -> dict: ...
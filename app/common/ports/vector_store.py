@@ -13,6 +13,39 @@ class VectorStorePort(Protocol):
         metadata: dict,
     ) -> None: ...
 
+    def upsert_texts(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: list[str],
+        texts: list[str],
+        metadatas: list[dict],
+    ) -> None: ...
+
+    def delete_documents(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: Optional[list[str]] = None,
+        where: Optional[dict] = None,
+    ) -> None: ...
+
+    def get_metadatas(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: Optional[list[str]] = None,
+        where: Optional[dict] = None,
+    ) -> dict[str, dict]: ...
+
+    def update_metadatas(
+        self,
+        *,
+        collection_name: str,
+        doc_ids: list[str],
+        metadatas: list[dict],
+    ) -> None: ...
+
     def get_embedding(self, *, collection_name: str, doc_id: str) -> Optional[Any]: ...
 
     def query_by_embedding(
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import redis
+from django.conf import settings
+
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+
+
+def get_redis() -> redis.Redis:
+    """
+    프로세스 공용 Redis 클라이언트 (내부 연결 풀 공유).
+
+    Celery 브로커와 같은 Redis를 기본으로 사용하며, `REDIS_URL`로 분리할 수 있습니다.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(
+                    settings.REDIS_URL,
+                    decode_responses=True,
+                    socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                )
+    return _client
@@ -0,0 +1,33 @@
+"""
+orjson 기반 DRF JSON Renderer.
+
+기본 `JSONRenderer`(json.dumps + DRF JSONEncoder)와 같은 출력 규칙을 유지합니다.
+- 한글 등 non-ASCII는 escape하지 않습니다. (UNICODE_JSON=True 와 동일)
+- datetime/Decimal/timedelta/QuerySet 등 JSON 기본 타입이 아닌 값은
+  DRF `JSONEncoder.default`로 변환합니다. (datetime의 "+00:00" → "Z" 포함)
+- UUID는 orjson이 직접 문자열로 변환합니다. (DRF와 동일)
+"""
+
+from __future__ import annotations
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# datetime은 DRF와 같은 표기를 위해 default로 넘깁니다.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+        renderer_context = renderer_context or {}
+        # orjson은 2칸 들여쓰기만 지원합니다. (?indent / Accept: ...; indent=N)
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=options)
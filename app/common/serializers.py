@@ -0,0 +1,68 @@
+"""
+Sparse fieldset(응답 필드 선택) 공통 Serializer 유틸.
+
+- `?view=summary|full`: 목록 화면용 요약/전체 표현 선택
+- `?fields=a,b,c`: 응답에 포함할 필드 직접 지정 (모르는 필드는 무시)
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from rest_framework import serializers
+
+VIEW_SUMMARY = "summary"
+VIEW_FULL = "full"
+
+
+class DynamicFieldsMixin:
+    """
+    `fields` 인자(또는 context["fields"])에 없는 필드를 응답에서 제외하는 ModelSerializer mixin.
+
+    nested serializer는 부모 context를 공유하므로, 부모에 fields를 넘기지 않고
+    context로 전달하면 nested 공고 필드에만 적용됩니다.
+    클래스에 선언된 nested serializer는 부모에 bind되기 전(context가 비어 있을 때) deepcopy로
+    다시 생성되므로, 필터는 `get_fields()`에서 bind된 뒤의 context를 읽어 적용합니다.
+    """
+
+    # 필드 선택과 관계없이 항상 포함되는 필드 (식별자)
+    always_include: tuple[str, ...] = ()
+
+    def __init__(self, *args, fields: Optional[Iterable[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._requested_fields = fields
+
+    def get_fields(self):
+        declared = super().get_fields()
+        fields = self._requested_fields
+        if fields is None:
+            fields = self.context.get("fields")
+        if not fields:
+            return declared
+        allowed = set(fields) | set(self.always_include)
+        return {name: field for name, field in declared.items() if name in allowed}
+
+    @classmethod
+    def model_only_fields(
+        cls, fields: Optional[Iterable[str]] = None, *, prefix: str = ""
+    ) -> list[str]:
+        """
+        응답에 필요한 모델 컬럼 목록 (queryset `.only()`용).
+        """
+        names = list(cls.Meta.fields)
+        if fields:
+            allowed = set(fields) | set(cls.always_include)
+            names = [name for name in names if name in allowed]
+        return [f"{prefix}{name}" for name in names]
+
+
+class FieldsetQuerySerializer(serializers.Serializer):
+    """view/fields QueryString 파라미터"""
+
+    view = serializers.ChoiceField(
+        required=False, choices=[(VIEW_SUMMARY, VIEW_SUMMARY), (VIEW_FULL, VIEW_FULL)]
+    )
+    fields = serializers.CharField(required=False, allow_blank=False, max_length=500)
+
+    def validate_fields(self, value: str) -> list[str]:
+        return [name.strip() for name in value.split(",") if name.strip()]
@@ -0,0 +1,159 @@
+"""
+Single-flight 요청 병합.
+
+같은 키의 무거운 계산(예: 같은 이력서의 실시간 추천)이 동시에 여러 번 들어오면 한 번만 실행합니다.
+
+- 프로세스 안: 키별 Future를 공유합니다. 먼저 온 요청(leader)만 계산하고, 나머지는 같은 결과
+  (또는 같은 예외)를 받습니다.
+- 워커 간: leader는 Redis lock(SET NX EX)을 잡고 계산합니다. 다른 워커가 lock을 잡고 있으면
+  풀릴 때까지 기다린 뒤 lock을 잡고 계산합니다. 이때 fn은 먼저 저장된 결과를 재사용해야 합니다.
+  (예: 추천은 입력 fingerprint가 같은 현재 세트를 그대로 반환)
+- 기다리는 시간이 wait_timeout을 넘으면 다시 계산하지 않고 on_timeout() 결과를 반환합니다.
+  (남은 시간이 없는 요청이 다시 계산해 먼저 끝난 결과를 덮어쓰지 않도록)
+- Redis를 사용할 수 없으면 lock 없이 계산합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Generic, TypeVar
+
+from common.redis_client import get_redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# lock 소유자만 해제하도록 토큰을 비교 후 삭제합니다.
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight(Generic[T]):
+    LOCK_KEY_PREFIX = "singleflight:"
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        lock_ttl_seconds: int,
+        redis_client=None,
+        poll_interval_seconds: float = 0.05,
+    ):
+        self._namespace = namespace
+        self._lock_ttl_seconds = max(1, int(lock_ttl_seconds))
+        self._redis = redis_client
+        self._poll_interval_seconds = poll_interval_seconds
+        self._lock = threading.Lock()
+        self._flights: dict[str, Future] = {}
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = get_redis()
+        return self._redis
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.LOCK_KEY_PREFIX}{self._namespace}:{key}"
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        *,
+        wait_timeout: float,
+        on_timeout: Callable[[], T],
+    ) -> tuple[T, bool]:
+        """
+        key에 대해 진행 중인 계산이 있으면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+
+        Args:
+            key: 병합 키
+            fn: 계산 함수
+            wait_timeout: 다른 요청/워커의 계산을 기다릴 최대 시간(초)
+            on_timeout: 기다리는 시간이 wait_timeout을 넘었을 때 fn 대신 반환할 값을 만드는 함수
+                (예: 저장된 결과 또는 빈 결과)
+
+        Returns:
+            (결과, 다른 요청의 계산 결과를 공유받았는지 여부)
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._flights[key] = future
+
+        if not leader:
+            try:
+                return future.result(timeout=max(0.0, wait_timeout)), True
+            except FutureTimeoutError:
+                logger.warning(
+                    f"Single-flight {self._namespace}:{key} wait timed out; "
+                    "skipping recomputation"
+                )
+                return on_timeout(), False
+
+        try:
+            value = self._run_locked(
+                key, fn, wait_timeout=wait_timeout, on_timeout=on_timeout
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value, False
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+
+    def _run_locked(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        *,
+        wait_timeout: float,
+        on_timeout: Callable[[], T],
+    ) -> T:
+        lock_key = self._lock_key(key)
+        token = uuid.uuid4().hex
+        give_up_at = time.monotonic() + max(0.0, wait_timeout)
+        acquired = timed_out = False
+        try:
+            while True:
+                if self.redis.set(lock_key, token, nx=True, ex=self._lock_ttl_seconds):
+                    acquired = True
+                    break
+                if time.monotonic() >= give_up_at:
+                    logger.warning(
+                        f"Single-flight lock {lock_key} still held; "
+                        "skipping recomputation"
+                    )
+                    timed_out = True
+                    break
+                time.sleep(self._poll_interval_seconds)
+        except RedisError as e:
+            logger.warning(f"Single-flight lock unavailable for {lock_key}: {e}")
+
+        if timed_out:
+            return on_timeout()
+        if not acquired:
+            return fn()
+        try:
+            return fn()
+        finally:
+            try:
+                self.redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+            except RedisError as e:
+                logger.warning(f"Failed to release single-flight lock {lock_key}: {e}")
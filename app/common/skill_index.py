@@ -0,0 +1,337 @@
+"""
+In-process 스킬 → 공고 역색인 (bitmap inverted index).
+
+- 스킬마다 공고 row에 대한 NumPy bool 비트맵을 하나씩 둡니다.
+- 공고별 포지션 카테고리/경력 범위/created_at은 열(column) 배열로 보관합니다.
+- Postgres `skills_required`에서 최초 1회 전체 빌드하고,
+  이후에는 `JobPostingChange`(변경 로그)를 `ChangeLogCursor`로 읽어 증분 갱신합니다.
+  (늦게 커밋된 작은 id 변경도 최근 구간을 다시 읽어 반영)
+
+매칭 수 랭킹은 요청 스킬 비트맵의 합(vectorized popcount)으로 계산하므로
+수천 건 규모에서 네트워크 왕복 없이 1ms 이하로 끝납니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# career_min/career_max 가 NULL 인 경우의 sentinel
+_CAREER_NONE = -1
+
+
+class SkillBitmapIndex:
+    _instance: Optional["SkillBitmapIndex"] = None
+    _instance_lock = threading.Lock()
+
+    _initial_capacity = 1024
+
+    def __init__(self, *, refresh_interval_seconds: float = 5.0):
+        self._lock = threading.RLock()
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._last_refresh_check = 0.0
+        self._built = False
+        self._cursor = None
+        self._reset(capacity=self._initial_capacity)
+
+    @classmethod
+    def get_instance(cls) -> "SkillBitmapIndex":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = SkillBitmapIndex(
+                        refresh_interval_seconds=float(
+                            getattr(settings, "SKILL_INDEX_REFRESH_INTERVAL_SECONDS", 5)
+                        )
+                    )
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # 저장 구조
+    # ------------------------------------------------------------------
+    def _reset(self, *, capacity: int) -> None:
+        self._size = 0
+        self._capacity = capacity
+        self._row_by_posting: dict[int, int] = {}
+        self._posting_ids = np.zeros(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._career_min = np.full(capacity, _CAREER_NONE, dtype=np.int32)
+        self._career_max = np.full(capacity, _CAREER_NONE, dtype=np.int32)
+        self._created_at = np.zeros(capacity, dtype=np.int64)
+        self._category = np.zeros(capacity, dtype=np.int16)
+        self._category_codes: dict[str, int] = {"": 0}
+        self._skills_by_row: list[frozenset[str]] = []
+        self._bitmaps: dict[str, np.ndarray] = {}
+
+    def _grow(self) -> None:
+        new_capacity = self._capacity * 2
+
+        def _extend(arr: np.ndarray, fill) -> np.ndarray:
+            out = np.full(new_capacity, fill, dtype=arr.dtype)
+            out[: self._capacity] = arr
+            return out
+
+        self._posting_ids = _extend(self._posting_ids, 0)
+        self._alive = _extend(self._alive, False)
+        self._career_min = _extend(self._career_min, _CAREER_NONE)
+        self._career_max = _extend(self._career_max, _CAREER_NONE)
+        self._created_at = _extend(self._created_at, 0)
+        self._category = _extend(self._category, 0)
+        self._bitmaps = {
+            skill: _extend(bitmap, False) for skill, bitmap in self._bitmaps.items()
+        }
+        self._capacity = new_capacity
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self._category_codes)
+            self._category_codes[category] = code
+        return code
+
+    def _clear_row(self, row: int) -> None:
+        for skill in self._skills_by_row[row]:
+            bitmap = self._bitmaps.get(skill)
+            if bitmap is not None:
+                bitmap[row] = False
+        self._skills_by_row[row] = frozenset()
+        self._alive[row] = False
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+    def upsert(
+        self,
+        *,
+        posting_id: int,
+        skills: Iterable[str],
+        position_category: str = "",
+        career_min: Optional[int] = None,
+        career_max: Optional[int] = None,
+        created_at: Optional[datetime] = None,
+    ) -> None:
+        skill_set = frozenset(s for s in (skills or []) if s)
+        with self._lock:
+            row = self._row_by_posting.get(posting_id)
+            if row is None:
+                if not skill_set:
+                    # 스킬이 없는 공고는 그래프에도 노드가 없으므로 동일하게 제외합니다.
+                    return
+                if self._size >= self._capacity:
+                    self._grow()
+                row = self._size
+                self._size += 1
+                self._row_by_posting[posting_id] = row
+                self._skills_by_row.append(frozenset())
+            else:
+                self._clear_row(row)
+
+            self._posting_ids[row] = posting_id
+            self._career_min[row] = _CAREER_NONE if career_min is None else career_min
+            self._career_max[row] = _CAREER_NONE if career_max is None else career_max
+            self._created_at[row] = int(created_at.timestamp()) if created_at else 0
+            self._category[row] = self._category_code(position_category or "")
+            self._skills_by_row[row] = skill_set
+            self._alive[row] = bool(skill_set)
+            for skill in skill_set:
+                bitmap = self._bitmaps.get(skill)
+                if bitmap is None:
+                    bitmap = np.zeros(self._capacity, dtype=bool)
+                    self._bitmaps[skill] = bitmap
+                bitmap[row] = True
+
+    def remove(self, *, posting_id: int) -> None:
+        with self._lock:
+            row = self._row_by_posting.get(posting_id)
+            if row is not None:
+                self._clear_row(row)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        return self._cursor.version if self._cursor is not None else 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._alive[: self._size]))
+
+    def get_required_skills(self, *, posting_id: int) -> set[str]:
+        with self._lock:
+            row = self._row_by_posting.get(posting_id)
+            if row is None:
+                return set()
+            return set(self._skills_by_row[row])
+
+    def match_counts(self, user_skills: Iterable[str]) -> np.ndarray:
+        """
+        row별 매칭 스킬 수(uint16)를 반환합니다. (길이 = 현재 row 수)
+        """
+        n = self._size
+        counts = np.zeros(n, dtype=np.uint16)
+        for skill in set(user_skills or []):
+            bitmap = self._bitmaps.get(skill)
+            if bitmap is not None:
+                counts += bitmap[:n]
+        return counts
+
+    def get_postings_by_skills(
+        self,
+        *,
+        user_skills: set[str],
+        limit: int = 50,
+        position_category: Optional[str] = None,
+        career_years: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+    ) -> list[int]:
+        """
+        매칭 스킬 수 내림차순, posting_id 내림차순으로 정렬된 공고 ID를 반환합니다.
+        (Neo4jGraphStore.get_postings_by_skills 와 동일한 순서)
+        """
+        if not user_skills or limit <= 0:
+            return []
+
+        with self._lock:
+            n = self._size
+            counts = self.match_counts(user_skills)
+            mask = (counts > 0) & self._alive[:n]
+
+            if position_category is not None:
+                code = self._category_codes.get(position_category)
+                if code is None:
+                    return []
+                mask &= self._category[:n] == code
+            if career_years is not None:
+                cmin = self._career_min[:n]
+                cmax = self._career_max[:n]
+                mask &= (cmin == _CAREER_NONE) | (cmin <= career_years)
+                mask &= (cmax == _CAREER_NONE) | (cmax >= career_years)
+            if created_after is not None:
+                mask &= self._created_at[:n] >= int(created_after.timestamp())
+
+            rows = np.flatnonzero(mask)
+            if rows.size == 0:
+                return []
+            # lexsort: 마지막 key가 1순위 (match_count DESC, posting_id DESC)
+            order = np.lexsort(
+                (-self._posting_ids[rows], -counts[rows].astype(np.int32))
+            )
+            top = rows[order[:limit]]
+            return [int(pid) for pid in self._posting_ids[top]]
+
+    # ------------------------------------------------------------------
+    # Postgres 동기화
+    # ------------------------------------------------------------------
+    def ensure_fresh(self) -> None:
+        """
+        최초 호출 시 전체 빌드, 이후에는 refresh_interval 마다 변경 로그를 확인합니다.
+        """
+        if not self._built:
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now - self._last_refresh_check < self._refresh_interval_seconds:
+            return
+        self.refresh()
+
+    def rebuild(self) -> None:
+        from job.change_log import ChangeLogCursor
+        from job.models import JobPosting
+
+        started = time.perf_counter()
+        with self._lock:
+            # 버전을 먼저 읽어야 빌드 도중 들어온 변경을 놓치지 않습니다(중복 반영은 idempotent).
+            cursor = ChangeLogCursor()
+            cursor.reset()
+            self._reset(capacity=self._initial_capacity)
+            rows = (
+                JobPosting.objects.exclude(skills_required__isnull=True)
+                .values_list(*_ROW_FIELDS)
+                .iterator(chunk_size=2000)
+            )
+            for row in rows:
+                self._apply_row(row)
+            self._cursor = cursor
+            self._built = True
+            self._last_refresh_check = time.monotonic()
+        logger.info(
+            f"SkillBitmapIndex built: {len(self)} postings, {len(self._bitmaps)} skills "
+            f"(version={self.version}, {time.perf_counter() - started:.3f}s)"
+        )
+
+    def refresh(self) -> int:
+        """
+        변경 로그에서 마지막 버전 이후의 변경분만 반영합니다.
+
+        Returns:
+            반영한 공고 수
+        """
+        from job.models import JobPosting
+
+        with self._lock:
+            self._last_refresh_check = time.monotonic()
+            if self._cursor is None or self._cursor.history_pruned():
+                self.rebuild()
+                return len(self)
+            changes = self._cursor.read()
+            if not changes:
+                return 0
+
+            changed_ids = {posting_id for _, posting_id, _ in changes}
+            current = {
+                row[0]: row
+                for row in JobPosting.objects.filter(
+                    posting_id__in=changed_ids
+                ).values_list(*_ROW_FIELDS)
+            }
+            for posting_id in changed_ids:
+                row = current.get(posting_id)
+                if row is None:
+                    self.remove(posting_id=posting_id)
+                else:
+                    self._apply_row(row)
+            return len(changed_ids)
+
+    def _apply_row(self, row: tuple) -> None:
+        from job.domain.position import resolve_position_category
+
+        (
+            posting_id,
+            skills,
+            position,
+            position_category,
+            position_category_version,
+            career_min,
+            career_max,
+            created_at,
+        ) = row
+        self.upsert(
+            posting_id=int(posting_id),
+            skills=skills if isinstance(skills, list) else [],
+            position_category=resolve_position_category(
+                position, position_category, position_category_version
+            ),
+            career_min=career_min,
+            career_max=career_max,
+            created_at=created_at,
+        )
+
+
+_ROW_FIELDS = (
+    "posting_id",
+    "skills_required",
+    "position",
+    "position_category",
+    "position_category_version",
+    "career_min",
+    "career_max",
+    "created_at",
+)
@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from common.admission import AdmissionController, AdmissionRejected, TokenBucket
+
+
+def _controller(**kwargs) -> AdmissionController:
+    options = {
+        "max_concurrent": 1,
+        "max_queue": 1,
+        "queue_timeout_seconds": 5,
+        "retry_after_seconds": 3,
+    }
+    options.update(kwargs)
+    return AdmissionController("test", **options)
+
+
+class TestAdmissionController:
+    def test_rejects_immediately_when_queue_is_full(self):
+        controller = _controller(max_queue=0)
+
+        with controller.admit() as waited:
+            assert waited == 0.0
+            with pytest.raises(AdmissionRejected) as exc_info:
+                with controller.admit():
+                    pass
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.retry_after_seconds == 3
+        stats = controller.get_stats()
+        assert stats["active"] == 0
+        assert stats["admitted_total"] == 1
+        assert stats["rejected_queue_full_total"] == 1
+
+    def test_queued_request_runs_when_slot_frees(self):
+        controller = _controller()
+        holding, release = threading.Event(), threading.Event()
+
+        def _hold():
+            with controller.admit():
+                holding.set()
+                release.wait(5)
+
+        def _queued():
+            with controller.admit() as waited:
+                return waited
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(_hold)
+            assert holding.wait(5)
+            queued = executor.submit(_queued)
+            while controller.get_stats()["waiting"] == 0:
+                pass
+            release.set()
+            waited = queued.result()
+
+        assert waited > 0
+        stats = controller.get_stats()
+        assert stats["queued_total"] == 1
+        assert stats["admitted_total"] == 2
+        assert stats["queue_wait_seconds"]["samples"] == 2
+        assert stats["queue_wait_seconds"]["max"] == pytest.approx(waited, abs=1e-3)
+
+    def test_rejects_after_queue_timeout(self):
+        controller = _controller(queue_timeout_seconds=0.05)
+
+        with controller.admit():
+            with pytest.raises(AdmissionRejected) as exc_info:
+                with controller.admit():
+                    pass
+
+        assert exc_info.value.reason == "queue_timeout"
+        stats = controller.get_stats()
+        assert stats["waiting"] == 0
+        assert stats["rejected_timeout_total"] == 1
+
+
+class TestTokenBucket:
+    def test_limits_each_key_after_burst(self):
+        bucket = TokenBucket()
+
+        assert bucket.consume(1, rate_per_second=0.5, burst=2) == 0.0
+        assert bucket.consume(1, rate_per_second=0.5, burst=2) == 0.0
+        assert bucket.consume(1, rate_per_second=0.5, burst=2) == pytest.approx(
+            2.0, abs=0.01
+        )
+        assert bucket.consume(2, rate_per_second=0.5, burst=2) == 0.0
+        assert bucket.get_stats() == {"tracked_keys": 2, "limited_total": 1}
+
+    def test_zero_rate_disables_limit(self):
+        bucket = TokenBucket()
+
+        assert all(
+            bucket.consume(1, rate_per_second=0, burst=1) == 0.0 for _ in range(5)
+        )
+
+    def test_evicts_least_recently_used_keys(self):
+        bucket = TokenBucket(max_keys=2)
+
+        for key in (1, 2, 3):
+            bucket.consume(key, rate_per_second=1, burst=1)
+
+        assert bucket.get_stats()["tracked_keys"] == 2
+        # 버려진 키는 가득 찬 버킷으로 다시 시작합니다.
+        assert bucket.consume(1, rate_per_second=1, burst=1) == 0.0
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+from common.deadline import Deadline, DeadlineExceeded, run_with_timeout
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadline:
+    def test_slice_is_bounded_by_remaining_time(self):
+        clock = _FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+
+        assert deadline.slice(0.2) == pytest.approx(2.0)
+
+        clock.now += 9.0
+        assert deadline.remaining() == pytest.approx(1.0)
+        assert deadline.slice(0.2) == pytest.approx(1.0)
+        assert deadline.slice(1.0, reserve=0.5) == pytest.approx(0.5)
+
+        clock.now += 2.0
+        assert deadline.expired()
+        assert deadline.slice(0.2) == 0.0
+
+    def test_degraded_stages_keep_first_occurrence_order(self):
+        deadline = Deadline.from_budget_ms(1000)
+
+        deadline.mark_degraded("planner")
+        deadline.mark_degraded("llm_rerank")
+        deadline.mark_degraded("planner")
+
+        assert deadline.budget_seconds == pytest.approx(1.0)
+        assert deadline.degraded == ["planner", "llm_rerank"]
+
+
+class TestRunWithTimeout:
+    def test_returns_result_within_timeout(self):
+        assert run_with_timeout(lambda: 42, timeout=1.0) == 42
+
+    def test_propagates_exception(self):
+        def _fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_with_timeout(_fail, timeout=1.0)
+
+    def test_raises_without_waiting_for_slow_call(self):
+        release = threading.Event()
+        try:
+            with pytest.raises(DeadlineExceeded):
+                run_with_timeout(lambda: release.wait(5), timeout=0.05, name="slow")
+        finally:
+            release.set()
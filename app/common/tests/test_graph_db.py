@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from common.adapters.async_neo4j_graph_store import AsyncNeo4jGraphStore
+from common.async_graph_db import AsyncGraphDBClient
+from common.graph_db import GraphDBClient
+from neo4j import READ_ACCESS, WRITE_ACCESS
+
+
+class TestGraphDBClient:
+    def setup_method(self):
+        self._original_instance = GraphDBClient._instance
+        GraphDBClient._instance = None
+
+    def teardown_method(self):
+        GraphDBClient._instance = self._original_instance
+
+    @patch("common.graph_db.GraphDatabase")
+    def test_get_instance_creates_single_pooled_driver(self, mock_graph_database):
+        first = GraphDBClient.get_instance()
+        second = GraphDBClient.get_instance()
+
+        assert first is second
+        mock_graph_database.driver.assert_called_once()
+        options = mock_graph_database.driver.call_args.kwargs
+        assert options["max_connection_pool_size"] > 0
+        assert options["liveness_check_timeout"] is not None
+        assert options["connection_acquisition_timeout"] > 0
+
+    @patch("common.graph_db.GraphDatabase")
+    def test_execute_read_routes_to_reader_and_maps_records(self, mock_graph_database):
+        session = mock_graph_database.driver.return_value.session.return_value
+        session = session.__enter__.return_value
+        tx = MagicMock()
+        tx.run.return_value = iter([{"posting_id": 1}, {"posting_id": 2}])
+        session.execute_read.side_effect = lambda work: work(tx)
+
+        result = GraphDBClient.get_instance().execute_read(
+            "MATCH ...", {"a": 1}, mapper=lambda record: record["posting_id"]
+        )
+
+        assert result == [1, 2]
+        driver = mock_graph_database.driver.return_value
+        assert driver.session.call_args.kwargs["default_access_mode"] == READ_ACCESS
+        tx.run.assert_called_once_with("MATCH ...", {"a": 1})
+
+    @patch("common.graph_db.GraphDatabase")
+    def test_add_job_posting_uses_single_write_transaction(self, mock_graph_database):
+        session = mock_graph_database.driver.return_value.session.return_value
+        session = session.__enter__.return_value
+        tx = MagicMock()
+        session.execute_write.side_effect = lambda work, *args: work(tx, *args)
+
+        GraphDBClient.get_instance().add_job_posting(
+            posting_id=1, position="Dev", company_name="C", skills=["Python", "Go"]
+        )
+
+        driver = mock_graph_database.driver.return_value
+        assert driver.session.call_args.kwargs["default_access_mode"] == WRITE_ACCESS
+        tx.run.assert_called_once()
+        assert tx.run.call_args.kwargs["skills"] == ["Python", "Go"]
+
+
+class _AsyncRecords:
+    def __init__(self, records):
+        self._records = iter(records)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._records)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class TestAsyncGraphDBClient:
+    @patch("common.async_graph_db.AsyncGraphDatabase")
+    def test_instance_per_event_loop(self, mock_graph_database):
+        async def _get():
+            return AsyncGraphDBClient.get_instance(), AsyncGraphDBClient.get_instance()
+
+        first, same = asyncio.run(_get())
+        other, _ = asyncio.run(_get())
+
+        assert first is same
+        assert first is not other
+
+    @patch("common.async_graph_db.AsyncGraphDatabase")
+    def test_async_graph_store_reads_postings(self, mock_graph_database):
+        session = mock_graph_database.driver.return_value.session.return_value
+        session = session.__aenter__.return_value
+        tx = MagicMock()
+        tx.run = AsyncMock(
+            return_value=_AsyncRecords([{"posting_id": 3}, {"posting_id": 1}])
+        )
+
+        async def _execute_read(work):
+            return await work(tx)
+
+        session.execute_read = AsyncMock(side_effect=_execute_read)
+
+        result = asyncio.run(
+            AsyncNeo4jGraphStore().get_postings_by_skills(user_skills={"Python"})
+        )
+
+        assert result == [3, 1]
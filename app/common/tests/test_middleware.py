@@ -0,0 +1,55 @@
+"""
+Tests for API gzip middleware
+
+/api/ 응답 압축 조건(경로/크기/스트리밍) 테스트
+"""
+
+import gzip
+
+import pytest
+from common.middleware import ApiGZipMiddleware
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+LARGE_BODY = b'{"position": "\xeb\xb0\xb1\xec\x97\x94\xeb\x93\x9c"}' * 200
+
+
+def _run(path: str, response: HttpResponse) -> HttpResponse:
+    request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING="gzip, br")
+    return ApiGZipMiddleware(lambda _: response)(request)
+
+
+class TestApiGZipMiddleware:
+    def test_compresses_large_api_response(self):
+        response = _run("/api/v1/jobs/", HttpResponse(LARGE_BODY))
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert gzip.decompress(response.content) == LARGE_BODY
+
+    def test_skips_small_and_non_api_responses(self):
+        assert not _run("/api/v1/jobs/", HttpResponse(b"{}")).has_header(
+            "Content-Encoding"
+        )
+        assert not _run("/admin/", HttpResponse(LARGE_BODY)).has_header(
+            "Content-Encoding"
+        )
+
+    def test_skips_streaming_and_event_stream(self):
+        streaming = _run("/api/v1/stream/", StreamingHttpResponse(iter([LARGE_BODY])))
+        sse = _run(
+            "/api/v1/events/",
+            HttpResponse(LARGE_BODY, content_type="text/event-stream"),
+        )
+
+        assert not streaming.has_header("Content-Encoding")
+        assert not sse.has_header("Content-Encoding")
+
+
+@pytest.mark.django_db
+def test_public_api_response_is_gzipped_end_to_end(settings):
+    settings.API_GZIP_MIN_LENGTH = 200
+    response = APIClient().get("/api/v1/skills/", HTTP_ACCEPT_ENCODING="gzip")
+
+    assert response["Content-Encoding"] == "gzip"
@@ -0,0 +1,94 @@
+"""
+Tests for orjson renderer/parser
+
+기본 JSONRenderer와의 출력 호환성
+"""
+
+import io
+import uuid
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from common.parsers import ORJSONParser
+from common.renderers import ORJSONRenderer
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+
+def _recommendation_payload(count: int = 100) -> dict:
+    """추천 API 응답 형태(JobRecommendationReadSerializer, view=full)"""
+    created_at = datetime(2026, 1, 1, 9, 30, tzinfo=dt_timezone.utc)
+    return {
+        "user_id": 1,
+        "resume_id": 1,
+        "recommendations": [
+            {
+                "id": i,
+                "user_id": 1,
+                "rank": i + 1,
+                "match_score": 87,
+                "match_reason": "필수 스택(Python, Django) 일치 | [근거:requirements] "
+                "대용량 트래픽 처리 경험 / 비동기 작업 큐 운영 경험" * 3,
+                "created_at": created_at,
+                "job_posting": {
+                    "posting_id": 1000 + i,
+                    "url": f"https://example.com/job/{1000 + i}",
+                    "company_name": f"주식회사 잡크롤러 {i}",
+                    "position": "백엔드 개발자 (Python/Django)",
+                    "category": "개발",
+                    "main_tasks": "• 채용 공고 추천 플랫폼의 백엔드 API 설계 및 개발\n"
+                    * 8,
+                    "requirements": "• Python, Django 기반 서비스 개발 경험 3년 이상\n"
+                    * 8,
+                    "preferred_points": "• Celery, Redis 를 활용한 비동기 처리 경험\n"
+                    * 6,
+                    "location": "서울",
+                    "district": "강남구",
+                    "employment_type": "정규직",
+                    "career_min": 3,
+                    "career_max": 7,
+                    "created_at": created_at,
+                    "updated_at": created_at + timedelta(hours=i),
+                },
+            }
+            for i in range(count)
+        ],
+    }
+
+
+class TestORJSONRenderer:
+    def test_output_matches_default_renderer(self):
+        data = {
+            "text": "백엔드 개발자",
+            "created_at": datetime(2026, 1, 1, tzinfo=dt_timezone.utc),
+            "naive": datetime(2026, 1, 1, 9, 0),
+            "score": Decimal("87.50"),
+            "duration": timedelta(seconds=90),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "nested": [{"a": 1, "b": None, "c": 1.5, "d": True}],
+            1: "int key",
+        }
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_recommendation_payload_matches_default_renderer(self):
+        data = _recommendation_payload(count=100)
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_none_renders_empty_body(self):
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestORJSONParser:
+    def test_parses_utf8_body(self):
+        stream = io.BytesIO('{"q": "백엔드", "ids": [1, 2]}'.encode("utf-8"))
+
+        assert ORJSONParser().parse(stream) == {"q": "백엔드", "ids": [1, 2]}
+
+    @pytest.mark.parametrize("body", [b'{"a": NaN}', b"{invalid", b"\xff\xfe"])
+    def test_rejects_invalid_json(self, body):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(body))
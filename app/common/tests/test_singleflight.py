@@ -0,0 +1,183 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from common.singleflight import SingleFlight
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+class InMemoryRedis:
+    """single-flight lock에 쓰는 Redis 명령(SET NX EX, 해제 스크립트)만 흉내 낸 클라이언트"""
+
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def set(self, key, value, nx=False, ex=None):
+        with self._lock:
+            if nx and key in self.strings:
+                return None
+            self.strings[key] = value
+            return True
+
+    def eval(self, script, numkeys, key, token):
+        with self._lock:
+            if self.strings.get(key) == token:
+                del self.strings[key]
+                return 1
+            return 0
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def _fail(*args, **kwargs):
+            raise RedisConnectionError("down")
+
+        return _fail
+
+
+def _unused():
+    raise AssertionError("on_timeout should not be called")
+
+
+def _flight(redis_client) -> SingleFlight:
+    return SingleFlight(
+        "test",
+        lock_ttl_seconds=10,
+        redis_client=redis_client,
+        poll_interval_seconds=0.01,
+    )
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_computation(self):
+        redis = InMemoryRedis()
+        flight = _flight(redis)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def _compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ["result"]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(
+                flight.do, "k", _compute, wait_timeout=5, on_timeout=_unused
+            )
+            assert started.wait(5)
+            followers = [
+                executor.submit(
+                    flight.do, "k", _compute, wait_timeout=5, on_timeout=_unused
+                )
+                for _ in range(3)
+            ]
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert len(calls) == 1
+        assert results[0] == (["result"], False)
+        assert all(result == (["result"], True) for result in results[1:])
+        # 계산이 끝나면 lock과 진행 중 항목이 정리되어 다음 호출은 새로 계산합니다.
+        assert redis.strings == {}
+        assert flight.do("k", lambda: ["next"], wait_timeout=1, on_timeout=_unused) == (
+            ["next"],
+            False,
+        )
+
+    def test_followers_receive_leader_exception(self):
+        flight = _flight(InMemoryRedis())
+        started, release = threading.Event(), threading.Event()
+
+        def _fail():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(
+                flight.do, "k", _fail, wait_timeout=5, on_timeout=_unused
+            )
+            assert started.wait(5)
+            follower = executor.submit(
+                flight.do, "k", lambda: "unused", wait_timeout=5, on_timeout=_unused
+            )
+            release.set()
+
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_waits_for_lock_held_by_another_worker(self):
+        redis = InMemoryRedis()
+        other_worker, this_worker = _flight(redis), _flight(redis)
+        started, release = threading.Event(), threading.Event()
+        order = []
+
+        def _other():
+            started.set()
+            release.wait(5)
+            order.append("other")
+            return "stored"
+
+        def _this():
+            order.append("this")
+            return "reused"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(
+                other_worker.do, "k", _other, wait_timeout=5, on_timeout=_unused
+            )
+            assert started.wait(5)
+            waiting = executor.submit(
+                this_worker.do, "k", _this, wait_timeout=5, on_timeout=_unused
+            )
+            release.set()
+
+            assert waiting.result() == ("reused", False)
+        assert order == ["other", "this"]
+
+    def test_returns_fallback_when_lock_wait_times_out(self):
+        redis = InMemoryRedis()
+        redis.set("singleflight:test:k", "someone-else")
+        calls = []
+
+        result = _flight(redis).do(
+            "k", lambda: calls.append(1), wait_timeout=0.05, on_timeout=lambda: "stored"
+        )
+
+        # 기다리다 포기한 요청은 다시 계산하지 않습니다.
+        assert result == ("stored", False)
+        assert calls == []
+        assert redis.strings == {"singleflight:test:k": "someone-else"}
+
+    def test_follower_returns_fallback_when_wait_times_out(self):
+        flight = _flight(InMemoryRedis())
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def _slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "fresh"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(
+                flight.do, "k", _slow, wait_timeout=5, on_timeout=_unused
+            )
+            assert started.wait(5)
+            follower = flight.do(
+                "k", _slow, wait_timeout=0.05, on_timeout=lambda: "stored"
+            )
+            release.set()
+
+            assert follower == ("stored", False)
+            assert leader.result() == ("fresh", False)
+        assert calls == [1]
+
+    def test_computes_without_lock_when_redis_is_down(self):
+        assert _flight(BrokenRedis()).do(
+            "k", lambda: 1, wait_timeout=1, on_timeout=_unused
+        ) == (1, False)
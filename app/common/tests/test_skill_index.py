@@ -0,0 +1,147 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from common.adapters.skill_index_graph_store import SkillIndexGraphStore
+from common.skill_index import SkillBitmapIndex
+from django.core.management import call_command
+from django.utils import timezone
+from job.models import JobPosting, JobPostingChange
+
+
+class TestSkillBitmapIndex:
+    def _build(self) -> SkillBitmapIndex:
+        index = SkillBitmapIndex()
+        index.upsert(posting_id=1, skills=["Python", "Django"], career_min=1)
+        index.upsert(posting_id=2, skills=["Python"], position_category="backend")
+        index.upsert(
+            posting_id=3,
+            skills=["Python", "Django", "AWS"],
+            position_category="backend",
+            career_min=5,
+            career_max=10,
+        )
+        index.upsert(posting_id=4, skills=["React"])
+        return index
+
+    def test_orders_by_match_count_then_posting_id_desc(self):
+        index = self._build()
+
+        result = index.get_postings_by_skills(
+            user_skills={"Python", "Django"}, limit=10
+        )
+
+        assert result == [3, 1, 2]
+
+    def test_limit_and_empty_skills(self):
+        index = self._build()
+
+        assert index.get_postings_by_skills(user_skills={"Python"}, limit=2) == [3, 2]
+        assert index.get_postings_by_skills(user_skills=set(), limit=10) == []
+
+    def test_filters_by_category_and_career(self):
+        index = self._build()
+
+        assert index.get_postings_by_skills(
+            user_skills={"Python"}, position_category="backend"
+        ) == [3, 2]
+        assert index.get_postings_by_skills(user_skills={"Python"}, career_years=2) == [
+            2,
+            1,
+        ]
+
+    def test_upsert_replaces_skills_and_remove_drops_posting(self):
+        index = self._build()
+
+        index.upsert(posting_id=3, skills=["Go"])
+        index.remove(posting_id=1)
+
+        assert index.get_required_skills(posting_id=3) == {"Go"}
+        assert index.get_postings_by_skills(user_skills={"Python", "Django"}) == [2]
+
+    def test_grows_beyond_initial_capacity(self):
+        index = SkillBitmapIndex()
+        for pid in range(1, 3001):
+            index.upsert(posting_id=pid, skills=["Python"])
+
+        assert len(index) == 3000
+        assert index.get_postings_by_skills(user_skills={"Python"}, limit=3) == [
+            3000,
+            2999,
+            2998,
+        ]
+
+
+@pytest.mark.django_db
+class TestSkillBitmapIndexSync:
+    def _create(self, posting_id: int, skills: list[str]) -> JobPosting:
+        return JobPosting.objects.create(
+            posting_id=posting_id,
+            url=f"https://example.com/job/{posting_id}",
+            company_name="Company",
+            position="Backend Developer",
+            skills_required=skills,
+        )
+
+    def test_rebuild_and_incremental_refresh_from_change_log(self):
+        self._create(1, ["Python"])
+        self._create(2, ["Python", "Django"])
+        index = SkillBitmapIndex()
+        index.rebuild()
+
+        assert index.get_postings_by_skills(user_skills={"Python", "Django"}) == [2, 1]
+        assert index.version == JobPostingChange.latest_version()
+
+        self._create(3, ["Django"])
+        JobPosting.objects.get(posting_id=1).delete()
+
+        assert index.refresh() == 2
+        assert index.get_postings_by_skills(user_skills={"Python", "Django"}) == [2, 3]
+        assert index.refresh() == 0
+
+    def test_refresh_picks_up_change_committed_late_with_lower_id(self):
+        self._create(1, ["Python"])
+        self._create(2, ["Python"])
+        late = JobPostingChange.objects.filter(posting_id=1).order_by("id").first()
+        late_id = late.id
+        late.delete()
+        index = SkillBitmapIndex()
+        index.rebuild()
+
+        # 더 작은 id를 먼저 받은 트랜잭션이 인덱스 빌드 이후에 커밋된 상황
+        JobPosting.objects.filter(posting_id=1).update(skills_required=["Go"])
+        JobPostingChange.objects.create(id=late_id, posting_id=1)
+
+        assert index.refresh() == 1
+        assert index.get_postings_by_skills(user_skills={"Go"}) == [1]
+        assert index.refresh() == 0
+
+    def test_prune_keeps_latest_change_and_index_rebuilds_after_gap(self):
+        self._create(1, ["Python"])
+        index = SkillBitmapIndex()
+        index.rebuild()
+        self._create(2, ["Python"])
+        latest = JobPostingChange.latest_version()
+        JobPostingChange.objects.update(created_at=timezone.now() - timedelta(days=30))
+
+        call_command("prune_posting_changes", days=14)
+
+        assert list(JobPostingChange.objects.values_list("id", flat=True)) == [latest]
+        assert JobPostingChange.latest_version() == latest
+        # 반영 전 변경이 정리되었으므로 refresh는 전체 재빌드로 따라잡습니다.
+        index.refresh()
+        assert index.get_postings_by_skills(user_skills={"Python"}) == [2, 1]
+        assert index.version == latest
+
+    def test_graph_store_reads_from_index_and_delegates_writes(self):
+        self._create(1, ["Python"])
+        fallback = MagicMock()
+        store = SkillIndexGraphStore(fallback=fallback, index=SkillBitmapIndex())
+
+        assert store.get_postings_by_skills(user_skills={"Python"}) == [1]
+        assert store.get_required_skills(posting_id=1) == {"Python"}
+
+        store.upsert_job_posting(
+            posting_id=1, position="Dev", company_name="C", skills_required=["Go"]
+        )
+        fallback.upsert_job_posting.assert_called_once()
@@ -75,6 +75,8 @@ if not os.getenv("USE_NGINX", "False") == "True":
 
 MIDDLEWARE.extend(
     [
+        # 응답 본문을 마지막에 압축하도록 본문을 다루는 middleware보다 앞에 둡니다.
+        "common.middleware.ApiGZipMiddleware",
         "common.middleware.RequestIdMiddleware",
         "corsheaders.middleware.CorsMiddleware",
         "django.contrib.sessions.middleware.SessionMiddleware",
@@ -182,6 +184,16 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "common.authentication.JWTCookieAuthentication",
     ),
+    # orjson 기반 JSON 직렬화/파싱 (출력 형식은 기본 JSONRenderer와 동일)
+    "DEFAULT_RENDERER_CLASSES": (
+        "common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 SIMPLE_JWT = {
@@ -238,6 +250,24 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 
+# Redis (스케줄러/lock 등 앱 공용, 기본은 Celery 브로커와 동일)
+REDIS_URL = os.getenv("REDIS_URL", CELERY_BROKER_URL)
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+
+# 공고 처리 스케줄러: 이 시간(초) 안의 반복 저장은 한 번의 처리로 합칩니다.
+JOB_PROCESSING_DEBOUNCE_SECONDS = float(
+    os.getenv("JOB_PROCESSING_DEBOUNCE_SECONDS", "30")
+)
+# 공고별 처리 lock TTL (워커가 죽어도 lock이 남지 않도록 태스크 time limit보다 약간 길게)
+JOB_PROCESSING_LOCK_TTL_SECONDS = CELERY_TASK_TIME_LIMIT + 60
+# 대량 적재(POST /api/v1/jobs/bulk/): 요청당 최대 행 수 / 처리 태스크 블록 크기
+JOB_INGEST_MAX_ROWS = int(os.getenv("JOB_INGEST_MAX_ROWS", "10000"))
+JOB_INGEST_PROCESS_BLOCK_SIZE = int(os.getenv("JOB_INGEST_PROCESS_BLOCK_SIZE", "500"))
+# 이 시간(초)보다 오래된 pending은 태스크 유실로 보고 다시 예약합니다.
+JOB_PROCESSING_PENDING_STALE_SECONDS = float(
+    os.getenv("JOB_PROCESSING_PENDING_STALE_SECONDS", "900")
+)
+
 # Auto processing switches (mainly for tests)
 AUTO_PROCESS_RESUME_ON_SAVE = os.getenv("AUTO_PROCESS_RESUME_ON_SAVE", "True") == "True"
 AUTO_PROCESS_JOB_ON_SAVE = os.getenv("AUTO_PROCESS_JOB_ON_SAVE", "True") == "True"
@@ -248,6 +278,114 @@ NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 if not NEO4J_PASSWORD:
     raise ValueError("NEO4J_PASSWORD must be set in environment variables")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE") or None
+# 드라이버 연결 풀: 프로세스(워커)당 최대 연결 수 / 풀에서 연결을 얻기까지 대기(초)
+NEO4J_MAX_CONNECTION_POOL_SIZE = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "50"))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(
+    os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "30")
+)
+# 이 시간(초) 이상 유휴 상태였던 연결은 사용 전에 liveness check(RESET)를 수행
+NEO4J_LIVENESS_CHECK_TIMEOUT = float(os.getenv("NEO4J_LIVENESS_CHECK_TIMEOUT", "60"))
+
+# 추천 후보 조회용 그래프 저장소 선택
+# - "neo4j": 매 요청 Neo4j 조회 (기본)
+# - "skill_index": in-process 스킬 비트맵 인덱스 (Postgres 기반, 변경 로그로 증분 갱신)
+GRAPH_STORE_BACKEND = os.getenv("GRAPH_STORE_BACKEND", "neo4j")
+try:
+    SKILL_INDEX_REFRESH_INTERVAL_SECONDS = float(
+        os.getenv("SKILL_INDEX_REFRESH_INTERVAL_SECONDS", "5")
+    )
+except ValueError:
+    SKILL_INDEX_REFRESH_INTERVAL_SECONDS = 5.0
+
+# 회사명 typeahead 사전(in-process)이 다른 프로세스의 변경을 확인하는 주기(초)
+try:
+    COMPANY_DIRECTORY_REFRESH_INTERVAL_SECONDS = float(
+        os.getenv("COMPANY_DIRECTORY_REFRESH_INTERVAL_SECONDS", "5")
+    )
+except ValueError:
+    COMPANY_DIRECTORY_REFRESH_INTERVAL_SECONDS = 5.0
+
+# 스킬 관련 공고(precomputed) 캐시: 이 시간보다 오래된 항목은 그대로 응답하고 Celery 재계산을 예약
+RELATED_POSTINGS_MAX_AGE_SECONDS = int(
+    os.getenv("RELATED_POSTINGS_MAX_AGE_SECONDS", "3600")
+)
+# 공고 변경 로그: 늦게 커밋된 변경을 찾기 위해 다시 읽는 최근 id 구간 / 보존 기간(일)
+JOB_POSTING_CHANGE_RESCAN_WINDOW = int(
+    os.getenv("JOB_POSTING_CHANGE_RESCAN_WINDOW", "1000")
+)
+JOB_POSTING_CHANGE_RETENTION_DAYS = int(
+    os.getenv("JOB_POSTING_CHANGE_RETENTION_DAYS", "14")
+)
+# 현재 세트가 아닌 추천 세트 보존 기간(일). prune_recommendation_sets 가 이보다 오래된 세트를 삭제
+RECOMMENDATION_SET_RETENTION_DAYS = int(
+    os.getenv("RECOMMENDATION_SET_RETENTION_DAYS", "7")
+)
+# 야간 추천 배치: 병렬 worker 수 / 동시 LLM 호출 상한 / 사용자당 추천 수
+RECOMMENDATION_BATCH_WORKERS = int(os.getenv("RECOMMENDATION_BATCH_WORKERS", "4"))
+RECOMMENDATION_BATCH_LLM_CONCURRENCY = int(
+    os.getenv("RECOMMENDATION_BATCH_LLM_CONCURRENCY", "2")
+)
+RECOMMENDATION_BATCH_LIMIT = int(os.getenv("RECOMMENDATION_BATCH_LIMIT", "20"))
+# 추천 검색에서 Chroma chunk 메타데이터의 position_category로 거를지 여부
+# (기존 문서에 메타데이터가 없으므로 `backfill_position_categories --all` 실행 후 켭니다)
+RECOMMENDATION_CHROMA_CATEGORY_FILTER = (
+    os.getenv("RECOMMENDATION_CHROMA_CATEGORY_FILTER", "False") == "True"
+)
+# 공고 처리 직후 대표 이력서에 역매칭해 현재 추천 세트를 증분 갱신할지 여부
+RECOMMENDATION_REVERSE_MATCH_ON_PROCESS = (
+    os.getenv("RECOMMENDATION_REVERSE_MATCH_ON_PROCESS", "True") == "True"
+)
+# 추천된 공고가 수정/삭제되면 커밋 후 해당 사용자의 추천 스냅샷 갱신 태스크를 예약할지 여부
+RECOMMENDATION_SNAPSHOT_REFRESH_ON_CHANGE = (
+    os.getenv("RECOMMENDATION_SNAPSHOT_REFRESH_ON_CHANGE", "True") == "True"
+)
+# 역매칭용 대표 이력서 인덱스(in-process)가 이력서 변경을 확인하는 주기(초)
+RESUME_MATCH_INDEX_REFRESH_INTERVAL_SECONDS = float(
+    os.getenv("RESUME_MATCH_INDEX_REFRESH_INTERVAL_SECONDS", "60")
+)
+# 실시간 추천(for-resume/for-user) 시간 예산(ms). ?budget_ms= 로 지정하며 최대값을 넘으면 잘라냅니다.
+RECOMMENDATION_DEFAULT_BUDGET_MS = int(
+    os.getenv("RECOMMENDATION_DEFAULT_BUDGET_MS", "30000")
+)
+RECOMMENDATION_MAX_BUDGET_MS = int(os.getenv("RECOMMENDATION_MAX_BUDGET_MS", "60000"))
+# 실시간 추천 single-flight: 워커 간 Redis lock TTL / deadline 없는 호출이 다른 계산을 기다릴 최대 시간(초)
+RECOMMENDATION_SINGLEFLIGHT_LOCK_TTL_SECONDS = int(
+    os.getenv("RECOMMENDATION_SINGLEFLIGHT_LOCK_TTL_SECONDS", "90")
+)
+RECOMMENDATION_SINGLEFLIGHT_WAIT_SECONDS = float(
+    os.getenv("RECOMMENDATION_SINGLEFLIGHT_WAIT_SECONDS", "60")
+)
+# 실시간 추천 admission control (worker 프로세스별): 동시 실행 수 / 대기열 길이 / 대기 시간(초) /
+# 거절 시 Retry-After(초). 대기 중인 요청도 스레드를 점유하므로 동시 실행 + 대기열은
+# gunicorn 스레드 수(--threads)보다 작게 둡니다.
+RECOMMENDATION_MAX_CONCURRENT = int(os.getenv("RECOMMENDATION_MAX_CONCURRENT", "2"))
+RECOMMENDATION_MAX_QUEUE = int(os.getenv("RECOMMENDATION_MAX_QUEUE", "1"))
+RECOMMENDATION_QUEUE_TIMEOUT_SECONDS = float(
+    os.getenv("RECOMMENDATION_QUEUE_TIMEOUT_SECONDS", "5")
+)
+RECOMMENDATION_RETRY_AFTER_SECONDS = int(
+    os.getenv("RECOMMENDATION_RETRY_AFTER_SECONDS", "5")
+)
+# 실시간 추천 사용자별 token bucket: 분당 요청 수(0이면 제한 없음) / 연속 허용 수
+RECOMMENDATION_USER_RATE_PER_MINUTE = float(
+    os.getenv("RECOMMENDATION_USER_RATE_PER_MINUTE", "10")
+)
+RECOMMENDATION_USER_RATE_BURST = int(os.getenv("RECOMMENDATION_USER_RATE_BURST", "3"))
+# Slack webhook 요청 간 최소 간격(초)
+SLACK_MIN_INTERVAL_SECONDS = float(os.getenv("SLACK_MIN_INTERVAL_SECONDS", "1.0"))
+# public GET 응답(ETag 지원)의 Cache-Control max-age
+PUBLIC_API_CACHE_MAX_AGE_SECONDS = int(
+    os.getenv("PUBLIC_API_CACHE_MAX_AGE_SECONDS", "60")
+)
+# 스킬 옵션은 배포 사이에 바뀌지 않으므로 더 길게 캐시합니다. (ETag는 목록 해시)
+SKILL_OPTIONS_CACHE_MAX_AGE_SECONDS = int(
+    os.getenv("SKILL_OPTIONS_CACHE_MAX_AGE_SECONDS", "3600")
+)
+
+# API 응답 gzip 압축 (common.middleware.ApiGZipMiddleware)
+API_GZIP_PATH_PREFIX = "/api/"
+API_GZIP_MIN_LENGTH = int(os.getenv("API_GZIP_MIN_LENGTH", "1024"))
 
 # CORS Configuration
 CORS_ALLOWED_ORIGINS = (
@@ -268,6 +406,13 @@ CORS_ALLOW_HEADERS = [
     "x-csrftoken",
     "x-requested-with",
 ]
+CORS_EXPOSE_HEADERS = [
+    "etag",
+    "last-modified",
+    "retry-after",
+    "x-total-count",
+    "x-degraded-stages",
+]
 
 # Security Headers
 SECURE_BROWSER_XSS_FILTER = True
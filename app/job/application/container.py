@@ -2,8 +2,15 @@ from __future__ import annotations
 
 from common.adapters.chroma_vector_store import ChromaVectorStore
 from common.adapters.django_job_repo import DjangoJobPostingRepository
+from common.adapters.django_posting_signature_store import (
+    DjangoPostingSignatureStore,
+)
+from common.adapters.django_skill_stat_repo import DjangoSkillStatRepository
 from common.adapters.neo4j_graph_store import Neo4jGraphStore
 from job.application.usecases.process_job_posting import ProcessJobPostingUseCase
+from job.application.usecases.process_job_postings_bulk import (
+    BulkProcessJobPostingsUseCase,
+)
 
 
 def build_process_job_posting_usecase() -> ProcessJobPostingUseCase:
@@ -14,4 +21,15 @@ def build_process_job_posting_usecase() -> ProcessJobPostingUseCase:
         job_repo=DjangoJobPostingRepository(),
         vector_store=ChromaVectorStore(),
         graph_store=Neo4jGraphStore(),
+        signature_store=DjangoPostingSignatureStore(),
+    )
+
+
+def build_bulk_process_job_postings_usecase() -> BulkProcessJobPostingsUseCase:
+    return BulkProcessJobPostingsUseCase(
+        job_repo=DjangoJobPostingRepository(),
+        vector_store=ChromaVectorStore(),
+        graph_store=Neo4jGraphStore(),
+        skill_stats=DjangoSkillStatRepository(),
+        signature_store=DjangoPostingSignatureStore(),
     )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from common.ports.posting_signature_store import PostingSignatureStorePort
+from job.domain.minhash import MIN_TEXT_CHARS, build_dedup_text, compute_signature
+from job.models import JobPosting
+
+
+def resolve_canonical_id(
+    store: PostingSignatureStorePort, job_posting: JobPosting
+) -> Optional[int]:
+    """
+    공고의 MinHash 서명을 저장하고, 유사 중복이면 대표 공고 ID를 반환합니다.
+
+    본문이 짧아 판정할 수 없으면 서명을 지우고 None(자신이 대표)을 반환합니다.
+    """
+    text = build_dedup_text(
+        job_posting.main_tasks, job_posting.requirements, job_posting.preferred_points
+    )
+    if len(text) < MIN_TEXT_CHARS:
+        store.delete(posting_id=job_posting.posting_id)
+        return None
+
+    signature = compute_signature(text)
+    canonical_id = store.find_canonical(
+        posting_id=job_posting.posting_id, signature=signature
+    )
+    store.save(posting_id=job_posting.posting_id, signature=signature)
+    return canonical_id
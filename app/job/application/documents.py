@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from common.ports.vector_store import VectorStorePort
+from job.application.chunking import chunk_text_for_rag
+from job.application.embedding_text import build_job_posting_embedding_text
+from job.models import JobPosting
+
+JOB_POSTINGS_COLLECTION = "job_postings"
+JOB_POSTING_CHUNKS_COLLECTION = "job_posting_chunks"
+
+# 너무 짧은 텍스트는 검색/임베딩 가치가 낮아서 제외
+MIN_EMBEDDING_TEXT_CHARS = 10
+MIN_CHUNK_CHARS = 20
+
+
+@dataclass(frozen=True)
+class VectorDocument:
+    collection_name: str
+    doc_id: str
+    text: str
+    metadata: dict
+
+
+def build_job_posting_documents(job_posting: JobPosting) -> list[VectorDocument]:
+    """
+    채용 공고 1건의 벡터 문서(공고 본문 1개 + RAG용 섹션 chunk들)를 생성합니다.
+
+    단건/대량 처리 유스케이스가 같은 문서 구성을 쓰도록 공통화한 함수입니다.
+    """
+    posting_id = job_posting.posting_id
+    documents: list[VectorDocument] = []
+
+    embedding_text, metadata = build_job_posting_embedding_text(job_posting)
+    if len(embedding_text) > MIN_EMBEDDING_TEXT_CHARS:
+        documents.append(
+            VectorDocument(
+                collection_name=JOB_POSTINGS_COLLECTION,
+                doc_id=str(posting_id),
+                text=embedding_text,
+                metadata=metadata,
+            )
+        )
+
+    # RAG용 섹션 chunk
+    # - requirements / preferred_points / main_tasks / skills_required(+position) 를 분리해서 저장
+    # - 추천 시 "근거 스니펫"을 직접 검색/인용할 수 있게 합니다.
+    sections: list[tuple[str, str]] = [
+        ("tasks", job_posting.main_tasks or ""),
+        ("requirements", job_posting.requirements or ""),
+        ("preferred", job_posting.preferred_points or ""),
+        ("stack", ", ".join(job_posting.skills_required or [])),
+        ("position", job_posting.position or ""),
+    ]
+    for section_name, section_text in sections:
+        for ch in chunk_text_for_rag(section=section_name, text=section_text):
+            if len(ch.text) < MIN_CHUNK_CHARS:
+                continue
+            documents.append(
+                VectorDocument(
+                    collection_name=JOB_POSTING_CHUNKS_COLLECTION,
+                    doc_id=f"{posting_id}:{ch.section}:{ch.chunk_index}",
+                    text=ch.text,
+                    metadata={
+                        **(metadata or {}),
+                        "posting_id": int(posting_id),
+                        "section": ch.section,
+                        "chunk_index": int(ch.chunk_index),
+                    },
+                )
+            )
+    return documents
+
+
+def delete_job_posting_documents(
+    vector_store: VectorStorePort, posting_ids: list[int]
+) -> None:
+    """
+    공고들의 벡터 문서(공고 본문 + 섹션 chunk)를 삭제합니다.
+
+    유사 중복으로 판정되어 더 이상 임베딩하지 않는 공고가 검색 결과에 남지 않도록 사용합니다.
+    """
+    if not posting_ids:
+        return
+    vector_store.delete_documents(
+        collection_name=JOB_POSTINGS_COLLECTION,
+        doc_ids=[str(posting_id) for posting_id in posting_ids],
+    )
+    vector_store.delete_documents(
+        collection_name=JOB_POSTING_CHUNKS_COLLECTION,
+        where={"posting_id": {"$in": [int(posting_id) for posting_id in posting_ids]}},
+    )
+
+
+def push_position_categories(
+    vector_store: VectorStorePort, categories: dict[int, str]
+) -> int:
+    """
+    공고별 position_category를 이미 저장된 벡터 문서(공고 본문 + 섹션 chunk) 메타데이터에 반영합니다.
+
+    기존 메타데이터에 카테고리만 덮어써서 다시 쓰므로 재임베딩하지 않습니다.
+
+    Returns:
+        갱신한 문서 수
+    """
+    if not categories:
+        return 0
+    posting_ids = [int(posting_id) for posting_id in categories]
+    updated = 0
+    for collection_name, metadatas_by_id in (
+        (
+            JOB_POSTINGS_COLLECTION,
+            vector_store.get_metadatas(
+                collection_name=JOB_POSTINGS_COLLECTION,
+                doc_ids=[str(posting_id) for posting_id in posting_ids],
+            ),
+        ),
+        (
+            JOB_POSTING_CHUNKS_COLLECTION,
+            vector_store.get_metadatas(
+                collection_name=JOB_POSTING_CHUNKS_COLLECTION,
+                where={"posting_id": {"$in": posting_ids}},
+            ),
+        ),
+    ):
+        doc_ids, metadatas = [], []
+        for doc_id, metadata in metadatas_by_id.items():
+            # 공고 본문 문서는 doc_id가 곧 posting_id입니다.
+            category = categories.get(int(metadata.get("posting_id", doc_id)))
+            if category is None or metadata.get("position_category") == category:
+                continue
+            doc_ids.append(doc_id)
+            metadatas.append({**metadata, "position_category": category})
+        vector_store.update_metadatas(
+            collection_name=collection_name, doc_ids=doc_ids, metadatas=metadatas
+        )
+        updated += len(doc_ids)
+    return updated
@@ -37,6 +37,8 @@ def build_job_posting_embedding_text(job_posting: JobPosting) -> tuple[str, dict
         "company_name": job_posting.company_name or "",
         "location": job_posting.location or "",
         "position": job_posting.position or "",
+        # 추천 검색에서 Chroma where로 포지션 카테고리를 거르기 위한 메타데이터
+        "position_category": job_posting.resolved_position_category,
         "employment_type": job_posting.employment_type or "",
         "career_min": job_posting.career_min,
         "career_max": job_posting.career_max,
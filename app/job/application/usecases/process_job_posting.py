@@ -5,9 +5,14 @@ import logging
 from common.application.result import Err, Ok, Result
 from common.ports.graph_store import GraphStorePort
 from common.ports.job_repo import JobPostingRepositoryPort
+from common.ports.posting_signature_store import PostingSignatureStorePort
 from common.ports.vector_store import VectorStorePort
-from job.application.chunking import chunk_text_for_rag
-from job.application.embedding_text import build_job_posting_embedding_text
+from job.application.dedup import resolve_canonical_id
+from job.application.documents import (
+    JOB_POSTINGS_COLLECTION,
+    build_job_posting_documents,
+    delete_job_posting_documents,
+)
 from job.dtos import ProcessJobPostingResultDTO
 from skill.services import SkillExtractionService
 
@@ -19,8 +24,11 @@ class ProcessJobPostingUseCase:
     채용 공고 처리 유스케이스.
 
     - 스킬 추출(필수/우대)
+    - 유사 중복 판정(MinHash LSH, 중복 공고는 임베딩 생략)
     - 임베딩 업서트(Chroma)
     - 그래프 업데이트(Neo4j)
+
+    스킬 통계(SkillStat)는 스킬 필드 저장 시 `JobPosting.save()`가 이전 값과의 차이로 반영합니다.
     """
 
     def __init__(
@@ -29,10 +37,12 @@ class ProcessJobPostingUseCase:
         job_repo: JobPostingRepositoryPort,
         vector_store: VectorStorePort,
         graph_store: GraphStorePort,
+        signature_store: PostingSignatureStorePort | None = None,
     ):
         self._job_repo = job_repo
         self._vector_store = vector_store
         self._graph_store = graph_store
+        self._signature_store = signature_store
 
     def execute(self, *, posting_id: int) -> Result[ProcessJobPostingResultDTO]:
         job_posting = self._job_repo.get_by_id(posting_id)
@@ -59,52 +69,36 @@ class ProcessJobPostingUseCase:
                 job_posting, update_fields=["skills_required", "skills_preferred"]
             )
 
-        # 3) 임베딩 업서트
-        embedding_text, metadata = build_job_posting_embedding_text(job_posting)
-        if len(embedding_text) > 10:
-            self._vector_store.upsert_text(
-                collection_name="job_postings",
-                doc_id=str(posting_id),
-                text=embedding_text,
-                metadata=metadata,
+        # 3) 유사 중복 판정 → 대표 공고 표시
+        if self._signature_store is not None:
+            canonical_id = resolve_canonical_id(self._signature_store, job_posting)
+            if job_posting.duplicate_of_id != canonical_id:
+                job_posting.duplicate_of_id = canonical_id
+                self._job_repo.save(job_posting, update_fields=["duplicate_of"])
+                # 대표 공고였다가 중복이 된 공고의 기존 벡터는 검색에 남지 않도록 지웁니다.
+                if canonical_id is not None:
+                    delete_job_posting_documents(self._vector_store, [posting_id])
+
+        # 4) 임베딩 업서트 (공고 본문 + RAG용 섹션 chunk, 대표 공고만)
+        if job_posting.duplicate_of_id is not None:
+            logger.info(
+                f"Skip embedding duplicate posting {posting_id} "
+                f"(canonical={job_posting.duplicate_of_id})"
             )
+            documents = []
         else:
-            logger.warning(f"Embedding text too short for posting {posting_id}")
-
-        # 3-2) RAG용 섹션 chunk 임베딩 업서트
-        # - requirements / preferred_points / main_tasks / skills_required(+position) 를 분리해서 저장
-        # - 추천 시 "근거 스니펫"을 직접 검색/인용할 수 있게 합니다.
-        chunks_collection = "job_posting_chunks"
-        sections: list[tuple[str, str]] = [
-            ("tasks", job_posting.main_tasks or ""),
-            ("requirements", job_posting.requirements or ""),
-            ("preferred", job_posting.preferred_points or ""),
-            (
-                "stack",
-                ", ".join(job_posting.skills_required or []),
-            ),
-            ("position", job_posting.position or ""),
-        ]
-        for section_name, section_text in sections:
-            for ch in chunk_text_for_rag(section=section_name, text=section_text):
-                doc_id = f"{posting_id}:{ch.section}:{ch.chunk_index}"
-                chunk_metadata = {
-                    **(metadata or {}),
-                    "posting_id": int(posting_id),
-                    "section": ch.section,
-                    "chunk_index": int(ch.chunk_index),
-                }
-                # 너무 짧은 텍스트는 검색/임베딩 가치가 낮아서 제외
-                if len(ch.text) < 20:
-                    continue
-                self._vector_store.upsert_text(
-                    collection_name=chunks_collection,
-                    doc_id=doc_id,
-                    text=ch.text,
-                    metadata=chunk_metadata,
-                )
+            documents = build_job_posting_documents(job_posting)
+            if not any(d.collection_name == JOB_POSTINGS_COLLECTION for d in documents):
+                logger.warning(f"Embedding text too short for posting {posting_id}")
+        for document in documents:
+            self._vector_store.upsert_text(
+                collection_name=document.collection_name,
+                doc_id=document.doc_id,
+                text=document.text,
+                metadata=document.metadata,
+            )
 
-        # 4) 그래프 업데이트
+        # 5) 그래프 업데이트
         if skills_required:
             self._graph_store.upsert_job_posting(
                 posting_id=posting_id,
@@ -121,5 +115,6 @@ class ProcessJobPostingUseCase:
                 skills_preferred_text=(
                     skills_preferred[:50] if skills_preferred else ""
                 ),
+                duplicate_of=job_posting.duplicate_of_id,
             )
         )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+
+from common.application.result import Err, Ok, Result
+from common.ports.graph_store import GraphStorePort
+from common.ports.job_repo import JobPostingRepositoryPort
+from common.ports.posting_signature_store import PostingSignatureStorePort
+from common.ports.skill_stats import SkillStatsPort
+from common.ports.vector_store import VectorStorePort
+from job.application.dedup import resolve_canonical_id
+from job.application.documents import (
+    VectorDocument,
+    build_job_posting_documents,
+    delete_job_posting_documents,
+)
+from job.dtos import BulkProcessJobPostingsResultDTO
+from skill.services import SkillExtractionService
+
+logger = logging.getLogger(__name__)
+
+
+class BulkProcessJobPostingsUseCase:
+    """
+    채용 공고 대량 처리 유스케이스 (reindex용).
+
+    단건 유스케이스와 같은 결과를 만들되, 공고 블록 단위로 외부 호출을 묶습니다.
+    - 공고 로드: 1회 쿼리
+    - 스킬 필드 저장: bulk_update 1회
+    - 유사 중복 판정: posting_id 오름차순으로 서명 저장 (블록 내 중복도 탐지)
+    - 임베딩 업서트: 컬렉션별 1회 (배치 임베딩)
+    - 그래프 업데이트: UNWIND 1회
+    """
+
+    def __init__(
+        self,
+        *,
+        job_repo: JobPostingRepositoryPort,
+        vector_store: VectorStorePort,
+        graph_store: GraphStorePort,
+        skill_stats: SkillStatsPort | None = None,
+        signature_store: PostingSignatureStorePort | None = None,
+    ):
+        self._job_repo = job_repo
+        self._vector_store = vector_store
+        self._graph_store = graph_store
+        self._skill_stats = skill_stats
+        self._signature_store = signature_store
+
+    def execute(
+        self, *, posting_ids: list[int]
+    ) -> Result[BulkProcessJobPostingsResultDTO]:
+        if not posting_ids:
+            return Err(code="INVALID", message="posting_ids is empty")
+
+        started = time.perf_counter()
+        job_postings = self._job_repo.get_many(posting_ids)
+        found_ids = {jp.posting_id for jp in job_postings}
+        missing_ids = [pid for pid in posting_ids if pid not in found_ids]
+
+        # 1) 스킬 추출 + 변경분만 모아서 저장
+        changed = []
+        skill_diffs = []
+        for job_posting in job_postings:
+            skills_required, skills_preferred = (
+                SkillExtractionService.extract_skills_from_job_posting(
+                    requirements=job_posting.requirements,
+                    preferred_points=job_posting.preferred_points,
+                    main_tasks=job_posting.main_tasks,
+                )
+            )
+            previous_required = set(job_posting.skills_required or [])
+            if (
+                job_posting.skills_required != skills_required
+                or job_posting.skills_preferred != skills_preferred
+            ):
+                job_posting.skills_required = skills_required
+                job_posting.skills_preferred = skills_preferred
+                changed.append(job_posting)
+            skill_diffs.append((job_posting, previous_required, set(skills_required)))
+        self._job_repo.bulk_update_skills(changed)
+
+        # 2) 유사 중복 판정 (등록 순서대로 서명을 저장해야 블록 내 대표 공고가 먼저 저장됨)
+        if self._signature_store is not None:
+            duplicates_changed = []
+            for job_posting in sorted(
+                job_postings, key=lambda jp: (jp.created_at, jp.posting_id)
+            ):
+                canonical_id = resolve_canonical_id(self._signature_store, job_posting)
+                if job_posting.duplicate_of_id != canonical_id:
+                    job_posting.duplicate_of_id = canonical_id
+                    duplicates_changed.append(job_posting)
+            self._job_repo.bulk_update_duplicates(duplicates_changed)
+            # 새로 중복이 된 공고의 기존 벡터는 검색에 남지 않도록 지웁니다.
+            delete_job_posting_documents(
+                self._vector_store,
+                [
+                    jp.posting_id
+                    for jp in duplicates_changed
+                    if jp.duplicate_of_id is not None
+                ],
+            )
+
+        # 3) 임베딩 업서트 (컬렉션별 배치, 대표 공고만)
+        documents_by_collection: dict[str, list[VectorDocument]] = defaultdict(list)
+        for job_posting in job_postings:
+            if job_posting.duplicate_of_id is not None:
+                continue
+            for document in build_job_posting_documents(job_posting):
+                documents_by_collection[document.collection_name].append(document)
+        for collection_name, documents in documents_by_collection.items():
+            self._vector_store.upsert_texts(
+                collection_name=collection_name,
+                doc_ids=[d.doc_id for d in documents],
+                texts=[d.text for d in documents],
+                metadatas=[d.metadata for d in documents],
+            )
+
+        # 4) 그래프 업데이트 (UNWIND)
+        self._graph_store.upsert_job_postings(
+            postings=[
+                {
+                    "posting_id": jp.posting_id,
+                    "position": jp.position,
+                    "company_name": jp.company_name,
+                    "skills_required": jp.skills_required,
+                }
+                for jp in job_postings
+                if jp.skills_required
+            ]
+        )
+
+        # 5) 스킬 통계 증분 갱신 (bulk_update는 save()를 거치지 않으므로 직접 반영)
+        if self._skill_stats is not None:
+            for job_posting, previous_required, current_required in skill_diffs:
+                self._skill_stats.apply_posting_change(
+                    added=current_required - previous_required,
+                    removed=previous_required - current_required,
+                    posted_at=job_posting.created_at,
+                )
+
+        elapsed = time.perf_counter() - started
+        processed = len(job_postings)
+        logger.info(
+            f"Bulk processed {processed}/{len(posting_ids)} postings "
+            f"in {elapsed:.2f}s ({processed / elapsed if elapsed else 0:.1f}/s)"
+        )
+        return Ok(
+            BulkProcessJobPostingsResultDTO(
+                success=True,
+                requested=len(posting_ids),
+                processed=processed,
+                missing_ids=missing_ids,
+                skills_updated=len(changed),
+                duplicates=sum(1 for jp in job_postings if jp.duplicate_of_id),
+                documents=sum(len(d) for d in documents_by_collection.values()),
+                elapsed_seconds=round(elapsed, 3),
+                postings_per_second=round(processed / elapsed, 2) if elapsed else 0.0,
+            )
+        )
@@ -0,0 +1,107 @@
+"""
+공고 변경 로그(`JobPostingChange`) 읽기/정리.
+
+Postgres 시퀀스 id는 커밋 순서대로 보이지 않습니다. 먼저 id를 받은 트랜잭션이 나중에 커밋되면,
+"마지막 버전 이후(id > version)"만 읽는 소비자는 그 변경을 영원히 건너뜁니다.
+`ChangeLogCursor`는 마지막 버전 아래 최근 rescan_window 개 id 구간을 매번 다시 읽고, 이미 반영한
+id를 기억해 늦게 커밋된 변경만 추가로 돌려줍니다.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def _rescan_window() -> int:
+    return max(0, int(getattr(settings, "JOB_POSTING_CHANGE_RESCAN_WINDOW", 1000)))
+
+
+class ChangeLogCursor:
+    """
+    변경 로그 증분 읽기 커서 (호출자가 동시 접근을 직렬화해야 합니다)
+
+    version: 반영한 최대 변경 id
+    """
+
+    def __init__(self, *, rescan_window: Optional[int] = None):
+        self._rescan_window = (
+            _rescan_window() if rescan_window is None else max(0, rescan_window)
+        )
+        self.version = 0
+        self._seen_recent: set[int] = set()
+
+    def reset(self) -> int:
+        """
+        현재 보이는 변경 로그 끝으로 이동합니다. (전체 재빌드 직전에 호출)
+
+        Returns:
+            새 version
+        """
+        from job.models import JobPostingChange
+
+        version = JobPostingChange.latest_version()
+        self.version = version
+        self._seen_recent = set(
+            JobPostingChange.objects.filter(
+                id__gt=version - self._rescan_window, id__lte=version
+            ).values_list("id", flat=True)
+        )
+        return version
+
+    def read(self) -> list[tuple[int, int, str]]:
+        """
+        아직 반영하지 않은 변경 (id, posting_id, op)을 id 순으로 반환하고 커서를 옮깁니다.
+        """
+        from job.models import JobPostingChange
+
+        low = max(0, self.version - self._rescan_window)
+        changes = [
+            change
+            for change in JobPostingChange.objects.filter(id__gt=low)
+            .order_by("id")
+            .values_list("id", "posting_id", "op")
+            if change[0] > self.version or change[0] not in self._seen_recent
+        ]
+        if not changes:
+            return []
+
+        self.version = max(self.version, changes[-1][0])
+        floor = self.version - self._rescan_window
+        self._seen_recent = {
+            change_id
+            for change_id in self._seen_recent.union(c[0] for c in changes)
+            if change_id > floor
+        }
+        return changes
+
+    def history_pruned(self) -> bool:
+        """
+        version 이하 변경이 하나도 남아 있지 않으면(보존 기간 정리로 삭제됨) 그 사이 변경을
+        놓쳤을 수 있으므로 호출자는 전체 재빌드해야 합니다.
+        """
+        from job.models import JobPostingChange
+
+        if self.version <= 0:
+            return False
+        return not JobPostingChange.objects.filter(id__lte=self.version).exists()
+
+
+def prune_posting_changes(*, older_than_days: int) -> int:
+    """
+    보존 기간이 지난 변경 로그를 삭제합니다. (최신 1건은 버전 유지를 위해 남김)
+
+    Returns:
+        삭제한 행 수
+    """
+    from job.models import JobPostingChange
+
+    latest = JobPostingChange.latest_version()
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    deleted, _ = JobPostingChange.objects.filter(
+        created_at__lt=cutoff, id__lt=latest
+    ).delete()
+    return deleted
@@ -0,0 +1,179 @@
+"""
+In-process 회사명 typeahead 사전.
+
+`Company` 테이블(posting_count > 0)을 정렬된 검색 키 배열로 메모리에 올려 두고
+prefix를 이진 탐색(bisect)으로 찾습니다. 요청마다 공고 테이블을 DISTINCT/ILIKE 스캔하지 않으므로
+지연 시간이 공고 수와 무관합니다.
+
+- 검색 키: `job.domain.company.company_search_keys` (전체 이름 + 단어 시작 접미사)
+- 결과 순서: prefix 매칭(공고 수 내림차순, 이름순) → 부족하면 부분 문자열 매칭으로 채움
+- 부분 문자열 매칭은 bigram(1글자 질의는 글자) → 순위 목록 역색인에서 가장 짧은 목록만 확인하므로
+  전체 회사명을 훑지 않습니다.
+- 같은 프로세스의 쓰기는 `mark_stale()`로 즉시, 다른 프로세스의 쓰기는
+  refresh_interval 마다 `Company` 버전(Max(updated_at), 행 수)을 확인해 반영합니다.
+  공고 저장만으로는 Company.updated_at이 바뀌지 않으므로(공고 수가 바뀔 때만 갱신) 다시 적재하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from django.conf import settings
+from job.domain.company import company_search_keys, normalize_company_name
+
+logger = logging.getLogger(__name__)
+
+
+def _ngrams(text: str) -> list[str]:
+    """부분 문자열 질의 키: 2글자 이상은 bigram, 1글자는 글자 자체"""
+    if len(text) < 2:
+        return [text] if text else []
+    return [text[i : i + 2] for i in range(len(text) - 1)]
+
+
+class CompanyDirectory:
+    _instance: Optional["CompanyDirectory"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, *, refresh_interval_seconds: float = 5.0):
+        self._lock = threading.RLock()
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._last_refresh_check = 0.0
+        self._stale = True
+        self._version: tuple = ()
+        self.load([])
+
+    @classmethod
+    def get_instance(cls) -> "CompanyDirectory":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = CompanyDirectory(
+                        refresh_interval_seconds=float(
+                            getattr(
+                                settings,
+                                "COMPANY_DIRECTORY_REFRESH_INTERVAL_SECONDS",
+                                5,
+                            )
+                        )
+                    )
+        return cls._instance
+
+    @classmethod
+    def mark_stale(cls) -> None:
+        """다음 조회 시 다시 적재하도록 표시합니다. (Company 갱신 직후 호출)"""
+        if cls._instance is not None:
+            cls._instance._stale = True
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    def load(self, rows: Iterable[tuple[str, int]]) -> None:
+        """
+        (회사명, 공고 수) 목록으로 사전을 다시 만듭니다.
+        """
+        ranked = sorted(
+            ((name, count) for name, count in rows if name and count > 0),
+            key=lambda row: (-row[1], row[0]),
+        )
+        names = [name for name, _ in ranked]
+        entries = sorted(
+            (key, rank)
+            for rank, name in enumerate(names)
+            for key in company_search_keys(name)
+        )
+        normalized = [normalize_company_name(name) for name in names]
+        grams: dict[str, list[int]] = defaultdict(list)
+        for rank, text in enumerate(normalized):
+            # 1글자 질의도 찾을 수 있도록 글자 단위 키를 함께 둡니다.
+            for gram in set(text).union(_ngrams(text)):
+                grams[gram].append(rank)
+        with self._lock:
+            self._names = names
+            self._normalized = normalized
+            self._keys = [key for key, _ in entries]
+            self._key_ranks = [rank for _, rank in entries]
+            self._grams = dict(grams)
+
+    @staticmethod
+    def _current_version() -> tuple:
+        from django.db.models import Count, Max
+        from job.models import Company
+
+        stats = Company.objects.aggregate(
+            updated_at=Max("updated_at"), rows=Count("id")
+        )
+        return (stats["updated_at"], stats["rows"])
+
+    def ensure_fresh(self) -> None:
+        if self._stale:
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now - self._last_refresh_check < self._refresh_interval_seconds:
+            return
+        self._last_refresh_check = now
+        if self._current_version() != self._version:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        from job.models import Company
+
+        started = time.perf_counter()
+        with self._lock:
+            # 적재 도중 들어온 쓰기는 다시 stale로 표시되므로 플래그를 먼저 내립니다.
+            self._stale = False
+            version = self._current_version()
+            self.load(
+                Company.objects.filter(posting_count__gt=0).values_list(
+                    "name", "posting_count"
+                )
+            )
+            self._version = version
+            self._last_refresh_check = time.monotonic()
+        logger.info(
+            f"CompanyDirectory loaded: {len(self._names)} companies "
+            f"({time.perf_counter() - started:.3f}s)"
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, q: str = "", *, limit: int = 20) -> list[str]:
+        if limit <= 0:
+            return []
+        query = normalize_company_name(q)
+        with self._lock:
+            names, normalized = self._names, self._normalized
+            keys, key_ranks = self._keys, self._key_ranks
+            grams = self._grams
+        if not query:
+            return names[:limit]
+
+        prefix_ranks: set[int] = set()
+        i = bisect_left(keys, query)
+        while i < len(keys) and keys[i].startswith(query):
+            prefix_ranks.add(key_ranks[i])
+            i += 1
+        ranks = sorted(prefix_ranks)[:limit]
+
+        if len(ranks) < limit:
+            # 단어 경계가 없는 합성어("카카오뱅크"의 "뱅크")는 부분 문자열로 보충합니다.
+            # 질의의 n-gram 중 가장 드문 것의 순위 목록(오름차순)만 확인합니다.
+            candidates = min(
+                (grams.get(gram, []) for gram in set(_ngrams(query))), key=len
+            )
+            for rank in candidates:
+                if rank not in prefix_ranks and query in normalized[rank]:
+                    ranks.append(rank)
+                    if len(ranks) >= limit:
+                        break
+        return [names[rank] for rank in ranks]
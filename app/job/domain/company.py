@@ -0,0 +1,34 @@
+"""
+회사명 정규화 / typeahead 검색 키 (순수 도메인 로직).
+
+- 법인 표기("(주)", "주식회사", "Inc." 등), 구두점, 공백을 제거하고 소문자로 비교합니다.
+- 검색 키는 전체 이름 + 각 단어 시작 위치부터의 접미사입니다.
+  ("Company Alpha" → "companyalpha", "alpha") 그래서 prefix 검색만으로
+  단어 중간부터 입력한 경우("Alpha")도 찾을 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_LEGAL_FORMS = re.compile(
+    r"\(주\)|㈜|주식회사|\(유\)|유한회사|\(사\)|사단법인|\(재\)|재단법인"
+    r"|\b(?:co\.?,?\s*ltd|inc|corp|llc)\b\.?",
+    re.IGNORECASE,
+)
+_WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def company_words(name: str) -> list[str]:
+    text = unicodedata.normalize("NFKC", name or "").lower()
+    return _WORD.findall(_LEGAL_FORMS.sub(" ", text))
+
+
+def normalize_company_name(name: str) -> str:
+    return "".join(company_words(name))
+
+
+def company_search_keys(name: str) -> list[str]:
+    words = company_words(name)
+    return list(dict.fromkeys("".join(words[i:]) for i in range(len(words))))
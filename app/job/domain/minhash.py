@@ -0,0 +1,107 @@
+"""
+MinHash / LSH 기반 유사 중복 공고 탐지 (순수 도메인 로직).
+
+- 공고 본문(main_tasks + requirements + preferred_points)을 정규화한 뒤
+  문자 n-gram(shingle) 집합으로 만들고, 128개 해시 순열의 최솟값으로 서명을 만듭니다.
+- 서명을 BANDS개 밴드(밴드당 ROWS_PER_BAND행)로 나눈 해시가 버킷 키입니다.
+  같은 버킷을 하나라도 공유하면 후보이며, 서명 일치율(≈ Jaccard)로 최종 판정합니다.
+- BANDS=16, ROWS=8 이면 후보가 될 확률이 50%인 Jaccard 임계값은 약 (1/16)^(1/8) ≈ 0.71 입니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+import numpy as np
+
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+# 이 길이보다 짧은 본문은 정보가 적어 중복 판정을 하지 않습니다.
+MIN_TEXT_CHARS = 50
+DUPLICATE_THRESHOLD = 0.85
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20240611)
+# (a * x + b) mod p 해시 순열 파라미터 (프로세스/배포 간 동일해야 하므로 고정 시드)
+_PERM_A = _rng.integers(1, (1 << 31) - 1, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, (1 << 31) - 1, size=NUM_PERM, dtype=np.uint64)
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    소문자화, 유니코드 정규화(NFKC), 구두점/공백 제거.
+
+    크롤링 출처마다 다른 공백/불릿/구두점 차이를 없애 같은 공고가 같은 문자열이 되게 합니다.
+    """
+    if not text:
+        return ""
+    t = unicodedata.normalize("NFKC", str(text)).lower()
+    return _NON_WORD.sub("", t)
+
+
+def build_dedup_text(
+    main_tasks: str | None, requirements: str | None, preferred_points: str | None
+) -> str:
+    return normalize_text(
+        " ".join(t for t in (main_tasks, requirements, preferred_points) if t)
+    )
+
+
+def _shingle_hashes(normalized: str) -> np.ndarray:
+    if len(normalized) <= SHINGLE_SIZE:
+        shingles = {normalized}
+    else:
+        shingles = {
+            normalized[i : i + SHINGLE_SIZE]
+            for i in range(len(normalized) - SHINGLE_SIZE + 1)
+        }
+    return np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little"
+            )
+            & 0x7FFFFFFF
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+def compute_signature(normalized: str) -> list[int]:
+    """
+    정규화된 텍스트의 MinHash 서명(길이 NUM_PERM)을 반환합니다.
+    """
+    hashes = _shingle_hashes(normalized)
+    # (NUM_PERM, n_shingles): 31비트 값끼리 곱이므로 uint64에서 overflow 없음
+    permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _MERSENNE_PRIME
+    return [int(v) for v in permuted.min(axis=1)]
+
+
+def band_buckets(signature: list[int]) -> list[tuple[int, int]]:
+    """
+    서명을 밴드별 버킷 키 (band, bucket_hash)로 변환합니다. bucket_hash는 signed 64bit.
+    """
+    buckets = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(
+            ",".join(map(str, rows)).encode("ascii"), digest_size=8
+        ).digest()
+        buckets.append((band, int.from_bytes(digest, "little", signed=True)))
+    return buckets
+
+
+def estimate_similarity(a: list[int], b: list[int]) -> float:
+    """
+    두 서명의 일치 비율 (Jaccard 유사도 추정치).
+    """
+    if not a or not b or len(a) != len(b):
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
@@ -0,0 +1,52 @@
+"""
+포지션명 → 포지션 카테고리 매핑 (순수 도메인 로직).
+
+- 카테고리: backend / frontend / devops / data_ml / mobile / "" (분류 불가)
+- 공고의 카테고리는 저장 시 `JobPosting.position_category`에 미리 계산해 두고,
+  매핑 규칙을 바꾸면 POSITION_CATEGORY_VERSION을 올린 뒤
+  `backfill_position_categories`로 이전 버전 행(과 Chroma 메타데이터)을 다시 계산합니다.
+"""
+
+from __future__ import annotations
+
+# 키워드/우선순위를 바꾸면 올립니다. (저장된 카테고리의 mapper 버전 stamp)
+POSITION_CATEGORY_VERSION = 1
+
+_CATEGORY_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("backend", ("backend", "백엔드", "server", "서버")),
+    ("frontend", ("frontend", "프론트", "web", "웹")),
+    ("devops", ("devops", "infra", "인프라", "sre", "platform", "플랫폼")),
+    ("data_ml", ("data", "ml", "ai", "머신러닝", "데이터", "research", "리서치")),
+    ("mobile", ("android", "ios", "mobile", "모바일")),
+)
+
+
+def normalize_position_text(text: str) -> str:
+    if not text:
+        return ""
+    s = str(text).strip().lower()
+    s = s.replace(" ", "").replace("/", "").replace("-", "").replace("_", "")
+    return s
+
+
+def map_position_to_category(normalized_text: str) -> str:
+    if not normalized_text:
+        return ""
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if any(k in normalized_text for k in keywords):
+            return category
+    return ""
+
+
+def position_category_of(position: str) -> str:
+    """포지션명 원문 → 카테고리"""
+    return map_position_to_category(normalize_position_text(position))
+
+
+def resolve_position_category(
+    position: str, stored_category: str, stored_version: int
+) -> str:
+    """저장된 카테고리가 현재 mapper 버전이면 그대로 쓰고, 아니면 다시 계산합니다."""
+    if stored_version == POSITION_CATEGORY_VERSION:
+        return stored_category or ""
+    return position_category_of(position)
@@ -0,0 +1,50 @@
+"""
+공고 목록 검색어(q) → Postgres tsquery 변환 (순수 도메인 로직).
+
+검색 컬럼(search_vector)은 'simple' 설정으로 만들어 형태소 분석을 하지 않습니다.
+한국어는 띄어쓰기 단위 토큰이 조사/복합어와 붙어 있어("백엔드개발자") 그대로는 매칭되지 않으므로,
+문서와 검색어 모두 한글 구간을 2글자 bigram으로 쪼개 색인/검색합니다.
+(bigram 생성 규칙은 migration 0012의 agent_hangul_bigrams() 함수와 동일해야 합니다.)
+"""
+
+from __future__ import annotations
+
+import re
+
+# 밑줄/구두점은 문서 색인 시에도 공백으로 치환되므로 단어 문자만 토큰으로 봅니다.
+_TOKEN = re.compile(r"[^\W_]+", re.UNICODE)
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+# 검색어 토큰 수 상한 (과도하게 긴 tsquery 방지)
+MAX_QUERY_TERMS = 16
+
+
+def hangul_bigrams(text: str) -> list[str]:
+    bigrams = []
+    for run in _HANGUL_RUN.findall(text or ""):
+        if len(run) == 1:
+            continue
+        bigrams.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return bigrams
+
+
+def build_tsquery(q: str) -> str:
+    """
+    검색어를 to_tsquery('simple', ...) 입력 문자열로 변환합니다. (모든 term AND)
+
+    - 한글: 2글자 bigram (한 글자 단어는 prefix 검색)
+    - 그 외: 소문자 prefix 검색 (`term:*`)
+
+    Returns:
+        tsquery 문자열. 검색할 토큰이 없으면 빈 문자열
+    """
+    terms: list[str] = []
+    for token in _TOKEN.findall((q or "").lower()):
+        bigrams = hangul_bigrams(token)
+        non_hangul = _HANGUL_RUN.sub(" ", token).split()
+        terms.extend(f"'{b}'" for b in bigrams)
+        if not bigrams and _HANGUL_RUN.search(token):
+            terms.extend(f"'{h}':*" for h in _HANGUL_RUN.findall(token))
+        terms.extend(f"'{t}':*" for t in non_hangul)
+    # 중복 제거(순서 유지) 후 상한 적용
+    unique = list(dict.fromkeys(terms))[:MAX_QUERY_TERMS]
+    return " & ".join(unique)
@@ -12,4 +12,22 @@ class ProcessJobPostingResultDTO(BaseModel):
     skills_preferred_text: Optional[str] = Field(
         default=None, description="우대 사항 텍스트(일부)"
     )
+    duplicate_of: Optional[int] = Field(
+        default=None, description="유사 중복인 경우 대표 공고 ID"
+    )
     error: Optional[str] = Field(default=None, description="에러 메시지")
+
+
+class BulkProcessJobPostingsResultDTO(BaseModel):
+    success: bool = Field(description="성공 여부")
+    requested: int = Field(default=0, description="요청한 공고 수")
+    processed: int = Field(default=0, description="처리한 공고 수")
+    missing_ids: list[int] = Field(default_factory=list, description="없는 공고 ID")
+    deferred_ids: list[int] = Field(
+        default_factory=list, description="다른 워커가 처리 중이라 미룬 공고 ID"
+    )
+    skills_updated: int = Field(default=0, description="스킬 필드가 바뀐 공고 수")
+    duplicates: int = Field(default=0, description="유사 중복으로 판정된 공고 수")
+    documents: int = Field(default=0, description="업서트한 벡터 문서 수")
+    elapsed_seconds: float = Field(default=0.0, description="처리 시간(초)")
+    postings_per_second: float = Field(default=0.0, description="처리량")
@@ -0,0 +1,73 @@
+"""
+채용 공고 대량 적재(ingest) 입력 포맷 파싱
+
+크롤러가 보내는 NDJSON / CSV / JSON 배열을 공고 dict 목록으로 변환합니다.
+API(parser)와 관리 커맨드가 같은 함수를 사용합니다.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import IO, Iterable, Iterator
+
+# CSV에서 JSON 배열로 받는 컬럼
+_JSON_COLUMNS = {"category"}
+
+
+def iter_ndjson(lines: Iterable[str]) -> Iterator[dict]:
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_no}: {e}") from e
+        if not isinstance(row, dict):
+            raise ValueError(f"Line {line_no} is not a JSON object")
+        yield row
+
+
+def iter_csv(stream: IO[str]) -> Iterator[dict]:
+    """
+    헤더가 있는 CSV를 읽습니다. 빈 값은 None, category는 JSON 배열 또는 '|' 구분 문자열.
+    """
+    for row in csv.DictReader(stream):
+        parsed: dict = {}
+        for key, value in row.items():
+            if key is None:
+                continue
+            value = value.strip() if isinstance(value, str) else value
+            if value == "" or value is None:
+                parsed[key] = None
+            elif key in _JSON_COLUMNS:
+                parsed[key] = (
+                    json.loads(value) if value.startswith("[") else value.split("|")
+                )
+            else:
+                parsed[key] = value
+        yield parsed
+
+
+def load_rows(stream: IO[bytes] | IO[str], fmt: str) -> list[dict]:
+    """
+    Args:
+        stream: 입력 스트림 (bytes면 UTF-8로 디코딩)
+        fmt: "ndjson" | "csv" | "json"
+    """
+    if isinstance(stream, io.TextIOBase):
+        text_stream = stream
+    else:
+        text_stream = io.StringIO(stream.read().decode("utf-8-sig"), newline="")
+    if fmt == "ndjson":
+        return list(iter_ndjson(text_stream))
+    if fmt == "csv":
+        return list(iter_csv(text_stream))
+    if fmt == "json":
+        data = json.load(text_stream)
+        if not isinstance(data, list):
+            raise ValueError("JSON payload must be an array of postings")
+        return data
+    raise ValueError(f"Unsupported format: {fmt}")
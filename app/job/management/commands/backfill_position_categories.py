@@ -0,0 +1,63 @@
+"""
+Management command to backfill JobPosting.position_category.
+
+포지션 카테고리 매핑 규칙(`job.domain.position`)을 바꾸고 POSITION_CATEGORY_VERSION을 올린 뒤,
+이전 버전으로 계산된 공고의 카테고리를 다시 계산합니다.
+다시 계산한 카테고리는 Chroma 문서(공고 본문 + chunk) 메타데이터에도 반영합니다. (재임베딩 없음)
+
+position_category 필드 도입 이전에 임베딩된 문서에는 메타데이터가 없으므로, 배포 후 한 번
+`--all`로 실행한 뒤 RECOMMENDATION_CHROMA_CATEGORY_FILTER를 켭니다.
+"""
+
+import time
+
+from common.adapters.chroma_vector_store import ChromaVectorStore
+from django.core.management.base import BaseCommand
+from job.application.documents import push_position_categories
+from job.domain.position import POSITION_CATEGORY_VERSION
+from job.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = "Recomputes JobPosting.position_category for rows stamped with an older mapper version."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk update (default: 1000)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every posting regardless of its mapper version",
+        )
+        parser.add_argument(
+            "--skip-vectors",
+            action="store_true",
+            help="Do not push the categories into Chroma metadata",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        vector_store = None if options["skip_vectors"] else ChromaVectorStore()
+        documents = 0
+
+        def _push(categories: dict[int, str]) -> None:
+            nonlocal documents
+            documents += push_position_categories(vector_store, categories)
+
+        total = JobPosting.backfill_position_categories(
+            batch_size=options["batch_size"],
+            force=options["all"],
+            on_batch=_push if vector_store is not None else None,
+        )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled position categories: {total} postings, "
+                f"{documents} vector documents "
+                f"(mapper v{POSITION_CATEGORY_VERSION}, {elapsed:.2f}s)"
+            )
+        )
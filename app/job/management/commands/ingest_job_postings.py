@@ -0,0 +1,60 @@
+"""
+Management command to bulk ingest job postings from an NDJSON/CSV/JSON file.
+
+크롤러 결과 파일을 한 번에 upsert 하고, 변경된 공고만 블록 단위 처리 태스크로 넘깁니다.
+"""
+
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from job.ingest import load_rows
+from job.serializers import JobPostingIngestSerializer
+from job.services import JobService
+
+_FORMATS_BY_EXTENSION = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+
+
+class Command(BaseCommand):
+    help = "Bulk upserts job postings from an NDJSON/CSV/JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Input file path.")
+        parser.add_argument(
+            "--format",
+            type=str,
+            choices=["ndjson", "csv", "json"],
+            help="Input format (default: inferred from the file extension).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or _FORMATS_BY_EXTENSION.get(
+            os.path.splitext(path)[1].lower(), "json"
+        )
+
+        started = time.perf_counter()
+        try:
+            with open(path, "rb") as f:
+                rows = load_rows(f, fmt)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Failed to read {path}: {e}")
+
+        valid_rows = []
+        for index, row in enumerate(rows):
+            serializer = JobPostingIngestSerializer(data=row)
+            if serializer.is_valid():
+                valid_rows.append(serializer.validated_data)
+            else:
+                self.stderr.write(f"Row {index} skipped: {serializer.errors}")
+
+        result = JobService.bulk_upsert_job_postings(valid_rows)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Ingested {len(rows)} rows in {elapsed:.2f}s: "
+                f"created={result['created']} updated={result['updated']} "
+                f"unchanged={result['unchanged']} "
+                f"invalid={len(rows) - len(valid_rows)}"
+            )
+        )
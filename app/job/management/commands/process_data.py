@@ -4,12 +4,15 @@ Management command to process existing JobPostings and Resumes using Celery task
 이 커맨드는 기존 데이터를 비동기적으로 처리하여 ChromaDB와 Neo4j에 저장합니다.
 """
 
+import json
+import os
 import time
 
 from celery import group
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 from job.models import JobPosting, Resume
-from job.tasks import process_job_posting
+from job.tasks import process_job_posting, process_job_postings_bulk
 from resume.tasks import process_resume
 
 
@@ -38,6 +41,32 @@ class Command(BaseCommand):
             action="store_true",
             help="Wait for all tasks to complete and show progress.",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help=(
+                "JobPosting only: each task processes a block of postings "
+                "(--batch-size becomes the number of block tasks per wave). "
+                "Always waits per wave, reports throughput and writes a checkpoint."
+            ),
+        )
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=200,
+            help="Number of postings per bulk task (default: 200).",
+        )
+        parser.add_argument(
+            "--checkpoint-file",
+            type=str,
+            default="process_data_checkpoint.json",
+            help="Checkpoint file for --bulk (default: process_data_checkpoint.json).",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Resume --bulk processing after the last checkpointed posting.",
+        )
 
     def handle(self, *args, **options):
         process_job_postings_flag = options["all"] or options["model"] == "jobposting"
@@ -53,7 +82,14 @@ class Command(BaseCommand):
             )
             return
 
-        if process_job_postings_flag:
+        if process_job_postings_flag and options["bulk"]:
+            self.process_job_postings_bulk(
+                batch_size=batch_size,
+                block_size=options["block_size"],
+                checkpoint_file=options["checkpoint_file"],
+                resume=options["resume"],
+            )
+        elif process_job_postings_flag:
             self.process_job_postings(batch_size, wait)
 
         if process_resumes_flag:
@@ -111,6 +147,112 @@ class Command(BaseCommand):
             )
         )
 
+    def process_job_postings_bulk(
+        self, *, batch_size, block_size, checkpoint_file, resume
+    ):
+        """
+        Process JobPostings in blocks (one Celery task per block), wave by wave.
+
+        각 wave가 끝날 때마다 마지막으로 성공한 posting_id를 체크포인트에 기록하므로
+        중단된 경우 --resume 으로 이어서 처리할 수 있습니다.
+        """
+        if block_size <= 0:
+            raise CommandError("--block-size must be positive.")
+
+        last_posting_id = None
+        processed_total = 0
+        if resume and os.path.exists(checkpoint_file):
+            with open(checkpoint_file, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            last_posting_id = checkpoint.get("last_posting_id")
+            processed_total = int(checkpoint.get("processed", 0))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Resuming after posting_id={last_posting_id} "
+                    f"({processed_total} already processed)"
+                )
+            )
+
+        queryset = JobPosting.objects.order_by("posting_id")
+        if last_posting_id is not None:
+            queryset = queryset.filter(posting_id__gt=last_posting_id)
+        posting_ids = list(queryset.values_list("posting_id", flat=True))
+        total = len(posting_ids)
+        if total == 0:
+            self.stdout.write(self.style.WARNING("No JobPostings to process."))
+            return
+
+        blocks = [posting_ids[i : i + block_size] for i in range(0, total, block_size)]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processing {total} JobPostings in {len(blocks)} blocks "
+                f"of {block_size} ({batch_size} blocks per wave)..."
+            )
+        )
+
+        started = time.perf_counter()
+        processed = 0
+        for wave_start in range(0, len(blocks), batch_size):
+            wave = blocks[wave_start : wave_start + batch_size]
+            wave_started = time.perf_counter()
+            results = (
+                group(process_job_postings_bulk.s(block) for block in wave)
+                .apply_async()
+                .get(timeout=1800, propagate=False)
+            )
+
+            # 실패한 블록 직전까지만 체크포인트를 전진시킵니다.
+            failed = None
+            for block, result in zip(wave, results):
+                if not isinstance(result, dict) or not result.get("success"):
+                    failed = (block, result)
+                    break
+                processed += int(result.get("processed", 0))
+                last_posting_id = block[-1]
+
+            self._write_checkpoint(
+                checkpoint_file, last_posting_id, processed_total + processed
+            )
+
+            wave_elapsed = time.perf_counter() - wave_started
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"Wave {wave_start // batch_size + 1}: {processed}/{total} postings "
+                f"({processed / elapsed if elapsed else 0:.1f} postings/sec overall, "
+                f"{wave_elapsed:.1f}s for this wave)"
+            )
+
+            if failed is not None:
+                block, result = failed
+                raise CommandError(
+                    f"Block starting at posting_id={block[0]} failed: {result}. "
+                    f"Re-run with --resume to continue from the checkpoint."
+                )
+
+        elapsed = time.perf_counter() - started
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {processed} JobPostings in {elapsed:.1f}s "
+                f"({processed / elapsed if elapsed else 0:.1f} postings/sec)."
+            )
+        )
+
+    @staticmethod
+    def _write_checkpoint(path, last_posting_id, processed):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "last_posting_id": last_posting_id,
+                    "processed": processed,
+                    "updated_at": timezone.now().isoformat(),
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+
     def process_resumes(self, batch_size, wait):
         """
         Process all Resumes by submitting them to Celery queue.
@@ -0,0 +1,25 @@
+"""
+Management command to prune the job posting change log.
+
+보존 기간(JOB_POSTING_CHANGE_RETENTION_DAYS)이 지난 `JobPostingChange` 행을 삭제합니다.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from job.change_log import prune_posting_changes
+
+
+class Command(BaseCommand):
+    help = "Deletes job posting change log rows older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.JOB_POSTING_CHANGE_RETENTION_DAYS,
+            help="보존 기간(일). 이보다 오래된 변경 로그를 삭제합니다. (최신 1건은 유지)",
+        )
+
+    def handle(self, *args, **options):
+        total = prune_posting_changes(older_than_days=options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Pruned {total} posting changes"))
@@ -0,0 +1,22 @@
+"""
+Management command to rebuild the materialized Company table.
+
+JobPosting 전체를 회사명별로 다시 집계하여 회사 사전(공고 수/last_seen)을 재계산합니다.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from job.models import Company
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the materialized company dictionary (Company) from job postings."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = Company.rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt companies: {total} companies ({elapsed:.2f}s)")
+        )
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0008_alter_jobposting_career_max_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobPostingChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("posting_id", models.IntegerField(db_index=True)),
+                (
+                    "op",
+                    models.CharField(
+                        choices=[("upsert", "upsert"), ("delete", "delete")],
+                        default="upsert",
+                        max_length=10,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "agent_job_posting_change",
+            },
+        ),
+    ]
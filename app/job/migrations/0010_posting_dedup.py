@@ -0,0 +1,68 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0009_jobpostingchange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobPostingSignature",
+            fields=[
+                ("posting_id", models.IntegerField(primary_key=True, serialize=False)),
+                ("signature", models.JSONField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "agent_job_posting_signature",
+            },
+        ),
+        migrations.AddField(
+            model_name="jobposting",
+            name="duplicate_of",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="유사 중복 공고의 대표(canonical) 공고. NULL이면 자신이 대표",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="duplicates",
+                to="job.jobposting",
+            ),
+        ),
+        migrations.CreateModel(
+            name="JobPostingLSHBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("posting_id", models.IntegerField(db_index=True)),
+                ("band", models.SmallIntegerField()),
+                ("bucket", models.BigIntegerField()),
+            ],
+            options={
+                "db_table": "agent_job_posting_lsh_bucket",
+                "indexes": [
+                    models.Index(
+                        fields=["band", "bucket"], name="lsh_bucket_lookup_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("posting_id", "band"),
+                        name="lsh_bucket_posting_band_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+INDEX_NAME = "agent_job_posting_skills_required_gin"
+
+
+def create_gin_index(apps, schema_editor):
+    # GIN(jsonb_ops)은 Postgres 전용입니다. (SQLite 테스트 DB에서는 건너뜀)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+        "ON agent_job_posting USING GIN (skills_required jsonb_ops)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0010_posting_dedup"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,112 @@
+from django.db import migrations
+
+# 문서 텍스트 정규화: 구두점/공백을 하나의 공백으로 (job.domain.search 의 토큰 규칙과 동일)
+CREATE_FUNCTIONS = r"""
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION agent_search_text(src text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT lower(regexp_replace(coalesce(src, ''), '[[:punct:][:space:]]+', ' ', 'g'))
+$$;
+
+CREATE OR REPLACE FUNCTION agent_hangul_bigrams(src text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(substr(w, i, 2), ' '), '')
+    FROM regexp_split_to_table(coalesce(src, ''), '[^가-힣]+') AS w,
+         generate_series(1, greatest(char_length(w) - 1, 0)) AS i
+    WHERE char_length(w) >= 2
+$$;
+
+CREATE OR REPLACE FUNCTION agent_search_tsvector(src text, weight "char")
+RETURNS tsvector LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT setweight(
+        to_tsvector('simple', agent_search_text(src))
+        || to_tsvector('simple', agent_hangul_bigrams(src)),
+        weight
+    )
+$$;
+
+CREATE OR REPLACE FUNCTION agent_job_posting_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector :=
+        agent_search_tsvector(
+            coalesce(NEW.company_name, '') || ' ' || coalesce(NEW.position, ''), 'A'
+        )
+        || agent_search_tsvector(
+            coalesce(NEW.main_tasks, '') || ' ' || coalesce(NEW.requirements, ''), 'B'
+        )
+        || agent_search_tsvector(NEW.preferred_points, 'C')
+        || agent_search_tsvector(
+            coalesce(NEW.location, '') || ' ' || coalesce(NEW.district, ''), 'D'
+        );
+    RETURN NEW;
+END
+$$;
+"""
+
+CREATE_COLUMN = r"""
+ALTER TABLE agent_job_posting ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+DROP TRIGGER IF EXISTS agent_job_posting_search_vector_trg ON agent_job_posting;
+CREATE TRIGGER agent_job_posting_search_vector_trg
+    BEFORE INSERT OR UPDATE OF company_name, position, main_tasks, requirements,
+        preferred_points, location, district
+    ON agent_job_posting
+    FOR EACH ROW EXECUTE FUNCTION agent_job_posting_search_vector_update();
+
+-- 기존 row 백필 (트리거가 search_vector를 다시 계산)
+UPDATE agent_job_posting SET company_name = company_name;
+
+CREATE INDEX IF NOT EXISTS agent_job_posting_search_vector_gin
+    ON agent_job_posting USING GIN (search_vector);
+
+-- 짧은 컬럼 부분/접두 매칭(icontains/istartswith → UPPER(col::text) LIKE)용 trigram 인덱스
+CREATE INDEX IF NOT EXISTS agent_job_posting_company_trgm
+    ON agent_job_posting USING GIN (UPPER(company_name::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS agent_job_posting_position_trgm
+    ON agent_job_posting USING GIN (UPPER(position::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS agent_job_posting_location_trgm
+    ON agent_job_posting USING GIN (UPPER(location::text) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS agent_job_posting_district_trgm
+    ON agent_job_posting USING GIN (UPPER(district::text) gin_trgm_ops);
+"""
+
+DROP_ALL = r"""
+DROP INDEX IF EXISTS agent_job_posting_district_trgm;
+DROP INDEX IF EXISTS agent_job_posting_location_trgm;
+DROP INDEX IF EXISTS agent_job_posting_position_trgm;
+DROP INDEX IF EXISTS agent_job_posting_company_trgm;
+DROP INDEX IF EXISTS agent_job_posting_search_vector_gin;
+DROP TRIGGER IF EXISTS agent_job_posting_search_vector_trg ON agent_job_posting;
+ALTER TABLE agent_job_posting DROP COLUMN IF EXISTS search_vector;
+DROP FUNCTION IF EXISTS agent_job_posting_search_vector_update();
+DROP FUNCTION IF EXISTS agent_search_tsvector(text, "char");
+DROP FUNCTION IF EXISTS agent_hangul_bigrams(text);
+DROP FUNCTION IF EXISTS agent_search_text(text);
+"""
+
+
+def create_search_vector(apps, schema_editor):
+    # tsvector/pg_trgm은 Postgres 전용입니다. (SQLite 테스트 DB에서는 icontains fallback)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_FUNCTIONS, params=None)
+    schema_editor.execute(CREATE_COLUMN, params=None)
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_ALL, params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0011_skills_required_gin"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
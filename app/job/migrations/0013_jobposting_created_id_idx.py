@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 01:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0012_jobposting_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                fields=["created_at", "posting_id"], name="job_posting_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.7 on 2026-10-19 01:19
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+from job.domain.company import normalize_company_name
+
+TRGM_INDEX_NAME = "agent_company_normalized_trgm"
+
+
+def backfill_companies(apps, schema_editor):
+    JobPosting = apps.get_model("job", "JobPosting")
+    Company = apps.get_model("job", "Company")
+    rows = (
+        JobPosting.objects.exclude(company_name="")
+        .values("company_name")
+        .annotate(count=Count("posting_id"), seen=Max("updated_at"))
+    )
+    Company.objects.bulk_create(
+        [
+            Company(
+                name=row["company_name"],
+                normalized_name=normalize_company_name(row["company_name"]),
+                posting_count=row["count"],
+                last_seen=row["seen"],
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+def create_trgm_index(apps, schema_editor):
+    # 부분 문자열 검색용 trigram 인덱스는 Postgres 전용입니다. (pg_trgm은 0012에서 생성)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {TRGM_INDEX_NAME} "
+        "ON agent_company USING GIN (normalized_name gin_trgm_ops)"
+    )
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TRGM_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0013_jobposting_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Company",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("normalized_name", models.CharField(max_length=255)),
+                ("posting_count", models.IntegerField(default=0)),
+                ("last_seen", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "agent_company",
+                "indexes": [
+                    models.Index(
+                        fields=["normalized_name"],
+                        name="company_normalized_prefix_idx",
+                        opclasses=["varchar_pattern_ops"],
+                    ),
+                    models.Index(
+                        fields=["-posting_count", "name"],
+                        name="company_posting_count_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+        migrations.RunPython(backfill_companies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-19 01:41
+
+from django.db import migrations, models
+from job.domain.position import POSITION_CATEGORY_VERSION, position_category_of
+
+
+def backfill_position_categories(apps, schema_editor):
+    JobPosting = apps.get_model("job", "JobPosting")
+    batch = []
+    for posting in JobPosting.objects.only("posting_id", "position").iterator(
+        chunk_size=2000
+    ):
+        posting.position_category = position_category_of(posting.position)
+        posting.position_category_version = POSITION_CATEGORY_VERSION
+        batch.append(posting)
+        if len(batch) >= 1000:
+            JobPosting.objects.bulk_update(
+                batch, ["position_category", "position_category_version"]
+            )
+            batch = []
+    if batch:
+        JobPosting.objects.bulk_update(
+            batch, ["position_category", "position_category_version"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0014_company"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobposting",
+            name="position_category",
+            field=models.CharField(
+                blank=True, default="", help_text="포지션 카테고리", max_length=20
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobposting",
+            name="position_category_version",
+            field=models.PositiveSmallIntegerField(
+                default=0, help_text="position_category를 계산한 mapper 버전"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                fields=["position_category"], name="job_posting_category_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_position_categories, migrations.RunPython.noop),
+    ]
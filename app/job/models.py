@@ -1,5 +1,15 @@
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
 from django.conf import settings
 from django.db import models, transaction
+from job.domain.position import (
+    POSITION_CATEGORY_VERSION,
+    position_category_of,
+    resolve_position_category,
+)
 
 # Backward compatibility imports
 # Resume and JobRecommendation have been moved to separate apps
@@ -7,7 +17,17 @@ from django.db import models, transaction
 from recommendation.models import JobRecommendation  # noqa: F401
 from resume.models import Resume  # noqa: F401
 
-__all__ = ["JobPosting", "Resume", "JobRecommendation"]
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "Company",
+    "JobPosting",
+    "JobPostingChange",
+    "JobPostingSignature",
+    "JobPostingLSHBucket",
+    "Resume",
+    "JobRecommendation",
+]
 
 
 class JobPosting(models.Model):
@@ -30,37 +50,460 @@ class JobPosting(models.Model):
     skills_preferred = models.TextField(
         null=True, blank=True, help_text="우대 사항 원문"
     )
+    duplicate_of = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="duplicates",
+        help_text="유사 중복 공고의 대표(canonical) 공고. NULL이면 자신이 대표",
+    )
+    # position 에서 미리 계산한 카테고리 (job.domain.position). SQL/Chroma where 필터용
+    position_category = models.CharField(
+        max_length=20, blank=True, default="", help_text="포지션 카테고리"
+    )
+    position_category_version = models.PositiveSmallIntegerField(
+        default=0, help_text="position_category를 계산한 mapper 버전"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # 처리 태스크가 채우는 필드. 이 필드만 저장할 때는 재처리를 예약하지 않습니다.
+    PROCESSING_OUTPUT_FIELDS = frozenset(
+        {"skills_required", "skills_preferred", "duplicate_of"}
+    )
+
     class Meta:
         db_table = "agent_job_posting"
+        indexes = [
+            # 목록 정렬/keyset 페이지네이션 (created_at, posting_id)
+            models.Index(
+                fields=["created_at", "posting_id"], name="job_posting_created_id_idx"
+            ),
+            models.Index(fields=["position_category"], name="job_posting_category_idx"),
+        ]
 
     def __str__(self):
         return f"{self.company_name} - {self.position} - {self.url}"
 
+    def stamp_position_category(self) -> None:
+        """position 으로 카테고리를 다시 계산하고 mapper 버전을 기록합니다."""
+        self.position_category = position_category_of(self.position)
+        self.position_category_version = POSITION_CATEGORY_VERSION
+
+    @classmethod
+    def backfill_position_categories(
+        cls,
+        *,
+        batch_size: int = 1000,
+        force: bool = False,
+        on_batch: Optional[Callable[[dict[int, str]], None]] = None,
+    ) -> int:
+        """
+        mapper 버전이 현재와 다른 공고의 position_category를 다시 계산합니다.
+
+        save() 훅(변경 로그/재처리 예약)을 타지 않도록 bulk_update로 두 필드만 씁니다.
+
+        Args:
+            batch_size: bulk_update 묶음 크기
+            force: True면 버전과 무관하게 전체를 다시 계산
+            on_batch: 묶음마다 {posting_id: position_category}로 호출 (벡터 메타데이터 반영용)
+
+        Returns:
+            갱신한 공고 수
+        """
+        queryset = cls.objects.only("posting_id", "position")
+        if not force:
+            queryset = queryset.exclude(
+                position_category_version=POSITION_CATEGORY_VERSION
+            )
+        fields = ["position_category", "position_category_version"]
+        updated = 0
+        batch: list["JobPosting"] = []
+
+        def _flush() -> None:
+            cls.objects.bulk_update(batch, fields)
+            if on_batch is not None:
+                on_batch({p.posting_id: p.position_category for p in batch})
+
+        for posting in queryset.iterator(chunk_size=batch_size):
+            posting.stamp_position_category()
+            batch.append(posting)
+            if len(batch) >= batch_size:
+                _flush()
+                updated += len(batch)
+                batch = []
+        if batch:
+            _flush()
+            updated += len(batch)
+        return updated
+
+    @property
+    def resolved_position_category(self) -> str:
+        """현재 mapper 버전으로 계산된 카테고리 (backfill 전 행은 즉석 계산)"""
+        return resolve_position_category(
+            self.position, self.position_category, self.position_category_version
+        )
+
     def save(self, *args, **kwargs):
         """
         저장 후 트랜잭션 커밋 시 비동기 처리 태스크 호출
         """
-        # update_fields에 skills_* 필드가 포함된 경우 태스크 호출 스킵
-        # (무한 루프 방지 - tasks.py에서 이미 스킬 업데이트 수행)
+        # update_fields가 처리 결과 필드(skills_*, duplicate_of)뿐이면 태스크 호출 스킵
+        # (무한 루프 방지 - tasks.py에서 이미 해당 필드 업데이트 수행)
         update_fields = kwargs.get("update_fields")
         auto_enabled = getattr(settings, "AUTO_PROCESS_JOB_ON_SAVE", True)
         should_process = auto_enabled and (
             update_fields is None
-            or not set(update_fields).issubset({"skills_required", "skills_preferred"})
+            or not set(update_fields).issubset(self.PROCESSING_OUTPUT_FIELDS)
+        )
+
+        if update_fields is None:
+            self.stamp_position_category()
+        elif "position" in update_fields:
+            self.stamp_position_category()
+            kwargs["update_fields"] = {
+                *update_fields,
+                "position_category",
+                "position_category_version",
+            }
+
+        # 회사 사전(Company)/스킬 통계(SkillStat) 카운트 보정을 위해 저장 전 값을 읽어 둡니다.
+        # 신규 저장이면 이전 값이 없으므로 처음 저장된 스킬이 그대로 카운트됩니다.
+        track_company = update_fields is None or "company_name" in update_fields
+        track_skills = update_fields is None or "skills_required" in update_fields
+        previous = (
+            JobPosting.objects.filter(pk=self.pk)
+            .values_list("company_name", "skills_required")
+            .first()
+            if track_company or track_skills
+            else None
+        )
+        previous_company, previous_skills = previous or (None, None)
+        # 이 공고를 추천받은 사용자의 스냅샷(비정규화 공고 요약)은 커밋 후 다시 씁니다.
+        # 처리 결과 필드(skills_*, duplicate_of)는 스냅샷에 없으므로 건너뜁니다.
+        snapshot_user_ids = (
+            []
+            if self._state.adding
+            or (
+                update_fields is not None
+                and set(update_fields).issubset(self.PROCESSING_OUTPUT_FIELDS)
+            )
+            else JobPosting.recommended_user_ids([self.pk])
         )
 
         # 모델 저장
         super().save(*args, **kwargs)
 
+        # in-process 인덱스(스킬 비트맵 등)가 증분 갱신할 수 있도록 변경 로그를 남깁니다.
+        JobPostingChange.record([self.posting_id])
+        if track_company:
+            Company.apply_posting_change(
+                added=[self.company_name],
+                removed=[previous_company] if previous_company is not None else [],
+            )
+        if track_skills:
+            self._apply_skill_stat_change(
+                added=self.skills_required, removed=previous_skills
+            )
+
         # 트랜잭션 커밋 후 비동기 처리
         if should_process:
             transaction.on_commit(lambda: self._schedule_processing())
+        if snapshot_user_ids:
+            transaction.on_commit(
+                lambda: JobPosting.schedule_snapshot_refresh(snapshot_user_ids)
+            )
+
+    def delete(self, *args, **kwargs):
+        posting_id = self.posting_id
+        # 대표 공고가 지워지면 중복 공고들은 SET_NULL로 대표가 되지만 임베딩이 없으므로 재처리합니다.
+        promoted_ids = list(self.duplicates.values_list("posting_id", flat=True))
+        # 추천 행은 CASCADE로 지워지므로 스냅샷을 다시 쓸 사용자를 먼저 읽어 둡니다.
+        snapshot_user_ids = JobPosting.recommended_user_ids([posting_id])
+        result = super().delete(*args, **kwargs)
+        if snapshot_user_ids:
+            transaction.on_commit(
+                lambda: JobPosting.schedule_snapshot_refresh(snapshot_user_ids)
+            )
+        JobPostingChange.record([posting_id], op=JobPostingChange.Op.DELETE)
+        if promoted_ids:
+            JobPostingChange.record(promoted_ids)
+            if getattr(settings, "AUTO_PROCESS_JOB_ON_SAVE", True):
+                transaction.on_commit(
+                    lambda: JobPosting._schedule_processing_many(promoted_ids)
+                )
+        Company.apply_posting_change(added=[], removed=[self.company_name])
+        self._apply_skill_stat_change(added=None, removed=self.skills_required)
+        JobPostingLSHBucket.objects.filter(posting_id=posting_id).delete()
+        JobPostingSignature.objects.filter(posting_id=posting_id).delete()
+        return result
+
+    def _apply_skill_stat_change(self, *, added, removed) -> None:
+        """필수 스킬 이전/이후 값의 차이만 SkillStat에 반영합니다."""
+        from common.adapters.django_skill_stat_repo import DjangoSkillStatRepository
+
+        current = set(added) if isinstance(added, list) else set()
+        previous = set(removed) if isinstance(removed, list) else set()
+        DjangoSkillStatRepository().apply_posting_change(
+            added=current - previous,
+            removed=previous - current,
+            posted_at=self.created_at,
+        )
+
+    @staticmethod
+    def recommended_user_ids(posting_ids: list[int]) -> list[int]:
+        """공고를 추천받은 사용자 ID (스냅샷 갱신 대상, 설정이 꺼져 있으면 빈 리스트)"""
+        if not posting_ids or not getattr(
+            settings, "RECOMMENDATION_SNAPSHOT_REFRESH_ON_CHANGE", True
+        ):
+            return []
+        return list(
+            JobRecommendation.objects.filter(job_posting_id__in=posting_ids)
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+
+    @staticmethod
+    def schedule_snapshot_refresh(user_ids: list[int]) -> None:
+        """
+        추천 스냅샷 갱신 태스크를 예약합니다.
+        broker 장애로 예약하지 못해도 공고 저장은 그대로 진행합니다. (다음 추천 생성 때 갱신)
+        """
+        from recommendation.tasks import refresh_recommendation_snapshots
+
+        try:
+            refresh_recommendation_snapshots.delay(user_ids)
+        except Exception as e:
+            logger.warning(f"Failed to schedule snapshot refresh for {user_ids}: {e}")
+
+    @property
+    def is_canonical(self) -> bool:
+        return self.duplicate_of_id is None
+
+    @property
+    def canonical_id(self) -> int:
+        return self.duplicate_of_id or self.posting_id
 
     def _schedule_processing(self):
-        """비동기 처리 태스크 스케줄링"""
-        from .tasks import process_job_posting
+        """비동기 처리 태스크 스케줄링 (debounce/중복 병합)"""
+        JobPosting._schedule_processing_many([self.posting_id])
+
+    @staticmethod
+    def _schedule_processing_many(posting_ids: list[int]) -> None:
+        from .scheduling import JobProcessingScheduler
+
+        scheduler = JobProcessingScheduler()
+        for posting_id in posting_ids:
+            scheduler.schedule(posting_id)
+
+
+class Company(models.Model):
+    """
+    회사 사전 (materialized, typeahead용).
+
+    - normalized_name: `job.domain.company.normalize_company_name` 결과 (prefix 검색 키)
+    - posting_count: 해당 회사명의 공고 수 (typeahead 랭킹 기준)
+    - last_seen: 해당 회사 공고가 마지막으로 upsert된 시각
+    - updated_at: 공고 수가 마지막으로 바뀐 시각 (`CompanyDirectory` 갱신 버전)
+
+    공고 save/delete 및 bulk ingest에서 diff만 증분 갱신하며,
+    queryset 단위 삭제처럼 훅을 거치지 않는 경로는 `rebuild_companies` 커맨드로 재집계합니다.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    normalized_name = models.CharField(max_length=255)
+    posting_count = models.IntegerField(default=0)
+    last_seen = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "agent_company"
+        indexes = [
+            # LIKE 'prefix%' 검색 (Postgres는 varchar_pattern_ops 필요)
+            models.Index(
+                fields=["normalized_name"],
+                name="company_normalized_prefix_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            models.Index(
+                fields=["-posting_count", "name"], name="company_posting_count_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.posting_count})"
 
-        process_job_posting.delay(self.posting_id)
+    @classmethod
+    def apply_posting_change(
+        cls, *, added: Iterable[str], removed: Iterable[str]
+    ) -> None:
+        """
+        공고 upsert/delete 로 바뀐 회사명 diff를 F() 표현식으로 반영합니다.
+
+        added/removed 에 같은 이름이 있으면 카운트는 상쇄되고 last_seen만 갱신됩니다.
+        """
+        from django.db.models.functions import Greatest
+        from django.utils import timezone
+        from job.company_directory import CompanyDirectory
+        from job.domain.company import normalize_company_name
+
+        added = [name for name in added if name]
+        delta: Counter[str] = Counter(added)
+        delta.subtract(name for name in removed if name)
+        seen = sorted(set(added))
+        if not seen and not any(delta.values()):
+            return
+
+        now = timezone.now()
+        by_delta: dict[int, list[str]] = defaultdict(list)
+        for name, value in delta.items():
+            if value:
+                by_delta[value].append(name)
+
+        with transaction.atomic():
+            if seen:
+                cls.objects.bulk_create(
+                    [
+                        cls(name=name, normalized_name=normalize_company_name(name))
+                        for name in seen
+                    ],
+                    ignore_conflicts=True,
+                )
+                # updated_at은 사전(CompanyDirectory) 버전이므로 공고 수가 바뀔 때만 갱신합니다.
+                cls.objects.filter(name__in=seen).update(last_seen=now)
+            for value, names in by_delta.items():
+                cls.objects.filter(name__in=names).update(
+                    posting_count=Greatest(models.F("posting_count") + value, 0),
+                    updated_at=now,
+                )
+        if by_delta:
+            CompanyDirectory.mark_stale()
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """
+        JobPosting 전체에서 회사별 공고 수/최근 갱신 시각을 다시 집계합니다.
+
+        Returns:
+            집계된 회사 수
+        """
+        from job.company_directory import CompanyDirectory
+        from job.domain.company import normalize_company_name
+
+        rows = (
+            JobPosting.objects.exclude(company_name="")
+            .values("company_name")
+            .annotate(count=models.Count("posting_id"), seen=models.Max("updated_at"))
+        )
+        companies = [
+            cls(
+                name=row["company_name"],
+                normalized_name=normalize_company_name(row["company_name"]),
+                posting_count=row["count"],
+                last_seen=row["seen"],
+            )
+            for row in rows
+        ]
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(companies, batch_size=500)
+        CompanyDirectory.mark_stale()
+        return len(companies)
+
+
+class JobPostingChange(models.Model):
+    """
+    채용 공고 변경 로그 (append-only).
+
+    - id(단조 증가)가 곧 "코퍼스 버전"입니다.
+    - 프로세스 내 인덱스는 `job.change_log.ChangeLogCursor`로 마지막으로 반영한 id 이후의 변경분
+      (및 늦게 커밋된 최근 구간 변경)만 읽어 증분 갱신합니다.
+    - 보존 기간(`JOB_POSTING_CHANGE_RETENTION_DAYS`)이 지난 행은 `prune_posting_changes`로 삭제합니다.
+    - bulk_create/bulk_update 처럼 save()를 거치지 않는 경로는 `record()`를 직접 호출해야 합니다.
+    """
+
+    class Op(models.TextChoices):
+        UPSERT = "upsert", "upsert"
+        DELETE = "delete", "delete"
+
+    posting_id = models.IntegerField(db_index=True)
+    op = models.CharField(max_length=10, choices=Op.choices, default=Op.UPSERT)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "agent_job_posting_change"
+
+    def __str__(self):
+        return f"#{self.id} {self.op} {self.posting_id}"
+
+    @classmethod
+    def record(cls, posting_ids, *, op: str = Op.UPSERT) -> None:
+        rows = [cls(posting_id=int(pid), op=op) for pid in posting_ids]
+        if rows:
+            cls.objects.bulk_create(rows)
+
+    @classmethod
+    def latest_version(cls) -> int:
+        return cls.objects.aggregate(v=models.Max("id"))["v"] or 0
+
+    @classmethod
+    def latest_change(cls) -> tuple[str, Optional[datetime]]:
+        """
+        (버전 토큰, 변경 시각). PK 인덱스 범위 조회만 하므로 조건부 GET 검증에 사용합니다.
+
+        토큰은 최신 id와 최근 구간(`JOB_POSTING_CHANGE_RESCAN_WINDOW`)의 행 수를 합친 값이라,
+        최신 id보다 작은 id가 늦게 커밋되어도 바뀝니다. (Postgres 시퀀스는 커밋 순서가 아님)
+        """
+        row = cls.objects.order_by("-id").values_list("id", "created_at").first()
+        if not row:
+            return "0", None
+        version, changed_at = row
+        window = int(getattr(settings, "JOB_POSTING_CHANGE_RESCAN_WINDOW", 1000))
+        recent = cls.objects.filter(id__gt=version - window).count()
+        return f"{version}.{recent}", changed_at
+
+
+class JobPostingSignature(models.Model):
+    """
+    공고 본문의 MinHash 서명 (유사 중복 판정용).
+
+    - signature: `job.domain.minhash.compute_signature` 결과 (정수 배열)
+    """
+
+    posting_id = models.IntegerField(primary_key=True)
+    signature = models.JSONField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "agent_job_posting_signature"
+
+    def __str__(self):
+        return f"signature {self.posting_id}"
+
+
+class JobPostingLSHBucket(models.Model):
+    """
+    MinHash 서명의 LSH 밴드 버킷.
+
+    (band, bucket) 인덱스로 같은 버킷을 공유하는 후보 공고를 공고당 밴드 수만큼의
+    인덱스 조회로 찾습니다. (전체 공고와 비교하지 않음)
+    """
+
+    posting_id = models.IntegerField(db_index=True)
+    band = models.SmallIntegerField()
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        db_table = "agent_job_posting_lsh_bucket"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["posting_id", "band"], name="lsh_bucket_posting_band_uniq"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["band", "bucket"], name="lsh_bucket_lookup_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.posting_id} band={self.band} bucket={self.bucket}"
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from job.ingest import load_rows
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    application/x-ndjson: 한 줄에 JSON 객체 하나. list[dict]로 파싱합니다.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return load_rows(stream, self.format)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ParseError(f"NDJSON parse error - {e}")
+
+
+class CSVParser(BaseParser):
+    """
+    text/csv: 헤더가 있는 CSV. list[dict]로 파싱합니다.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return load_rows(stream, self.format)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ParseError(f"CSV parse error - {e}")
@@ -0,0 +1,149 @@
+"""
+채용 공고 처리 태스크 스케줄러 (debounce + coalescing)
+
+- pending(ZSET): 큐에 들어가 있는 공고 ID → 최초 스케줄 시각
+  이미 pending이면 새 태스크를 넣지 않고 collapsed 카운터만 올립니다. (공고당 queued 최대 1개)
+- lock(posting별 SET NX EX): 실행 중인 태스크가 소유합니다. (공고당 running 최대 1개)
+  태스크가 lock을 잡으면 pending에서 빠지므로, 실행 중 저장된 변경은 새 태스크 1개로 모입니다.
+- 태스크는 debounce 창만큼 지연 실행되어 창 안의 반복 저장이 한 번의 처리로 합쳐집니다.
+
+Redis를 사용할 수 없으면 기존처럼 즉시 `.delay()` 하고 lock 없이 처리합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from typing import Optional
+
+from common.redis_client import get_redis
+from django.conf import settings
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# lock 소유자만 해제하도록 토큰을 비교 후 삭제합니다.
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Redis 장애로 lock 없이 처리하는 경우의 토큰
+NO_LOCK = ""
+
+
+class JobProcessingScheduler:
+    PENDING_KEY = "job_processing:pending"
+    STATS_KEY = "job_processing:stats"
+    LOCK_KEY_PREFIX = "job_processing:lock:"
+
+    def __init__(self, *, redis_client=None):
+        self._redis = redis_client
+        self._debounce_seconds = float(settings.JOB_PROCESSING_DEBOUNCE_SECONDS)
+        self._lock_ttl_seconds = int(settings.JOB_PROCESSING_LOCK_TTL_SECONDS)
+        self._pending_stale_seconds = float(
+            settings.JOB_PROCESSING_PENDING_STALE_SECONDS
+        )
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = get_redis()
+        return self._redis
+
+    def _lock_key(self, posting_id: int) -> str:
+        return f"{self.LOCK_KEY_PREFIX}{posting_id}"
+
+    def _enqueue(self, posting_id: int, *, countdown: float) -> None:
+        from job.tasks import process_job_posting
+
+        if countdown > 0:
+            process_job_posting.apply_async(args=[posting_id], countdown=countdown)
+        else:
+            process_job_posting.delay(posting_id)
+
+    def schedule(self, posting_id: int) -> bool:
+        """
+        공고 처리를 예약합니다.
+
+        Returns:
+            새 태스크를 큐에 넣었으면 True, 기존 pending 태스크에 합쳐졌으면 False
+        """
+        posting_id = int(posting_id)
+        now = time.time()
+        try:
+            if not self.redis.zadd(self.PENDING_KEY, {posting_id: now}, nx=True):
+                queued_at = self.redis.zscore(self.PENDING_KEY, posting_id)
+                if (
+                    queued_at is not None
+                    and now - queued_at < self._pending_stale_seconds
+                ):
+                    self.redis.hincrby(self.STATS_KEY, "collapsed", 1)
+                    return False
+                # 태스크가 유실된 pending(워커 재시작 등)은 새로 예약합니다.
+                logger.warning(f"Re-enqueueing stale pending posting {posting_id}")
+                self.redis.zadd(self.PENDING_KEY, {posting_id: now})
+            self.redis.hincrby(self.STATS_KEY, "scheduled", 1)
+        except RedisError as e:
+            logger.warning(f"Scheduler unavailable, enqueueing {posting_id}: {e}")
+            self._enqueue(posting_id, countdown=0)
+            return True
+
+        self._enqueue(posting_id, countdown=self._debounce_seconds)
+        return True
+
+    def acquire(self, posting_id: int) -> Optional[str]:
+        """
+        처리 lock을 잡고 pending에서 제거합니다.
+
+        Returns:
+            lock 토큰 (다른 워커가 처리 중이면 None, Redis 장애 시 NO_LOCK)
+        """
+        token = uuid.uuid4().hex
+        try:
+            if not self.redis.set(
+                self._lock_key(posting_id), token, nx=True, ex=self._lock_ttl_seconds
+            ):
+                return None
+            self.redis.zrem(self.PENDING_KEY, posting_id)
+        except RedisError as e:
+            logger.warning(f"Processing lock unavailable for {posting_id}: {e}")
+            return NO_LOCK
+        return token
+
+    def release(self, posting_id: int, token: str) -> None:
+        if not token:
+            return
+        try:
+            self.redis.eval(_RELEASE_SCRIPT, 1, self._lock_key(posting_id), token)
+        except RedisError as e:
+            logger.warning(f"Failed to release processing lock {posting_id}: {e}")
+
+    def defer(self, posting_id: int) -> None:
+        """
+        다른 워커가 처리 중인 공고를 debounce 후 다시 시도합니다. (pending은 유지)
+        """
+        self._enqueue(posting_id, countdown=self._debounce_seconds)
+
+    def get_stats(self) -> dict:
+        """
+        큐 깊이/실행 중/누적 예약·병합 수를 반환합니다.
+        """
+        now = time.time()
+        oldest = self.redis.zrange(self.PENDING_KEY, 0, 0, withscores=True)
+        counters = self.redis.hgetall(self.STATS_KEY) or {}
+        running = sum(
+            1
+            for _ in self.redis.scan_iter(match=f"{self.LOCK_KEY_PREFIX}*", count=1000)
+        )
+        return {
+            "pending": int(self.redis.zcard(self.PENDING_KEY)),
+            "running": running,
+            "oldest_pending_seconds": (round(now - oldest[0][1], 3) if oldest else 0.0),
+            "scheduled_total": int(counters.get("scheduled", 0)),
+            "collapsed_total": int(counters.get("collapsed", 0)),
+            "debounce_seconds": self._debounce_seconds,
+        }
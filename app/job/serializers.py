@@ -1,8 +1,21 @@
+from typing import Optional
+
+from common.serializers import (
+    VIEW_FULL,
+    VIEW_SUMMARY,
+    DynamicFieldsMixin,
+    FieldsetQuerySerializer,
+)
 from job.models import JobPosting
 from rest_framework import serializers
 
+# 목록 응답에서 제외하는 큰 본문 컬럼 (UI에서는 상세 화면에서만 사용)
+JOB_POSTING_LARGE_FIELDS = ("main_tasks", "requirements", "preferred_points")
+
+
+class JobPostingSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    always_include = ("posting_id",)
 
-class JobPostingSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobPosting
         fields = [
@@ -24,6 +37,60 @@ class JobPostingSerializer(serializers.ModelSerializer):
         ]
 
 
+class JobPostingSummarySerializer(JobPostingSerializer):
+    """목록용 요약 Serializer (본문 컬럼 제외)"""
+
+    class Meta(JobPostingSerializer.Meta):
+        fields = [
+            name
+            for name in JobPostingSerializer.Meta.fields
+            if name not in JOB_POSTING_LARGE_FIELDS
+        ]
+
+
+def get_job_posting_serializer_class(
+    view: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    *,
+    default: str = VIEW_SUMMARY,
+) -> type[JobPostingSerializer]:
+    """
+    view/fields 파라미터에 맞는 공고 Serializer 클래스.
+
+    fields를 직접 지정하면 본문 컬럼도 고를 수 있도록 전체 Serializer를 기준으로 필터링합니다.
+    """
+    if fields or (view or default) == VIEW_FULL:
+        return JobPostingSerializer
+    return JobPostingSummarySerializer
+
+
+class JobPostingIngestSerializer(serializers.ModelSerializer):
+    """
+    대량 적재(ingest)용 공고 Serializer.
+
+    기존 공고 upsert가 목적이므로 posting_id 중복(unique) 검증을 하지 않습니다.
+    """
+
+    class Meta:
+        model = JobPosting
+        fields = [
+            "posting_id",
+            "url",
+            "company_name",
+            "position",
+            "category",
+            "main_tasks",
+            "requirements",
+            "preferred_points",
+            "location",
+            "district",
+            "employment_type",
+            "career_min",
+            "career_max",
+        ]
+        extra_kwargs = {"posting_id": {"validators": []}}
+
+
 class CommaSeparatedStringListField(serializers.Field):
     """
     QueryString에서 comma-separated 문자열을 받아 list[str]로 변환하는 필드.
@@ -56,7 +123,7 @@ class CommaSeparatedStringListField(serializers.Field):
         return list(value)
 
 
-class JobPostingQuerySerializer(serializers.Serializer):
+class JobPostingQuerySerializer(FieldsetQuerySerializer):
     """채용 공고 조회용 QuerySerializer"""
 
     # 기존(Backward compatibility)
@@ -80,6 +147,8 @@ class JobPostingQuerySerializer(serializers.Serializer):
         choices=[
             ("latest", "latest"),
             ("oldest", "oldest"),
+            # q가 있을 때만 의미가 있으며(Postgres ts_rank), 없으면 latest와 동일
+            ("relevance", "relevance"),
         ],
         default="latest",
     )
@@ -8,10 +8,14 @@ import logging
 from datetime import datetime, time, timedelta
 from typing import Dict, List, Optional
 
-from django.db import transaction
-from django.db.models import Q
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BooleanField, FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
-from job.models import JobPosting
+from job.company_directory import CompanyDirectory
+from job.domain.search import build_tsquery
+from job.models import Company, JobPosting, JobPostingChange
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,23 @@ from common.application.result import Err, Ok
 from job.application.container import build_process_job_posting_usecase
 from job.dtos import ProcessJobPostingResultDTO
 
+# ingest 시 비교/저장하는 공고 필드 (JobPostingIngestSerializer 와 동일)
+INGEST_FIELDS = (
+    "posting_id",
+    "url",
+    "company_name",
+    "position",
+    "category",
+    "main_tasks",
+    "requirements",
+    "preferred_points",
+    "location",
+    "district",
+    "employment_type",
+    "career_min",
+    "career_max",
+)
+
 
 class JobService:
     """
@@ -45,7 +66,7 @@ class JobService:
             return None
 
     @staticmethod
-    def get_all_job_postings(query_params: Dict) -> List[JobPosting]:
+    def get_all_job_postings(query_params: Dict) -> QuerySet[JobPosting]:
         """
         모든 채용 공고 조회
 
@@ -106,62 +127,112 @@ class JobService:
         if source := query_params.get("source"):
             queryset = queryset.filter(url__icontains=source)
 
+        ranked = False
         if q := query_params.get("q"):
-            queryset = queryset.filter(
-                Q(company_name__icontains=q)
-                | Q(position__icontains=q)
-                | Q(main_tasks__icontains=q)
-                | Q(requirements__icontains=q)
-                | Q(preferred_points__icontains=q)
-                | Q(location__icontains=q)
-                | Q(district__icontains=q)
-            )
+            queryset, ranked = JobService._filter_by_search_query(queryset, q)
 
-        # tech_stack: skills_required(JSON 배열) 기반으로 필터링.
-        # DB 백엔드별 JSON contains 지원 편차를 피하기 위해 Python 레벨로 안전하게 처리.
+        # tech_stack: skills_required(JSON 배열)에 하나라도 포함된 공고
         tech_stack: list[str] = query_params.get("tech_stack") or []
-        materialized: Optional[list[JobPosting]] = None
-        if tech_stack:
-            materialized = list(queryset)
-            normalized = [s.strip() for s in tech_stack if s and s.strip()]
-            if normalized:
-                materialized = [
-                    jp
-                    for jp in materialized
-                    if jp.skills_required
-                    and any(stack in jp.skills_required for stack in normalized)
-                ]
+        normalized = [s.strip() for s in tech_stack if s and s.strip()]
+        if normalized:
+            queryset = JobService._filter_by_tech_stack(queryset, normalized)
 
         # --- 정렬 ---
+        # posting_id를 tie-breaker로 두어 (created_at, posting_id) keyset 페이지네이션과
+        # 복합 인덱스(job_posting_created_id_idx)를 그대로 사용합니다.
         sort = query_params.get("sort") or "latest"
-        if materialized is None:
-            if sort == "oldest":
-                return queryset.order_by("created_at")
-            return queryset.order_by("-created_at")
+        if sort == "relevance" and ranked:
+            return queryset.order_by("-search_rank", "-created_at", "-posting_id")
+        if sort == "oldest":
+            return queryset.order_by("created_at", "posting_id")
+        return queryset.order_by("-created_at", "-posting_id")
+
+    @staticmethod
+    def _filter_by_search_query(queryset, q: str) -> tuple[QuerySet, bool]:
+        """
+        검색어(q) 필터.
+
+        - Postgres: 가중치 tsvector(search_vector, GIN) 매칭 OR 짧은 컬럼의
+          trigram(GIN) 부분 매칭. `search_rank`(ts_rank)를 annotate 합니다.
+        - 그 외(SQLite 테스트 등): 컬럼별 icontains OR
+
+        Returns:
+            (queryset, search_rank annotate 여부)
+        """
+        short_fields = (
+            Q(company_name__icontains=q)
+            | Q(position__icontains=q)
+            | Q(location__icontains=q)
+            | Q(district__icontains=q)
+        )
+        if connection.vendor != "postgresql":
+            return (
+                queryset.filter(
+                    short_fields
+                    | Q(main_tasks__icontains=q)
+                    | Q(requirements__icontains=q)
+                    | Q(preferred_points__icontains=q)
+                ),
+                False,
+            )
+
+        tsquery = build_tsquery(q)
+        if not tsquery:
+            return queryset.filter(short_fields), False
+        queryset = queryset.annotate(
+            search_match=RawSQL(
+                "agent_job_posting.search_vector @@ to_tsquery('simple', %s)",
+                (tsquery,),
+                output_field=BooleanField(),
+            ),
+            # ts_rank는 real(float4)입니다. cursor에 저장한 값과 다음 페이지 비교(float8)가
+            # 같은 값이 되도록 double precision으로 변환합니다. (경계 row 중복 방지)
+            search_rank=RawSQL(
+                "ts_rank(agent_job_posting.search_vector, to_tsquery('simple', %s))"
+                "::double precision",
+                (tsquery,),
+                output_field=FloatField(),
+            ),
+        )
+        return queryset.filter(Q(search_match=True) | short_fields), True
 
-        # list 정렬(Python)
-        reverse = sort != "oldest"
-        return sorted(materialized, key=lambda jp: jp.created_at, reverse=reverse)
+    @staticmethod
+    def _filter_by_tech_stack(queryset, stacks: list[str]):
+        """
+        skills_required 배열이 stacks 중 하나라도 포함하는 공고로 필터링합니다.
+
+        - Postgres: jsonb `?|` 연산자(has_any_keys) → GIN 인덱스 사용
+        - 그 외(SQLite 테스트 등): JSON 배열 원소 조회를 지원하지 않으므로
+          (posting_id, skills_required)만 읽어 Python에서 판정 후 ID로 필터링
+        """
+        if connection.vendor == "postgresql":
+            return queryset.filter(skills_required__has_any_keys=stacks)
+
+        wanted = set(stacks)
+        matched_ids = [
+            posting_id
+            for posting_id, skills in queryset.exclude(
+                skills_required__isnull=True
+            ).values_list("posting_id", "skills_required")
+            if isinstance(skills, list) and wanted.intersection(skills)
+        ]
+        return queryset.filter(posting_id__in=matched_ids)
 
     @staticmethod
     def get_company_options(*, q: str = "", limit: int = 20) -> list[str]:
         """
         회사명 옵션 목록(typeahead) 조회.
 
+        in-process 회사 사전(`CompanyDirectory`)에서 prefix 이진 탐색으로 찾고,
+        공고 수 내림차순으로 반환합니다.
+
         Args:
-            q: 회사명 부분 문자열(대소문자 무시)
+            q: 회사명 검색어(대소문자/법인 표기/공백 무시, 단어 시작 prefix)
             limit: 반환 최대 개수(상한은 serializer에서 제한)
         """
-        qs = (
-            JobPosting.objects.exclude(company_name__isnull=True)
-            .exclude(company_name="")
-            .values_list("company_name", flat=True)
-        )
-        if q:
-            qs = qs.filter(company_name__icontains=q)
-
-        # DISTINCT + 정렬
-        return list(qs.distinct().order_by("company_name")[:limit])
+        directory = CompanyDirectory.get_instance()
+        directory.ensure_fresh()
+        return directory.search(q, limit=limit)
 
     @staticmethod
     def create_job_posting(data: Dict) -> JobPosting:
@@ -179,6 +250,108 @@ class JobService:
             logger.info(f"Created JobPosting {job_posting.posting_id}")
             return job_posting
 
+    @staticmethod
+    def bulk_upsert_job_postings(rows: List[Dict]) -> Dict:
+        """
+        채용 공고 대량 upsert (크롤러 ingest)
+
+        - 내용이 바뀌지 않은 공고는 건너뜁니다. (updated_at/재처리 없음)
+        - 신규/변경 공고만 `bulk_create(update_conflicts=True)` 한 번으로 저장합니다.
+          (행별 save() 훅을 타지 않으므로 변경 로그는 직접 남깁니다.)
+        - 커밋 후 변경된 공고 ID를 블록 단위 처리 태스크로 한 번에 넘깁니다.
+
+        Args:
+            rows: 검증된 공고 데이터 딕셔너리 리스트 (JobPostingIngestSerializer)
+
+        Returns:
+            {"received", "created", "updated", "unchanged", "changed_ids"}
+        """
+        # 같은 요청 안의 중복 posting_id는 마지막 행이 우선합니다.
+        by_id = {int(row["posting_id"]): row for row in rows}
+        fields = [f for f in INGEST_FIELDS if f != "posting_id"]
+
+        existing = {
+            row["posting_id"]: row
+            for row in JobPosting.objects.filter(posting_id__in=by_id.keys()).values(
+                *INGEST_FIELDS
+            )
+        }
+
+        to_save: List[JobPosting] = []
+        created = updated = 0
+        for posting_id, row in by_id.items():
+            current = existing.get(posting_id)
+            if current is not None and all(
+                current.get(f) == row.get(f, current.get(f)) for f in fields
+            ):
+                continue
+            if current is None:
+                created += 1
+                values = {f: row.get(f) for f in fields}
+            else:
+                updated += 1
+                # 부분 행이면 기존 값을 유지합니다.
+                values = {f: row.get(f, current.get(f)) for f in fields}
+            posting = JobPosting(posting_id=posting_id, **values)
+            posting.stamp_position_category()
+            to_save.append(posting)
+
+        changed_ids = [jp.posting_id for jp in to_save]
+        with transaction.atomic():
+            if to_save:
+                JobPosting.objects.bulk_create(
+                    to_save,
+                    batch_size=1000,
+                    update_conflicts=True,
+                    unique_fields=["posting_id"],
+                    update_fields=[
+                        *fields,
+                        "position_category",
+                        "position_category_version",
+                        "updated_at",
+                    ],
+                )
+                JobPostingChange.record(changed_ids)
+                Company.apply_posting_change(
+                    added=[jp.company_name for jp in to_save],
+                    removed=[
+                        existing[jp.posting_id]["company_name"]
+                        for jp in to_save
+                        if jp.posting_id in existing
+                    ],
+                )
+                if getattr(settings, "AUTO_PROCESS_JOB_ON_SAVE", True):
+                    transaction.on_commit(
+                        lambda: JobService._schedule_bulk_processing(changed_ids)
+                    )
+                snapshot_user_ids = JobPosting.recommended_user_ids(
+                    [jp.posting_id for jp in to_save if jp.posting_id in existing]
+                )
+                if snapshot_user_ids:
+                    transaction.on_commit(
+                        lambda: JobPosting.schedule_snapshot_refresh(snapshot_user_ids)
+                    )
+
+        logger.info(
+            f"Bulk upserted JobPostings: received={len(rows)} created={created} "
+            f"updated={updated} unchanged={len(by_id) - len(to_save)}"
+        )
+        return {
+            "received": len(rows),
+            "created": created,
+            "updated": updated,
+            "unchanged": len(by_id) - len(to_save),
+            "changed_ids": changed_ids,
+        }
+
+    @staticmethod
+    def _schedule_bulk_processing(posting_ids: List[int]) -> None:
+        from job.tasks import process_job_postings_bulk
+
+        block_size = settings.JOB_INGEST_PROCESS_BLOCK_SIZE
+        for i in range(0, len(posting_ids), block_size):
+            process_job_postings_bulk.delay(posting_ids[i : i + block_size])
+
     @staticmethod
     def update_job_posting(posting_id: int, data: Dict) -> Optional[JobPosting]:
         """
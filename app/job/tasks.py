@@ -6,12 +6,34 @@ import logging
 
 from celery import shared_task
 from common.application.result import Err, Ok
-from job.application.container import build_process_job_posting_usecase
-from job.dtos import ProcessJobPostingResultDTO
+from django.conf import settings
+from job.application.container import (
+    build_bulk_process_job_postings_usecase,
+    build_process_job_posting_usecase,
+)
+from job.dtos import BulkProcessJobPostingsResultDTO, ProcessJobPostingResultDTO
+from job.scheduling import JobProcessingScheduler
 
 logger = logging.getLogger(__name__)
 
 
+def _schedule_reverse_match(posting_ids: list[int]) -> None:
+    """
+    처리된 공고를 대표 이력서에 역매칭하도록 예약합니다. (영향받는 사용자 추천 세트만 증분 갱신)
+    broker 장애로 예약하지 못해도 공고 처리 결과는 그대로 반환합니다. (야간 배치가 보정)
+    """
+    if not posting_ids or not getattr(
+        settings, "RECOMMENDATION_REVERSE_MATCH_ON_PROCESS", False
+    ):
+        return
+    from recommendation.tasks import reverse_match_postings
+
+    try:
+        reverse_match_postings.delay(posting_ids)
+    except Exception as e:
+        logger.warning(f"Failed to schedule reverse match for {posting_ids}: {e}")
+
+
 @shared_task(bind=True, max_retries=3)
 def process_job_posting(self, posting_id: int, reindex: bool = False):
     """
@@ -26,6 +48,13 @@ def process_job_posting(self, posting_id: int, reindex: bool = False):
     Returns:
         dict: 처리 결과
     """
+    scheduler = JobProcessingScheduler()
+    token = scheduler.acquire(int(posting_id))
+    if token is None:
+        # 다른 워커가 같은 공고를 처리 중 → 끝난 뒤 한 번 더 처리하도록 미룹니다.
+        scheduler.defer(int(posting_id))
+        return {"success": False, "posting_id": posting_id, "deferred": True}
+
     try:
         # reindex는 현재 로직 차이 없음(유지)
         usecase = build_process_job_posting_usecase()
@@ -33,6 +62,8 @@ def process_job_posting(self, posting_id: int, reindex: bool = False):
 
         if isinstance(result, Ok):
             dto: ProcessJobPostingResultDTO = result.value
+            if dto.success and dto.duplicate_of is None:
+                _schedule_reverse_match([int(posting_id)])
             return dto.model_dump()
 
         assert isinstance(result, Err)
@@ -51,3 +82,64 @@ def process_job_posting(self, posting_id: int, reindex: bool = False):
         except self.MaxRetriesExceededError:
             logger.error(f"Max retries exceeded for posting {posting_id}")
             return {"success": False, "error": error_msg}
+    finally:
+        scheduler.release(int(posting_id), token)
+
+
+@shared_task(bind=True, max_retries=3)
+def process_job_postings_bulk(self, posting_ids: list[int]):
+    """
+    채용 공고 블록을 한 번에 처리하는 Celery 태스크 (대량 reindex용)
+
+    단건 태스크와 같은 공고별 lock을 잡고, 다른 워커가 처리 중인 공고는 블록에서 빼고
+    단건 태스크로 미룹니다. (공고당 running 최대 1개)
+
+    Args:
+        posting_ids: JobPosting ID 블록
+
+    Returns:
+        dict: 처리 결과 (처리 수, 처리량 등)
+    """
+    scheduler = JobProcessingScheduler()
+    tokens: dict[int, str] = {}
+    deferred: list[int] = []
+    for posting_id in dict.fromkeys(int(pid) for pid in posting_ids):
+        token = scheduler.acquire(posting_id)
+        if token is None:
+            scheduler.defer(posting_id)
+            deferred.append(posting_id)
+        else:
+            tokens[posting_id] = token
+
+    try:
+        if not tokens:
+            return BulkProcessJobPostingsResultDTO(
+                success=True, requested=len(deferred), deferred_ids=deferred
+            ).model_dump()
+
+        usecase = build_bulk_process_job_postings_usecase()
+        result = usecase.execute(posting_ids=list(tokens))
+
+        if isinstance(result, Ok):
+            dto: BulkProcessJobPostingsResultDTO = result.value
+            dto.deferred_ids = deferred
+            if dto.success:
+                missing = set(dto.missing_ids)
+                _schedule_reverse_match([pid for pid in tokens if pid not in missing])
+            return dto.model_dump()
+
+        assert isinstance(result, Err)
+        return {"success": False, "error": result.message}
+
+    except Exception as e:
+        error_msg = f"Error bulk processing {len(posting_ids)} job postings: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+
+        try:
+            # 미룬 공고는 단건 태스크가 처리하므로 lock을 잡은 공고만 재시도합니다.
+            raise self.retry(args=[list(tokens)], exc=e, countdown=60)
+        except self.MaxRetriesExceededError:
+            return {"success": False, "error": error_msg}
+    finally:
+        for posting_id, token in tokens.items():
+            scheduler.release(posting_id, token)
@@ -0,0 +1,134 @@
+"""
+Tests for bulk job posting processing
+
+블록 단위 대량 처리(use case / process_data --bulk) 테스트
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common.adapters.django_job_repo import DjangoJobPostingRepository
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from job.application.usecases.process_job_postings_bulk import (
+    BulkProcessJobPostingsUseCase,
+)
+from job.models import JobPosting, JobPostingChange
+
+
+def _create(posting_id: int, requirements: str = "Python, Django required"):
+    return JobPosting.objects.create(
+        posting_id=posting_id,
+        url=f"https://example.com/job/{posting_id}",
+        company_name="Company",
+        position="Backend Developer",
+        main_tasks="Build APIs for the recommendation platform and data pipelines.",
+        requirements=requirements,
+    )
+
+
+@pytest.mark.django_db
+class TestBulkProcessJobPostingsUseCase:
+    def test_batches_external_calls_per_block(self):
+        _create(1)
+        _create(2, requirements="React, TypeScript required")
+        vector_store = MagicMock()
+        graph_store = MagicMock()
+        usecase = BulkProcessJobPostingsUseCase(
+            job_repo=DjangoJobPostingRepository(),
+            vector_store=vector_store,
+            graph_store=graph_store,
+        )
+        version_before = JobPostingChange.latest_version()
+
+        result = usecase.execute(posting_ids=[1, 2, 999])
+
+        dto = result.value
+        assert dto.processed == 2
+        assert dto.missing_ids == [999]
+        assert dto.skills_updated == 2
+        assert set(JobPosting.objects.get(posting_id=1).skills_required) == {
+            "Python",
+            "Django",
+        }
+        # 컬렉션별 1회 업서트, 그래프는 UNWIND 1회
+        collections = [
+            call.kwargs["collection_name"]
+            for call in vector_store.upsert_texts.call_args_list
+        ]
+        assert sorted(collections) == ["job_posting_chunks", "job_postings"]
+        vector_store.upsert_text.assert_not_called()
+        graph_store.upsert_job_postings.assert_called_once()
+        postings = graph_store.upsert_job_postings.call_args.kwargs["postings"]
+        assert [p["posting_id"] for p in postings] == [1, 2]
+        # bulk_update 경로도 변경 로그를 남깁니다.
+        assert JobPostingChange.latest_version() > version_before
+
+
+class _FakeGroup:
+    def __init__(self, signatures, fail_on=None):
+        self.blocks = [sig.args[0] for sig in signatures]
+        self.fail_on = fail_on
+
+    def apply_async(self):
+        return self
+
+    def get(self, timeout=None, propagate=True):
+        return [
+            (
+                {"success": False, "error": "boom"}
+                if self.fail_on is not None and self.fail_on in block
+                else {"success": True, "processed": len(block)}
+            )
+            for block in self.blocks
+        ]
+
+
+@pytest.mark.django_db
+class TestProcessDataBulkCommand:
+    def test_checkpoint_and_resume_after_failure(self, tmp_path):
+        for pid in range(1, 6):
+            _create(pid)
+        checkpoint = tmp_path / "checkpoint.json"
+        submitted = []
+
+        def failing_group(signatures):
+            g = _FakeGroup(signatures, fail_on=3)
+            submitted.append(g.blocks)
+            return g
+
+        with patch("job.management.commands.process_data.group", failing_group):
+            with pytest.raises(CommandError):
+                call_command(
+                    "process_data",
+                    model="jobposting",
+                    bulk=True,
+                    block_size=2,
+                    batch_size=5,
+                    checkpoint_file=str(checkpoint),
+                )
+
+        assert submitted == [[[1, 2], [3, 4], [5]]]
+        assert json.loads(checkpoint.read_text())["last_posting_id"] == 2
+
+        resumed = []
+
+        def ok_group(signatures):
+            g = _FakeGroup(signatures)
+            resumed.append(g.blocks)
+            return g
+
+        with patch("job.management.commands.process_data.group", ok_group):
+            call_command(
+                "process_data",
+                model="jobposting",
+                bulk=True,
+                block_size=2,
+                batch_size=5,
+                checkpoint_file=str(checkpoint),
+                resume=True,
+            )
+
+        assert resumed == [[[3, 4], [5]]]
+        assert not checkpoint.exists()
@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from job.company_directory import CompanyDirectory
+from job.domain.company import company_search_keys, normalize_company_name
+from job.models import Company, JobPosting
+from job.services import JobService
+
+
+def test_normalize_company_name_strips_legal_forms_and_punctuation():
+    assert normalize_company_name("(주)카카오 뱅크") == "카카오뱅크"
+    assert normalize_company_name("주식회사 당근마켓") == "당근마켓"
+    assert normalize_company_name("Toss Inc.") == "toss"
+    assert company_search_keys("Company Alpha") == ["companyalpha", "alpha"]
+
+
+class TestCompanyDirectory:
+    def _build(self) -> CompanyDirectory:
+        directory = CompanyDirectory()
+        directory.load(
+            [
+                ("카카오", 3),
+                ("카카오뱅크", 7),
+                ("Kakao Games", 2),
+                ("Naver", 5),
+                ("Closed Co", 0),
+            ]
+        )
+        return directory
+
+    def test_prefix_matches_ranked_by_posting_count(self):
+        directory = self._build()
+
+        assert directory.search("카카오") == ["카카오뱅크", "카카오"]
+        assert directory.search("games") == ["Kakao Games"]
+        assert directory.search("", limit=2) == ["카카오뱅크", "Naver"]
+
+    def test_substring_fills_after_prefix_and_skips_empty_companies(self):
+        directory = self._build()
+
+        assert directory.search("뱅크") == ["카카오뱅크"]
+        assert directory.search("오") == ["카카오뱅크", "카카오"]
+        assert directory.search("ka") == ["Kakao Games"]
+        assert directory.search("closed") == []
+        assert directory.search("카카오", limit=1) == ["카카오뱅크"]
+
+
+@pytest.mark.django_db
+class TestCompanyMaintenance:
+    def _create(self, posting_id: int, company_name: str) -> JobPosting:
+        return JobPosting.objects.create(
+            posting_id=posting_id,
+            url=f"https://example.com/job/{posting_id}",
+            company_name=company_name,
+            position="Dev",
+        )
+
+    def _counts(self) -> dict[str, int]:
+        return dict(Company.objects.values_list("name", "posting_count"))
+
+    def test_save_and_delete_maintain_posting_counts(self):
+        self._create(1, "Alpha")
+        self._create(2, "Alpha")
+        posting = self._create(3, "Beta")
+
+        posting.company_name = "Alpha"
+        posting.save()
+        JobPosting.objects.get(posting_id=1).delete()
+
+        assert self._counts() == {"Alpha": 2, "Beta": 0}
+        assert Company.objects.get(name="Alpha").normalized_name == "alpha"
+
+    def test_bulk_upsert_applies_company_diff(self):
+        self._create(1, "Alpha")
+        JobService.bulk_upsert_job_postings(
+            [
+                {"posting_id": 1, "company_name": "Beta"},
+                {
+                    "posting_id": 2,
+                    "url": "https://example.com/job/2",
+                    "company_name": "Beta",
+                    "position": "Dev",
+                },
+            ]
+        )
+
+        assert self._counts() == {"Alpha": 0, "Beta": 2}
+
+    def test_rebuild_command_and_typeahead_ranking(self):
+        self._create(1, "Company Beta")
+        self._create(2, "Company Beta")
+        self._create(3, "Company Alpha")
+        Company.objects.all().delete()
+
+        call_command("rebuild_companies")
+
+        assert self._counts() == {"Company Alpha": 1, "Company Beta": 2}
+        assert JobService.get_company_options(q="company", limit=5) == [
+            "Company Beta",
+            "Company Alpha",
+        ]
+
+    def test_directory_reloads_only_when_company_counts_change(self):
+        posting = self._create(1, "Alpha")
+        directory = CompanyDirectory(refresh_interval_seconds=0)
+        directory.rebuild()
+
+        with patch.object(directory, "rebuild") as rebuild:
+            posting.position = "Backend Dev"
+            posting.save()
+            directory._stale = False
+            directory.ensure_fresh()
+            rebuild.assert_not_called()
+
+            self._create(2, "Beta")
+            directory._stale = False
+            directory.ensure_fresh()
+            rebuild.assert_called_once()
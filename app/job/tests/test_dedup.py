@@ -0,0 +1,200 @@
+"""
+Tests for near-duplicate job posting detection
+
+MinHash 서명 / LSH 버킷 기반 유사 중복 공고 판정 테스트
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common.adapters.django_job_repo import DjangoJobPostingRepository
+from common.adapters.django_posting_signature_store import (
+    DjangoPostingSignatureStore,
+)
+from job.application.usecases.process_job_posting import ProcessJobPostingUseCase
+from job.application.usecases.process_job_postings_bulk import (
+    BulkProcessJobPostingsUseCase,
+)
+from job.domain.minhash import (
+    BANDS,
+    band_buckets,
+    build_dedup_text,
+    compute_signature,
+    estimate_similarity,
+)
+from job.models import (
+    JobPosting,
+    JobPostingChange,
+    JobPostingLSHBucket,
+    JobPostingSignature,
+)
+from recommendation.domain.scoring import collapse_duplicates
+
+MAIN_TASKS = (
+    "채용 공고 추천 플랫폼의 백엔드 API를 설계하고 데이터 파이프라인을 운영합니다."
+)
+REQUIREMENTS = "Python, Django 기반 서비스 개발 경험 3년 이상, PostgreSQL 운영 경험"
+PREFERRED = "Celery, Redis 를 활용한 비동기 처리 경험"
+
+
+def _create(posting_id: int, **overrides) -> JobPosting:
+    fields = {
+        "url": f"https://example.com/job/{posting_id}",
+        "company_name": "Company",
+        "position": "Backend Developer",
+        "main_tasks": MAIN_TASKS,
+        "requirements": REQUIREMENTS,
+        "preferred_points": PREFERRED,
+    }
+    fields.update(overrides)
+    return JobPosting.objects.create(posting_id=posting_id, **fields)
+
+
+class TestMinHash:
+    def test_formatting_differences_produce_identical_signature(self):
+        a = build_dedup_text(MAIN_TASKS, REQUIREMENTS, PREFERRED)
+        b = build_dedup_text(
+            f"• {MAIN_TASKS}\n", REQUIREMENTS.upper(), PREFERRED.replace(",", " /")
+        )
+
+        assert estimate_similarity(compute_signature(a), compute_signature(b)) == 1.0
+
+    def test_unrelated_postings_are_dissimilar(self):
+        a = compute_signature(build_dedup_text(MAIN_TASKS, REQUIREMENTS, PREFERRED))
+        b = compute_signature(
+            build_dedup_text(
+                "모바일 앱 화면을 개발합니다.",
+                "Swift, Kotlin 개발 경험",
+                "디자인 시스템 구축 경험",
+            )
+        )
+
+        assert estimate_similarity(a, b) < 0.3
+        assert len(band_buckets(a)) == BANDS
+
+
+@pytest.mark.django_db
+class TestProcessJobPostingDedup:
+    def _usecase(self, vector_store):
+        return ProcessJobPostingUseCase(
+            job_repo=DjangoJobPostingRepository(),
+            vector_store=vector_store,
+            graph_store=MagicMock(),
+            signature_store=DjangoPostingSignatureStore(),
+        )
+
+    def test_marks_duplicate_and_skips_embedding(self):
+        _create(1)
+        _create(2, company_name="Company (재게시)", preferred_points=PREFERRED + "!")
+        _create(3, main_tasks="모바일 앱 화면을 개발합니다. " * 3)
+        vector_store = MagicMock()
+        usecase = self._usecase(vector_store)
+
+        usecase.execute(posting_id=1)
+        vector_store.reset_mock()
+        result = usecase.execute(posting_id=2)
+
+        assert result.value.duplicate_of == 1
+        assert JobPosting.objects.get(posting_id=2).duplicate_of_id == 1
+        vector_store.upsert_text.assert_not_called()
+        deleted = {
+            call.kwargs["collection_name"]: call.kwargs
+            for call in vector_store.delete_documents.call_args_list
+        }
+        assert deleted["job_postings"]["doc_ids"] == ["2"]
+        assert deleted["job_posting_chunks"]["where"] == {"posting_id": {"$in": [2]}}
+
+        usecase.execute(posting_id=3)
+        assert JobPosting.objects.get(posting_id=3).duplicate_of_id is None
+        assert vector_store.upsert_text.called
+        assert JobPostingLSHBucket.objects.filter(posting_id=3).count() == BANDS
+
+    def test_duplicate_of_duplicate_points_to_canonical(self):
+        _create(1)
+        _create(2, duplicate_of_id=1)
+        _create(3)
+        store = DjangoPostingSignatureStore()
+        signature = compute_signature(
+            build_dedup_text(MAIN_TASKS, REQUIREMENTS, PREFERRED)
+        )
+        store.save(posting_id=2, signature=signature)
+
+        assert store.find_canonical(posting_id=3, signature=signature) == 1
+
+    def test_earliest_registered_posting_is_canonical(self):
+        _create(1)
+        _create(2)
+        JobPosting.objects.filter(posting_id=2).update(
+            created_at=JobPosting.objects.get(posting_id=1).created_at
+            - timedelta(days=1)
+        )
+        usecase = self._usecase(MagicMock())
+
+        usecase.execute(posting_id=1)
+        usecase.execute(posting_id=2)
+
+        assert JobPosting.objects.get(posting_id=2).duplicate_of_id is None
+        usecase.execute(posting_id=1)
+        assert JobPosting.objects.get(posting_id=1).duplicate_of_id == 2
+
+    def test_deleting_canonical_reprocesses_promoted_duplicates(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        _create(1)
+        _create(2, duplicate_of_id=1)
+        _create(3, duplicate_of_id=1)
+        settings.AUTO_PROCESS_JOB_ON_SAVE = True
+        latest = JobPostingChange.latest_version()
+
+        with patch("job.scheduling.JobProcessingScheduler.schedule") as schedule:
+            with django_capture_on_commit_callbacks(execute=True):
+                JobPosting.objects.get(posting_id=1).delete()
+
+        assert sorted(call.args[0] for call in schedule.call_args_list) == [2, 3]
+        assert set(
+            JobPostingChange.objects.filter(id__gt=latest).values_list(
+                "posting_id", flat=True
+            )
+        ) == {1, 2, 3}
+
+    def test_delete_removes_signature(self):
+        _create(1)
+        self._usecase(MagicMock()).execute(posting_id=1)
+
+        JobPosting.objects.get(posting_id=1).delete()
+
+        assert not JobPostingSignature.objects.exists()
+        assert not JobPostingLSHBucket.objects.exists()
+
+
+@pytest.mark.django_db
+def test_bulk_usecase_detects_duplicates_within_block():
+    _create(1)
+    _create(2)
+    vector_store = MagicMock()
+    usecase = BulkProcessJobPostingsUseCase(
+        job_repo=DjangoJobPostingRepository(),
+        vector_store=vector_store,
+        graph_store=MagicMock(),
+        signature_store=DjangoPostingSignatureStore(),
+    )
+
+    result = usecase.execute(posting_ids=[2, 1])
+
+    assert result.value.duplicates == 1
+    assert JobPosting.objects.get(posting_id=2).duplicate_of_id == 1
+    # 생성, skills bulk_update, duplicate_of bulk_update가 각각 변경 로그를 남깁니다.
+    assert JobPostingChange.objects.filter(posting_id=2).count() == 3
+    for call in vector_store.upsert_texts.call_args_list:
+        assert all(not doc_id.startswith("2") for doc_id in call.kwargs["doc_ids"])
+
+
+def test_collapse_duplicates_keeps_highest_ranked():
+    ranked = [
+        {"posting_id": 5, "canonical_id": 1},
+        {"posting_id": 1, "canonical_id": 1},
+        {"posting_id": 7, "canonical_id": 7},
+    ]
+
+    assert [c["posting_id"] for c in collapse_duplicates(ranked)] == [5, 7]
@@ -0,0 +1,113 @@
+"""
+Tests for bulk job posting ingest
+
+채용 공고 대량 적재(API / 관리 커맨드) 테스트
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from job.models import JobPosting, JobPostingChange
+from job.services import JobService
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+def _row(posting_id: int, **overrides) -> dict:
+    return {
+        "posting_id": posting_id,
+        "url": f"https://example.com/job/{posting_id}",
+        "company_name": "Company",
+        "position": "Backend Developer",
+        "career_min": 1,
+        "career_max": 3,
+        **overrides,
+    }
+
+
+@pytest.mark.django_db
+class TestBulkUpsertJobPostings:
+    def test_creates_updates_and_skips_unchanged(self):
+        JobService.bulk_upsert_job_postings([_row(1), _row(2)])
+        created_at = JobPosting.objects.get(posting_id=1).created_at
+        version = JobPostingChange.latest_version()
+
+        result = JobService.bulk_upsert_job_postings(
+            [_row(1), _row(2, position="Platform Engineer"), _row(3)]
+        )
+
+        assert result["created"] == 1
+        assert result["updated"] == 1
+        assert result["unchanged"] == 1
+        assert sorted(result["changed_ids"]) == [2, 3]
+        assert JobPosting.objects.get(posting_id=2).position == "Platform Engineer"
+        assert JobPosting.objects.get(posting_id=1).created_at == created_at
+        assert JobPostingChange.latest_version() - version == 2
+
+    def test_schedules_one_bulk_task_for_changed_ids(self, settings):
+        settings.AUTO_PROCESS_JOB_ON_SAVE = True
+        with patch("job.tasks.process_job_postings_bulk.delay") as mock_delay:
+            with patch("job.models.JobPosting._schedule_processing") as per_row:
+                with patch(
+                    "django.db.transaction.on_commit", side_effect=lambda f: f()
+                ):
+                    JobService.bulk_upsert_job_postings([_row(1), _row(2)])
+
+        mock_delay.assert_called_once_with([1, 2])
+        per_row.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestBulkIngestView:
+    def setup_method(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_X_API_KEY=settings.API_SECRET_KEY)
+
+    def test_ndjson_payload(self):
+        body = "\n".join(json.dumps(_row(pid)) for pid in (1, 2)) + "\n"
+
+        response = self.client.post(
+            "/api/v1/jobs/bulk/", data=body, content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 2
+        assert JobPosting.objects.count() == 2
+
+    def test_csv_payload_reports_invalid_rows(self):
+        body = (
+            "posting_id,url,company_name,position,category,career_min\n"
+            '1,https://example.com/job/1,Company,Backend,"[""백엔드""]",2\n'
+            "2,not-a-url,Company,Backend,,\n"
+        )
+
+        response = self.client.post(
+            "/api/v1/jobs/bulk/", data=body, content_type="text/csv"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 1
+        assert response.data["invalid"] == 1
+        assert response.data["errors"][0]["index"] == 1
+        assert JobPosting.objects.get(posting_id=1).category == ["백엔드"]
+
+    def test_requires_api_key(self):
+        response = APIClient().post("/api/v1/jobs/bulk/", data=[], format="json")
+
+        assert response.status_code in (
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+
+@pytest.mark.django_db
+def test_ingest_command_reads_ndjson_file(tmp_path):
+    path = tmp_path / "postings.ndjson"
+    path.write_text("\n".join(json.dumps(_row(pid)) for pid in (1, 2, 3)))
+
+    call_command("ingest_job_postings", str(path))
+
+    assert JobPosting.objects.count() == 3
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from job.application.documents import (
+    JOB_POSTING_CHUNKS_COLLECTION,
+    JOB_POSTINGS_COLLECTION,
+    build_job_posting_documents,
+)
+from job.domain.position import POSITION_CATEGORY_VERSION, position_category_of
+from job.models import JobPosting
+from job.services import JobService
+
+
+def test_position_category_of():
+    assert position_category_of("Backend Developer") == "backend"
+    assert position_category_of("웹 프론트엔드 개발자") == "frontend"
+    assert position_category_of("Android Engineer") == "mobile"
+    assert position_category_of("영업 담당") == ""
+
+
+@pytest.mark.django_db
+class TestPositionCategoryColumn:
+    def _create(self, posting_id: int, position: str) -> JobPosting:
+        return JobPosting.objects.create(
+            posting_id=posting_id,
+            url=f"https://example.com/job/{posting_id}",
+            company_name="Company",
+            position=position,
+            requirements="Python 백엔드 개발 경험이 있으신 분을 찾습니다",
+        )
+
+    def test_save_stamps_category_and_version(self):
+        posting = self._create(1, "Backend Developer")
+
+        posting.position = "iOS Developer"
+        posting.save(update_fields=["position"])
+
+        row = JobPosting.objects.values(
+            "position_category", "position_category_version"
+        ).get(posting_id=1)
+        assert row == {
+            "position_category": "mobile",
+            "position_category_version": POSITION_CATEGORY_VERSION,
+        }
+
+    def test_bulk_upsert_stamps_category(self):
+        JobService.bulk_upsert_job_postings(
+            [
+                {
+                    "posting_id": 1,
+                    "url": "https://example.com/job/1",
+                    "company_name": "Company",
+                    "position": "DevOps Engineer",
+                }
+            ]
+        )
+
+        assert JobPosting.objects.get(posting_id=1).position_category == "devops"
+
+    def test_backfill_recomputes_stale_versions_only(self):
+        self._create(1, "Backend Developer")
+        self._create(2, "Frontend Developer")
+        JobPosting.objects.filter(posting_id=1).update(
+            position_category="", position_category_version=0
+        )
+
+        call_command("backfill_position_categories", skip_vectors=True)
+
+        assert list(
+            JobPosting.objects.order_by("posting_id").values_list(
+                "position_category", "position_category_version"
+            )
+        ) == [
+            ("backend", POSITION_CATEGORY_VERSION),
+            ("frontend", POSITION_CATEGORY_VERSION),
+        ]
+        assert JobPosting.backfill_position_categories() == 0
+
+    @patch("job.management.commands.backfill_position_categories.ChromaVectorStore")
+    def test_backfill_pushes_categories_into_vector_metadata(self, mock_store_cls):
+        self._create(1, "Backend Developer")
+        JobPosting.objects.filter(posting_id=1).update(position_category_version=0)
+        vector_store = mock_store_cls.return_value
+        vector_store.get_metadatas.side_effect = lambda *, collection_name, **kwargs: (
+            {"1": {"company_name": "Company"}}
+            if collection_name == JOB_POSTINGS_COLLECTION
+            else {
+                "1:tasks:0": {"posting_id": 1, "section": "tasks"},
+                "1:stack:0": {"posting_id": 1, "position_category": "backend"},
+            }
+        )
+
+        call_command("backfill_position_categories")
+
+        updates = {
+            call.kwargs["collection_name"]: call.kwargs
+            for call in vector_store.update_metadatas.call_args_list
+        }
+        assert updates[JOB_POSTINGS_COLLECTION]["metadatas"] == [
+            {"company_name": "Company", "position_category": "backend"}
+        ]
+        # 이미 같은 카테고리인 chunk는 다시 쓰지 않습니다.
+        assert updates[JOB_POSTING_CHUNKS_COLLECTION]["doc_ids"] == ["1:tasks:0"]
+        vector_store.upsert_texts.assert_not_called()
+
+    def test_chunk_metadata_includes_category(self):
+        posting = self._create(1, "Backend Developer")
+
+        chunks = [
+            doc
+            for doc in build_job_posting_documents(posting)
+            if doc.collection_name == JOB_POSTING_CHUNKS_COLLECTION
+        ]
+
+        assert chunks
+        assert {doc.metadata["position_category"] for doc in chunks} == {"backend"}
@@ -0,0 +1,168 @@
+"""
+Tests for JobProcessingScheduler
+
+공고 처리 스케줄러(debounce/병합/lock) 테스트
+"""
+
+import fnmatch
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common.application.result import Ok
+from job.dtos import BulkProcessJobPostingsResultDTO
+from job.scheduling import NO_LOCK, JobProcessingScheduler
+from job.tasks import process_job_postings_bulk
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+class InMemoryRedis:
+    """스케줄러가 사용하는 Redis 명령만 흉내 낸 테스트용 클라이언트"""
+
+    def __init__(self):
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.strings: dict[str, str] = {}
+
+    def zadd(self, key, mapping, nx=False):
+        zset = self.zsets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            member = str(member)
+            if nx and member in zset:
+                continue
+            added += member not in zset
+            zset[member] = score
+        return added
+
+    def zscore(self, key, member):
+        return self.zsets.get(key, {}).get(str(member))
+
+    def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(str(member), None) is not None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zrange(self, key, start, end, withscores=False):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1])
+        return items[start : end + 1]
+
+    def hincrby(self, key, field, amount):
+        h = self.hashes.setdefault(key, {})
+        h[field] = h.get(field, 0) + amount
+        return h[field]
+
+    def hgetall(self, key):
+        return {k: str(v) for k, v in self.hashes.get(key, {}).items()}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        if self.strings.get(key) == token:
+            del self.strings[key]
+            return 1
+        return 0
+
+    def scan_iter(self, match, count=None):
+        return [k for k in list(self.strings) if fnmatch.fnmatch(k, match)]
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def _fail(*args, **kwargs):
+            raise RedisConnectionError("down")
+
+        return _fail
+
+
+@pytest.fixture
+def enqueue():
+    with patch.object(JobProcessingScheduler, "_enqueue") as mock_enqueue:
+        yield mock_enqueue
+
+
+class TestJobProcessingScheduler:
+    def test_repeated_saves_collapse_into_one_queued_task(self, enqueue):
+        scheduler = JobProcessingScheduler(redis_client=InMemoryRedis())
+
+        assert scheduler.schedule(1) is True
+        assert scheduler.schedule(1) is False
+        assert scheduler.schedule(1) is False
+        assert scheduler.schedule(2) is True
+
+        assert enqueue.call_count == 2
+        stats = scheduler.get_stats()
+        assert stats["pending"] == 2
+        assert stats["scheduled_total"] == 2
+        assert stats["collapsed_total"] == 2
+
+    def test_save_while_running_queues_exactly_one_follow_up(self, enqueue):
+        scheduler = JobProcessingScheduler(redis_client=InMemoryRedis())
+        scheduler.schedule(1)
+
+        token = scheduler.acquire(1)
+        assert token
+        assert scheduler.get_stats()["running"] == 1
+
+        # 실행 중 저장 → 새 태스크 1개, 이후 저장은 병합
+        assert scheduler.schedule(1) is True
+        assert scheduler.schedule(1) is False
+        # 실행 중에는 두 번째 워커가 lock을 잡지 못함
+        assert scheduler.acquire(1) is None
+
+        scheduler.release(1, token)
+        assert scheduler.acquire(1)
+        assert scheduler.get_stats()["pending"] == 0
+
+    def test_release_ignores_foreign_token(self, enqueue):
+        redis = InMemoryRedis()
+        scheduler = JobProcessingScheduler(redis_client=redis)
+        token = scheduler.acquire(1)
+
+        scheduler.release(1, "other")
+
+        assert scheduler.acquire(1) is None
+        scheduler.release(1, token)
+        assert scheduler.acquire(1) is not None
+
+    def test_stale_pending_is_re_enqueued(self, enqueue, settings):
+        settings.JOB_PROCESSING_PENDING_STALE_SECONDS = 0
+        scheduler = JobProcessingScheduler(redis_client=InMemoryRedis())
+
+        assert scheduler.schedule(1) is True
+        assert scheduler.schedule(1) is True
+        assert enqueue.call_count == 2
+
+    def test_falls_back_to_immediate_enqueue_without_redis(self, enqueue):
+        scheduler = JobProcessingScheduler(redis_client=BrokenRedis())
+
+        assert scheduler.schedule(1) is True
+        enqueue.assert_called_once_with(1, countdown=0)
+        assert scheduler.acquire(1) == NO_LOCK
+
+    def test_bulk_task_skips_postings_locked_by_another_worker(self, enqueue):
+        redis = InMemoryRedis()
+        scheduler = JobProcessingScheduler(redis_client=redis)
+        other_token = scheduler.acquire(2)
+        usecase = MagicMock()
+        usecase.execute.return_value = Ok(
+            BulkProcessJobPostingsResultDTO(success=True, requested=2, processed=2)
+        )
+
+        with patch("job.tasks.JobProcessingScheduler", return_value=scheduler):
+            with patch(
+                "job.tasks.build_bulk_process_job_postings_usecase",
+                return_value=usecase,
+            ):
+                result = process_job_postings_bulk([1, 2, 3])
+
+        # 처리 중인 공고 2는 블록에서 빠지고 단건 태스크로 미뤄집니다.
+        usecase.execute.assert_called_once_with(posting_ids=[1, 3])
+        enqueue.assert_called_once_with(2, countdown=scheduler._debounce_seconds)
+        assert result["deferred_ids"] == [2]
+        # 블록이 잡은 lock은 해제되고, 다른 워커의 lock은 그대로 남습니다.
+        assert redis.strings == {scheduler._lock_key(2): other_token}
@@ -0,0 +1,26 @@
+"""
+Tests for job list search query
+
+검색어(q) → tsquery 변환 테스트
+"""
+
+from job.domain.search import build_tsquery, hangul_bigrams
+
+
+class TestBuildTsquery:
+    def test_hangul_is_split_into_bigrams(self):
+        assert hangul_bigrams("백엔드개발자") == [
+            "백엔",
+            "엔드",
+            "드개",
+            "개발",
+            "발자",
+        ]
+        assert build_tsquery("백엔드") == "'백엔' & '엔드'"
+
+    def test_latin_terms_use_prefix_match(self):
+        assert build_tsquery("React.js 개발") == "'react':* & 'js':* & '개발'"
+
+    def test_quotes_and_operators_are_dropped(self):
+        assert build_tsquery("a' | !b") == "'a':* & 'b':*"
+        assert build_tsquery("!!!") == ""
@@ -178,3 +178,21 @@ class TestJobService:
         # Then
         assert result["success"] is False
         assert "not found" in result["error"]
+
+    def test_get_all_job_postings_tech_stack_keeps_db_ordering(self):
+        """tech_stack 필터는 쿼리셋을 유지하고 DB에서 정렬"""
+        for posting_id, skills in [(1, ["Python"]), (2, ["Java"]), (3, ["Django"])]:
+            JobPosting.objects.create(
+                posting_id=posting_id,
+                url=f"https://example.com/job/{posting_id}",
+                company_name="Company",
+                position="Engineer",
+                skills_required=skills,
+            )
+
+        result = JobService.get_all_job_postings(
+            {"tech_stack": ["Python", " Django "], "sort": "oldest"}
+        )
+
+        assert result.query.order_by == ("created_at", "posting_id")
+        assert [jp.posting_id for jp in result] == [1, 3]
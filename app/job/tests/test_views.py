@@ -10,6 +10,7 @@ from datetime import timezone as dt_timezone
 import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
 from job.models import JobPosting
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -78,9 +79,9 @@ class TestJobPostingViewSet:
 
         # Then
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data["results"]) >= 1
         # 기본 정렬은 최신순(latest)
-        assert response.data[0]["posting_id"] == new_posting.posting_id
+        assert response.data["results"][0]["posting_id"] == new_posting.posting_id
 
     def test_list_job_postings_with_q_filter(self):
         """q(키워드) 필터링"""
@@ -101,8 +102,8 @@ class TestJobPostingViewSet:
 
         response = self.client.get("/api/v1/jobs/?q=Backend")
         assert response.status_code == status.HTTP_200_OK
-        assert any(item["posting_id"] == 10 for item in response.data)
-        assert all(item["posting_id"] != 11 for item in response.data)
+        assert any(item["posting_id"] == 10 for item in response.data["results"])
+        assert all(item["posting_id"] != 11 for item in response.data["results"])
 
     def test_list_job_postings_with_company_location_experience_filters(self):
         """company/location/experience 필터링"""
@@ -129,8 +130,8 @@ class TestJobPostingViewSet:
             "/api/v1/jobs/?company=Company%20A&location=Seoul&experience=2"
         )
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
-        assert response.data[0]["posting_id"] == 20
+        assert len(response.data["results"]) == 1
+        assert response.data["results"][0]["posting_id"] == 20
 
     def test_list_job_postings_with_tech_stack_filter(self):
         """tech_stack 필터링(JSON skills_required 기반)"""
@@ -151,8 +152,8 @@ class TestJobPostingViewSet:
 
         response = self.client.get("/api/v1/jobs/?tech_stack=Python,Django")
         assert response.status_code == status.HTTP_200_OK
-        assert any(item["posting_id"] == 30 for item in response.data)
-        assert all(item["posting_id"] != 31 for item in response.data)
+        assert any(item["posting_id"] == 30 for item in response.data["results"])
+        assert all(item["posting_id"] != 31 for item in response.data["results"])
 
     def test_list_job_postings_sort_oldest(self):
         """정렬(sort=oldest)"""
@@ -177,7 +178,154 @@ class TestJobPostingViewSet:
 
         response = self.client.get("/api/v1/jobs/?sort=oldest")
         assert response.status_code == status.HTTP_200_OK
-        assert response.data[0]["posting_id"] == 40
+        assert response.data["results"][0]["posting_id"] == 40
+
+    def test_list_job_postings_search_with_relevance_sort(self):
+        """검색어(q) + 정렬(sort=relevance)"""
+        JobPosting.objects.create(
+            posting_id=50,
+            url="https://example.com/job/50",
+            company_name="SearchCo",
+            position="백엔드 개발자",
+        )
+        JobPosting.objects.create(
+            posting_id=51,
+            url="https://example.com/job/51",
+            company_name="SearchCo",
+            position="Designer",
+        )
+
+        response = self.client.get("/api/v1/jobs/?q=백엔드&sort=relevance")
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["posting_id"] for item in response.data["results"]] == [50]
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="search_rank(ts_rank)는 PostgreSQL에서만 계산됩니다",
+    )
+    def test_list_job_postings_relevance_cursor_pagination(self):
+        """sort=relevance cursor 페이지네이션: 경계 row가 다음 페이지에 반복되지 않음"""
+        for posting_id, position in enumerate(
+            ["백엔드", "백엔드 백엔드 개발자", "백엔드 개발자", "백엔드 서버 개발자"],
+            start=70,
+        ):
+            JobPosting.objects.create(
+                posting_id=posting_id,
+                url=f"https://example.com/job/{posting_id}",
+                company_name="RankCo",
+                position=position,
+            )
+
+        seen = []
+        url = "/api/v1/jobs/?q=백엔드&sort=relevance&page_size=1"
+        while url and len(seen) <= 4:
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(item["posting_id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        assert sorted(seen) == [70, 71, 72, 73]
+
+    def test_list_job_postings_cursor_pagination(self):
+        """keyset cursor 페이지네이션 (next/previous 링크 순회)"""
+        same_time = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+        for posting_id in range(60, 65):
+            JobPosting.objects.create(
+                posting_id=posting_id,
+                url=f"https://example.com/job/{posting_id}",
+                company_name="PageCo",
+                position="Engineer",
+            )
+        # created_at이 같아도 posting_id tie-breaker로 누락/중복이 없어야 합니다.
+        JobPosting.objects.filter(posting_id__in=[61, 62, 63]).update(
+            created_at=same_time
+        )
+
+        seen = []
+        url = "/api/v1/jobs/?company=PageCo&page_size=2"
+        pages = []
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.data)
+            seen.extend(item["posting_id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        assert len(pages) == 3
+        assert sorted(seen) == [60, 61, 62, 63, 64]
+        assert len(set(seen)) == 5
+        assert pages[0]["previous"] is None
+
+        response = self.client.get(pages[2]["previous"])
+        assert [item["posting_id"] for item in response.data["results"]] == [
+            item["posting_id"] for item in pages[1]["results"]
+        ]
+
+    def test_list_job_postings_invalid_cursor_returns_404(self):
+        """잘못된 cursor는 404"""
+        response = self.client.get("/api/v1/jobs/?cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_job_postings_sparse_fieldsets(self):
+        """목록은 기본 요약(summary), view=full / fields= 로 필드 선택"""
+        JobPosting.objects.create(
+            posting_id=70,
+            url="https://example.com/job/70",
+            company_name="FieldCo",
+            position="Engineer",
+            main_tasks="Long main tasks",
+            requirements="Long requirements",
+        )
+
+        summary = self.client.get("/api/v1/jobs/?company=FieldCo").data["results"][0]
+        assert summary["company_name"] == "FieldCo"
+        assert "main_tasks" not in summary
+        assert "requirements" not in summary
+
+        full = self.client.get("/api/v1/jobs/?company=FieldCo&view=full").data
+        assert full["results"][0]["main_tasks"] == "Long main tasks"
+
+        picked = self.client.get(
+            "/api/v1/jobs/?company=FieldCo&fields=company_name,requirements,unknown"
+        ).data["results"][0]
+        assert picked == {
+            "posting_id": 70,
+            "company_name": "FieldCo",
+            "requirements": "Long requirements",
+        }
+
+    def test_job_postings_conditional_get(self):
+        """상세/목록 ETag: 변경이 없으면 304, 공고가 수정되면 200"""
+        posting = JobPosting.objects.create(
+            posting_id=80,
+            url="https://example.com/job/80",
+            company_name="EtagCo",
+            position="Engineer",
+        )
+        detail_url = "/api/v1/jobs/80/"
+        list_url = "/api/v1/jobs/?company=EtagCo"
+        detail_etag = self.client.get(detail_url)["ETag"]
+        list_etag = self.client.get(list_url)["ETag"]
+
+        assert (
+            self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code
+            == status.HTTP_304_NOT_MODIFIED
+        )
+        assert (
+            self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code
+            == status.HTTP_304_NOT_MODIFIED
+        )
+
+        posting.position = "Senior Engineer"
+        posting.save()
+        assert (
+            self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code
+            == status.HTTP_200_OK
+        )
+        assert (
+            self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code
+            == status.HTTP_200_OK
+        )
 
     def test_list_job_postings_invalid_sort_returns_400(self):
         """잘못된 sort 값은 400"""
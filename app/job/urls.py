@@ -1,5 +1,5 @@
 from django.urls import include, path
-from job.views import CompanyOptionsView, JobPostingViewSet
+from job.views import CompanyOptionsView, JobPostingViewSet, JobProcessingStatsView
 from rest_framework.routers import DefaultRouter
 
 router = DefaultRouter()
@@ -8,5 +8,10 @@ router.register(r"", JobPostingViewSet, basename="job")
 urlpatterns = [
     # NOTE: router 보다 먼저 두어야 /companies/ 가 pk 로 오인되지 않습니다.
     path("companies/", CompanyOptionsView.as_view(), name="job-company-options"),
+    path(
+        "processing-stats/",
+        JobProcessingStatsView.as_view(),
+        name="job-processing-stats",
+    ),
     path("", include(router.urls)),
 ]
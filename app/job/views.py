@@ -6,16 +6,28 @@ Job Posting Views
 
 import logging
 
+from common.conditional import apply_validators, check_not_modified, make_etag
+from common.pagination import KeysetPagination
+from common.parsers import ORJSONParser
+from django.conf import settings
 from drf_spectacular.utils import extend_schema
-from job.models import JobPosting
+from job.models import JobPosting, JobPostingChange
+from job.parsers import CSVParser, NDJSONParser
 from job.permissions import HasSimpleSecretKey
+from job.scheduling import JobProcessingScheduler
 from job.serializers import (
     CompanyOptionsQuerySerializer,
+    JobPostingIngestSerializer,
     JobPostingQuerySerializer,
     JobPostingSerializer,
+    JobPostingSummarySerializer,
+    get_job_posting_serializer_class,
 )
 from job.services import JobService
+from redis.exceptions import RedisError
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -29,6 +41,8 @@ class CompanyOptionsView(APIView):
     회사명 옵션(typeahead) 조회 (public)
 
     GET /api/v1/jobs/companies/?q=...&limit=...
+
+    공고 변경 로그 버전이 같으면 304를 반환합니다.
     """
 
     permission_classes = [AllowAny]
@@ -50,7 +64,39 @@ class CompanyOptionsView(APIView):
 
         q = query_serializer.validated_data.get("q", "") or ""
         limit = query_serializer.validated_data.get("limit", 20)
-        return Response(JobService.get_company_options(q=q, limit=limit), status=200)
+
+        version, changed_at = JobPostingChange.latest_change()
+        etag = make_etag("companies", version, q, limit)
+        not_modified = check_not_modified(request, etag=etag, last_modified=changed_at)
+        if not_modified is not None:
+            return not_modified
+
+        response = Response(
+            JobService.get_company_options(q=q, limit=limit), status=200
+        )
+        return apply_validators(response, etag=etag, last_modified=changed_at)
+
+
+class JobProcessingStatsView(APIView):
+    """
+    공고 처리 스케줄러 상태 조회 (API Key 필요)
+
+    GET /api/v1/jobs/processing-stats/
+    """
+
+    permission_classes = [HasSimpleSecretKey]
+
+    @extend_schema(responses={status.HTTP_200_OK: dict})
+    def get(self, request, *args, **kwargs):
+        try:
+            stats = JobProcessingScheduler().get_stats()
+        except RedisError as e:
+            logger.error(f"Error getting processing stats: {e}", exc_info=True)
+            return Response(
+                {"error": "Scheduler backend unavailable"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return Response(stats, status=status.HTTP_200_OK)
 
 
 class JobPostingViewSet(GenericViewSet):
@@ -64,16 +110,19 @@ class JobPostingViewSet(GenericViewSet):
     queryset = JobPosting.objects.all()
     serializer_class = JobPostingSerializer
     permission_classes = [HasSimpleSecretKey | IsAuthenticated]
+    pagination_class = KeysetPagination
 
     @extend_schema(
         parameters=[JobPostingQuerySerializer],
-        responses={status.HTTP_200_OK: JobPostingSerializer(many=True)},
+        responses={status.HTTP_200_OK: JobPostingSummarySerializer(many=True)},
     )
     def list(self, request, *args, **kwargs):
         """
-        채용 공고 목록 조회
+        채용 공고 목록 조회 (keyset cursor 페이지네이션)
 
-        GET /api/v1/jobs/
+        GET /api/v1/jobs/?cursor=...&page_size=...&view=summary|full&fields=...
+
+        기본은 본문 컬럼을 제외한 요약(summary) 표현이며, 조회 컬럼도 그만큼만 읽습니다.
         """
         try:
             query_serializer = JobPostingQuerySerializer(data=request.query_params)
@@ -86,11 +135,35 @@ class JobPostingViewSet(GenericViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            job_postings = JobService.get_all_job_postings(
-                query_serializer.validated_data
+            # 목록 내용은 공고 코퍼스(변경 로그 버전)와 QueryString으로 결정됩니다.
+            version, changed_at = JobPostingChange.latest_change()
+            etag = make_etag("jobs", version, request.get_full_path())
+            not_modified = check_not_modified(
+                request, etag=etag, last_modified=changed_at, public=False
+            )
+            if not_modified is not None:
+                return not_modified
+
+            params = query_serializer.validated_data
+            serializer_class = get_job_posting_serializer_class(
+                params.get("view"), params.get("fields")
             )
-            serializer = self.get_serializer(job_postings, many=True)
-            return Response(serializer.data)
+            job_postings = JobService.get_all_job_postings(params).only(
+                # created_at은 keyset cursor 인코딩에 필요
+                "created_at",
+                *serializer_class.model_only_fields(params.get("fields")),
+            )
+            page = self.paginate_queryset(job_postings)
+            serializer = serializer_class(page, many=True, fields=params.get("fields"))
+            return apply_validators(
+                self.get_paginated_response(serializer.data),
+                etag=etag,
+                last_modified=changed_at,
+                public=False,
+            )
+        except APIException:
+            # 잘못된 cursor(404) 등은 DRF 예외 처리에 맡깁니다.
+            raise
         except Exception as e:
             logger.error(f"Failed to list job postings: {str(e)}", exc_info=True)
             return Response(
@@ -112,8 +185,25 @@ class JobPostingViewSet(GenericViewSet):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            etag = make_etag(
+                "job", job_posting.posting_id, job_posting.updated_at.isoformat()
+            )
+            not_modified = check_not_modified(
+                request,
+                etag=etag,
+                last_modified=job_posting.updated_at,
+                public=False,
+            )
+            if not_modified is not None:
+                return not_modified
+
             serializer = self.get_serializer(job_posting)
-            return Response(serializer.data)
+            return apply_validators(
+                Response(serializer.data),
+                etag=etag,
+                last_modified=job_posting.updated_at,
+                public=False,
+            )
         except Exception as e:
             logger.error(
                 f"Failed to retrieve job posting {pk}: {str(e)}", exc_info=True
@@ -225,3 +315,56 @@ class JobPostingViewSet(GenericViewSet):
                 {"error": "Failed to delete job posting"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @extend_schema(
+        request=JobPostingIngestSerializer(many=True),
+        responses={status.HTTP_200_OK: dict},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        parser_classes=[ORJSONParser, NDJSONParser, CSVParser],
+        permission_classes=[HasSimpleSecretKey],
+    )
+    def bulk(self, request, *args, **kwargs):
+        """
+        채용 공고 대량 적재 (크롤러용, API Key 필요)
+
+        POST /api/v1/jobs/bulk/
+        - Content-Type: application/json(배열) | application/x-ndjson | text/csv
+        - 유효한 행만 upsert 하고, 잘못된 행은 index와 함께 errors로 반환합니다.
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response(
+                {"error": "Payload must be a list of job postings"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        max_rows = settings.JOB_INGEST_MAX_ROWS
+        if len(rows) > max_rows:
+            return Response(
+                {"error": f"Too many rows (max {max_rows})"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        valid_rows, errors = [], []
+        for index, row in enumerate(rows):
+            serializer = JobPostingIngestSerializer(data=row)
+            if serializer.is_valid():
+                valid_rows.append(serializer.validated_data)
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+
+        try:
+            result = JobService.bulk_upsert_job_postings(valid_rows)
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert job postings: {str(e)}", exc_info=True)
+            return Response(
+                {"error": "Failed to ingest job postings"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        result["invalid"] = len(errors)
+        result["errors"] = errors
+        return Response(result, status=status.HTTP_200_OK)
@@ -1,23 +1,97 @@
 from __future__ import annotations
 
+import threading
+from typing import Optional
+
+from common.adapters.bounded_llm import (
+    BoundedRecommendationEvaluator,
+    BoundedSearchPlanBuilder,
+)
 from common.adapters.chroma_vector_store import ChromaVectorStore
+from common.adapters.django_recommendation_batch_repo import (
+    DjangoRecommendationBatchRepository,
+)
 from common.adapters.gemini_recommendation_evaluator import (
     GeminiRecommendationEvaluator,
 )
 from common.adapters.gemini_search_plan_builder import GeminiSearchPlanBuilder
 from common.adapters.neo4j_graph_store import Neo4jGraphStore
+from common.adapters.skill_index_graph_store import SkillIndexGraphStore
+from common.adapters.slack_notifier import SlackWebhookNotifier
+from common.ports.graph_store import GraphStorePort
+from common.ports.recommendation_evaluator import RecommendationEvaluatorPort
+from common.ports.search_plan_builder import SearchPlanBuilderPort
+from django.conf import settings
+from recommendation.application.posting_features import PostingFeatureCache
 from recommendation.application.usecases.generate_recommendations import (
     GenerateRecommendationsUseCase,
 )
+from recommendation.application.usecases.nightly_batch import (
+    NightlyRecommendationBatchUseCase,
+)
+
+
+def _build_graph_store() -> GraphStorePort:
+    """
+    GRAPH_STORE_BACKEND 설정에 따라 그래프 저장소를 선택합니다.
+    - "neo4j"(기본): 매 요청 Neo4j 조회
+    - "skill_index": 스킬 후보 조회를 in-process 비트맵 인덱스로 처리(쓰기/통계는 Neo4j)
+    """
+    graph_store = Neo4jGraphStore()
+    if getattr(settings, "GRAPH_STORE_BACKEND", "neo4j") == "skill_index":
+        return SkillIndexGraphStore(fallback=graph_store)
+    return graph_store
 
 
-def build_generate_recommendations_usecase() -> GenerateRecommendationsUseCase:
+def build_generate_recommendations_usecase(
+    *,
+    llm_semaphore: Optional[threading.Semaphore] = None,
+    feature_cache: Optional[PostingFeatureCache] = None,
+) -> GenerateRecommendationsUseCase:
     """
     Recommendation 유스케이스 조립(Dependency Injection).
+
+    Args:
+        llm_semaphore: 지정하면 LLM 호출(검색전략/평가)의 동시 실행 수를 제한합니다.
+        feature_cache: 여러 이력서가 공유할 공고 특징 캐시 (배치용)
     """
+    evaluator: RecommendationEvaluatorPort = GeminiRecommendationEvaluator()
+    plan_builder: SearchPlanBuilderPort = GeminiSearchPlanBuilder()
+    if llm_semaphore is not None:
+        evaluator = BoundedRecommendationEvaluator(
+            inner=evaluator, semaphore=llm_semaphore
+        )
+        plan_builder = BoundedSearchPlanBuilder(
+            inner=plan_builder, semaphore=llm_semaphore
+        )
     return GenerateRecommendationsUseCase(
         vector_store=ChromaVectorStore(),
-        graph_store=Neo4jGraphStore(),
-        evaluator=GeminiRecommendationEvaluator(),
-        plan_builder=GeminiSearchPlanBuilder(),
+        graph_store=_build_graph_store(),
+        evaluator=evaluator,
+        plan_builder=plan_builder,
+        feature_cache=feature_cache,
+    )
+
+
+def build_nightly_batch_usecase() -> NightlyRecommendationBatchUseCase:
+    """
+    야간 추천 배치 유스케이스 조립.
+
+    추천 유스케이스 하나(공고 특징 캐시, LLM semaphore 포함)를 모든 worker가 공유합니다.
+    """
+    usecase = build_generate_recommendations_usecase(
+        llm_semaphore=threading.BoundedSemaphore(
+            settings.RECOMMENDATION_BATCH_LLM_CONCURRENCY
+        ),
+        feature_cache=PostingFeatureCache(),
+    )
+    return NightlyRecommendationBatchUseCase(
+        repository=DjangoRecommendationBatchRepository(
+            usecase=usecase, limit=settings.RECOMMENDATION_BATCH_LIMIT
+        ),
+        notifier=SlackWebhookNotifier(
+            webhook_url=settings.SLACK_WEBHOOK_URL,
+            min_interval_seconds=settings.SLACK_MIN_INTERVAL_SECONDS,
+        ),
+        max_workers=settings.RECOMMENDATION_BATCH_WORKERS,
     )
@@ -0,0 +1,69 @@
+"""
+공고별 추천 특징(feature) 캐시.
+
+추천 랭킹은 후보 공고마다 기술스택/자격요건/우대사항 스킬 집합과 포지션 카테고리를 계산합니다.
+자격요건/우대사항 스킬은 원문 정규식 추출이라 비용이 크므로, 배치(야간 추천)처럼
+여러 이력서를 연달아 처리할 때는 공고당 한 번만 계산해 공유합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from job.models import JobPosting
+from skill.services import SkillExtractionService
+
+
+@dataclass(frozen=True)
+class PostingFeatures:
+    stack_skills: frozenset[str]
+    requirement_skills: frozenset[str]
+    preferred_skills: frozenset[str]
+    position_category: str
+
+
+def extract_posting_features(posting: JobPosting) -> PostingFeatures:
+    # 우대사항: preferred_points 우선, 없으면 skills_preferred 사용
+    preferred_text = posting.preferred_points or posting.skills_preferred or ""
+    return PostingFeatures(
+        stack_skills=frozenset(posting.skills_required or []),
+        requirement_skills=frozenset(
+            SkillExtractionService.extract_skills(posting.requirements or "")
+        ),
+        preferred_skills=frozenset(
+            SkillExtractionService.extract_skills(preferred_text)
+        ),
+        position_category=posting.resolved_position_category,
+    )
+
+
+class PostingFeatureCache:
+    """
+    (posting_id, updated_at) 키의 thread-safe 특징 캐시.
+
+    공고가 수정되면 updated_at이 바뀌므로 이전 항목은 자연히 무시됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._features: dict[int, tuple[Optional[datetime], PostingFeatures]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, posting: JobPosting) -> PostingFeatures:
+        with self._lock:
+            cached = self._features.get(posting.posting_id)
+            if cached is not None and cached[0] == posting.updated_at:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        features = extract_posting_features(posting)
+        with self._lock:
+            self._features[posting.posting_id] = (posting.updated_at, features)
+        return features
+
+    def __len__(self) -> int:
+        return len(self._features)
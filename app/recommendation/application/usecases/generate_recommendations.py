@@ -1,25 +1,46 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Optional, TypeVar
 
 from common.application.result import Err, Ok, Result
+from common.deadline import Deadline, DeadlineExceeded, run_with_timeout
 from common.ports.graph_store import GraphStorePort
 from common.ports.recommendation_evaluator import RecommendationEvaluatorPort
 from common.ports.search_plan_builder import SearchPlanBuilderPort
 from common.ports.vector_store import VectorStorePort
+from django.conf import settings
+from job.domain.position import POSITION_CATEGORY_VERSION
 from job.models import JobPosting
+from recommendation.application.posting_features import (
+    PostingFeatureCache,
+    PostingFeatures,
+    extract_posting_features,
+)
 from recommendation.domain.scoring import (
+    collapse_duplicates,
     map_position_to_category,
     normalize_match_score,
     normalize_position_text,
 )
+from recommendation.domain.scoring_engine import score_candidates
 from recommendation.models import JobRecommendation, RecommendationPrompt
 from resume.models import Resume
-from skill.services import SkillExtractionService
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 시간 예산(deadline)이 있을 때 단계별 몫 (전체 예산 대비 비율)
+PLANNER_BUDGET_FRACTION = 0.2
+RETRIEVAL_BUDGET_FRACTION = 0.3
+GRAPH_BUDGET_FRACTION = 0.1
+# LLM 재정렬은 남은 시간을 쓰되, 저장/직렬화 몫으로 이만큼은 남겨 둡니다.
+RESPONSE_RESERVE_FRACTION = 0.1
+# LLM 단계에 줄 수 있는 시간이 이보다 짧으면 호출하지 않고 건너뜁니다.
+MIN_LLM_STAGE_SECONDS = 0.5
+
 
 class GenerateRecommendationsUseCase:
     """
@@ -36,11 +57,14 @@ class GenerateRecommendationsUseCase:
         graph_store: GraphStorePort,
         evaluator: RecommendationEvaluatorPort,
         plan_builder: SearchPlanBuilderPort,
+        feature_cache: Optional[PostingFeatureCache] = None,
     ):
         self._vector_store = vector_store
         self._graph_store = graph_store
         self._evaluator = evaluator
         self._plan_builder = plan_builder
+        # 배치 실행 시 여러 이력서가 공고 특징 계산 결과를 공유합니다.
+        self._feature_cache = feature_cache
 
     def execute(
         self,
@@ -48,12 +72,20 @@ class GenerateRecommendationsUseCase:
         resume_id: int,
         limit: int = 100,
         prompt_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Result[list[JobRecommendation]]:
         """
         추천 생성 흐름
         - 1) resume.analysis_result.position을 query로 벡터 검색해 후보(기본 50) 추림
         - 2) 후보를 (기술스택 > 자격요건 > 우대사항 > 벡터유사도) 우선순위로 점수화/정렬
         - 3) prompt_id가 있으면 LLM 평가 후 LLM score로 재정렬
+
+        deadline이 있으면 단계마다 예산 안에서만 기다립니다.
+        - planner: 시간이 부족하거나 넘기면 휴리스틱 fallback 전략 ("planner")
+        - retrieval: chunk 쿼리를 병렬 실행하고, 예산 안에 끝나지 않은 쿼리는 무시 ("retrieval")
+        - graph: 시간 초과 시 그래프 후보 보강 생략 ("graph")
+        - llm_rerank: 시간이 부족하거나 넘기면 rule-based 순서 그대로 반환 ("llm_rerank")
+        생략/축소한 단계는 deadline.degraded에 기록됩니다.
         """
         try:
             resume = Resume.objects.get(id=resume_id)
@@ -72,7 +104,16 @@ class GenerateRecommendationsUseCase:
             return Ok([])
 
         # 1) LLM Planner: 검색전략 생성 (API 키 없으면 fallback)
-        plan = self._plan_builder.build_plan(resume=resume)
+        plan = self._within_deadline(
+            deadline,
+            stage="planner",
+            fn=lambda: self._plan_builder.build_plan(resume=resume),
+            timeout=(
+                deadline.slice(PLANNER_BUDGET_FRACTION) if deadline is not None else 0
+            ),
+            min_seconds=MIN_LLM_STAGE_SECONDS,
+            fallback=lambda: self._plan_builder.build_fallback_plan(resume=resume),
+        )
         plan_filters = (
             plan.get("filters") if isinstance(plan.get("filters"), dict) else {}
         )
@@ -111,13 +152,22 @@ class GenerateRecommendationsUseCase:
             }
 
         # 강한 포지션 필터
-        # - 최종 랭킹 단계에서 확정적으로 제외합니다.
-        # - chunk 컬렉션은 position_category 메타데이터가 없을 수 있어(where로 걸면 결과가 0이 됨),
-        #   retrieval 단계에서는 where_filter에 position_category를 섞지 않습니다.
+        # - chunk 메타데이터의 position_category(저장 시 미리 계산)로 retrieval 단계에서 거릅니다.
+        #   (80개를 가져온 뒤 대부분을 버리지 않도록, 메타데이터 backfill 후 설정으로 켬)
+        # - legacy/그래프 경로도 있으므로 최종 랭킹 단계에서 한 번 더 확정적으로 제외합니다.
         user_position_category = map_position_to_category(
             normalize_position_text(user_position)
         )
         chunk_where_filter = where_filter
+        if user_position_category and getattr(
+            settings, "RECOMMENDATION_CHROMA_CATEGORY_FILTER", False
+        ):
+            category_filter = {"position_category": {"$eq": user_position_category}}
+            chunk_where_filter = (
+                {"$and": [*where_filter["$and"], category_filter]}
+                if where_filter
+                else category_filter
+            )
 
         # posting_id별 점수/근거 집계
         posting_scores: dict[int, float] = {}
@@ -131,6 +181,7 @@ class GenerateRecommendationsUseCase:
                 (score, text)
             )
 
+        chunk_queries: list[tuple[str, float]] = []
         for q in queries[:6]:
             if not isinstance(q, dict):
                 continue
@@ -141,15 +192,25 @@ class GenerateRecommendationsUseCase:
                 weight = float(q.get("weight", 1.0))
             except Exception:
                 weight = 1.0
-            weight = min(max(weight, 0.0), 1.0)
+            chunk_queries.append((query_text, min(max(weight, 0.0), 1.0)))
 
-            qr = self._vector_store.query_by_text(
+        def _query_chunks(query_text: str) -> Optional[dict]:
+            return self._vector_store.query_by_text(
                 collection_name=chunks_collection,
                 query_text=query_text,
                 n_results=80,
                 min_similarity=0.5,
                 where=chunk_where_filter,
             )
+
+        retrieval_remaining = deadline.remaining() if deadline is not None else 0.0
+        chunk_results = self._run_chunk_queries(
+            [query_text for query_text, _ in chunk_queries],
+            query=_query_chunks,
+            deadline=deadline,
+        )
+
+        for (_query_text, weight), qr in zip(chunk_queries, chunk_results):
             if not qr or not qr.get("ids") or not qr["ids"][0]:
                 continue
 
@@ -186,51 +247,27 @@ class GenerateRecommendationsUseCase:
         # chunk 인덱싱이 아직 안 되어 있거나(초기 배포), 테스트에서 vector store가 legacy path만 mock하는 경우가 있어
         # 결과가 비면 기존(job_postings) 벡터 검색으로 fallback 합니다.
         if not posting_scores:
-            legacy_candidate_ids: list[int] = []
-            embedding = self._vector_store.get_embedding(
-                collection_name="resumes",
-                doc_id=str(resume_id),
-            )
-            if embedding is not None:
-                qr = self._vector_store.query_by_embedding(
-                    collection_name="job_postings",
-                    query_embedding=embedding,
-                    n_results=50,
-                    min_similarity=0.7,
-                    where=where_filter,
+            # chunk 검색이 쓰고 남은 retrieval 몫 안에서만 실행합니다. (최대 4번의 Chroma 호출)
+            legacy_timeout = 0.0
+            if deadline is not None and "retrieval" not in deadline.degraded:
+                legacy_timeout = min(
+                    deadline.budget_seconds * RETRIEVAL_BUDGET_FRACTION
+                    - (retrieval_remaining - deadline.remaining()),
+                    deadline.remaining(),
                 )
-                legacy_candidate_ids = _parse_vector_query_results(qr)
-                if where_filter and not legacy_candidate_ids:
-                    qr = self._vector_store.query_by_embedding(
-                        collection_name="job_postings",
-                        query_embedding=embedding,
-                        n_results=50,
-                        min_similarity=0.7,
-                        where=None,
-                    )
-                    legacy_candidate_ids = _parse_vector_query_results(qr)
-            else:
-                query_text = (
-                    resume.experience_summary
-                    or f"보유 스킬: {', '.join(sorted(user_skills))}"
-                )
-                qr = self._vector_store.query_by_text(
-                    collection_name="job_postings",
-                    query_text=query_text,
-                    n_results=50,
-                    min_similarity=0.7,
-                    where=where_filter,
-                )
-                legacy_candidate_ids = _parse_vector_query_results(qr)
-                if where_filter and not legacy_candidate_ids:
-                    qr = self._vector_store.query_by_text(
-                        collection_name="job_postings",
-                        query_text=query_text,
-                        n_results=50,
-                        min_similarity=0.7,
-                        where=None,
-                    )
-                    legacy_candidate_ids = _parse_vector_query_results(qr)
+            legacy_candidate_ids = self._within_deadline(
+                deadline,
+                stage="retrieval",
+                fn=lambda: self._legacy_candidate_ids(
+                    resume_id=resume_id,
+                    resume=resume,
+                    user_skills=user_skills,
+                    where_filter=where_filter,
+                    parse=_parse_vector_query_results,
+                ),
+                timeout=legacy_timeout,
+                fallback=list,
+            )
 
             if not legacy_candidate_ids:
                 return Ok([])
@@ -240,19 +277,26 @@ class GenerateRecommendationsUseCase:
                 posting_scores[pid] = float(vector_scores.get(pid, 0.0))
 
         # 후보 보강(스킬 그래프) - 그래프도 where_filter와 같은 강한 필터를 적용하기 위해 DB에서 확인
-        graph_ids = self._graph_store.get_postings_by_skills(
-            user_skills=user_skills, limit=80
+        graph_ids = self._within_deadline(
+            deadline,
+            stage="graph",
+            fn=lambda: self._graph_store.get_postings_by_skills(
+                user_skills=user_skills, limit=80
+            ),
+            timeout=(
+                deadline.slice(GRAPH_BUDGET_FRACTION) if deadline is not None else 0
+            ),
+            fallback=list,
         )
-        postings_for_graph = JobPosting.objects.filter(posting_id__in=graph_ids).only(
-            "posting_id", "position"
-        )
-        for p in postings_for_graph:
-            if user_position_category:
-                job_cat = map_position_to_category(normalize_position_text(p.position))
-                if not job_cat or job_cat != user_position_category:
-                    continue
-            if p.posting_id not in posting_scores:
-                posting_scores[p.posting_id] = 0.0
+        postings_for_graph = JobPosting.objects.filter(posting_id__in=graph_ids)
+        if user_position_category:
+            postings_for_graph = postings_for_graph.filter(
+                position_category=user_position_category,
+                position_category_version=POSITION_CATEGORY_VERSION,
+            )
+        for posting_id in postings_for_graph.values_list("posting_id", flat=True):
+            if posting_id not in posting_scores:
+                posting_scores[posting_id] = 0.0
 
         candidate_ids = sorted(
             posting_scores.keys(), key=lambda pid: posting_scores[pid], reverse=True
@@ -261,12 +305,7 @@ class GenerateRecommendationsUseCase:
             candidate_ids, field_name="posting_id"
         )
 
-        def _ratio(matched_count: int, total_count: int) -> float:
-            if total_count <= 0:
-                return 0.0
-            return matched_count / total_count
-
-        ranked_candidates: list[dict] = []
+        scorable: list[tuple[int, JobPosting, PostingFeatures]] = []
         for pid in candidate_ids:
             posting = postings_by_id.get(pid)
             if not posting:
@@ -275,65 +314,83 @@ class GenerateRecommendationsUseCase:
             # 강한 포지션 필터(최종 안전장치):
             # - chunk where_filter로 걸렀더라도, legacy fallback/그래프 보강 경로에서 섞일 수 있어
             #   여기서 한번 더 확정적으로 제외합니다.
+            features = (
+                self._feature_cache.get(posting)
+                if self._feature_cache is not None
+                else extract_posting_features(posting)
+            )
             if user_position_category:
-                job_position_category = map_position_to_category(
-                    normalize_position_text(posting.position)
-                )
+                job_position_category = features.position_category
                 if (
                     not job_position_category
                     or job_position_category != user_position_category
                 ):
                     continue
+            scorable.append((pid, posting, features))
+
+        # A안: 튜플 정렬(기술스택 > 자격요건 > 우대사항 > 벡터유사도)
+        # - 기술스택(최우선): JSON skills_required 기반
+        # - 자격요건(2순위): requirements 텍스트에서 스킬 추출
+        # - 우대사항(3순위): preferred_points 우선, 없으면 skills_preferred 사용
+        # 비율/표기용 점수(0~100)/정렬은 후보 전체를 한 번에 계산합니다.
+        vector_similarity = [
+            float(vector_scores.get(pid, 0.0)) for pid, _, _ in scorable
+        ]
+        scores = score_candidates(
+            user_skills=user_skills,
+            stack_skills=[f.stack_skills for _, _, f in scorable],
+            requirement_skills=[f.requirement_skills for _, _, f in scorable],
+            preferred_skills=[f.preferred_skills for _, _, f in scorable],
+            vector_similarity=vector_similarity,
+        )
 
-            # 기술스택(최우선): JSON skills_required 기반
-            stack_skills = set(posting.skills_required or [])
-            stack_matched = user_skills & stack_skills
-            stack_ratio = _ratio(len(stack_matched), len(stack_skills))
-
-            # 자격요건(2순위): requirements 텍스트에서 스킬 추출
-            req_text = posting.requirements or ""
-            req_skills = set(SkillExtractionService.extract_skills(req_text))
-            req_matched = user_skills & req_skills
-            req_ratio = _ratio(len(req_matched), len(req_skills))
-
-            # 우대사항(3순위): preferred_points 우선, 없으면 skills_preferred 사용
-            pref_text = posting.preferred_points or posting.skills_preferred or ""
-            pref_skills = set(SkillExtractionService.extract_skills(pref_text))
-            pref_matched = user_skills & pref_skills
-            pref_ratio = _ratio(len(pref_matched), len(pref_skills))
-
-            vec_sim = float(vector_scores.get(pid, 0.0))
-
-            # A안: 튜플 정렬(기술스택 > 자격요건 > 우대사항 > 벡터유사도)
-            sort_key = (stack_ratio, req_ratio, pref_ratio, vec_sim)
-
-            # 표기용 점수(0~100). 랭킹은 sort_key로 결정.
-            display_score = min(
-                100.0,
-                max(
-                    0.0,
-                    100.0
-                    * ((0.60 * stack_ratio) + (0.25 * req_ratio) + (0.15 * pref_ratio)),
-                ),
+        ranked_candidates: list[dict] = []
+        for i in scores.order:
+            pid, posting, features = scorable[i]
+            ranked_candidates.append(
+                {
+                    "posting": posting,
+                    "posting_id": pid,
+                    "canonical_id": posting.duplicate_of_id or pid,
+                    "features": features,
+                    "display_score": int(scores.display_score[i]),
+                    "vector_similarity": vector_similarity[i],
+                    "stack_match_ratio": float(scores.stack_ratio[i]),
+                    "requirements_match_ratio": float(scores.requirements_ratio[i]),
+                    "preferred_match_ratio": float(scores.preferred_ratio[i]),
+                    "stack_matches": int(scores.stack_matches[i]),
+                    "requirements_matches": int(scores.requirements_matches[i]),
+                    "preferred_matches": int(scores.preferred_matches[i]),
+                }
             )
-            display_score_int = normalize_match_score(display_score)
 
+        def _build_reason(candidate: dict) -> str:
+            # 사유 문자열은 최종 상위 limit 건에 대해서만 만듭니다.
+            features = candidate["features"]
             parts: list[str] = []
-            if stack_skills:
-                parts.append(f"기술스택 {len(stack_matched)}/{len(stack_skills)}")
+            if features.stack_skills:
+                parts.append(
+                    f"기술스택 {candidate['stack_matches']}/{len(features.stack_skills)}"
+                )
             else:
                 parts.append("기술스택 정보 없음")
-            if req_skills:
-                parts.append(f"자격요건 {len(req_matched)}/{len(req_skills)}")
+            if features.requirement_skills:
+                parts.append(
+                    f"자격요건 {candidate['requirements_matches']}"
+                    f"/{len(features.requirement_skills)}"
+                )
             else:
                 parts.append("자격요건 스킬 추출 없음")
-            if pref_skills:
-                parts.append(f"우대사항 {len(pref_matched)}/{len(pref_skills)}")
+            if features.preferred_skills:
+                parts.append(
+                    f"우대사항 {candidate['preferred_matches']}"
+                    f"/{len(features.preferred_skills)}"
+                )
             else:
                 parts.append("우대사항 스킬 추출 없음")
-            parts.append(f"포지션 벡터유사도 {vec_sim:.2f}")
+            parts.append(f"포지션 벡터유사도 {candidate['vector_similarity']:.2f}")
             # S1: 근거 스니펫(섹션별 상위 일부) 포함
-            ev = evidence_by_posting.get(pid, {})
+            ev = evidence_by_posting.get(candidate["posting_id"], {})
             for sec in ("requirements", "preferred", "tasks", "stack", "position"):
                 snippets = ev.get(sec, [])
                 if not snippets:
@@ -343,26 +400,10 @@ class GenerateRecommendationsUseCase:
                 if top_texts:
                     joined = " / ".join(top_texts)
                     parts.append(f"[근거:{sec}] {joined}")
-            reason = " | ".join(parts)
-
-            ranked_candidates.append(
-                {
-                    "posting": posting,
-                    "posting_id": pid,
-                    "sort_key": sort_key,
-                    "display_score": display_score_int,
-                    "vector_similarity": vec_sim,
-                    "stack_match_ratio": stack_ratio,
-                    "requirements_match_ratio": req_ratio,
-                    "preferred_match_ratio": pref_ratio,
-                    "stack_matches": len(stack_matched),
-                    "requirements_matches": len(req_matched),
-                    "preferred_matches": len(pref_matched),
-                    "reason": reason,
-                }
-            )
+            return " | ".join(parts)
 
-        ranked_candidates.sort(key=lambda x: x["sort_key"], reverse=True)
+        # 같은 공고가 여러 출처로 크롤링된 경우 대표 1건만 추천합니다.
+        ranked_candidates = collapse_duplicates(ranked_candidates)
         ranked_candidates = ranked_candidates[
             : min(rerank_limit, len(ranked_candidates))
         ]
@@ -371,6 +412,7 @@ class GenerateRecommendationsUseCase:
 
         # 2) match_score/match_reason
         recommendations: list[dict] = []
+        batch_results: Optional[list[dict]] = None
         if prompt_id:
             prompt = RecommendationPrompt.objects.get(id=prompt_id)
             postings_to_evaluate = [x["posting"] for x in ranked_candidates]
@@ -409,13 +451,28 @@ class GenerateRecommendationsUseCase:
                 for x in ranked_candidates
             ]
 
-            batch_results = self._evaluator.evaluate_batch(
-                postings=postings_to_evaluate,
-                resume=resume,
-                prompt=prompt,
-                search_contexts=search_contexts,
+            # 시간이 부족하거나 넘기면 LLM 평가 없이 rule-based 순서로 응답합니다.
+            batch_results = self._within_deadline(
+                deadline,
+                stage="llm_rerank",
+                fn=lambda: self._evaluator.evaluate_batch(
+                    postings=postings_to_evaluate,
+                    resume=resume,
+                    prompt=prompt,
+                    search_contexts=search_contexts,
+                ),
+                timeout=(
+                    deadline.slice(
+                        1.0,
+                        reserve=deadline.budget_seconds * RESPONSE_RESERVE_FRACTION,
+                    )
+                    if deadline is not None
+                    else 0
+                ),
+                min_seconds=MIN_LLM_STAGE_SECONDS,
+                fallback=lambda: None,
             )
-            for posting, result in zip(postings_to_evaluate, batch_results):
+            for posting, result in zip(postings_to_evaluate, batch_results or []):
                 recommendations.append(
                     {
                         "posting_id": posting.posting_id,
@@ -431,9 +488,10 @@ class GenerateRecommendationsUseCase:
 
             # 3) LLM score 재정렬(요청 사항)
             recommendations.sort(key=lambda x: x["match_score"], reverse=True)
-        else:
+
+        if batch_results is None:
             # 비-LLM 경로: 튜플 정렬 결과 그대로 사용
-            for x in ranked_candidates:
+            for x in ranked_candidates[:limit]:
                 posting = x["posting"]
                 recommendations.append(
                     {
@@ -441,7 +499,7 @@ class GenerateRecommendationsUseCase:
                         "company_name": posting.company_name,
                         "position": posting.position,
                         "match_score": x["display_score"],
-                        "match_reason": x["reason"],
+                        "match_reason": _build_reason(x),
                         "url": posting.url,
                         "location": posting.location,
                         "employment_type": posting.employment_type,
@@ -468,3 +526,139 @@ class GenerateRecommendationsUseCase:
             )
 
         return Ok(recommendation_obj_list[:limit])
+
+    def _legacy_candidate_ids(
+        self,
+        *,
+        resume_id: int,
+        resume: Resume,
+        user_skills: set[str],
+        where_filter: Optional[dict],
+        parse: Callable[[Optional[dict]], list[int]],
+    ) -> list[int]:
+        """
+        chunk 검색 결과가 없을 때의 기존(job_postings) 벡터 검색 후보 ID (parse: 결과 → ID 목록)
+
+        이력서 임베딩이 있으면 임베딩으로, 없으면 요약/스킬 텍스트로 검색하고,
+        강한 필터(where_filter)로 결과가 없으면 필터 없이 한 번 더 검색합니다.
+        """
+        legacy_candidate_ids: list[int] = []
+        embedding = self._vector_store.get_embedding(
+            collection_name="resumes",
+            doc_id=str(resume_id),
+        )
+        if embedding is not None:
+            qr = self._vector_store.query_by_embedding(
+                collection_name="job_postings",
+                query_embedding=embedding,
+                n_results=50,
+                min_similarity=0.7,
+                where=where_filter,
+            )
+            legacy_candidate_ids = parse(qr)
+            if where_filter and not legacy_candidate_ids:
+                qr = self._vector_store.query_by_embedding(
+                    collection_name="job_postings",
+                    query_embedding=embedding,
+                    n_results=50,
+                    min_similarity=0.7,
+                    where=None,
+                )
+                legacy_candidate_ids = parse(qr)
+        else:
+            query_text = (
+                resume.experience_summary
+                or f"보유 스킬: {', '.join(sorted(user_skills))}"
+            )
+            qr = self._vector_store.query_by_text(
+                collection_name="job_postings",
+                query_text=query_text,
+                n_results=50,
+                min_similarity=0.7,
+                where=where_filter,
+            )
+            legacy_candidate_ids = parse(qr)
+            if where_filter and not legacy_candidate_ids:
+                qr = self._vector_store.query_by_text(
+                    collection_name="job_postings",
+                    query_text=query_text,
+                    n_results=50,
+                    min_similarity=0.7,
+                    where=None,
+                )
+                legacy_candidate_ids = parse(qr)
+        return legacy_candidate_ids
+
+    @staticmethod
+    def _within_deadline(
+        deadline: Optional[Deadline],
+        *,
+        stage: str,
+        fn: Callable[[], T],
+        timeout: float,
+        fallback: Callable[[], T],
+        min_seconds: float = 0.0,
+    ) -> T:
+        """
+        deadline이 없으면 fn을 그대로 호출하고, 있으면 timeout 안에서만 기다립니다.
+
+        줄 수 있는 시간이 min_seconds보다 짧거나 시간 안에 끝나지 않으면 fallback 결과를 쓰고
+        stage를 degraded로 기록합니다.
+        """
+        if deadline is None:
+            return fn()
+        if timeout <= 0 or timeout < min_seconds:
+            logger.warning(
+                f"Skipping recommendation stage '{stage}': "
+                f"{deadline.remaining():.3f}s left of {deadline.budget_seconds:.3f}s budget"
+            )
+            deadline.mark_degraded(stage)
+            return fallback()
+        try:
+            return run_with_timeout(fn, timeout=timeout, name=f"rec-{stage}")
+        except DeadlineExceeded as e:
+            logger.warning(f"Recommendation stage '{stage}' timed out: {e}")
+            deadline.mark_degraded(stage)
+            return fallback()
+
+    @staticmethod
+    def _run_chunk_queries(
+        query_texts: list[str],
+        *,
+        query: Callable[[str], Optional[dict]],
+        deadline: Optional[Deadline],
+    ) -> list[Optional[dict]]:
+        """
+        chunk 검색 쿼리 실행. deadline이 있으면 병렬로 실행하고 retrieval 몫 안에 끝난 결과만 씁니다.
+        (끝나지 않은 쿼리는 결과를 버리고, 아직 시작하지 않은 쿼리는 취소합니다.)
+        """
+        if deadline is None or not query_texts:
+            return [query(query_text) for query_text in query_texts]
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(query_texts), thread_name_prefix="rec-retrieval"
+        )
+        try:
+            futures = [executor.submit(query, query_text) for query_text in query_texts]
+            done, not_done = wait(
+                futures, timeout=deadline.slice(RETRIEVAL_BUDGET_FRACTION)
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if not_done:
+            logger.warning(
+                f"Ignoring {len(not_done)}/{len(futures)} chunk queries past the retrieval budget"
+            )
+            deadline.mark_degraded("retrieval")
+
+        results: list[Optional[dict]] = []
+        for future in futures:
+            if future not in done:
+                results.append(None)
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"Chunk query failed: {e}")
+                results.append(None)
+        return results
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from common.application.result import Ok, Result
+from common.ports.notifier import NotifierPort
+from common.ports.recommendation_batch import RecommendationBatchRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+# Slack 메시지에 포함할 사용자별 추천 수
+SLACK_TOP_N = 10
+
+
+@dataclass
+class BatchProgress:
+    """배치 진행 상황 카운터 (여러 worker 스레드에서 갱신)"""
+
+    total: int
+    done: int = 0
+    succeeded: int = 0
+    empty: int = 0
+    failed: int = 0
+    recommendations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, *, outcome: str, recommendations: int = 0) -> int:
+        with self._lock:
+            self.done += 1
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.recommendations += recommendations
+            return self.done
+
+    def summary(self, *, elapsed_seconds: float) -> dict:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "empty": self.empty,
+            "failed": self.failed,
+            "recommendations": self.recommendations,
+            "elapsed_seconds": round(elapsed_seconds, 3),
+            "resumes_per_second": (
+                round(self.done / elapsed_seconds, 3) if elapsed_seconds > 0 else 0.0
+            ),
+        }
+
+
+class NightlyRecommendationBatchUseCase:
+    """
+    야간 추천 배치 유스케이스.
+
+    - 대표 이력서(is_primary)마다 추천을 생성/저장합니다. (대상 조회/저장은 repository 포트)
+    - max_workers 개 스레드로 병렬 처리합니다. 작업은 대부분 외부 I/O(Chroma/Neo4j/LLM/DB) 대기라
+      프로세스 풀 없이도 병렬화되며, 공고 특징 캐시와 LLM semaphore를 프로세스 안에서 공유합니다.
+    - Slack 알림은 notifier에 모아 두었다가 실행 끝에 묶음 전송합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        repository: RecommendationBatchRepositoryPort,
+        notifier: NotifierPort,
+        max_workers: int = 4,
+        progress_every: int = 50,
+    ):
+        self._repository = repository
+        self._notifier = notifier
+        self._max_workers = max(1, max_workers)
+        self._progress_every = max(1, progress_every)
+
+    def execute(self) -> Result[dict]:
+        started = time.perf_counter()
+        targets = self._repository.list_targets()
+        progress = BatchProgress(total=len(targets))
+
+        if not targets:
+            self._notifier.queue("⚠️ 분석할 이력서가 없습니다.")
+        elif self._max_workers == 1:
+            for resume_id, user_id in targets:
+                self._run_one(resume_id, user_id, progress)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="nightly-rec"
+            ) as executor:
+                for resume_id, user_id in targets:
+                    executor.submit(self._run_in_worker, resume_id, user_id, progress)
+
+        summary = progress.summary(elapsed_seconds=time.perf_counter() - started)
+        if targets:
+            self._notifier.queue(self._summary_message(summary))
+        summary["slack_posts"] = self._notifier.flush()
+        logger.info(f"Nightly recommendation batch finished: {summary}")
+        return Ok(summary)
+
+    def _run_in_worker(self, resume_id: int, user_id: int, progress: BatchProgress):
+        try:
+            self._run_one(resume_id, user_id, progress)
+        finally:
+            self._repository.release_thread_resources()
+
+    def _run_one(self, resume_id: int, user_id: int, progress: BatchProgress) -> None:
+        try:
+            recommendations = self._repository.generate_recommendations(resume_id)
+        except Exception as e:
+            logger.error(
+                f"Nightly recommendation failed for user {user_id} (resume {resume_id}): {e}",
+                exc_info=True,
+            )
+            done = progress.record(outcome="failed")
+            self._notifier.queue(
+                f"❌ User {user_id}: 예상치 못한 오류 - {type(e).__name__}: {e}"
+            )
+        else:
+            if recommendations:
+                done = progress.record(
+                    outcome="succeeded", recommendations=len(recommendations)
+                )
+                self._notifier.queue(self._user_message(user_id, recommendations))
+            else:
+                done = progress.record(outcome="empty")
+                self._notifier.queue(f"⚠️ User {user_id}: 추천 결과가 없습니다.")
+
+        if done % self._progress_every == 0 or done == progress.total:
+            logger.info(
+                f"Nightly recommendation progress: {done}/{progress.total} "
+                f"(succeeded={progress.succeeded}, empty={progress.empty}, "
+                f"failed={progress.failed})"
+            )
+
+    @staticmethod
+    def _user_message(user_id: int, recommendations: Sequence) -> str:
+        top = recommendations[:SLACK_TOP_N]
+        lines = [f"✨ User {user_id}님을 위한 {len(top)}개의 채용 공고 추천 ✨\n"]
+        for rec in top:
+            posting = rec.job_posting
+            lines.append(
+                f"🏢 {posting.company_name} - {posting.position} (매칭: {rec.match_score}점)\n"
+                f"   └ {rec.match_reason}\n   <{posting.url}|공고 보기>"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _summary_message(summary: dict) -> str:
+        return (
+            f"📊 야간 추천 배치 완료: 대상 {summary['total']}명 "
+            f"(성공 {summary['succeeded']}, 결과 없음 {summary['empty']}, "
+            f"실패 {summary['failed']}), 추천 {summary['recommendations']}건, "
+            f"{summary['elapsed_seconds']:.1f}s"
+        )
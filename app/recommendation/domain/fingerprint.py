@@ -0,0 +1,34 @@
+"""
+추천 입력 fingerprint (순수 도메인 로직).
+
+추천 결과를 결정하는 사용자 쪽 입력(이력서 내용/분석 결과, 프롬프트, 개수)의 해시입니다.
+공고 코퍼스 쪽 변경은 fingerprint에 넣지 않고 세트의 corpus_version으로 따로 비교합니다.
+(새 공고는 역매칭으로 현재 세트에 반영되므로, 공고가 늘 때마다 fingerprint가 바뀌면 안 됩니다.)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Optional
+
+
+def recommendation_fingerprint(
+    *,
+    resume_hash: str,
+    analysis_result: Any,
+    prompt_id: Optional[int] = None,
+    prompt_content: str = "",
+    limit: int = 0,
+) -> str:
+    analysis = json.dumps(
+        analysis_result or {}, sort_keys=True, ensure_ascii=False, default=str
+    )
+    parts = [
+        resume_hash or "",
+        hashlib.sha256(analysis.encode("utf-8")).hexdigest(),
+        str(prompt_id or ""),
+        hashlib.sha256((prompt_content or "").encode("utf-8")).hexdigest(),
+        str(limit),
+    ]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
@@ -2,10 +2,30 @@ from __future__ import annotations
 
 import math
 
+from job.domain.position import (
+    map_position_to_category,
+    normalize_position_text,
+)
 from job.models import JobPosting
 from skill.services import SkillExtractionService
 
 
+def collapse_duplicates(ranked_candidates: list[dict]) -> list[dict]:
+    """
+    랭킹 순으로 정렬된 후보에서 같은 대표 공고(canonical_id)를 공유하는
+    유사 중복 공고는 가장 높은 순위 하나만 남깁니다.
+    """
+    seen: set[int] = set()
+    collapsed = []
+    for candidate in ranked_candidates:
+        key = candidate.get("canonical_id") or candidate["posting_id"]
+        if key in seen:
+            continue
+        seen.add(key)
+        collapsed.append(candidate)
+    return collapsed
+
+
 def normalize_match_score(value: object) -> int:
     """
     추천 점수를 정수(int)로 정규화합니다.
@@ -30,44 +50,42 @@ def normalize_match_score(value: object) -> int:
     return int(math.floor(x + 0.5))
 
 
-def normalize_position_text(text: str) -> str:
-    if not text:
-        return ""
-    s = str(text).strip().lower()
-    s = s.replace(" ", "").replace("/", "").replace("-", "").replace("_", "")
-    return s
-
-
-def map_position_to_category(normalized_text: str) -> str:
-    if not normalized_text:
-        return ""
-
-    backend_keywords = ("backend", "백엔드", "server", "서버")
-    frontend_keywords = ("frontend", "프론트", "web", "웹")
-    devops_keywords = ("devops", "infra", "인프라", "sre", "platform", "플랫폼")
-    data_ml_keywords = (
-        "data",
-        "ml",
-        "ai",
-        "머신러닝",
-        "데이터",
-        "research",
-        "리서치",
+def skill_match_ratios(
+    user_skills: set[str],
+    stack_skills: set[str],
+    requirement_skills: set[str],
+    preferred_skills: set[str],
+) -> tuple[float, float, float]:
+    """
+    (기술스택, 자격요건, 우대사항) 스킬 일치 비율. 추천 랭킹의 정렬 키 앞부분입니다.
+    """
+
+    def _ratio(skills: set[str]) -> float:
+        if not skills:
+            return 0.0
+        return len(user_skills & skills) / len(skills)
+
+    return (
+        _ratio(stack_skills),
+        _ratio(requirement_skills),
+        _ratio(preferred_skills),
+    )
+
+
+def display_match_score(
+    stack_ratio: float, requirements_ratio: float, preferred_ratio: float
+) -> int:
+    """
+    표기용 점수(0~100): 기술스택 0.60 + 자격요건 0.25 + 우대사항 0.15 가중합.
+    """
+    return normalize_match_score(
+        100.0
+        * (
+            (0.60 * stack_ratio)
+            + (0.25 * requirements_ratio)
+            + (0.15 * preferred_ratio)
+        )
     )
-    mobile_keywords = ("android", "ios", "mobile", "모바일")
-
-    if any(k in normalized_text for k in backend_keywords):
-        return "backend"
-    if any(k in normalized_text for k in frontend_keywords):
-        return "frontend"
-    if any(k in normalized_text for k in devops_keywords):
-        return "devops"
-    if any(k in normalized_text for k in data_ml_keywords):
-        return "data_ml"
-    if any(k in normalized_text for k in mobile_keywords):
-        return "mobile"
-
-    return ""
 
 
 def calculate_position_similarity(user_position: str, job_position: str) -> float:
@@ -0,0 +1,153 @@
+"""
+후보 공고 일괄 점수 계산 엔진 (NumPy 벡터화).
+
+추천 랭킹은 후보마다 (기술스택, 자격요건, 우대사항) 스킬 일치 비율과 표기용 점수를 계산하고
+(기술스택 > 자격요건 > 우대사항 > 벡터유사도) 튜플 내림차순으로 정렬합니다.
+후보마다 set 교집합/튜플 정렬을 반복하는 대신,
+
+- 스킬을 정수 id로 바꿔(MASTER_SKILLS 순서, 처음 보는 스킬은 호출마다 뒤에 부여)
+  후보별 스킬 id를 하나의 평탄 배열로 모으고,
+- 사용자 스킬 mask를 인덱싱해 후보별 일치 수를 `np.bincount`로 한 번에 집계하고,
+- 정렬은 `np.lexsort`(stable)로 계산합니다.
+
+`skill_match_ratios` / `display_match_score` / `sorted(..., reverse=True)`와 결과가 정확히 같습니다.
+(같은 float64 연산 순서, 동점은 입력 순서 유지)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+import numpy as np
+from skill.services import MASTER_SKILLS
+
+
+@lru_cache(maxsize=1)
+def _master_skill_ids() -> dict[str, int]:
+    return {skill: skill_id for skill_id, skill in enumerate(MASTER_SKILLS)}
+
+
+class _SkillEncoder:
+    """스킬 이름 → 정수 id (호출 단위, MASTER_SKILLS에 없는 스킬은 뒤에 이어서 부여)"""
+
+    def __init__(self):
+        self._ids = _master_skill_ids()
+        self._extra: dict[str, int] = {}
+
+    def encode_many(self, skills: list[str]) -> list[int]:
+        skill_ids = list(map(self._ids.get, skills))
+        for i, skill_id in enumerate(skill_ids):
+            if skill_id is None:
+                skill_ids[i] = self._extra.setdefault(
+                    skills[i], len(self._ids) + len(self._extra)
+                )
+        return skill_ids
+
+    def lookup(self, skill: str) -> int | None:
+        skill_id = self._ids.get(skill)
+        return skill_id if skill_id is not None else self._extra.get(skill)
+
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._extra)
+
+
+@dataclass(frozen=True)
+class CandidateScores:
+    """
+    후보 배열(입력 순서)별 점수. order는 랭킹 순 후보 인덱스입니다.
+    """
+
+    order: np.ndarray
+    stack_ratio: np.ndarray
+    requirements_ratio: np.ndarray
+    preferred_ratio: np.ndarray
+    stack_matches: np.ndarray
+    requirements_matches: np.ndarray
+    preferred_matches: np.ndarray
+    display_score: np.ndarray
+
+
+def _encode_section(
+    skill_sets: Sequence[Iterable[str]], encoder: _SkillEncoder
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """후보별 스킬 집합 → (행 번호, 스킬 id, 후보별 스킬 수) 평탄 배열"""
+    n = len(skill_sets)
+    totals = np.fromiter((len(skills) for skills in skill_sets), np.int64, count=n)
+    skill_ids = np.array(
+        encoder.encode_many([skill for skills in skill_sets for skill in skills]),
+        dtype=np.int64,
+    )
+    rows = np.repeat(np.arange(n, dtype=np.int64), totals)
+    return rows, skill_ids, totals
+
+
+def _match_counts(
+    rows: np.ndarray, skill_ids: np.ndarray, user_mask: np.ndarray, n: int
+) -> np.ndarray:
+    hits = user_mask[skill_ids]
+    return np.bincount(rows[hits], minlength=n).astype(np.int64)
+
+
+def _ratio(matched: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(totals), dtype=np.float64)
+    np.divide(matched, totals, out=out, where=totals > 0)
+    return out
+
+
+def score_candidates(
+    *,
+    user_skills: Iterable[str],
+    stack_skills: Sequence[Iterable[str]],
+    requirement_skills: Sequence[Iterable[str]],
+    preferred_skills: Sequence[Iterable[str]],
+    vector_similarity: Sequence[float],
+) -> CandidateScores:
+    """
+    후보 N개의 스킬 일치 비율/표기용 점수/랭킹 순서를 한 번에 계산합니다.
+
+    Args:
+        user_skills: 사용자 보유 스킬
+        stack_skills / requirement_skills / preferred_skills: 후보별 섹션 스킬 집합 (길이 N)
+        vector_similarity: 후보별 벡터 유사도 (길이 N, 마지막 정렬 키)
+    """
+    n = len(stack_skills)
+    encoder = _SkillEncoder()
+    sections = [
+        _encode_section(skill_sets, encoder)
+        for skill_sets in (stack_skills, requirement_skills, preferred_skills)
+    ]
+
+    user_mask = np.zeros(len(encoder), dtype=bool)
+    for skill in user_skills:
+        skill_id = encoder.lookup(skill)
+        if skill_id is not None:
+            user_mask[skill_id] = True
+
+    matches = [
+        _match_counts(rows, skill_ids, user_mask, n) for rows, skill_ids, _ in sections
+    ]
+    stack_ratio, req_ratio, pref_ratio = (
+        _ratio(matched, totals) for matched, (_, _, totals) in zip(matches, sections)
+    )
+
+    # display_match_score와 같은 연산 순서(가중합 → 0~100 클램프 → half-up 반올림)
+    raw = 100.0 * ((0.60 * stack_ratio) + (0.25 * req_ratio) + (0.15 * pref_ratio))
+    display_score = np.floor(np.clip(raw, 0.0, 100.0) + 0.5).astype(np.int64)
+
+    vec = np.asarray(vector_similarity, dtype=np.float64)
+    # lexsort는 마지막 키가 1순위이고 stable이므로, 부호를 뒤집으면
+    # sorted(key=tuple, reverse=True)와 같은 순서(동점은 입력 순서)가 됩니다.
+    order = np.lexsort((-vec, -pref_ratio, -req_ratio, -stack_ratio))
+
+    return CandidateScores(
+        order=order,
+        stack_ratio=stack_ratio,
+        requirements_ratio=req_ratio,
+        preferred_ratio=pref_ratio,
+        stack_matches=matches[0],
+        requirements_matches=matches[1],
+        preferred_matches=matches[2],
+        display_score=display_score,
+    )
@@ -0,0 +1,27 @@
+"""
+Management command to prune old recommendation sets.
+
+현재 세트가 아닌 추천 세트 중 보존 기간(RECOMMENDATION_SET_RETENTION_DAYS)이 지난 것을 삭제합니다.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from recommendation.services import RecommendationService
+
+
+class Command(BaseCommand):
+    help = "Deletes non-current recommendation sets older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.RECOMMENDATION_SET_RETENTION_DAYS,
+            help="보존 기간(일). 이보다 오래된 비현재 세트를 삭제합니다.",
+        )
+
+    def handle(self, *args, **options):
+        total = RecommendationService.prune_recommendation_sets(
+            older_than_days=options["days"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Pruned {total} recommendation sets"))
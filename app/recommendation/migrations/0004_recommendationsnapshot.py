@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-19 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recommendation", "0003_jobrecommendation_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecommendationSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_id", models.IntegerField(unique=True)),
+                ("items", models.JSONField(default=list)),
+                ("version", models.BigIntegerField(default=1)),
+                ("generated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "agent_recommendation_snapshot",
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.7 on 2026-10-19 01:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0014_company"),
+        ("recommendation", "0004_recommendationsnapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecommendationSet",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("user_id", models.IntegerField(db_index=True)),
+                ("resume_id", models.IntegerField(blank=True, null=True)),
+                ("prompt_id", models.IntegerField(blank=True, null=True)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("corpus_version", models.BigIntegerField(default=0)),
+                ("generated_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "agent_recommendation_set",
+                "indexes": [
+                    models.Index(fields=["generated_at"], name="rec_set_generated_idx")
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="jobrecommendation",
+            name="recommendation_set",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="items",
+                to="recommendation.recommendationset",
+            ),
+        ),
+        migrations.AddField(
+            model_name="recommendationsnapshot",
+            name="recommendation_set",
+            field=models.OneToOneField(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="current_for",
+                to="recommendation.recommendationset",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobrecommendation",
+            index=models.Index(fields=["user_id", "rank"], name="rec_user_rank_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recommendation", "0005_recommendation_sets"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recommendationsnapshot",
+            name="corpus_version",
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
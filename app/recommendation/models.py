@@ -1,19 +1,82 @@
 from django.db import models
+from django.db.models import Exists, OuterRef, Q
+
+
+class RecommendationSet(models.Model):
+    """
+    한 번의 추천 생성 결과 묶음 (append-only).
+
+    - fingerprint: 입력(이력서 해시, 프롬프트, 개수) 해시.
+      현재 세트와 같고 corpus_version이 최신이면 재계산하지 않습니다.
+    - corpus_version: 이 세트가 반영한 `JobPostingChange` 버전.
+      생성 시점 버전으로 시작해, 새 공고 역매칭(`apply_new_postings`)이 끝나면 그 사이 변경이
+      모두 반영된(처리된 신규 공고 upsert/삭제뿐인) 구간까지만 올라갑니다.
+    - 사용자의 "현재" 세트는 `RecommendationSnapshot.recommendation_set` 포인터가 가리키며,
+      새 세트를 쓴 뒤 포인터만 원자적으로 교체합니다. (기존 행 DELETE 없음)
+    - 현재 세트가 아닌 오래된 세트는 `prune_recommendation_sets`로 정리합니다.
+    """
+
+    user_id = models.IntegerField(db_index=True)
+    resume_id = models.IntegerField(null=True, blank=True)
+    prompt_id = models.IntegerField(null=True, blank=True)
+    fingerprint = models.CharField(max_length=64)
+    corpus_version = models.BigIntegerField(default=0)
+    generated_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "agent_recommendation_set"
+        indexes = [
+            models.Index(fields=["generated_at"], name="rec_set_generated_idx"),
+        ]
+
+    def __str__(self):
+        return f"Recommendation set #{self.id} for user {self.user_id}"
+
+
+class JobRecommendationQuerySet(models.QuerySet):
+    def current(self):
+        """
+        사용자별 현재 세트의 추천만 남깁니다.
+
+        세트 없이 저장된(세트 도입 이전) 행은 사용자에게 현재 세트가 아직 없을 때만 포함합니다.
+        """
+        has_current_set = Exists(
+            RecommendationSnapshot.objects.filter(
+                user_id=OuterRef("user_id"), recommendation_set__isnull=False
+            )
+        )
+        return self.filter(
+            Q(recommendation_set__current_for__isnull=False)
+            | (Q(recommendation_set__isnull=True) & ~has_current_set)
+        )
 
 
 class JobRecommendation(models.Model):
     user_id = models.IntegerField()
     job_posting = models.ForeignKey("job.JobPosting", on_delete=models.CASCADE)
+    recommendation_set = models.ForeignKey(
+        RecommendationSet,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="items",
+    )
     rank = models.IntegerField(help_text="추천 순위 (1-10)")
     # DB 스키마는 변경하지 않고(Float 유지), API/저장 시점에 반올림 정수로 정규화합니다.
     match_score = models.FloatField(help_text="매칭 점수")
     match_reason = models.TextField(help_text="추천 이유")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "agent_job_recommendation"
         ordering = ["user_id", "rank"]
         unique_together = ["user_id", "rank", "created_at"]
+        indexes = [
+            models.Index(fields=["user_id", "rank"], name="rec_user_rank_idx"),
+        ]
+
+    objects = JobRecommendationQuerySet.as_manager()
 
     def __str__(self):
         return (
@@ -21,6 +84,41 @@ class JobRecommendation(models.Model):
         )
 
 
+class RecommendationSnapshot(models.Model):
+    """
+    사용자별 추천 목록 스냅샷 (materialized, 읽기 경로용).
+
+    추천 생성/변경 직후 목록 응답(순위, 점수, 이유, 공고 요약)을 JSON 문서 하나로
+    비정규화해 두고, `GET /recommendations/?user_id=` 는 user_id 유니크 인덱스
+    조회 한 번과 변경 로그 확인으로 응답합니다. (행별 JOIN/직렬화 없음)
+
+    - items: `JobRecommendationSummaryReadSerializer` 출력 목록 (rank 오름차순)
+    - version: 스냅샷을 다시 쓸 때마다 1씩 증가 (ETag 재료)
+    - corpus_version: items를 직렬화하기 직전의 `JobPostingChange` 버전.
+      이후 items 속 공고가 수정/삭제되면 조회 시 스냅샷을 다시 씁니다.
+    - recommendation_set: 사용자의 현재 추천 세트 포인터
+    """
+
+    user_id = models.IntegerField(unique=True)
+    recommendation_set = models.OneToOneField(
+        RecommendationSet,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="current_for",
+    )
+    items = models.JSONField(default=list)
+    version = models.BigIntegerField(default=1)
+    corpus_version = models.BigIntegerField(default=0)
+    generated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "agent_recommendation_snapshot"
+
+    def __str__(self):
+        return f"Recommendation snapshot v{self.version} for user {self.user_id}"
+
+
 class RecommendationPrompt(models.Model):
     name = models.CharField(max_length=100, help_text="프롬프트 이름 (예: 기술 면접관)")
     content = models.TextField(help_text="프롬프트 내용")
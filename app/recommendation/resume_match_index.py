@@ -0,0 +1,195 @@
+"""
+In-process 대표 이력서 역매칭 인덱스.
+
+새 공고가 처리될 때 "이 공고를 추천받을 만한 사용자"를 찾기 위해, 대표 이력서(is_primary)의
+분석 결과(스킬 집합, 경력 연차, 포지션 카테고리)만 메모리에 올려 둡니다.
+
+- 스킬 → 이력서 행 번호의 역색인으로 공고 스킬과 하나라도 겹치는 이력서만 후보로 봅니다.
+- 경력/포지션 필터는 추천 생성(`GenerateRecommendationsUseCase`)의 강한 필터와 같은 규칙입니다.
+- 이력서 변경은 refresh_interval 마다 (대표 이력서 수, 최종 수정/분석 시각)을 확인해 반영합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.conf import settings
+from recommendation.domain.scoring import (
+    map_position_to_category,
+    normalize_position_text,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResumeProfile:
+    resume_id: int
+    user_id: int
+    skills: frozenset[str]
+    career_years: int
+    position_category: str
+
+
+def build_resume_profile(
+    *, resume_id: int, user_id: int, analysis_result: object
+) -> Optional[ResumeProfile]:
+    """분석 결과에서 역매칭용 프로필을 만듭니다. (스킬이 없으면 추천 대상이 아니므로 None)"""
+    analysis = analysis_result if isinstance(analysis_result, dict) else {}
+    skills = frozenset(analysis.get("skills", []) or [])
+    if not skills or not user_id:
+        return None
+    try:
+        career_years = int(analysis.get("career_years", 0) or 0)
+    except (TypeError, ValueError):
+        career_years = 0
+    position = str(analysis.get("position", "") or "").strip()
+    return ResumeProfile(
+        resume_id=resume_id,
+        user_id=user_id,
+        skills=skills,
+        career_years=career_years,
+        position_category=map_position_to_category(normalize_position_text(position)),
+    )
+
+
+class ResumeMatchIndex:
+    _instance: Optional["ResumeMatchIndex"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, *, refresh_interval_seconds: float = 60.0):
+        self._lock = threading.RLock()
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._last_refresh_check = 0.0
+        self._stale = True
+        self._signature: tuple = ()
+        self.load([])
+
+    @classmethod
+    def get_instance(cls) -> "ResumeMatchIndex":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = ResumeMatchIndex(
+                        refresh_interval_seconds=float(
+                            getattr(
+                                settings,
+                                "RESUME_MATCH_INDEX_REFRESH_INTERVAL_SECONDS",
+                                60,
+                            )
+                        )
+                    )
+        return cls._instance
+
+    @classmethod
+    def mark_stale(cls) -> None:
+        """다음 조회 시 다시 적재하도록 표시합니다."""
+        if cls._instance is not None:
+            cls._instance._stale = True
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    def load(self, profiles: Iterable[ResumeProfile]) -> None:
+        rows = list(profiles)
+        by_skill: dict[str, list[int]] = {}
+        for row_id, profile in enumerate(rows):
+            for skill in profile.skills:
+                by_skill.setdefault(skill, []).append(row_id)
+        with self._lock:
+            self._rows = rows
+            self._by_skill = by_skill
+
+    @staticmethod
+    def _current_signature() -> tuple:
+        from django.db.models import Count, Max
+        from resume.models import Resume
+
+        # 분석 결과 저장은 update_fields로 updated_at을 건드리지 않으므로 analyzed_at도 봅니다.
+        stats = Resume.objects.filter(is_primary=True).aggregate(
+            count=Count("id"), updated=Max("updated_at"), analyzed=Max("analyzed_at")
+        )
+        return (stats["count"], stats["updated"], stats["analyzed"])
+
+    def ensure_fresh(self) -> None:
+        if self._stale:
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now - self._last_refresh_check < self._refresh_interval_seconds:
+            return
+        self._last_refresh_check = now
+        if self._current_signature() != self._signature:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        from resume.models import Resume
+
+        started = time.perf_counter()
+        with self._lock:
+            self._stale = False
+            signature = self._current_signature()
+            profiles = (
+                build_resume_profile(
+                    resume_id=resume_id,
+                    user_id=user_id,
+                    analysis_result=analysis_result,
+                )
+                for resume_id, user_id, analysis_result in Resume.objects.filter(
+                    is_primary=True
+                ).values_list("id", "user_id", "analysis_result")
+            )
+            self.load(profile for profile in profiles if profile is not None)
+            self._signature = signature
+            self._last_refresh_check = time.monotonic()
+        logger.info(
+            f"ResumeMatchIndex loaded: {len(self._rows)} primary resumes "
+            f"({time.perf_counter() - started:.3f}s)"
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def candidates(
+        self,
+        *,
+        skills: Iterable[str],
+        position_category: str,
+        career_min: Optional[int],
+        career_max: Optional[int],
+    ) -> list[ResumeProfile]:
+        """
+        공고와 스킬이 하나 이상 겹치고 경력/포지션 필터를 통과하는 대표 이력서 프로필.
+
+        - 경력: 이력서 연차가 있으면 career_min <= 연차 + 3, career_max >= 연차
+          (공고 쪽 값이 비어 있으면 해당 경계는 제한 없음)
+        - 포지션: 이력서 카테고리가 있으면 공고 카테고리가 같아야 함
+        """
+        with self._lock:
+            rows, by_skill = self._rows, self._by_skill
+        row_ids: set[int] = set()
+        for skill in skills:
+            row_ids.update(by_skill.get(skill, ()))
+
+        matched: list[ResumeProfile] = []
+        for row_id in sorted(row_ids):
+            profile = rows[row_id]
+            if profile.position_category and (
+                profile.position_category != position_category
+            ):
+                continue
+            years = profile.career_years
+            if years > 0:
+                if career_min is not None and career_min > years + 3:
+                    continue
+                if career_max is not None and career_max < years:
+                    continue
+            matched.append(profile)
+        return matched
@@ -1,5 +1,5 @@
 from job.models import JobPosting
-from job.serializers import JobPostingSerializer
+from job.serializers import JobPostingSerializer, JobPostingSummarySerializer
 from recommendation.domain.scoring import normalize_match_score
 from recommendation.models import JobRecommendation, RecommendationPrompt
 from rest_framework import serializers
@@ -39,6 +39,12 @@ class JobRecommendationReadSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at"]
 
 
+class JobRecommendationSummaryReadSerializer(JobRecommendationReadSerializer):
+    """목록 GET용 Serializer - job_posting 요약 정보(본문 컬럼 제외) 포함"""
+
+    job_posting = JobPostingSummarySerializer(read_only=True)
+
+
 class JobRecommendationWriteSerializer(serializers.ModelSerializer):
     """POST/PUT/PATCH 요청용 Serializer - job_posting ID만 받음"""
 
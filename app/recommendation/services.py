@@ -7,33 +7,67 @@ AI-Free 실시간 채용 공고 추천 엔진
 
 import logging
 import time
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional, Set
 
 from common.application.result import Err, Ok
+from common.deadline import Deadline
+from common.singleflight import SingleFlight
+from django.conf import settings
 from django.db import transaction
-from job.models import JobPosting
+from django.utils import timezone
+from job.models import JobPosting, JobPostingChange
+from recommendation.application.posting_features import (
+    PostingFeatures,
+    extract_posting_features,
+)
+from recommendation.domain.fingerprint import recommendation_fingerprint
 from recommendation.domain.scoring import (
     calculate_match_score_and_reason,
     calculate_position_similarity,
+    display_match_score,
     map_position_to_category,
     normalize_position_text,
+    skill_match_ratios,
+)
+from recommendation.models import (
+    JobRecommendation,
+    RecommendationPrompt,
+    RecommendationSet,
+    RecommendationSnapshot,
 )
-from recommendation.models import JobRecommendation, RecommendationPrompt
+from recommendation.resume_match_index import ResumeMatchIndex
+from recommendation.serializers import JobRecommendationSummaryReadSerializer
 from resume.models import Resume
 
 logger = logging.getLogger(__name__)
 # Backward-compat globals (tests/mocking & legacy static methods use these names)
 from common.adapters.chroma_vector_store import ChromaVectorStore
+from common.adapters.django_skill_stat_repo import DjangoSkillStatRepository
 from common.adapters.gemini_recommendation_evaluator import (
     GeminiRecommendationEvaluator,
 )
 from common.adapters.neo4j_graph_store import Neo4jGraphStore
 from recommendation.application.container import build_generate_recommendations_usecase
+from recommendation.application.usecases.generate_recommendations import (
+    GenerateRecommendationsUseCase,
+)
 
 vector_store = ChromaVectorStore()
 graph_store = Neo4jGraphStore()
+skill_stat_repo = DjangoSkillStatRepository()
 recommendation_evaluator = GeminiRecommendationEvaluator()
 
+# 같은 (이력서, 프롬프트, 개수) 실시간 추천의 동시 요청은 한 번만 계산합니다.
+recommendation_flight = SingleFlight(
+    "recommendations",
+    lock_ttl_seconds=settings.RECOMMENDATION_SINGLEFLIGHT_LOCK_TTL_SECONDS,
+)
+# 다른 계산을 기다리는 시간은 요청 예산의 이 비율까지만 씁니다. (나머지는 대체 응답용)
+SINGLEFLIGHT_WAIT_BUDGET_FRACTION = 0.5
+
 
 class RecommendationService:
     """
@@ -44,46 +78,63 @@ class RecommendationService:
 
     @staticmethod
     def get_recommendations(
-        resume_id: int, limit: int = 100, prompt_id: Optional[int] = None
+        resume_id: int,
+        limit: int = 100,
+        prompt_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
     ) -> List[JobRecommendation]:
         """
         사용자에게 적합한 채용 공고 추천
 
+        입력 fingerprint(이력서 해시, 프롬프트, 개수)가 현재 세트와 같고 현재 세트가 최신 코퍼스
+        버전까지 반영했으면(역매칭 포함) 재계산 없이 현재 세트를 반환합니다.
+
+        같은 (resume_id, prompt_id, limit) 요청이 동시에 들어오면 한 번만 계산하고(single-flight),
+        나머지 요청은 그 결과를 받습니다. 다른 워커가 계산 중이면 끝날 때까지 기다린 뒤
+        저장된 현재 세트를 재사용합니다. 기다리는 시간(예산의 일부)이 지나면 다시 계산하지 않고
+        사용자의 현재 세트(없으면 빈 결과)를 반환하며 "singleflight" 단계를 degraded로 기록합니다.
+
         Args:
             resume_id: 이력서 ID
             limit: 반환할 추천 개수 (기본 100개)
+            deadline: 요청 시간 예산 (생략/축소한 단계는 deadline.degraded에 기록)
 
         Returns:
             추천 공고 리스트 (각 항목은 posting_id, match_score, match_reason 포함)
         """
-        try:
-            user_id = (
-                Resume.objects.filter(id=resume_id)
-                .values_list("user_id", flat=True)
-                .first()
-            )
-            if not user_id:
-                logger.error(f"Resume {resume_id} not found")
-                return []
 
-            usecase = build_generate_recommendations_usecase()
-            result = usecase.execute(
-                resume_id=resume_id, limit=limit, prompt_id=prompt_id
+        def _generate() -> tuple[List[JobRecommendation], list[str]]:
+            recommendations = RecommendationService.generate_recommendations(
+                resume_id, limit=limit, prompt_id=prompt_id, deadline=deadline
             )
-            if isinstance(result, Err):
-                logger.warning(result.message)
-                return []
-
-            assert isinstance(result, Ok)
-            recommendation_obj_list = result.value
-
-            # 이미 받은 추천 공고가 있다면 공고 삭제 후 다시 저장
-            with transaction.atomic():
-                JobRecommendation.objects.filter(user_id=user_id).delete()
-                JobRecommendation.objects.bulk_create(recommendation_obj_list)
+            return recommendations, (deadline.degraded if deadline is not None else [])
 
-            return recommendation_obj_list[:limit]
+        def _stored() -> tuple[List[JobRecommendation], list[str]]:
+            return (
+                RecommendationService._current_recommendations(resume_id, limit=limit),
+                ["singleflight"],
+            )
 
+        try:
+            (recommendations, degraded), shared = recommendation_flight.do(
+                f"{resume_id}:{prompt_id or 0}:{limit}",
+                _generate,
+                wait_timeout=(
+                    deadline.slice(SINGLEFLIGHT_WAIT_BUDGET_FRACTION)
+                    if deadline is not None
+                    else settings.RECOMMENDATION_SINGLEFLIGHT_WAIT_SECONDS
+                ),
+                on_timeout=_stored,
+            )
+            if shared:
+                logger.info(
+                    f"Coalesced recommendation request for resume {resume_id} "
+                    f"(prompt {prompt_id}, limit {limit})"
+                )
+            # 공유받은 결과나 대체 응답이 축소된 결과라면 이 요청의 응답에도 알립니다.
+            for stage in degraded if deadline is not None else []:
+                deadline.mark_degraded(stage)
+            return list(recommendations)
         except Exception as e:
             logger.error(
                 f"Error generating recommendations for resume {resume_id}: {e}",
@@ -91,6 +142,129 @@ class RecommendationService:
             )
             return []
 
+    @staticmethod
+    def _current_recommendations(
+        resume_id: int, *, limit: int
+    ) -> List[JobRecommendation]:
+        """
+        이력서 사용자의 현재 세트 추천 (재계산/저장 없음, 현재 세트가 없으면 빈 리스트)
+        """
+        user_id = (
+            Resume.objects.filter(id=resume_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+        current_set = (
+            RecommendationSet.objects.filter(current_for__user_id=user_id).first()
+            if user_id
+            else None
+        )
+        if current_set is None:
+            return []
+        return list(
+            current_set.items.select_related("job_posting").order_by("rank")[:limit]
+        )
+
+    @staticmethod
+    def generate_recommendations(
+        resume_id: int,
+        *,
+        limit: int = 100,
+        prompt_id: Optional[int] = None,
+        usecase: Optional[GenerateRecommendationsUseCase] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> List[JobRecommendation]:
+        """
+        추천 생성/저장 (예외를 호출자에게 전달합니다)
+
+        배치처럼 실패 건수를 따로 집계해야 하는 호출자가 사용합니다.
+
+        Args:
+            resume_id: 이력서 ID
+            limit: 반환할 추천 개수
+            prompt_id: LLM 평가 프롬프트 ID
+            usecase: 공유할 추천 유스케이스 (None이면 새로 조립)
+            deadline: 요청 시간 예산 (None이면 단계별 시간 제한 없음)
+        """
+        resume = (
+            Resume.objects.filter(id=resume_id)
+            .values("user_id", "content_hash", "analysis_result")
+            .first()
+        )
+        if not resume or not resume["user_id"]:
+            logger.error(f"Resume {resume_id} not found")
+            return []
+        user_id = resume["user_id"]
+
+        # 코퍼스 버전은 생성 전에 읽어야 생성 중 바뀐 공고가 다음 실행에서 반영됩니다.
+        corpus_version = JobPostingChange.latest_version()
+        fingerprint = RecommendationService._fingerprint(
+            resume, limit=limit, prompt_id=prompt_id
+        )
+        current_set = RecommendationSet.objects.filter(
+            current_for__user_id=user_id,
+            fingerprint=fingerprint,
+            corpus_version__gte=corpus_version,
+        ).first()
+        if current_set is not None:
+            logger.info(
+                f"Recommendation inputs unchanged for user {user_id} "
+                f"(set {current_set.id}); skipping recomputation"
+            )
+            return list(
+                current_set.items.select_related("job_posting").order_by("rank")[:limit]
+            )
+
+        usecase = usecase or build_generate_recommendations_usecase()
+        result = usecase.execute(
+            resume_id=resume_id, limit=limit, prompt_id=prompt_id, deadline=deadline
+        )
+        if isinstance(result, Err):
+            logger.warning(result.message)
+            return []
+
+        assert isinstance(result, Ok)
+        recommendation_obj_list = result.value
+        if deadline is not None and deadline.degraded:
+            # 일부 단계를 생략한 결과는 보여주되, 다음 요청에서 다시 계산하도록 fingerprint를 비웁니다.
+            fingerprint = ""
+
+        # 새 세트를 append-only로 쓰고 현재 세트 포인터만 교체합니다. (기존 행 DELETE 없음)
+        with transaction.atomic():
+            recommendation_set = RecommendationSet.objects.create(
+                user_id=user_id,
+                resume_id=resume_id,
+                prompt_id=prompt_id,
+                fingerprint=fingerprint,
+                corpus_version=corpus_version,
+            )
+            for recommendation in recommendation_obj_list:
+                recommendation.recommendation_set = recommendation_set
+            JobRecommendation.objects.bulk_create(recommendation_obj_list)
+            RecommendationService.refresh_snapshot(
+                user_id, recommendation_set=recommendation_set
+            )
+
+        return recommendation_obj_list[:limit]
+
+    @staticmethod
+    def _fingerprint(resume: Dict, *, limit: int, prompt_id: Optional[int]) -> str:
+        prompt_content = ""
+        if prompt_id:
+            prompt_content = (
+                RecommendationPrompt.objects.filter(id=prompt_id)
+                .values_list("content", flat=True)
+                .first()
+                or ""
+            )
+        return recommendation_fingerprint(
+            resume_hash=resume["content_hash"] or "",
+            analysis_result=resume["analysis_result"],
+            prompt_id=prompt_id,
+            prompt_content=prompt_content,
+            limit=limit,
+        )
+
     @staticmethod
     def _normalize_position_text(text: str) -> str:
         """[Deprecated] 도메인 함수로 이동."""
@@ -248,23 +422,29 @@ class RecommendationService:
         return results[0]["score"], results[0]["reason"]
 
     @staticmethod
-    def get_skill_statistics(skill_name: str) -> Dict:
+    def get_skill_statistics(skill_name: Optional[str] = None) -> Dict:
         """
-        특정 스킬의 통계 정보 조회
+        스킬 통계 정보 조회
+
+        materialized `SkillStat` 테이블에서 조회하며, 아직 집계되지 않은 경우
+        (테이블이 비어 있음) 그래프 DB 집계로 폴백합니다.
 
         Args:
-            skill_name: 스킬 이름
+            skill_name: 스킬 이름 (None이면 전체 Top-N 통계)
 
         Returns:
-            스킬 통계 딕셔너리 (공고 수, 우대 공고 수, 인기도 등)
+            스킬 통계 딕셔너리 (공고 수, 최근 7/30일 공고 수 등)
         """
         try:
-            stats = graph_store.get_skill_statistics(skill_name=skill_name)
-            return stats
+            if skill_stat_repo.has_data():
+                return skill_stat_repo.get_statistics(skill_name=skill_name)
+            return graph_store.get_skill_statistics(skill_name=skill_name)
         except Exception as e:
             logger.error(
                 f"Error getting skill statistics for {skill_name}: {e}", exc_info=True
             )
+            if not skill_name:
+                return {"total_skills": 0, "most_required_skills": []}
             return {
                 "skill_name": skill_name,
                 "required_count": 0,
@@ -300,7 +480,331 @@ class RecommendationService:
         Returns:
             JobRecommendation 쿼리셋
         """
-        return JobRecommendation.objects.filter(user_id=user_id)
+        return (
+            JobRecommendation.objects.filter(user_id=user_id)
+            .current()
+            .select_related("job_posting")
+        )
+
+    @staticmethod
+    def get_snapshot(user_id: int) -> Optional[Dict]:
+        """
+        사용자 추천 스냅샷 조회 (user_id 유니크 인덱스 조회 1번, 쓰기 없음)
+
+        items 속 공고가 수정/삭제되면 공고 save/delete 경로가 커밋 후
+        `refresh_recommendation_snapshots` 태스크로 스냅샷을 다시 씁니다.
+
+        Returns:
+            {"items", "version", "corpus_version", "generated_at"} 또는 None (아직 생성 전)
+        """
+        return (
+            RecommendationSnapshot.objects.filter(user_id=user_id)
+            .values("items", "version", "corpus_version", "generated_at")
+            .first()
+        )
+
+    @staticmethod
+    def refresh_snapshot(
+        user_id: int, *, recommendation_set: Optional[RecommendationSet] = None
+    ) -> None:
+        """
+        사용자의 현재 추천으로 스냅샷을 다시 씁니다. (추천 생성/변경 직후 호출)
+
+        Args:
+            user_id: 사용자 ID
+            recommendation_set: 지정하면 현재 세트 포인터를 이 세트로 교체합니다.
+        """
+        now = timezone.now()
+        # 직렬화 전에 읽어야 그 사이 바뀐 공고가 다음 조회에서 다시 반영됩니다.
+        corpus_version = JobPostingChange.latest_version()
+        with transaction.atomic():
+            (
+                snapshot,
+                created,
+            ) = RecommendationSnapshot.objects.select_for_update().get_or_create(
+                user_id=user_id, defaults={"generated_at": now}
+            )
+            if recommendation_set is not None:
+                snapshot.recommendation_set = recommendation_set
+            recommendations = (
+                JobRecommendation.objects.filter(
+                    user_id=user_id,
+                    recommendation_set_id=snapshot.recommendation_set_id,
+                )
+                .select_related("job_posting")
+                .order_by("rank", "id")
+            )
+            snapshot.items = JobRecommendationSummaryReadSerializer(
+                recommendations, many=True
+            ).data
+            snapshot.corpus_version = corpus_version
+            snapshot.generated_at = now
+            if not created:
+                snapshot.version += 1
+            snapshot.save()
+
+    @staticmethod
+    def apply_new_postings(posting_ids: List[int]) -> Dict:
+        """
+        새로 처리된 공고를 대표 이력서에 역매칭해 영향받는 사용자의 현재 세트에만 반영합니다.
+
+        - `ResumeMatchIndex`로 스킬/경력/포지션이 맞는 사용자만 추리고, 공고 점수가 현재 세트의
+          k번째(k=RECOMMENDATION_BATCH_LIMIT) 점수보다 높을 때만 새 세트(현재 세트 + 공고)를 씁니다.
+        - 현재 세트의 corpus_version은 그 사이 변경이 모두 이번에 처리한 공고의 upsert이거나
+          삭제(추천 행은 CASCADE로 제거)인 구간까지만 올립니다. 아직 처리되지 않은 공고의 변경이나
+          세트에 들어 있는 공고의 수정은 그 앞에서 멈추므로, 다음 생성/야간 배치에서 재계산됩니다.
+        - LLM 프롬프트로 만든 세트는 점수 기준이 달라 역매칭하지 않습니다. (다음 생성 때 재계산)
+
+        Args:
+            posting_ids: 처리(스킬 추출)가 끝난 공고 ID 목록
+
+        Returns:
+            {"postings", "candidates", "updated_users"}
+        """
+        # 매칭 전에 읽은 버전까지만 "반영됨"으로 표시해야 그 사이 바뀐 공고를 놓치지 않습니다.
+        corpus_version = JobPostingChange.latest_version()
+        postings = list(
+            JobPosting.objects.filter(
+                posting_id__in=posting_ids, duplicate_of__isnull=True
+            )
+        )
+        index = ResumeMatchIndex.get_instance()
+        index.ensure_fresh()
+
+        matches: Dict[int, List[Dict]] = {}
+        candidates = 0
+        for posting in postings:
+            features = extract_posting_features(posting)
+            for profile in index.candidates(
+                skills=features.stack_skills
+                | features.requirement_skills
+                | features.preferred_skills,
+                position_category=features.position_category,
+                career_min=posting.career_min,
+                career_max=posting.career_max,
+            ):
+                stack_ratio, req_ratio, pref_ratio = skill_match_ratios(
+                    set(profile.skills),
+                    features.stack_skills,
+                    features.requirement_skills,
+                    features.preferred_skills,
+                )
+                score = display_match_score(stack_ratio, req_ratio, pref_ratio)
+                if score <= 0:
+                    continue
+                candidates += 1
+                matches.setdefault(profile.user_id, []).append(
+                    {
+                        "posting_id": posting.posting_id,
+                        "score": score,
+                        "reason": RecommendationService._reverse_match_reason(
+                            profile.skills, features
+                        ),
+                    }
+                )
+
+        targets = RecommendationService._advanceable_versions(
+            set(posting_ids), corpus_version=corpus_version
+        )
+        current_sets = {
+            recommendation_set.user_id: recommendation_set
+            for recommendation_set in RecommendationSet.objects.filter(
+                user_id__in=matches.keys(),
+                current_for__isnull=False,
+                prompt_id__isnull=True,
+            )
+        }
+        updated_users = 0
+        for user_id, user_matches in matches.items():
+            current_set = current_sets.get(user_id)
+            # 아직 추천 세트가 없는 사용자는 다음 전체 생성에서 처리합니다.
+            if current_set is not None and RecommendationService._insert_into_set(
+                current_set,
+                user_matches,
+                corpus_version=targets.get(current_set.id, current_set.corpus_version),
+            ):
+                updated_users += 1
+
+        set_ids_by_target: Dict[int, List[int]] = defaultdict(list)
+        for set_id, target in targets.items():
+            set_ids_by_target[target].append(set_id)
+        for target, set_ids in set_ids_by_target.items():
+            RecommendationSet.objects.filter(
+                id__in=set_ids, corpus_version__lt=target
+            ).update(corpus_version=target)
+
+        summary = {
+            "postings": len(postings),
+            "candidates": candidates,
+            "updated_users": updated_users,
+        }
+        logger.info(f"Reverse-matched new postings {posting_ids}: {summary}")
+        return summary
+
+    @staticmethod
+    def _advanceable_versions(
+        processed_ids: Set[int], *, corpus_version: int
+    ) -> Dict[int, int]:
+        """
+        현재(프롬프트 없는) 세트별로 corpus_version을 어디까지 올려도 되는지 계산합니다.
+
+        세트 버전 이후의 변경 중 다음 변경 바로 앞에서 멈춥니다.
+        - 이번에 처리하지 않은 공고의 upsert (처리/역매칭 전)
+        - 세트에 들어 있는 공고의 upsert (점수/이유가 달라졌을 수 있어 재계산 필요)
+
+        Returns:
+            {세트 ID: 올릴 corpus_version} (올릴 것이 없는 세트는 현재 버전)
+        """
+        sets = list(
+            RecommendationSet.objects.filter(
+                current_for__isnull=False,
+                prompt_id__isnull=True,
+                corpus_version__lt=corpus_version,
+            ).values_list("id", "corpus_version")
+        )
+        if not sets:
+            return {}
+
+        changes = JobPostingChange.objects.filter(
+            id__gt=min(version for _, version in sets), id__lte=corpus_version
+        ).values_list("id", "posting_id", "op")
+        blockers: List[int] = []
+        processed_changes: Dict[int, List[int]] = defaultdict(list)
+        for change_id, posting_id, op in changes.order_by("id"):
+            if op != JobPostingChange.Op.UPSERT:
+                continue
+            if posting_id in processed_ids:
+                processed_changes[posting_id].append(change_id)
+            else:
+                blockers.append(change_id)
+
+        edited_in_set: Dict[int, List[int]] = defaultdict(list)
+        if processed_changes:
+            for set_id, posting_id in JobRecommendation.objects.filter(
+                recommendation_set_id__in=[set_id for set_id, _ in sets],
+                job_posting_id__in=processed_changes.keys(),
+            ).values_list("recommendation_set_id", "job_posting_id"):
+                edited_in_set[set_id].extend(processed_changes[posting_id])
+
+        targets: Dict[int, int] = {}
+        for set_id, version in sets:
+            stops = [
+                change_id for change_id in edited_in_set[set_id] if change_id > version
+            ]
+            i = bisect_right(blockers, version)
+            if i < len(blockers):
+                stops.append(blockers[i])
+            targets[set_id] = min(stops) - 1 if stops else corpus_version
+        return targets
+
+    @staticmethod
+    def _insert_into_set(
+        current_set: RecommendationSet, user_matches: List[Dict], *, corpus_version: int
+    ) -> bool:
+        """
+        k번째 점수보다 높은 공고를 현재 세트 순위에 끼워 넣은 새 세트를 쓰고 포인터를 교체합니다.
+
+        Returns:
+            새 세트를 썼는지 여부
+        """
+        user_id = current_set.user_id
+        with transaction.atomic():
+            locked_set_id = (
+                RecommendationSnapshot.objects.select_for_update()
+                .filter(user_id=user_id)
+                .values_list("recommendation_set_id", flat=True)
+                .first()
+            )
+            # 그 사이 다른 세트로 교체되었으면(전체 재생성) 그 결과를 그대로 둡니다.
+            if locked_set_id != current_set.id:
+                return False
+
+            items = list(current_set.items.order_by("rank", "id"))
+            size = max(len(items), settings.RECOMMENDATION_BATCH_LIMIT)
+            floor = items[-1].match_score if len(items) >= size else -1
+            existing_ids = {item.job_posting_id for item in items}
+            new_matches = sorted(
+                (
+                    match
+                    for match in user_matches
+                    if match["posting_id"] not in existing_ids
+                    and match["score"] > floor
+                ),
+                key=lambda match: match["score"],
+                reverse=True,
+            )
+            if not new_matches:
+                return False
+
+            ranked = [
+                (item.job_posting_id, item.match_score, item.match_reason)
+                for item in items
+            ]
+            for match in new_matches:
+                # 점수가 더 낮은 첫 추천 앞에 넣고, 나머지 순서는 그대로 둡니다.
+                position = next(
+                    (i for i, row in enumerate(ranked) if row[1] < match["score"]),
+                    len(ranked),
+                )
+                ranked.insert(
+                    position, (match["posting_id"], match["score"], match["reason"])
+                )
+            ranked = ranked[:size]
+
+            recommendation_set = RecommendationSet.objects.create(
+                user_id=user_id,
+                resume_id=current_set.resume_id,
+                prompt_id=None,
+                fingerprint=current_set.fingerprint,
+                corpus_version=corpus_version,
+            )
+            JobRecommendation.objects.bulk_create(
+                [
+                    JobRecommendation(
+                        user_id=user_id,
+                        job_posting_id=posting_id,
+                        recommendation_set=recommendation_set,
+                        rank=rank,
+                        match_score=score,
+                        match_reason=reason,
+                    )
+                    for rank, (posting_id, score, reason) in enumerate(ranked, start=1)
+                ]
+            )
+            RecommendationService.refresh_snapshot(
+                user_id, recommendation_set=recommendation_set
+            )
+        return True
+
+    @staticmethod
+    def _reverse_match_reason(user_skills: frozenset, features: PostingFeatures) -> str:
+        parts: List[str] = []
+        for label, skills in (
+            ("기술스택", features.stack_skills),
+            ("자격요건", features.requirement_skills),
+            ("우대사항", features.preferred_skills),
+        ):
+            if skills:
+                parts.append(f"{label} {len(user_skills & skills)}/{len(skills)}")
+        parts.append("신규 공고 역매칭")
+        return " | ".join(parts)
+
+    @staticmethod
+    def prune_recommendation_sets(*, older_than_days: int) -> int:
+        """
+        현재 세트가 아닌 오래된 추천 세트(와 그 추천 행)를 삭제합니다.
+
+        Returns:
+            삭제된 세트 수
+        """
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        stale = RecommendationSet.objects.filter(
+            generated_at__lt=cutoff, current_for__isnull=True
+        )
+        _, per_model = stale.delete()
+        count = per_model.get(RecommendationSet._meta.label, 0)
+        logger.info(f"Pruned {count} recommendation sets older than {cutoff}")
+        return count
 
     @staticmethod
     def create_recommendation(data: Dict) -> JobRecommendation:
@@ -314,7 +818,15 @@ class RecommendationService:
             생성된 JobRecommendation 객체
         """
         with transaction.atomic():
+            # 사용자의 현재 세트에 포함시켜, 다음 세트로 교체될 때 함께 내려가도록 합니다.
+            data.setdefault(
+                "recommendation_set_id",
+                RecommendationSnapshot.objects.filter(user_id=data["user_id"])
+                .values_list("recommendation_set_id", flat=True)
+                .first(),
+            )
             recommendation = JobRecommendation.objects.create(**data)
+            RecommendationService.refresh_snapshot(recommendation.user_id)
             logger.info(
                 f"Created JobRecommendation {recommendation.id} for user {recommendation.user_id}"
             )
@@ -337,6 +849,7 @@ class RecommendationService:
 
         with transaction.atomic():
             recommendation.delete()
+            RecommendationService.refresh_snapshot(recommendation.user_id)
             logger.info(f"Deleted JobRecommendation {recommendation_id}")
             return True
 
@@ -352,7 +865,7 @@ def get_recommendations(resume_id: int, limit: int = 10) -> List[Dict]:
     return RecommendationService.get_recommendations(resume_id, limit)  # type: ignore[return-value]
 
 
-def get_skill_statistics(skill_name: str) -> Dict:
+def get_skill_statistics(skill_name: Optional[str] = None) -> Dict:
     """
     [Backward Compatibility] job/recommender.py 호환용
 
@@ -0,0 +1,72 @@
+"""
+Celery 태스크: 야간 추천 배치 / 신규 공고 역매칭 / 추천 세트 정리 / 스냅샷 갱신
+"""
+
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from recommendation.application.container import build_nightly_batch_usecase
+from recommendation.services import RecommendationService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def prune_recommendation_sets():
+    """
+    보존 기간이 지난 비현재 추천 세트를 삭제하는 Celery 태스크
+
+    Returns:
+        dict: 삭제된 세트 수
+    """
+    total = RecommendationService.prune_recommendation_sets(
+        older_than_days=settings.RECOMMENDATION_SET_RETENTION_DAYS
+    )
+    return {"success": True, "pruned": total}
+
+
+@shared_task
+def run_nightly_recommendations():
+    """
+    대표 이력서 전체에 대해 추천을 병렬 생성하고 Slack으로 묶음 알림하는 Celery 태스크
+
+    Returns:
+        dict: 실행 요약 (대상/성공/결과 없음/실패 수, 추천 수, 소요 시간)
+    """
+    result = build_nightly_batch_usecase().execute()
+    return {"success": True, **result.value}
+
+
+@shared_task
+def reverse_match_postings(posting_ids: list[int]):
+    """
+    처리된 공고를 대표 이력서에 역매칭해 영향받는 사용자의 현재 추천 세트만 갱신하는 Celery 태스크
+
+    Args:
+        posting_ids: 처리(스킬 추출)가 끝난 공고 ID 목록
+
+    Returns:
+        dict: 역매칭 요약 (공고 수, 후보 수, 갱신된 사용자 수)
+    """
+    summary = RecommendationService.apply_new_postings(
+        [int(pid) for pid in posting_ids]
+    )
+    return {"success": True, **summary}
+
+
+@shared_task
+def refresh_recommendation_snapshots(user_ids: list[int]):
+    """
+    추천 공고가 수정/삭제된 사용자의 추천 스냅샷을 다시 쓰는 Celery 태스크
+
+    Args:
+        user_ids: 스냅샷을 다시 쓸 사용자 ID 목록
+
+    Returns:
+        dict: 다시 쓴 스냅샷 수
+    """
+    user_ids = sorted({int(uid) for uid in user_ids})
+    for user_id in user_ids:
+        RecommendationService.refresh_snapshot(user_id)
+    return {"success": True, "refreshed": len(user_ids)}
@@ -0,0 +1,183 @@
+"""
+Tests for deadline-aware recommendation generation
+
+시간 예산(budget_ms) 안에서 느린 단계를 생략/축소하는 추천 생성 테스트
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common.deadline import Deadline
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from job.models import JobPosting
+from recommendation.application.usecases.generate_recommendations import (
+    GenerateRecommendationsUseCase,
+)
+from recommendation.models import RecommendationPrompt, RecommendationSet
+from recommendation.services import RecommendationService
+from rest_framework import status
+from rest_framework.test import APIClient
+from resume.models import Resume
+
+User = get_user_model()
+
+
+def _chunk_hit(posting_id: int) -> dict:
+    return {
+        "ids": [[f"{posting_id}-requirements-0"]],
+        "distances": [[0.2]],
+        "documents": [["Python, Django 경험"]],
+        "metadatas": [[{"posting_id": posting_id, "section": "requirements"}]],
+    }
+
+
+@pytest.mark.django_db
+class TestDeadlineAwareRecommendations:
+    def setup_method(self):
+        self.user = User.objects.create_user(username="deadline", password="pw")
+        self.resume = Resume.objects.create(
+            user=self.user,
+            content="Backend Developer",
+            analysis_result={"skills": ["Python", "Django"]},
+        )
+        JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Backend Developer",
+            skills_required=["Python", "Django"],
+        )
+        self.prompt = RecommendationPrompt.objects.create(name="p", content="c")
+        self.release = threading.Event()
+
+    def teardown_method(self):
+        self.release.set()
+
+    def _usecase(self) -> GenerateRecommendationsUseCase:
+        def _query_by_text(*, query_text, **kwargs):
+            if query_text == "slow":
+                self.release.wait(5)
+                return _chunk_hit(2)
+            return _chunk_hit(1)
+
+        vector_store = MagicMock()
+        vector_store.query_by_text.side_effect = _query_by_text
+        graph_store = MagicMock()
+        graph_store.get_postings_by_skills.return_value = []
+        plan_builder = MagicMock()
+        plan_builder.build_fallback_plan.return_value = {
+            "queries": [{"text": "fast"}, {"text": "slow"}]
+        }
+        evaluator = MagicMock()
+        evaluator.evaluate_batch.side_effect = lambda **kwargs: self.release.wait(5)
+        self.plan_builder, self.evaluator = plan_builder, evaluator
+        return GenerateRecommendationsUseCase(
+            vector_store=vector_store,
+            graph_store=graph_store,
+            evaluator=evaluator,
+            plan_builder=plan_builder,
+        )
+
+    def test_slow_stages_are_skipped_or_abandoned(self):
+        deadline = Deadline(1.5)
+
+        result = self._usecase().execute(
+            resume_id=self.resume.id,
+            limit=10,
+            prompt_id=self.prompt.id,
+            deadline=deadline,
+        )
+
+        # planner 몫(0.3s)이 최소 시간보다 짧아 호출하지 않고 fallback 전략을 씁니다.
+        self.plan_builder.build_plan.assert_not_called()
+        self.evaluator.evaluate_batch.assert_called_once()
+        assert deadline.degraded == ["planner", "retrieval", "llm_rerank"]
+        # 끝나지 않은 "slow" 쿼리 결과(공고 2)는 버리고, rule-based 순서로 응답합니다.
+        assert [r.job_posting_id for r in result.value] == [1]
+        assert result.value[0].match_reason
+
+    def test_legacy_fallback_is_bounded_by_retrieval_budget(self):
+        usecase = self._usecase()
+        usecase._vector_store.query_by_text.side_effect = lambda **kwargs: {"ids": [[]]}
+        usecase._vector_store.get_embedding.side_effect = (
+            lambda **kwargs: self.release.wait(5)
+        )
+        deadline = Deadline(1.0)
+
+        result = usecase.execute(
+            resume_id=self.resume.id, limit=10, prompt_id=None, deadline=deadline
+        )
+
+        # 이력서 임베딩 조회가 끝나지 않아도 retrieval 몫이 지나면 빈 결과로 응답합니다.
+        assert result.value == []
+        assert "retrieval" in deadline.degraded
+        assert deadline.remaining() > 0
+        usecase._vector_store.query_by_embedding.assert_not_called()
+
+    def test_degraded_result_is_not_reused(self):
+        usecase = self._usecase()
+        with patch(
+            "recommendation.services.build_generate_recommendations_usecase",
+            return_value=usecase,
+        ):
+            RecommendationService.get_recommendations(
+                self.resume.id, limit=10, deadline=Deadline(1.5)
+            )
+            recommendation_set = RecommendationSet.objects.get()
+            assert recommendation_set.fingerprint == ""
+
+            self.release.set()
+            RecommendationService.get_recommendations(self.resume.id, limit=10)
+
+        assert RecommendationSet.objects.count() == 2
+
+
+@pytest.mark.django_db
+class TestRecommendationBudgetParameter:
+    def setup_method(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="budget", password="pw")
+        self.client.force_authenticate(user=self.user)
+        self.client.credentials(HTTP_X_API_KEY=settings.API_SECRET_KEY)
+        self.resume = Resume.objects.create(user=self.user, content="Backend")
+
+    @patch("recommendation.views.RecommendationService.get_recommendations")
+    def test_degraded_stages_header(self, mock_get):
+        def _degrade(resume_id, *, limit, prompt_id, deadline):
+            deadline.mark_degraded("planner")
+            deadline.mark_degraded("llm_rerank")
+            return []
+
+        mock_get.side_effect = _degrade
+
+        response = self.client.get(
+            f"/api/v1/recommendations/for-resume/{self.resume.id}/?budget_ms=999999"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["X-Degraded-Stages"] == "planner,llm_rerank"
+        deadline = mock_get.call_args.kwargs["deadline"]
+        assert deadline.budget_seconds == settings.RECOMMENDATION_MAX_BUDGET_MS / 1000
+
+    @patch("recommendation.views.RecommendationService.get_recommendations")
+    def test_no_header_when_within_budget(self, mock_get):
+        mock_get.return_value = []
+
+        response = self.client.get(f"/api/v1/recommendations/for-user/{self.user.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Degraded-Stages" not in response
+        deadline = mock_get.call_args.kwargs["deadline"]
+        assert (
+            deadline.budget_seconds == settings.RECOMMENDATION_DEFAULT_BUDGET_MS / 1000
+        )
+
+    @pytest.mark.parametrize("budget_ms", ["0", "-5", "abc"])
+    def test_invalid_budget_is_rejected(self, budget_ms):
+        response = self.client.get(
+            f"/api/v1/recommendations/for-resume/{self.resume.id}/?budget_ms={budget_ms}"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,165 @@
+"""
+Tests for the nightly recommendation batch
+
+야간 추천 배치(병렬 실행, 진행 집계, Slack 묶음 전송) 테스트
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common.adapters.django_recommendation_batch_repo import (
+    DjangoRecommendationBatchRepository,
+)
+from common.adapters.slack_notifier import SlackWebhookNotifier
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from job.models import JobPosting
+from recommendation.application.posting_features import PostingFeatureCache
+from recommendation.application.usecases.nightly_batch import (
+    NightlyRecommendationBatchUseCase,
+)
+from recommendation.models import JobRecommendation
+from resume.models import Resume
+
+
+class FakeNotifier:
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def queue(self, text: str) -> None:
+        self.messages.append(text)
+
+    def flush(self) -> int:
+        return 1 if self.messages else 0
+
+
+class FakeBatchRepository(DjangoRecommendationBatchRepository):
+    """대상 조회는 Django ORM 그대로, 추천 생성만 바꿔 끼운 저장소"""
+
+    def __init__(self, recommend):
+        super().__init__(usecase=MagicMock(), limit=10)
+        self.generate_recommendations = recommend
+
+
+@pytest.mark.django_db
+class TestNightlyRecommendationBatch:
+    def setup_method(self):
+        User = get_user_model()
+        self.resumes = []
+        for i in range(3):
+            user = User.objects.create_user(username=f"user{i}", password="pw")
+            self.resumes.append(
+                Resume.objects.create(user=user, content=f"resume {i}", is_primary=True)
+            )
+        self.posting = JobPosting(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Backend Developer",
+        )
+
+    def _recommend(self, resume_id: int) -> list[JobRecommendation]:
+        if resume_id == self.resumes[1].id:
+            return []
+        if resume_id == self.resumes[2].id:
+            raise RuntimeError("boom")
+        return [
+            JobRecommendation(
+                user_id=1,
+                job_posting=self.posting,
+                rank=1,
+                match_score=90,
+                match_reason="Good",
+            )
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_summarizes_outcomes_and_batches_notifications(self, max_workers):
+        notifier = FakeNotifier()
+        usecase = NightlyRecommendationBatchUseCase(
+            repository=FakeBatchRepository(self._recommend),
+            notifier=notifier,
+            max_workers=max_workers,
+        )
+
+        summary = usecase.execute().value
+
+        assert summary["total"] == 3
+        assert (summary["succeeded"], summary["empty"], summary["failed"]) == (1, 1, 1)
+        assert summary["recommendations"] == 1
+        assert summary["slack_posts"] == 1
+        # 사용자별 3건 + 실행 요약 1건이 notifier에 모이고, 전송은 flush 한 번
+        assert len(notifier.messages) == 4
+        assert notifier.messages[-1].startswith("📊 야간 추천 배치 완료")
+
+    def test_no_primary_resumes(self):
+        Resume.objects.update(is_primary=False)
+        notifier = FakeNotifier()
+
+        summary = (
+            NightlyRecommendationBatchUseCase(
+                repository=FakeBatchRepository(MagicMock()), notifier=notifier
+            )
+            .execute()
+            .value
+        )
+
+        assert summary["total"] == 0
+        assert notifier.messages == ["⚠️ 분석할 이력서가 없습니다."]
+
+
+class TestSlackWebhookNotifier:
+    @patch("common.adapters.slack_notifier.requests.post")
+    def test_packs_queued_messages_into_few_requests(self, mock_post):
+        mock_post.return_value = MagicMock(status_code=200)
+        notifier = SlackWebhookNotifier(
+            webhook_url="https://hooks.example.com/x",
+            min_interval_seconds=0,
+            max_chars=25,
+        )
+        for text in ["a" * 10, "b" * 10, "c" * 10]:
+            notifier.queue(text)
+
+        assert notifier.flush() == 2
+        assert mock_post.call_args_list[0].kwargs["json"]["text"] == (
+            "a" * 10 + "\n\n" + "b" * 10
+        )
+        assert notifier.flush() == 0
+
+    @patch("common.adapters.slack_notifier.time.sleep")
+    @patch("common.adapters.slack_notifier.requests.post")
+    def test_retries_once_after_rate_limit(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            MagicMock(status_code=429, headers={"Retry-After": "2"}),
+            MagicMock(status_code=200),
+        ]
+        notifier = SlackWebhookNotifier(
+            webhook_url="https://hooks.example.com/x", min_interval_seconds=0
+        )
+        notifier.queue("hello")
+
+        assert notifier.flush() == 1
+        mock_sleep.assert_called_with(2.0)
+
+
+def test_posting_feature_cache_reuses_until_posting_changes():
+    posting = JobPosting(
+        posting_id=1,
+        url="https://example.com/job/1",
+        company_name="Company",
+        position="Backend Developer",
+        requirements="Python, Django 경험",
+        skills_required=["Python"],
+        updated_at=timezone.now(),
+    )
+    cache = PostingFeatureCache()
+
+    first = cache.get(posting)
+    second = cache.get(posting)
+    posting.updated_at = timezone.now()
+    cache.get(posting)
+
+    assert first is second
+    assert first.requirement_skills == {"Python", "Django"}
+    assert first.position_category == "backend"
+    assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,192 @@
+"""
+Tests for reverse matching of new postings
+
+신규 공고 역매칭(대표 이력서 인덱스, 현재 추천 세트 증분 갱신) 테스트
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from common.application.result import Ok
+from django.contrib.auth import get_user_model
+from job.models import JobPosting, JobPostingChange
+from recommendation.models import JobRecommendation, RecommendationSet
+from recommendation.resume_match_index import ResumeMatchIndex, build_resume_profile
+from recommendation.services import RecommendationService
+from resume.models import Resume
+
+
+def test_resume_match_index_filters_by_skill_career_and_position():
+    index = ResumeMatchIndex()
+    profiles = [
+        build_resume_profile(
+            resume_id=1,
+            user_id=1,
+            analysis_result={
+                "skills": ["Python", "Django"],
+                "career_years": 3,
+                "position": "Backend Developer",
+            },
+        ),
+        build_resume_profile(
+            resume_id=2,
+            user_id=2,
+            analysis_result={"skills": ["React"], "position": "Frontend Developer"},
+        ),
+        build_resume_profile(
+            resume_id=3,
+            user_id=3,
+            analysis_result={"skills": ["Python"], "career_years": 10},
+        ),
+        build_resume_profile(resume_id=4, user_id=4, analysis_result={}),
+    ]
+    index.load(profile for profile in profiles if profile is not None)
+
+    def _users(**kwargs) -> list[int]:
+        return [profile.user_id for profile in index.candidates(**kwargs)]
+
+    assert len(index) == 3
+    assert _users(
+        skills={"Python"}, position_category="backend", career_min=1, career_max=5
+    ) == [1]
+    assert _users(
+        skills={"Python"}, position_category="backend", career_min=None, career_max=None
+    ) == [1, 3]
+    assert _users(
+        skills={"Python", "React"},
+        position_category="frontend",
+        career_min=None,
+        career_max=None,
+    ) == [2, 3]
+
+
+@pytest.mark.django_db
+class TestApplyNewPostings:
+    def setup_method(self):
+        User = get_user_model()
+        self.backend_user = User.objects.create_user(username="be", password="pw")
+        self.frontend_user = User.objects.create_user(username="fe", password="pw")
+        self.resume = Resume.objects.create(
+            user=self.backend_user,
+            content="Backend Developer",
+            is_primary=True,
+            analysis_result={
+                "skills": ["Python", "Django"],
+                "career_years": 3,
+                "position": "Backend Developer",
+            },
+        )
+        Resume.objects.create(
+            user=self.frontend_user,
+            content="Frontend Developer",
+            is_primary=True,
+            analysis_result={"skills": ["React"], "position": "Frontend Developer"},
+        )
+        self.old_posting = JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Old",
+            position="Backend Developer",
+        )
+        ResumeMatchIndex.mark_stale()
+
+    def _generate(self, mock_build, *, score: int) -> MagicMock:
+        mock_build.return_value.execute.side_effect = lambda **kwargs: Ok(
+            [
+                JobRecommendation(
+                    user_id=self.backend_user.id,
+                    job_posting=self.old_posting,
+                    rank=1,
+                    match_score=score,
+                    match_reason="initial",
+                )
+            ]
+        )
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+        return mock_build.return_value
+
+    def _new_posting(self) -> JobPosting:
+        return JobPosting.objects.create(
+            posting_id=2,
+            url="https://example.com/job/2",
+            company_name="New",
+            position="Backend Engineer",
+            career_min=1,
+            career_max=5,
+            skills_required=["Python", "Django"],
+        )
+
+    @patch("recommendation.services.build_generate_recommendations_usecase")
+    def test_inserts_posting_that_beats_kth_score(self, mock_build, settings):
+        settings.RECOMMENDATION_BATCH_LIMIT = 2
+        usecase = self._generate(mock_build, score=40)
+        old_set = RecommendationSet.objects.get()
+
+        summary = RecommendationService.apply_new_postings(
+            [self._new_posting().posting_id]
+        )
+
+        assert summary == {"postings": 1, "candidates": 1, "updated_users": 1}
+        current = RecommendationService.get_recommendations_by_user(
+            self.backend_user.id
+        )
+        assert [(r.job_posting_id, r.rank, r.match_score) for r in current] == [
+            (2, 1, 60),
+            (1, 2, 40),
+        ]
+        snapshot = RecommendationService.get_snapshot(self.backend_user.id)
+        assert [item["job_posting"]["posting_id"] for item in snapshot["items"]] == [
+            2,
+            1,
+        ]
+        # 이전 세트는 append-only로 남고, 다음 생성은 최신 코퍼스를 반영했으므로 건너뜁니다.
+        assert RecommendationSet.objects.filter(id=old_set.id).exists()
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+        assert usecase.execute.call_count == 1
+
+    @patch("recommendation.services.build_generate_recommendations_usecase")
+    def test_full_set_with_higher_scores_is_marked_untouched(
+        self, mock_build, settings
+    ):
+        settings.RECOMMENDATION_BATCH_LIMIT = 1
+        usecase = self._generate(mock_build, score=90)
+
+        summary = RecommendationService.apply_new_postings(
+            [self._new_posting().posting_id]
+        )
+
+        assert summary["updated_users"] == 0
+        assert RecommendationSet.objects.count() == 1
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+        assert usecase.execute.call_count == 1
+
+    @patch("recommendation.services.build_generate_recommendations_usecase")
+    def test_unprocessed_change_stops_corpus_version(self, mock_build, settings):
+        settings.RECOMMENDATION_BATCH_LIMIT = 1
+        usecase = self._generate(mock_build, score=90)
+        JobPosting.objects.create(
+            posting_id=3,
+            url="https://example.com/job/3",
+            company_name="Pending",
+            position="Backend Developer",
+        )
+
+        RecommendationService.apply_new_postings([self._new_posting().posting_id])
+
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+        assert usecase.execute.call_count == 2
+
+    @patch("recommendation.services.build_generate_recommendations_usecase")
+    def test_edited_posting_in_set_is_recomputed(self, mock_build, settings):
+        settings.RECOMMENDATION_BATCH_LIMIT = 1
+        usecase = self._generate(mock_build, score=90)
+        self.old_posting.requirements = "Go, Kubernetes"
+        self.old_posting.save()
+
+        RecommendationService.apply_new_postings([self.old_posting.posting_id])
+
+        assert RecommendationSet.objects.get().corpus_version < (
+            JobPostingChange.latest_version()
+        )
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+        assert usecase.execute.call_count == 2
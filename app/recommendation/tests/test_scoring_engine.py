@@ -0,0 +1,47 @@
+"""
+Tests for the vectorized candidate scoring engine
+
+후보 일괄 점수 계산(비율, 표기용 점수, 튜플 정렬) 테스트
+"""
+
+from recommendation.domain.scoring_engine import score_candidates
+
+
+def test_scores_and_orders_like_tuple_sort():
+    scores = score_candidates(
+        user_skills={"Python", "Django", "Custom DSL"},
+        stack_skills=[
+            frozenset({"Python", "Java"}),
+            frozenset({"Python", "Custom DSL"}),
+            frozenset(),
+            frozenset({"Python", "Java"}),
+        ],
+        requirement_skills=[
+            frozenset({"Django"}),
+            frozenset(),
+            frozenset({"Django"}),
+            frozenset({"Django"}),
+        ],
+        preferred_skills=[frozenset(), frozenset(), frozenset(), frozenset()],
+        vector_similarity=[0.5, 0.1, 0.9, 0.5],
+    )
+
+    # 동점(0번/3번)은 입력 순서를 유지합니다.
+    assert scores.order.tolist() == [1, 0, 3, 2]
+    assert scores.stack_matches.tolist() == [1, 2, 0, 1]
+    assert scores.stack_ratio.tolist() == [0.5, 1.0, 0.0, 0.5]
+    # 0.60 * 0.5 + 0.25 * 1.0 = 55점, 기술스택만 전부 일치 = 60점
+    assert scores.display_score.tolist() == [55, 60, 25, 55]
+
+
+def test_empty_candidates():
+    scores = score_candidates(
+        user_skills={"Python"},
+        stack_skills=[],
+        requirement_skills=[],
+        preferred_skills=[],
+        vector_similarity=[],
+    )
+
+    assert scores.order.tolist() == []
+    assert scores.display_score.tolist() == []
@@ -4,12 +4,19 @@ Tests for RecommendationService
 추천 시스템 비즈니스 로직 테스트
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from common.application.result import Ok
+from common.deadline import Deadline
+from django.core.management import call_command
+from django.utils import timezone
 from job.models import JobPosting
-from recommendation.models import JobRecommendation
-from recommendation.services import RecommendationService
+from recommendation.models import JobRecommendation, RecommendationSet
+from recommendation.services import RecommendationService, recommendation_flight
 from resume.models import Resume
 
 
@@ -142,6 +149,9 @@ class TestRecommendationService:
         # Then
         assert len(recommendations) > 0
         assert recommendations[0].job_posting_id == 1
+        snapshot = RecommendationService.get_snapshot(user.id)
+        assert snapshot["version"] == 1
+        assert snapshot["items"][0]["job_posting"]["posting_id"] == 1
 
     @patch("recommendation.application.container.Neo4jGraphStore")
     @patch("recommendation.application.container.ChromaVectorStore")
@@ -274,3 +284,144 @@ class TestRecommendationService:
         # Then
         assert result is not None
         assert result.user_id == 1
+
+
+@pytest.mark.django_db
+class TestRecommendationSets:
+    """추천 세트(append-only + 현재 세트 포인터) 테스트"""
+
+    def setup_method(self):
+        from django.contrib.auth import get_user_model
+
+        self.user = get_user_model().objects.create_user(
+            username="setuser", password="password"
+        )
+        self.resume = Resume.objects.create(
+            user=self.user,
+            content="Backend Developer",
+            analysis_result={"skills": ["Python"], "career_years": 3},
+        )
+        self.posting = JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Backend Developer",
+        )
+
+    def _usecase(self, reason: str) -> MagicMock:
+        usecase = MagicMock()
+        usecase.execute.side_effect = lambda **kwargs: Ok(
+            [
+                JobRecommendation(
+                    user_id=self.user.id,
+                    job_posting=self.posting,
+                    rank=1,
+                    match_score=80,
+                    match_reason=reason,
+                )
+            ]
+        )
+        return usecase
+
+    @patch("recommendation.services.build_generate_recommendations_usecase")
+    def test_unchanged_inputs_skip_recomputation(self, mock_build):
+        mock_build.return_value = self._usecase("first")
+
+        first = RecommendationService.get_recommendations(self.resume.id, limit=10)
+        second = RecommendationService.get_recommendations(self.resume.id, limit=10)
+
+        assert mock_build.return_value.execute.call_count == 1
+        assert [r.id for r in second] == [r.id for r in first]
+        assert RecommendationSet.objects.count() == 1
+
+    @patch("recommendation.services.build_generate_recommendations_usecase")
+    def test_new_set_swaps_pointer_and_prune_drops_old_sets(self, mock_build):
+        mock_build.return_value = self._usecase("first")
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+        old_set = RecommendationSet.objects.get()
+
+        # 역매칭되지 않은 공고로 코퍼스가 바뀌면 현재 세트가 뒤처져 새 세트를 씁니다.
+        mock_build.return_value = self._usecase("second")
+        JobPosting.objects.create(
+            posting_id=2,
+            url="https://example.com/job/2",
+            company_name="Company",
+            position="Frontend Developer",
+        )
+        RecommendationService.get_recommendations(self.resume.id, limit=10)
+
+        current = RecommendationService.get_recommendations_by_user(self.user.id)
+        assert [r.match_reason for r in current] == ["second"]
+        assert JobRecommendation.objects.filter(user_id=self.user.id).count() == 2
+        snapshot = RecommendationService.get_snapshot(self.user.id)
+        assert [item["match_reason"] for item in snapshot["items"]] == ["second"]
+
+        RecommendationSet.objects.filter(id=old_set.id).update(
+            generated_at=timezone.now() - timedelta(days=30)
+        )
+        call_command("prune_recommendation_sets", days=7)
+
+        assert not RecommendationSet.objects.filter(id=old_set.id).exists()
+        assert JobRecommendation.objects.filter(user_id=self.user.id).count() == 1
+
+
+class TestRecommendationSingleFlight:
+    """동시 실시간 추천 요청 병합 테스트"""
+
+    @patch.object(RecommendationService, "generate_recommendations")
+    def test_concurrent_identical_requests_compute_once(self, mock_generate):
+        started, release = threading.Event(), threading.Event()
+
+        def _slow_generate(resume_id, *, limit, prompt_id, deadline):
+            started.set()
+            release.wait(5)
+            deadline.mark_degraded("llm_rerank")
+            return ["rec"]
+
+        mock_generate.side_effect = _slow_generate
+        redis = MagicMock()
+        redis.set.return_value = True
+        leader_deadline, follower_deadline = Deadline(5), Deadline(5)
+
+        with patch.object(recommendation_flight, "_redis", redis):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                leader = executor.submit(
+                    RecommendationService.get_recommendations,
+                    1,
+                    limit=10,
+                    deadline=leader_deadline,
+                )
+                assert started.wait(5)
+                follower = executor.submit(
+                    RecommendationService.get_recommendations,
+                    1,
+                    limit=10,
+                    deadline=follower_deadline,
+                )
+                release.set()
+
+                assert leader.result() == ["rec"]
+                assert follower.result() == ["rec"]
+
+        mock_generate.assert_called_once()
+        assert follower_deadline.degraded == ["llm_rerank"]
+
+    @patch.object(RecommendationService, "_current_recommendations")
+    @patch.object(RecommendationService, "generate_recommendations")
+    def test_lock_wait_timeout_returns_current_set(self, mock_generate, mock_current):
+        mock_current.return_value = ["stored"]
+        redis = MagicMock()
+        redis.set.return_value = None
+        deadline = Deadline(0.2)
+
+        with patch.object(recommendation_flight, "_redis", redis):
+            result = RecommendationService.get_recommendations(
+                1, limit=10, deadline=deadline
+            )
+
+        # 다른 워커의 계산을 예산 일부만큼 기다린 뒤, 다시 계산하지 않고 현재 세트로 응답합니다.
+        assert result == ["stored"]
+        mock_generate.assert_not_called()
+        mock_current.assert_called_once_with(1, limit=10)
+        assert deadline.degraded == ["singleflight"]
+        assert deadline.remaining() > 0
@@ -7,10 +7,14 @@ Tests for Recommendation Views
 from unittest.mock import patch
 
 import pytest
+from common.admission import AdmissionController, TokenBucket
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from job.models import JobPosting
+from recommendation import views
 from recommendation.models import JobRecommendation
+from recommendation.services import RecommendationService
+from recommendation.tasks import refresh_recommendation_snapshots
 from rest_framework import status
 from rest_framework.test import APIClient
 from resume.models import Resume
@@ -65,6 +69,165 @@ class TestJobRecommendationViewSet:
         # Then
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
+        # 목록은 공고 요약만 포함 (본문 컬럼 제외)
+        assert "main_tasks" not in response.data[0]["job_posting"]
+        assert response.data[0]["job_posting"]["company_name"] == "Company"
+
+        response = self.client.get("/api/v1/recommendations/?user_id=1&view=full")
+        assert response.data[0]["job_posting"]["main_tasks"] == "Dev"
+
+    def test_list_recommendations_conditional_get(self):
+        """저장된 추천 목록 ETag: 변경이 없으면 304, 추천이 바뀌면 200"""
+        posting = JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Developer",
+        )
+        recommendation = JobRecommendation.objects.create(
+            user_id=1, job_posting=posting, rank=1, match_score=85, match_reason="A"
+        )
+        url = "/api/v1/recommendations/?user_id=1"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert "private" in response["Cache-Control"]
+
+        recommendation.match_reason = "B"
+        recommendation.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_recommendations_served_from_snapshot(self, django_assert_num_queries):
+        """스냅샷이 있으면 추천 행/공고 조회 없이 스냅샷 1건 조회로 응답"""
+        posting = JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Developer",
+        )
+        RecommendationService.create_recommendation(
+            {
+                "user_id": 1,
+                "job_posting": posting,
+                "rank": 1,
+                "match_score": 85,
+                "match_reason": "Good match",
+            }
+        )
+        url = "/api/v1/recommendations/?user_id=1"
+        self.client.get(url)  # 인증 사용자 로딩 등 요청 외 쿼리를 한 번 데움
+
+        with django_assert_num_queries(1):
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]["rank"] == 1
+        assert response.data[0]["job_posting"]["company_name"] == "Company"
+
+        etag = response["ETag"]
+        RecommendationService.delete_recommendation(response.data[0]["id"])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+
+    def test_list_recommendations_fields_filter_nested_posting(
+        self, django_assert_num_queries
+    ):
+        """fields= 는 nested 공고 필드만 남기고, 행 수와 관계없이 공고를 JOIN 한 번으로 읽음"""
+        for posting_id in (1, 2, 3):
+            JobRecommendation.objects.create(
+                user_id=1,
+                job_posting=JobPosting.objects.create(
+                    posting_id=posting_id,
+                    url=f"https://example.com/job/{posting_id}",
+                    company_name="Company",
+                    position="Developer",
+                ),
+                rank=posting_id,
+                match_score=80,
+                match_reason="A",
+            )
+        url = "/api/v1/recommendations/?user_id=1&fields=company_name"
+        self.client.get(url)  # 인증 사용자 로딩 등 요청 외 쿼리를 한 번 데움
+
+        with django_assert_num_queries(4):
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+        assert all(
+            set(r["job_posting"]) == {"posting_id", "company_name"}
+            for r in response.data
+        )
+
+    def test_snapshot_follows_posting_update_and_delete(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        """스냅샷 속 공고가 수정/삭제되면 커밋 후 태스크가 스냅샷을 다시 써 ETag가 바뀜"""
+        settings.RECOMMENDATION_SNAPSHOT_REFRESH_ON_CHANGE = True
+        postings = [
+            JobPosting.objects.create(
+                posting_id=posting_id,
+                url=f"https://example.com/job/{posting_id}",
+                company_name="Company",
+                position="Developer",
+            )
+            for posting_id in (1, 2)
+        ]
+        for rank, posting in enumerate(postings, start=1):
+            RecommendationService.create_recommendation(
+                {
+                    "user_id": 1,
+                    "job_posting": posting,
+                    "rank": rank,
+                    "match_score": 85,
+                    "match_reason": "Good match",
+                }
+            )
+        url = "/api/v1/recommendations/?user_id=1"
+        etag = self.client.get(url)["ETag"]
+
+        postings[0].company_name = "Renamed"
+        with patch(
+            "recommendation.tasks.refresh_recommendation_snapshots.delay",
+            side_effect=refresh_recommendation_snapshots,
+        ) as mock_delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                postings[0].save()
+            with django_capture_on_commit_callbacks(execute=True):
+                postings[1].delete()
+        assert mock_delay.call_count == 2
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data[0]["job_posting"]["company_name"] == "Renamed"
+        assert [r["job_posting"]["posting_id"] for r in response.data] == [1]
+
+    def test_list_all_recommendations_paginated(self):
+        """user_id 없는 전체 목록은 keyset cursor 페이지 단위로 응답"""
+        posting = JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Developer",
+        )
+        for user_id in (1, 2, 3):
+            JobRecommendation.objects.create(
+                user_id=user_id,
+                job_posting=posting,
+                rank=1,
+                match_score=80,
+                match_reason="A",
+            )
+
+        response = self.client.get("/api/v1/recommendations/?page_size=2")
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["user_id"] for r in response.data["results"]] == [1, 2]
+
+        response = self.client.get(response.data["next"])
+        assert [r["user_id"] for r in response.data["results"]] == [3]
+        assert response.data["next"] is None
 
     @patch("recommendation.views.RecommendationService")
     def test_for_user_real_time_recommendations(self, mock_service):
@@ -100,6 +263,69 @@ class TestJobRecommendationViewSet:
         assert response.data["user_id"] == user2.id
         assert "recommendations" in response.data
 
+    @patch(
+        "recommendation.views.recommendation_admission",
+        AdmissionController(
+            "test",
+            max_concurrent=1,
+            max_queue=0,
+            queue_timeout_seconds=1,
+            retry_after_seconds=5,
+        ),
+    )
+    def test_for_resume_rejected_while_busy_but_cheap_reads_served(self):
+        """동시 실행 자리가 없으면 즉시 503, 가벼운 목록 조회는 영향 없음"""
+        # Given
+        resume = Resume.objects.create(user=self.user, content="Backend Developer")
+
+        # When: 다른 요청이 실행 자리를 차지하고 있는 동안
+        with views.recommendation_admission.admit():
+            response = self.client.get(
+                f"/api/v1/recommendations/for-resume/{resume.id}/"
+            )
+            list_response = self.client.get(
+                f"/api/v1/recommendations/?user_id={self.user.id}"
+            )
+
+        # Then
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response["Retry-After"] == "5"
+        assert list_response.status_code == status.HTTP_200_OK
+
+        stats = self.client.get("/api/v1/recommendations/admission-stats/")
+        assert stats.status_code == status.HTTP_200_OK
+        assert stats.data["rejected_queue_full_total"] == 1
+        assert stats.data["active"] == 0
+
+    @patch("recommendation.views.recommendation_rate_limit", TokenBucket())
+    @patch("recommendation.views.RecommendationService.get_recommendations")
+    def test_for_user_rate_limited_per_user(self, mock_get, settings):
+        """사용자별 token bucket을 넘으면 429 + Retry-After"""
+        # Given
+        settings.RECOMMENDATION_USER_RATE_PER_MINUTE = 6
+        settings.RECOMMENDATION_USER_RATE_BURST = 1
+        mock_get.return_value = []
+        Resume.objects.create(user=self.user, content="Backend Developer")
+        url = f"/api/v1/recommendations/for-user/{self.user.id}/"
+
+        # When
+        first = self.client.get(url)
+        second = self.client.get(url)
+
+        # Then
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert second["Retry-After"] == "10"
+        mock_get.assert_called_once()
+
+    def test_admission_stats_requires_api_key(self):
+        """admission-stats는 API 키가 필요"""
+        self.client.credentials()
+
+        response = self.client.get("/api/v1/recommendations/admission-stats/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
     def test_create_recommendation(self):
         """추천 생성"""
         # Given
@@ -5,11 +5,29 @@ Recommendation Views
 """
 
 import logging
+import math
 import time
-
+from functools import wraps
+from typing import Optional
+
+from common.admission import AdmissionController, AdmissionRejected, TokenBucket
+from common.conditional import (
+    apply_validators,
+    check_not_modified,
+    make_etag,
+    queryset_validators,
+)
+from common.deadline import Deadline
+from common.pagination import KeysetPagination
+from common.serializers import VIEW_FULL, FieldsetQuerySerializer
+from django.conf import settings
+from job.models import JobPostingChange
+from job.permissions import HasSimpleSecretKey
+from job.serializers import JobPostingSerializer, JobPostingSummarySerializer
 from recommendation.models import JobRecommendation, RecommendationPrompt
 from recommendation.serializers import (
     JobRecommendationReadSerializer,
+    JobRecommendationSummaryReadSerializer,
     JobRecommendationWriteSerializer,
     RecommendationPromptSerializer,
 )
@@ -19,11 +37,98 @@ from rest_framework.decorators import action
 from rest_framework.mixins import ListModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 from resume.models import Resume
 
 logger = logging.getLogger(__name__)
 
+DEGRADED_STAGES_HEADER = "X-Degraded-Stages"
+
+
+def _parse_budget_ms(raw: Optional[str]) -> int:
+    """
+    ?budget_ms= 파싱 (없으면 기본값, 최대값 초과 시 최대값)
+
+    Raises:
+        ValueError: 양의 정수가 아닌 경우
+    """
+    if raw in (None, ""):
+        return settings.RECOMMENDATION_DEFAULT_BUDGET_MS
+    budget_ms = int(raw)
+    if budget_ms <= 0:
+        raise ValueError("budget_ms must be positive")
+    return min(budget_ms, settings.RECOMMENDATION_MAX_BUDGET_MS)
+
+
+def _mark_degraded(response: Response, deadline: Deadline) -> Response:
+    """예산 때문에 생략/축소한 단계를 응답 헤더로 알립니다."""
+    if deadline.degraded:
+        response[DEGRADED_STAGES_HEADER] = ",".join(deadline.degraded)
+    return response
+
+
+# 실시간 추천(LLM/벡터 검색) 동시 실행 제한과 사용자별 요청 속도 제한 (worker 프로세스별)
+recommendation_admission = AdmissionController(
+    "recommendations",
+    max_concurrent=settings.RECOMMENDATION_MAX_CONCURRENT,
+    max_queue=settings.RECOMMENDATION_MAX_QUEUE,
+    queue_timeout_seconds=settings.RECOMMENDATION_QUEUE_TIMEOUT_SECONDS,
+    retry_after_seconds=settings.RECOMMENDATION_RETRY_AFTER_SECONDS,
+)
+recommendation_rate_limit = TokenBucket()
+
+
+def _rejected(
+    message: str, *, status_code: int, retry_after_seconds: float
+) -> Response:
+    response = Response({"error": message}, status=status_code)
+    response["Retry-After"] = str(max(1, math.ceil(retry_after_seconds)))
+    return response
+
+
+def _admission_controlled(view_method):
+    """
+    비싼 추천 action에 사용자별 속도 제한(429)과 동시 실행 제한(503)을 적용합니다.
+
+    거절은 기다리지 않고 바로 Retry-After와 함께 응답하므로, 다른 가벼운 요청의 스레드를
+    붙잡지 않습니다.
+    """
+
+    @wraps(view_method)
+    def _wrapped(self, request, *args, **kwargs):
+        user_key = (
+            request.user.pk
+            if request.user and request.user.is_authenticated
+            else BaseThrottle().get_ident(request)
+        )
+        retry_after = recommendation_rate_limit.consume(
+            user_key,
+            rate_per_second=settings.RECOMMENDATION_USER_RATE_PER_MINUTE / 60.0,
+            burst=settings.RECOMMENDATION_USER_RATE_BURST,
+        )
+        if retry_after > 0:
+            return _rejected(
+                "Too many recommendation requests",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                retry_after_seconds=retry_after,
+            )
+
+        try:
+            with recommendation_admission.admit() as waited:
+                if waited > 0:
+                    logger.info(f"Recommendation request admitted after {waited:.3f}s")
+                return view_method(self, request, *args, **kwargs)
+        except AdmissionRejected as e:
+            logger.warning(f"Recommendation request rejected: {e.reason}")
+            return _rejected(
+                "Recommendation service is busy",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                retry_after_seconds=e.retry_after_seconds,
+            )
+
+    return _wrapped
+
 
 class JobRecommendationViewSet(ModelViewSet):
     """
@@ -34,34 +139,140 @@ class JobRecommendationViewSet(ModelViewSet):
     """
 
     queryset = JobRecommendation.objects.all()
+    # user_id 없는 전체 목록(관리용)에만 적용됩니다.
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):
         """
         action에 따라 적절한 Serializer 반환
 
-        - 읽기 작업 (list, retrieve): JobRecommendationReadSerializer
+        - 목록 (list): JobRecommendationSummaryReadSerializer
+          (`view=full` 또는 `fields=` 지정 시 JobRecommendationReadSerializer)
+        - 상세 (retrieve): JobRecommendationReadSerializer
         - 쓰기 작업 (create, update, partial_update): JobRecommendationWriteSerializer
         """
         if self.action in ["create", "update", "partial_update"]:
             return JobRecommendationWriteSerializer
+        if self.action == "list" and not self._wants_full_job_posting():
+            return JobRecommendationSummaryReadSerializer
         return JobRecommendationReadSerializer
 
+    def _wants_full_job_posting(self) -> bool:
+        fieldset = getattr(self, "fieldset", {})
+        return bool(fieldset.get("fields")) or fieldset.get("view") == VIEW_FULL
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # nested job_posting serializer(DynamicFieldsMixin)에만 적용됩니다.
+        context["fields"] = getattr(self, "fieldset", {}).get("fields")
+        return context
+
+    def _optimize_list_queryset(self, queryset):
+        """공고를 JOIN으로 함께 읽고, 응답에 필요한 공고 컬럼만 조회합니다."""
+        job_posting_serializer = (
+            JobPostingSerializer
+            if self._wants_full_job_posting()
+            else JobPostingSummarySerializer
+        )
+        return queryset.select_related("job_posting").only(
+            "id",
+            "user_id",
+            "rank",
+            "match_score",
+            "match_reason",
+            "created_at",
+            "job_posting",
+            *job_posting_serializer.model_only_fields(
+                getattr(self, "fieldset", {}).get("fields"), prefix="job_posting__"
+            ),
+        )
+
+    def _list_response(self, request, queryset, *, paginate: bool = False) -> Response:
+        """
+        조건부 GET(ETag/Last-Modified) 검증 후 목록을 직렬화합니다.
+
+        추천 행(개수/최종 수정 시각)과 nested 공고 코퍼스 버전이 모두 같으면 304입니다.
+        paginate=True 이면 keyset cursor 페이지 단위로 응답합니다.
+        """
+        last_modified, count = queryset_validators(queryset)
+        version, changed_at = JobPostingChange.latest_change()
+        etag = make_etag(
+            "recommendations",
+            count,
+            last_modified.isoformat() if last_modified else "",
+            version,
+            request.get_full_path(),
+        )
+        last_modified = max(filter(None, [last_modified, changed_at]), default=None)
+        not_modified = check_not_modified(
+            request, etag=etag, last_modified=last_modified, public=False
+        )
+        if not_modified is not None:
+            return not_modified
+
+        queryset = self._optimize_list_queryset(queryset)
+        if paginate:
+            page = self.paginate_queryset(queryset.order_by("user_id", "rank", "id"))
+            response = self.get_paginated_response(
+                self.get_serializer(page, many=True).data
+            )
+        else:
+            response = Response(self.get_serializer(queryset, many=True).data)
+        return apply_validators(
+            response, etag=etag, last_modified=last_modified, public=False
+        )
+
+    def _snapshot_response(self, request, user_id: int, snapshot: dict) -> Response:
+        """사용자 추천 스냅샷(비정규화 JSON)을 그대로 응답합니다."""
+        etag = make_etag(
+            "recommendation-snapshot",
+            user_id,
+            snapshot["version"],
+            snapshot["corpus_version"],
+        )
+        last_modified = snapshot["generated_at"]
+        not_modified = check_not_modified(
+            request, etag=etag, last_modified=last_modified, public=False
+        )
+        if not_modified is not None:
+            return not_modified
+        return apply_validators(
+            Response(snapshot["items"]),
+            etag=etag,
+            last_modified=last_modified,
+            public=False,
+        )
+
     def list(self, request, *args, **kwargs):
         """
         저장된 추천 목록 조회
 
-        GET /api/v1/recommendations/?user_id=<int>
+        GET /api/v1/recommendations/?user_id=<int>&view=summary|full&fields=...
+
+        - user_id + 요약 보기: 사용자 스냅샷으로 응답 (스냅샷이 없으면 추천 행 조회).
+          스냅샷 속 공고가 수정/삭제되면 공고 저장 경로가 스냅샷 갱신 태스크를 예약합니다.
+        - user_id 없음(관리용 전체 목록): keyset cursor 페이지네이션
         """
+        fieldset = FieldsetQuerySerializer(data=request.query_params)
+        if not fieldset.is_valid():
+            return Response(
+                {"error": "Invalid query parameters", "details": fieldset.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        self.fieldset = fieldset.validated_data
+
         user_id = request.query_params.get("user_id")
 
         if user_id:
             try:
                 user_id = int(user_id)
-                recommendations = RecommendationService.get_recommendations_by_user(
-                    user_id
+                if not self._wants_full_job_posting():
+                    snapshot = RecommendationService.get_snapshot(user_id)
+                    if snapshot is not None:
+                        return self._snapshot_response(request, user_id, snapshot)
+                return self._list_response(
+                    request, RecommendationService.get_recommendations_by_user(user_id)
                 )
-                serializer = self.get_serializer(recommendations, many=True)
-                return Response(serializer.data)
             except ValueError:
                 return Response(
                     {"error": "user_id must be an integer"},
@@ -77,8 +288,17 @@ class JobRecommendationViewSet(ModelViewSet):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
 
-        # user_id 없으면 전체 조회
-        return super().list(request, *args, **kwargs)
+        # user_id 없으면 전체 조회 (페이지 단위)
+        return self._list_response(
+            request, JobRecommendation.objects.current(), paginate=True
+        )
+
+    def perform_update(self, serializer):
+        """수정된 추천이 속한 사용자(변경 전/후)의 스냅샷을 다시 씁니다."""
+        previous_user_id = serializer.instance.user_id
+        recommendation = serializer.save()
+        for user_id in {previous_user_id, recommendation.user_id}:
+            RecommendationService.refresh_snapshot(user_id)
 
     def retrieve(self, request, pk=None, *args, **kwargs):
         """
@@ -94,8 +314,27 @@ class JobRecommendationViewSet(ModelViewSet):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
+            version, changed_at = JobPostingChange.latest_change()
+            etag = make_etag(
+                "recommendation",
+                recommendation.id,
+                recommendation.updated_at.isoformat(),
+                version,
+            )
+            last_modified = max(filter(None, [recommendation.updated_at, changed_at]))
+            not_modified = check_not_modified(
+                request, etag=etag, last_modified=last_modified, public=False
+            )
+            if not_modified is not None:
+                return not_modified
+
             serializer = self.get_serializer(recommendation)
-            return Response(serializer.data)
+            return apply_validators(
+                Response(serializer.data),
+                etag=etag,
+                last_modified=last_modified,
+                public=False,
+            )
         except Exception as e:
             logger.error(
                 f"Failed to retrieve recommendation {pk}: {str(e)}", exc_info=True
@@ -155,15 +394,18 @@ class JobRecommendationViewSet(ModelViewSet):
             )
 
     @action(detail=False, methods=["get"], url_path="for-resume/(?P<resume_id>[0-9]+)")
+    @_admission_controlled
     def for_resume(self, request, resume_id=None):
         """
         특정 이력서를 위한 실시간 추천 생성
 
-        GET /api/v1/recommendations/for-resume/<resume_id>/?limit=10
+        GET /api/v1/recommendations/for-resume/<resume_id>/?limit=10&budget_ms=5000
 
         Args:
             resume_id: 이력서 ID (URL 파라미터)
             limit: 반환할 추천 개수 (쿼리 파라미터, 기본값 10)
+            budget_ms: 응답 시간 예산(ms). 넘길 것 같은 단계(LLM planner/재정렬, 검색 일부)는
+                생략하고 `X-Degraded-Stages` 헤더로 알립니다.
 
         Returns:
             실시간 생성된 추천 공고 리스트
@@ -181,11 +423,19 @@ class JobRecommendationViewSet(ModelViewSet):
                 {"error": "resume_id and limit must be integers"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        try:
+            budget_ms = _parse_budget_ms(request.query_params.get("budget_ms"))
+        except ValueError:
+            return Response(
+                {"error": "budget_ms must be a positive integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        deadline = Deadline.from_budget_ms(budget_ms)
 
         try:
             # 실시간 추천 생성
             recommendations = RecommendationService.get_recommendations(
-                resume_id, limit=limit, prompt_id=prompt_id
+                resume_id, limit=limit, prompt_id=prompt_id, deadline=deadline
             )
 
             # 응답 시간 로깅
@@ -196,7 +446,7 @@ class JobRecommendationViewSet(ModelViewSet):
             )
 
             serializer = self.get_serializer(recommendations, many=True)
-            return Response(serializer.data)
+            return _mark_degraded(Response(serializer.data), deadline)
         except Exception as e:
             logger.error(
                 f"Failed to generate recommendations for resume {resume_id}: {str(e)}",
@@ -208,11 +458,14 @@ class JobRecommendationViewSet(ModelViewSet):
             )
 
     @action(detail=False, methods=["get"], url_path="for-user/(?P<user_id>[0-9]+)")
+    @_admission_controlled
     def for_user(self, request, user_id=None):
         """
         특정 사용자를 위한 실시간 추천 생성
 
-        GET /api/v1/recommendations/for-user/<user_id>/?limit=10
+        GET /api/v1/recommendations/for-user/<user_id>/?limit=10&budget_ms=5000
+
+        budget_ms는 for-resume과 같습니다.
         """
         start_time = time.time()
 
@@ -227,6 +480,13 @@ class JobRecommendationViewSet(ModelViewSet):
                 {"error": "user_id and limit must be integers"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        try:
+            budget_ms = _parse_budget_ms(request.query_params.get("budget_ms"))
+        except ValueError:
+            return Response(
+                {"error": "budget_ms must be a positive integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         # 대표 이력서 우선, 없으면 최신 이력서
         resume = (
@@ -246,9 +506,11 @@ class JobRecommendationViewSet(ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        # 이력서 조회 후 예산을 시작해 추천 생성 시간만 제한합니다.
+        deadline = Deadline.from_budget_ms(budget_ms)
         try:
             recommendations = RecommendationService.get_recommendations(
-                resume.id, limit=limit, prompt_id=prompt_id
+                resume.id, limit=limit, prompt_id=prompt_id, deadline=deadline
             )
 
             elapsed_time = time.time() - start_time
@@ -259,21 +521,27 @@ class JobRecommendationViewSet(ModelViewSet):
 
             # 서비스가 dict를 반환하는 경우(테스트/mocking)도 대응
             if recommendations and isinstance(recommendations[0], dict):
-                return Response(
+                return _mark_degraded(
+                    Response(
+                        {
+                            "user_id": user_id_int,
+                            "resume_id": resume.id,
+                            "recommendations": recommendations,
+                        }
+                    ),
+                    deadline,
+                )
+
+            serializer = self.get_serializer(recommendations, many=True)
+            return _mark_degraded(
+                Response(
                     {
                         "user_id": user_id_int,
                         "resume_id": resume.id,
-                        "recommendations": recommendations,
+                        "recommendations": serializer.data,
                     }
-                )
-
-            serializer = self.get_serializer(recommendations, many=True)
-            return Response(
-                {
-                    "user_id": user_id_int,
-                    "resume_id": resume.id,
-                    "recommendations": serializer.data,
-                }
+                ),
+                deadline,
             )
         except Exception as e:
             logger.error(
@@ -285,6 +553,27 @@ class JobRecommendationViewSet(ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="admission-stats",
+        permission_classes=[HasSimpleSecretKey],
+    )
+    def admission_stats(self, request):
+        """
+        실시간 추천 admission control 상태 조회 (API Key 필요)
+
+        GET /api/v1/recommendations/admission-stats/
+
+        요청을 처리한 worker 프로세스의 실행/대기 수, 누적 수락·거절 수, 최근 대기 시간 분포입니다.
+        """
+        return Response(
+            {
+                **recommendation_admission.get_stats(),
+                "rate_limit": recommendation_rate_limit.get_stats(),
+            }
+        )
+
 
 class RecommendationPromptViewSet(GenericViewSet, ListModelMixin):
     """
@@ -298,3 +587,21 @@ class RecommendationPromptViewSet(GenericViewSet, ListModelMixin):
     def get_queryset(self):
         """활성화된 프롬프트만 조회"""
         return RecommendationPrompt.objects.filter(is_active=True)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        last_modified, count = queryset_validators(queryset)
+        etag = make_etag(
+            "prompts", count, last_modified.isoformat() if last_modified else ""
+        )
+        not_modified = check_not_modified(
+            request, etag=etag, last_modified=last_modified, public=False
+        )
+        if not_modified is not None:
+            return not_modified
+        return apply_validators(
+            super().list(request, *args, **kwargs),
+            etag=etag,
+            last_modified=last_modified,
+            public=False,
+        )
@@ -0,0 +1,16 @@
+from django.contrib import admin
+from skill.models import SkillStat
+
+
+@admin.register(SkillStat)
+class SkillStatAdmin(admin.ModelAdmin):
+    list_display = (
+        "skill_name",
+        "required_count",
+        "count_7d",
+        "count_30d",
+        "last_seen",
+        "updated_at",
+    )
+    search_fields = ("skill_name",)
+    ordering = ("-required_count",)
@@ -0,0 +1,24 @@
+"""
+Management command to rebuild the precomputed skill → related postings cache.
+
+`RelatedJobsBySkillView`가 사용하는 스킬별 관련 공고 ID 목록을 일괄 재계산합니다.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from skill.related_postings import RelatedPostingsService
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the precomputed skill -> company -> related posting ids cache."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = RelatedPostingsService.rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt related postings: {total} skills ({elapsed:.2f}s)"
+            )
+        )
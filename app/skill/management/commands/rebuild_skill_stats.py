@@ -0,0 +1,24 @@
+"""
+Management command to rebuild the materialized SkillStat table.
+
+JobPosting.skills_required 전체를 다시 집계하여 스킬 통계(7/30일 윈도우 포함)를 재계산합니다.
+"""
+
+import time
+
+from common.adapters.django_skill_stat_repo import DjangoSkillStatRepository
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the materialized skill statistics (SkillStat) from job postings."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = DjangoSkillStatRepository().rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt skill statistics: {total} skills ({elapsed:.2f}s)"
+            )
+        )
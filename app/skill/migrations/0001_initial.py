@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("skill_name", models.CharField(max_length=100, unique=True)),
+                ("required_count", models.IntegerField(default=0)),
+                ("count_7d", models.IntegerField(default=0)),
+                ("count_30d", models.IntegerField(default=0)),
+                ("last_seen", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "agent_skill_stat",
+                "ordering": ["-required_count", "skill_name"],
+                "indexes": [
+                    models.Index(
+                        fields=["-required_count", "skill_name"],
+                        name="skill_stat_required_idx",
+                    ),
+                    models.Index(
+                        fields=["-count_30d", "skill_name"], name="skill_stat_30d_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
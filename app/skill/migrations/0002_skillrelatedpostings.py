@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("skill", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SkillRelatedPostings",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("skill_name", models.CharField(max_length=100, unique=True)),
+                ("posting_ids", models.JSONField(default=list)),
+                ("version", models.BigIntegerField(default=0)),
+                ("computed_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "agent_skill_related_postings",
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import models
+
+
+class SkillStat(models.Model):
+    """
+    스킬별 공고 통계 (materialized).
+
+    - required_count: 해당 스킬을 필수로 요구하는 공고 수
+    - count_7d / count_30d: 최근 7일/30일 내 등록(created_at)된 공고 중 요구 수
+    - last_seen: 해당 스킬을 요구한 가장 최근 공고의 created_at
+
+    공고 처리/삭제 시 증분 갱신되며, 7/30일 윈도우는 시간이 지나며 밀리므로
+    `rebuild_skill_stats` 커맨드로 주기적으로 재계산합니다.
+    """
+
+    skill_name = models.CharField(max_length=100, unique=True)
+    required_count = models.IntegerField(default=0)
+    count_7d = models.IntegerField(default=0)
+    count_30d = models.IntegerField(default=0)
+    last_seen = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "agent_skill_stat"
+        ordering = ["-required_count", "skill_name"]
+        indexes = [
+            models.Index(
+                fields=["-required_count", "skill_name"],
+                name="skill_stat_required_idx",
+            ),
+            models.Index(
+                fields=["-count_30d", "skill_name"],
+                name="skill_stat_30d_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.skill_name} ({self.required_count})"
+
+
+class SkillRelatedPostings(models.Model):
+    """
+    스킬 → (해당 스킬을 요구하는 회사) → 그 회사의 다른 공고 ID 목록 (precomputed).
+
+    `RelatedJobsBySkillView`가 매 요청마다 그래프 2-hop 확장을 하지 않도록
+    주기 작업(`rebuild_related_postings`)에서 일괄 계산해 둡니다.
+
+    - posting_ids: posting_id 내림차순 정렬된 공고 ID 배열
+    - version: 계산 시점의 `JobPostingChange` 버전
+    """
+
+    skill_name = models.CharField(max_length=100, unique=True)
+    posting_ids = models.JSONField(default=list)
+    version = models.BigIntegerField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "agent_skill_related_postings"
+
+    def __str__(self):
+        return f"{self.skill_name} ({len(self.posting_ids)})"
@@ -0,0 +1,167 @@
+"""
+Related Postings Service
+
+스킬 → 회사 → 공고 ID 목록(precomputed) 관리
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional
+
+from common.redis_client import get_redis
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from job.models import JobPosting, JobPostingChange
+from redis.exceptions import RedisError
+from skill.models import SkillRelatedPostings
+
+logger = logging.getLogger(__name__)
+
+
+def compute_related_postings(
+    rows: Iterable[tuple], skill_names: Optional[Iterable[str]] = None
+) -> Dict[str, List[int]]:
+    """
+    (posting_id, company_name, skills_required) 행들로부터 스킬별 관련 공고 ID를 계산합니다.
+
+    `GraphDBClient.get_jobs_related_to_skill` 과 같은 규칙입니다:
+    스킬을 요구하는 공고(j)의 회사가 올린 공고 중 j 자신을 제외한 공고.
+    즉, 회사 내에서 해당 스킬을 요구하는 공고가 1건뿐이면 그 공고만 제외됩니다.
+
+    Returns:
+        {skill_name: posting_id 내림차순 리스트}
+    """
+    wanted = set(skill_names) if skill_names is not None else None
+    postings_by_company: Dict[str, List[int]] = defaultdict(list)
+    # skill -> company -> 해당 스킬을 요구하는 공고 ID 목록
+    matches: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+
+    for posting_id, company_name, skills in rows:
+        if not isinstance(skills, list) or not skills:
+            # 그래프에는 스킬이 있는 공고만 존재합니다.
+            continue
+        postings_by_company[company_name].append(posting_id)
+        for skill in set(skills):
+            if not skill or (wanted is not None and skill not in wanted):
+                continue
+            matches[skill][company_name].append(posting_id)
+
+    related: Dict[str, List[int]] = {}
+    for skill, companies in matches.items():
+        ids: set[int] = set()
+        for company_name, matched in companies.items():
+            company_postings = postings_by_company[company_name]
+            if len(matched) >= 2:
+                ids.update(company_postings)
+            else:
+                ids.update(pid for pid in company_postings if pid != matched[0])
+        related[skill] = sorted(ids, reverse=True)
+    return related
+
+
+class RelatedPostingsService:
+    """
+    스킬 관련 공고 캐시 서비스
+
+    - `rebuild()`: 전체 스킬에 대해 한 번의 공고 스캔으로 일괄 계산 (주기 작업/Celery)
+    - `get_entry()`: 캐시 조회만 수행 (요청 경로에서는 공고를 스캔하거나 행을 만들지 않음)
+    """
+
+    # 캐시에 없는 스킬(요구하는 공고가 없거나 알 수 없는 이름)의 빈 항목 계산 시각
+    EMPTY_COMPUTED_AT = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+    REFRESH_LOCK_KEY = "related_postings:refresh"
+
+    @staticmethod
+    def _rows():
+        return (
+            JobPosting.objects.exclude(skills_required__isnull=True)
+            .values_list("posting_id", "company_name", "skills_required")
+            .iterator(chunk_size=2000)
+        )
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        전체 스킬의 관련 공고 목록을 재계산합니다.
+
+        Returns:
+            저장된 스킬 수
+        """
+        started = time.perf_counter()
+        version = JobPostingChange.latest_version()
+        now = timezone.now()
+        related = compute_related_postings(RelatedPostingsService._rows())
+
+        with transaction.atomic():
+            SkillRelatedPostings.objects.exclude(skill_name__in=related.keys()).delete()
+            SkillRelatedPostings.objects.bulk_create(
+                [
+                    SkillRelatedPostings(
+                        skill_name=skill,
+                        posting_ids=ids,
+                        version=version,
+                        computed_at=now,
+                    )
+                    for skill, ids in related.items()
+                ],
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["skill_name"],
+                update_fields=["posting_ids", "version", "computed_at"],
+            )
+
+        logger.info(
+            f"Rebuilt related postings for {len(related)} skills "
+            f"(version={version}, {time.perf_counter() - started:.2f}s)"
+        )
+        return len(related)
+
+    @staticmethod
+    def _schedule_refresh() -> None:
+        """
+        오래된 캐시의 전체 재계산을 Celery에 예약합니다. (max age 동안 1회만)
+
+        Redis를 사용할 수 없으면 예약하지 않고 주기 작업에 맡깁니다.
+        """
+        from skill.tasks import refresh_related_postings
+
+        max_age = int(getattr(settings, "RELATED_POSTINGS_MAX_AGE_SECONDS", 3600))
+        try:
+            if not get_redis().set(
+                RelatedPostingsService.REFRESH_LOCK_KEY, "1", nx=True, ex=max_age
+            ):
+                return
+        except RedisError as e:
+            logger.warning(f"Skip scheduling related postings refresh: {e}")
+            return
+        refresh_related_postings.delay()
+
+    @staticmethod
+    def get_entry(skill_name: str) -> SkillRelatedPostings:
+        """
+        스킬 관련 공고 캐시 조회
+
+        - 캐시에 없는 스킬은 주기 재계산 시점에 요구하는 공고가 없었던 것이므로 빈 항목(미저장)을 반환
+        - 오래된 항목도 그대로 반환하고, 재계산은 Celery 태스크로 예약
+        """
+        entry = SkillRelatedPostings.objects.filter(skill_name=skill_name).first()
+        if entry is None:
+            return SkillRelatedPostings(
+                skill_name=skill_name,
+                posting_ids=[],
+                version=0,
+                computed_at=RelatedPostingsService.EMPTY_COMPUTED_AT,
+            )
+
+        max_age = timedelta(
+            seconds=getattr(settings, "RELATED_POSTINGS_MAX_AGE_SECONDS", 3600)
+        )
+        if timezone.now() - entry.computed_at >= max_age:
+            RelatedPostingsService._schedule_refresh()
+        return entry
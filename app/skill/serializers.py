@@ -0,0 +1,11 @@
+from common.serializers import FieldsetQuerySerializer
+from rest_framework import serializers
+
+
+class RelatedJobsQuerySerializer(FieldsetQuerySerializer):
+    """스킬 관련 공고 조회용 QuerySerializer"""
+
+    limit = serializers.IntegerField(
+        required=False, min_value=1, max_value=100, default=10
+    )
+    offset = serializers.IntegerField(required=False, min_value=0, default=0)
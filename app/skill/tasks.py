@@ -0,0 +1,22 @@
+"""
+Celery 태스크: 스킬 관련 집계 갱신
+"""
+
+import logging
+
+from celery import shared_task
+from skill.related_postings import RelatedPostingsService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_related_postings():
+    """
+    스킬 → 회사 → 공고 ID 캐시를 전체 재계산하는 Celery 태스크
+
+    Returns:
+        dict: 갱신된 스킬 수
+    """
+    total = RelatedPostingsService.rebuild()
+    return {"success": True, "skills": total}
@@ -0,0 +1,130 @@
+"""
+Tests for materialized SkillStat maintenance
+
+스킬 통계 증분 갱신/재계산 테스트
+"""
+
+from datetime import timedelta
+
+import pytest
+from common.adapters.django_skill_stat_repo import DjangoSkillStatRepository
+from django.core.management import call_command
+from django.utils import timezone
+from job.models import JobPosting
+from job.services import JobService
+from skill.models import SkillStat
+
+
+@pytest.mark.django_db
+class TestDjangoSkillStatRepository:
+    """DjangoSkillStatRepository 테스트"""
+
+    def test_apply_posting_change_increments_and_decrements(self):
+        """추가/제거된 스킬만 카운트에 반영"""
+        repo = DjangoSkillStatRepository()
+        now = timezone.now()
+
+        repo.apply_posting_change(added=["Python", "Django"], removed=[], posted_at=now)
+        repo.apply_posting_change(added=["Python"], removed=[], posted_at=now)
+        repo.apply_posting_change(added=["Go"], removed=["Django"], posted_at=now)
+
+        python = SkillStat.objects.get(skill_name="Python")
+        assert python.required_count == 2
+        assert python.count_7d == 2
+        assert python.last_seen == now
+        assert SkillStat.objects.get(skill_name="Django").required_count == 0
+        assert SkillStat.objects.get(skill_name="Go").required_count == 1
+
+    def test_old_posting_does_not_count_in_recent_windows(self):
+        """30일 이전 공고는 7/30일 카운트에 포함되지 않음"""
+        repo = DjangoSkillStatRepository()
+
+        repo.apply_posting_change(
+            added=["Java"],
+            removed=[],
+            posted_at=timezone.now() - timedelta(days=40),
+        )
+
+        java = SkillStat.objects.get(skill_name="Java")
+        assert java.required_count == 1
+        assert java.count_7d == 0
+        assert java.count_30d == 0
+
+    def test_get_statistics_top_n_and_single_skill(self):
+        """Top-N 통계와 단일 스킬 통계 형태"""
+        SkillStat.objects.create(skill_name="Python", required_count=5)
+        SkillStat.objects.create(skill_name="Django", required_count=3)
+        SkillStat.objects.create(skill_name="Cobol", required_count=0)
+        repo = DjangoSkillStatRepository()
+
+        top = repo.get_statistics()
+        single = repo.get_statistics(skill_name="Django")
+
+        assert top["total_skills"] == 2
+        assert [s["skill"] for s in top["most_required_skills"]] == [
+            "Python",
+            "Django",
+        ]
+        assert single["required_count"] == 3
+        assert repo.get_statistics(skill_name="Rust")["required_count"] == 0
+
+    def test_rebuild_command_recomputes_from_job_postings(self):
+        """rebuild_skill_stats 커맨드가 공고 기준으로 재집계"""
+        for posting_id, skills in [(1, ["Python"]), (2, ["Python", "Django"])]:
+            JobPosting.objects.create(
+                posting_id=posting_id,
+                url=f"https://example.com/job/{posting_id}",
+                company_name="Company",
+                position="Backend Developer",
+                skills_required=skills,
+            )
+        SkillStat.objects.create(skill_name="Stale", required_count=9)
+
+        call_command("rebuild_skill_stats", stdout=None)
+
+        assert dict(SkillStat.objects.values_list("skill_name", "required_count")) == {
+            "Python": 2,
+            "Django": 1,
+        }
+        assert SkillStat.objects.get(skill_name="Python").count_7d == 2
+
+
+@pytest.mark.django_db
+class TestJobPostingSkillStatHooks:
+    """JobPosting 저장/삭제 훅의 SkillStat 반영 테스트"""
+
+    def _counts(self):
+        return dict(SkillStat.objects.values_list("skill_name", "required_count"))
+
+    def test_insert_with_skills_is_counted_and_delete_decrements(self):
+        """스킬이 채워진 채 생성된 공고도 카운트되고, 삭제 시 차감"""
+        posting = JobPosting.objects.create(
+            posting_id=1,
+            url="https://example.com/job/1",
+            company_name="Company",
+            position="Backend Developer",
+            skills_required=["Python", "Django"],
+        )
+        assert self._counts() == {"Python": 1, "Django": 1}
+
+        posting.skills_required = ["Python", "Go"]
+        posting.save(update_fields=["skills_required"])
+        assert self._counts() == {"Python": 1, "Django": 0, "Go": 1}
+
+        JobService.delete_job_posting(posting.posting_id)
+        assert self._counts() == {"Python": 0, "Django": 0, "Go": 0}
+
+    def test_unrelated_update_fields_do_not_touch_counts(self):
+        """skills_required 를 저장하지 않으면 카운트 유지"""
+        posting = JobPosting.objects.create(
+            posting_id=2,
+            url="https://example.com/job/2",
+            company_name="Company",
+            position="Backend Developer",
+            skills_required=["Python"],
+        )
+
+        posting.skills_required = ["Rust"]
+        posting.save(update_fields=["skills_preferred"])
+
+        assert self._counts() == {"Python": 1}
@@ -1,6 +1,13 @@
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
+from django.utils import timezone
+from job.models import JobPosting
 from rest_framework import status
 from rest_framework.test import APIClient
+from skill.models import SkillRelatedPostings
+from skill.related_postings import RelatedPostingsService, compute_related_postings
 
 
 @pytest.mark.django_db
@@ -13,3 +20,116 @@ class TestSkillViews:
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.data, list)
         assert "Python" in response.data
+
+    def test_skill_options_conditional_get(self):
+        response = self.client.get("/api/v1/skills/")
+        assert "max-age=3600" in response["Cache-Control"]
+
+        cached = self.client.get("/api/v1/skills/", HTTP_IF_NONE_MATCH=response["ETag"])
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+class TestRelatedJobsBySkillView:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def _create(self, posting_id: int, company_name: str, skills: list[str]):
+        return JobPosting.objects.create(
+            posting_id=posting_id,
+            url=f"https://example.com/job/{posting_id}",
+            company_name=company_name,
+            position="Backend Developer",
+            skills_required=skills,
+        )
+
+    def _seed(self):
+        # Alpha: Python 공고 1건 → 본인 제외 Alpha의 나머지 공고
+        self._create(1, "Alpha", ["Python"])
+        self._create(2, "Alpha", ["React"])
+        self._create(3, "Alpha", ["Java"])
+        # Beta: Python 공고 2건 → Beta의 모든 공고
+        self._create(4, "Beta", ["Python"])
+        self._create(5, "Beta", ["Python", "Django"])
+        # Gamma: Python 미요구
+        self._create(6, "Gamma", ["Go"])
+
+    def test_compute_related_postings_matches_graph_rule(self):
+        self._seed()
+        rows = JobPosting.objects.values_list(
+            "posting_id", "company_name", "skills_required"
+        )
+
+        related = compute_related_postings(rows)
+
+        assert related["Python"] == [5, 4, 3, 2]
+        assert related["Go"] == []
+
+    def test_paginates_with_total_count_header(self):
+        self._seed()
+        RelatedPostingsService.rebuild()
+
+        response = self.client.get(
+            "/api/v1/skills/related/Python/", {"limit": 2, "offset": 1}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["posting_id"] for item in response.data] == [4, 3]
+        assert response["X-Total-Count"] == "4"
+        assert response["ETag"]
+
+    def test_deleted_postings_are_excluded_from_page_and_count(self):
+        self._seed()
+        RelatedPostingsService.rebuild()
+        JobPosting.objects.get(posting_id=4).delete()
+
+        response = self.client.get(
+            "/api/v1/skills/related/Python/", {"limit": 2, "offset": 1}
+        )
+
+        # 재계산 전이라도 삭제된 공고는 건너뛰고 전체 개수에서도 빠집니다.
+        assert [item["posting_id"] for item in response.data] == [3, 2]
+        assert response["X-Total-Count"] == "3"
+
+    def test_cache_miss_returns_empty_without_computing(self):
+        self._seed()
+
+        with patch.object(RelatedPostingsService, "_rows") as rows:
+            response = self.client.get("/api/v1/skills/related/NotASkill/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
+        assert response["X-Total-Count"] == "0"
+        rows.assert_not_called()
+        assert not SkillRelatedPostings.objects.exists()
+
+    def test_stale_entry_is_served_and_refresh_is_scheduled(self):
+        self._seed()
+        RelatedPostingsService.rebuild()
+        SkillRelatedPostings.objects.update(
+            computed_at=timezone.now() - timedelta(days=1)
+        )
+        self._create(7, "Gamma", ["Python"])
+
+        with patch.object(RelatedPostingsService, "_schedule_refresh") as schedule:
+            response = self.client.get("/api/v1/skills/related/Python/")
+
+        assert [item["posting_id"] for item in response.data] == [5, 4, 3, 2]
+        schedule.assert_called_once()
+
+    def test_returns_304_when_etag_matches(self):
+        self._seed()
+        RelatedPostingsService.rebuild()
+        first = self.client.get("/api/v1/skills/related/Python/")
+
+        second = self.client.get(
+            "/api/v1/skills/related/Python/", HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second["ETag"] == first["ETag"]
+
+    def test_invalid_limit(self):
+        response = self.client.get("/api/v1/skills/related/Python/", {"limit": 0})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
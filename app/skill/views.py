@@ -4,22 +4,39 @@ Skill Views
 스킬 관련 API 뷰
 """
 
-from common.graph_db import GraphDBClient
+from functools import lru_cache
+
+from common.conditional import apply_validators, check_not_modified, make_etag
+from django.conf import settings
 from drf_spectacular.utils import extend_schema
 from job.models import JobPosting
-from job.serializers import JobPostingSerializer
+from job.serializers import (
+    JobPostingSummarySerializer,
+    get_job_posting_serializer_class,
+)
+from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from skill.related_postings import RelatedPostingsService
+from skill.serializers import RelatedJobsQuerySerializer
 from skill.services import SkillExtractionService
 
 
+@lru_cache(maxsize=1)
+def _skill_options() -> tuple[list[str], str]:
+    """마스터 스킬 목록과 ETag (프로세스당 1회 계산)"""
+    skills = SkillExtractionService.get_all_skills()
+    return skills, make_etag("skill-options", *skills)
+
+
 class SkillOptionsView(APIView):
     """
     기술스택 옵션 목록 조회 (public)
 
     FE 필터 UI에서 미리 옵션을 로드해 사용할 수 있도록,
     지원하는 전체 스킬 목록(마스터 목록)을 반환합니다.
+    목록은 배포 사이에 바뀌지 않으므로 ETag(목록 해시) + 긴 max-age로 캐시합니다.
     """
 
     permission_classes = [AllowAny]
@@ -30,32 +47,95 @@ class SkillOptionsView(APIView):
         responses={200: list[str]},
     )
     def get(self, request):
-        return Response(SkillExtractionService.get_all_skills(), status=200)
+        skills, etag = _skill_options()
+        max_age = settings.SKILL_OPTIONS_CACHE_MAX_AGE_SECONDS
+        not_modified = check_not_modified(request, etag=etag, max_age=max_age)
+        if not_modified is not None:
+            return not_modified
+        return apply_validators(
+            Response(skills, status=200), etag=etag, max_age=max_age
+        )
 
 
 class RelatedJobsBySkillView(APIView):
     """
     특정 스킬과 관련된 채용 공고 조회
 
-    Neo4j 그래프 DB를 사용하여 스킬 기반 공고 검색을 수행합니다.
+    스킬 → 회사 → 공고 ID 목록은 주기 작업에서 미리 계산해 둔 캐시(`SkillRelatedPostings`)를
+    사용합니다. limit/offset 페이지네이션을 지원하며, 전체 개수는 `X-Total-Count` 헤더로
+    반환합니다. ETag가 일치하면 304를 반환합니다.
+    공고는 기본적으로 요약(summary) 표현이며 `view=full` 또는 `fields=`로 바꿀 수 있습니다.
     """
 
     permission_classes = [AllowAny]
 
     @extend_schema(
-        responses=JobPostingSerializer(many=True),
+        parameters=[RelatedJobsQuerySerializer],
+        responses=JobPostingSummarySerializer(many=True),
         summary="Get Related Jobs by Skill",
-        description="Get job postings related to a specific skill using Graph DB.",
+        description="Get job postings posted by companies that require the skill.",
     )
     def get(self, request, skill_name: str):
-        # Neo4j에서 스킬 관련 공고 ID 조회
-        posting_ids = GraphDBClient.get_instance().get_jobs_related_to_skill(skill_name)
+        query_serializer = RelatedJobsQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            return Response(
+                {
+                    "error": "Invalid query parameters",
+                    "details": query_serializer.errors,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        limit = query_serializer.validated_data["limit"]
+        offset = query_serializer.validated_data["offset"]
+        view = query_serializer.validated_data.get("view")
+        fields = query_serializer.validated_data.get("fields")
+
+        entry = RelatedPostingsService.get_entry(skill_name)
+        # 캐시 재계산 이후 삭제된 공고는 페이지와 전체 개수(X-Total-Count)에서 함께 뺍니다.
+        updated_at = (
+            dict(
+                JobPosting.objects.filter(posting_id__in=entry.posting_ids).values_list(
+                    "posting_id", "updated_at"
+                )
+            )
+            if entry.posting_ids
+            else {}
+        )
+        posting_ids = [pid for pid in entry.posting_ids if pid in updated_at]
+        page_ids = posting_ids[offset : offset + limit]
 
-        if not posting_ids:
-            return Response([], status=200)
+        # 페이지 공고의 수정 시각까지 포함해야 공고 내용 변경 시에도 ETag가 바뀝니다.
+        last_modified = max(
+            filter(None, [*(updated_at[pid] for pid in page_ids), entry.computed_at])
+        )
+        etag = make_etag(
+            skill_name,
+            entry.version,
+            entry.computed_at.isoformat(),
+            last_modified.isoformat(),
+            len(posting_ids),
+            offset,
+            limit,
+            view,
+            ",".join(fields or []),
+        )
+        not_modified = check_not_modified(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
 
-        # PostgreSQL에서 공고 상세 정보 조회
-        job_postings = JobPosting.objects.filter(posting_id__in=posting_ids)
-        serializer = JobPostingSerializer(job_postings, many=True)
+        # PostgreSQL에서 공고 상세 정보 조회 (캐시 순서 유지)
+        serializer_class = get_job_posting_serializer_class(view, fields)
+        postings = JobPosting.objects.only(
+            *serializer_class.model_only_fields(fields)
+        ).in_bulk(page_ids)
+        serializer = serializer_class(
+            [postings[pid] for pid in page_ids if pid in postings],
+            many=True,
+            fields=fields,
+        )
 
-        return Response(serializer.data)
+        response = Response(serializer.data)
+        response["X-Total-Count"] = str(len(posting_ids))
+        return apply_validators(response, etag=etag, last_modified=last_modified)
@@ -113,3 +113,63 @@ class TestRecommendationPerformance:
         ), f"Skill extraction time {elapsed_time:.3f}s exceeds 100ms"
         print(f"\n✓ Skill extraction time: {elapsed_time:.3f}s")
         print(f"  Extracted {len(skills)} skills from {len(long_text)} characters")
+
+
+class TestScoringEnginePerformance:
+    """후보 일괄 점수 계산(벡터화) 마이크로벤치마크"""
+
+    @pytest.mark.parametrize("n_candidates", [1_000, 10_000])
+    def test_score_candidates_matches_scalar_ranking(self, n_candidates):
+        """벡터화 점수/정렬이 후보별 계산과 정확히 같고, 1만 건도 충분히 빠름"""
+        import random
+
+        from recommendation.domain.scoring import (
+            display_match_score,
+            skill_match_ratios,
+        )
+        from recommendation.domain.scoring_engine import score_candidates
+        from skill.services import MASTER_SKILLS
+
+        # Given
+        rng = random.Random(n_candidates)
+        vocabulary = list(MASTER_SKILLS) + ["Unlisted A", "Unlisted B"]
+        user_skills = set(rng.sample(vocabulary, 12))
+        stacks, requirements, preferred, similarity = [], [], [], []
+        for _ in range(n_candidates):
+            stacks.append(frozenset(rng.sample(vocabulary, rng.randint(0, 8))))
+            requirements.append(frozenset(rng.sample(vocabulary, rng.randint(0, 6))))
+            preferred.append(frozenset(rng.sample(vocabulary, rng.randint(0, 4))))
+            similarity.append(round(rng.random(), 2))
+
+        # When
+        start_time = time.perf_counter()
+        expected = []
+        for i in range(n_candidates):
+            ratios = skill_match_ratios(
+                user_skills, stacks[i], requirements[i], preferred[i]
+            )
+            expected.append((ratios + (similarity[i],), i))
+        expected.sort(key=lambda x: x[0], reverse=True)
+        scalar_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        scores = score_candidates(
+            user_skills=user_skills,
+            stack_skills=stacks,
+            requirement_skills=requirements,
+            preferred_skills=preferred,
+            vector_similarity=similarity,
+        )
+        vectorized_time = time.perf_counter() - start_time
+
+        # Then
+        assert scores.order.tolist() == [i for _, i in expected]
+        for key, i in expected:
+            assert scores.display_score[i] == display_match_score(*key[:3])
+        assert (
+            vectorized_time < 0.5
+        ), f"Scoring {n_candidates} candidates took {vectorized_time:.3f}s"
+        print(
+            f"\n✓ Scoring {n_candidates} candidates: vectorized {vectorized_time:.4f}s "
+            f"(scalar {scalar_time:.4f}s)"
+        )
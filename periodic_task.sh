@@ -1,3 +1,6 @@
 #!/bin/bash
 # 0 0 * * * ${pwd}/periodic_task.sh >> /home/ubuntu/cron.log 2>&1
-docker exec -i app sh -c 'uv run python run_agent.py'
\ No newline at end of file
+docker exec -i app sh -c 'uv run python run_agent.py'
+docker exec -i app sh -c 'uv run python manage.py rebuild_skill_stats && uv run python manage.py rebuild_related_postings'
+docker exec -i app sh -c 'uv run python manage.py prune_recommendation_sets'
+docker exec -i app sh -c 'uv run python manage.py prune_posting_changes'